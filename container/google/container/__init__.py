@@ -15,94 +15,213 @@
 # limitations under the License.
 #
 
+import importlib
+import sys
+import typing
+
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    from google.container_v1.services.cluster_manager.async_client import ClusterManagerAsyncClient
+    from google.container_v1.services.cluster_manager.client import ClusterManagerClient
+    from google.container_v1.types.cluster_service import AcceleratorConfig
+    from google.container_v1.types.cluster_service import AddonsConfig
+    from google.container_v1.types.cluster_service import AuthenticatorGroupsConfig
+    from google.container_v1.types.cluster_service import AutoUpgradeOptions
+    from google.container_v1.types.cluster_service import AutoprovisioningNodePoolDefaults
+    from google.container_v1.types.cluster_service import BinaryAuthorization
+    from google.container_v1.types.cluster_service import CancelOperationRequest
+    from google.container_v1.types.cluster_service import ClientCertificateConfig
+    from google.container_v1.types.cluster_service import CloudRunConfig
+    from google.container_v1.types.cluster_service import Cluster
+    from google.container_v1.types.cluster_service import ClusterAutoscaling
+    from google.container_v1.types.cluster_service import ClusterUpdate
+    from google.container_v1.types.cluster_service import CompleteIPRotationRequest
+    from google.container_v1.types.cluster_service import CreateClusterRequest
+    from google.container_v1.types.cluster_service import CreateNodePoolRequest
+    from google.container_v1.types.cluster_service import DailyMaintenanceWindow
+    from google.container_v1.types.cluster_service import DatabaseEncryption
+    from google.container_v1.types.cluster_service import DeleteClusterRequest
+    from google.container_v1.types.cluster_service import DeleteNodePoolRequest
+    from google.container_v1.types.cluster_service import GetClusterRequest
+    from google.container_v1.types.cluster_service import GetNodePoolRequest
+    from google.container_v1.types.cluster_service import GetOperationRequest
+    from google.container_v1.types.cluster_service import GetServerConfigRequest
+    from google.container_v1.types.cluster_service import HorizontalPodAutoscaling
+    from google.container_v1.types.cluster_service import HttpLoadBalancing
+    from google.container_v1.types.cluster_service import IPAllocationPolicy
+    from google.container_v1.types.cluster_service import IntraNodeVisibilityConfig
+    from google.container_v1.types.cluster_service import IstioConfig
+    from google.container_v1.types.cluster_service import KubernetesDashboard
+    from google.container_v1.types.cluster_service import LegacyAbac
+    from google.container_v1.types.cluster_service import ListClustersRequest
+    from google.container_v1.types.cluster_service import ListClustersResponse
+    from google.container_v1.types.cluster_service import ListLocationsRequest
+    from google.container_v1.types.cluster_service import ListLocationsResponse
+    from google.container_v1.types.cluster_service import ListNodePoolsRequest
+    from google.container_v1.types.cluster_service import ListNodePoolsResponse
+    from google.container_v1.types.cluster_service import ListOperationsRequest
+    from google.container_v1.types.cluster_service import ListOperationsResponse
+    from google.container_v1.types.cluster_service import ListUsableSubnetworksRequest
+    from google.container_v1.types.cluster_service import ListUsableSubnetworksResponse
+    from google.container_v1.types.cluster_service import Location
+    from google.container_v1.types.cluster_service import MaintenancePolicy
+    from google.container_v1.types.cluster_service import MaintenanceWindow
+    from google.container_v1.types.cluster_service import MasterAuth
+    from google.container_v1.types.cluster_service import MasterAuthorizedNetworksConfig
+    from google.container_v1.types.cluster_service import MaxPodsConstraint
+    from google.container_v1.types.cluster_service import NetworkConfig
+    from google.container_v1.types.cluster_service import NetworkPolicy
+    from google.container_v1.types.cluster_service import NetworkPolicyConfig
+    from google.container_v1.types.cluster_service import NodeConfig
+    from google.container_v1.types.cluster_service import NodeManagement
+    from google.container_v1.types.cluster_service import NodePool
+    from google.container_v1.types.cluster_service import NodePoolAutoscaling
+    from google.container_v1.types.cluster_service import NodeTaint
+    from google.container_v1.types.cluster_service import Operation
+    from google.container_v1.types.cluster_service import OperationProgress
+    from google.container_v1.types.cluster_service import PodSecurityPolicyConfig
+    from google.container_v1.types.cluster_service import PrivateClusterConfig
+    from google.container_v1.types.cluster_service import RecurringTimeWindow
+    from google.container_v1.types.cluster_service import ResourceLimit
+    from google.container_v1.types.cluster_service import ResourceUsageExportConfig
+    from google.container_v1.types.cluster_service import RollbackNodePoolUpgradeRequest
+    from google.container_v1.types.cluster_service import ServerConfig
+    from google.container_v1.types.cluster_service import SetAddonsConfigRequest
+    from google.container_v1.types.cluster_service import SetLabelsRequest
+    from google.container_v1.types.cluster_service import SetLegacyAbacRequest
+    from google.container_v1.types.cluster_service import SetLocationsRequest
+    from google.container_v1.types.cluster_service import SetLoggingServiceRequest
+    from google.container_v1.types.cluster_service import SetMaintenancePolicyRequest
+    from google.container_v1.types.cluster_service import SetMasterAuthRequest
+    from google.container_v1.types.cluster_service import SetMonitoringServiceRequest
+    from google.container_v1.types.cluster_service import SetNetworkPolicyRequest
+    from google.container_v1.types.cluster_service import SetNodePoolAutoscalingRequest
+    from google.container_v1.types.cluster_service import SetNodePoolManagementRequest
+    from google.container_v1.types.cluster_service import SetNodePoolSizeRequest
+    from google.container_v1.types.cluster_service import ShieldedInstanceConfig
+    from google.container_v1.types.cluster_service import StartIPRotationRequest
+    from google.container_v1.types.cluster_service import StatusCondition
+    from google.container_v1.types.cluster_service import TimeWindow
+    from google.container_v1.types.cluster_service import UpdateClusterRequest
+    from google.container_v1.types.cluster_service import UpdateMasterRequest
+    from google.container_v1.types.cluster_service import UpdateNodePoolRequest
+    from google.container_v1.types.cluster_service import UsableSubnetwork
+    from google.container_v1.types.cluster_service import UsableSubnetworkSecondaryRange
+    from google.container_v1.types.cluster_service import VerticalPodAutoscaling
+    from google.container_v1.types.cluster_service import WorkloadMetadataConfig
+
+# The module defining each public name. Names are imported on first
+# access, so that importing this package does not load the client, the
+# gRPC transport or the message types until they are used.
+_LAZY_IMPORTS = {
+    'ClusterManagerAsyncClient': 'google.container_v1.services.cluster_manager.async_client',
+    'ClusterManagerClient': 'google.container_v1.services.cluster_manager.client',
+    'AcceleratorConfig': 'google.container_v1.types.cluster_service',
+    'AddonsConfig': 'google.container_v1.types.cluster_service',
+    'AuthenticatorGroupsConfig': 'google.container_v1.types.cluster_service',
+    'AutoUpgradeOptions': 'google.container_v1.types.cluster_service',
+    'AutoprovisioningNodePoolDefaults': 'google.container_v1.types.cluster_service',
+    'BinaryAuthorization': 'google.container_v1.types.cluster_service',
+    'CancelOperationRequest': 'google.container_v1.types.cluster_service',
+    'ClientCertificateConfig': 'google.container_v1.types.cluster_service',
+    'CloudRunConfig': 'google.container_v1.types.cluster_service',
+    'Cluster': 'google.container_v1.types.cluster_service',
+    'ClusterAutoscaling': 'google.container_v1.types.cluster_service',
+    'ClusterUpdate': 'google.container_v1.types.cluster_service',
+    'CompleteIPRotationRequest': 'google.container_v1.types.cluster_service',
+    'CreateClusterRequest': 'google.container_v1.types.cluster_service',
+    'CreateNodePoolRequest': 'google.container_v1.types.cluster_service',
+    'DailyMaintenanceWindow': 'google.container_v1.types.cluster_service',
+    'DatabaseEncryption': 'google.container_v1.types.cluster_service',
+    'DeleteClusterRequest': 'google.container_v1.types.cluster_service',
+    'DeleteNodePoolRequest': 'google.container_v1.types.cluster_service',
+    'GetClusterRequest': 'google.container_v1.types.cluster_service',
+    'GetNodePoolRequest': 'google.container_v1.types.cluster_service',
+    'GetOperationRequest': 'google.container_v1.types.cluster_service',
+    'GetServerConfigRequest': 'google.container_v1.types.cluster_service',
+    'HorizontalPodAutoscaling': 'google.container_v1.types.cluster_service',
+    'HttpLoadBalancing': 'google.container_v1.types.cluster_service',
+    'IPAllocationPolicy': 'google.container_v1.types.cluster_service',
+    'IntraNodeVisibilityConfig': 'google.container_v1.types.cluster_service',
+    'IstioConfig': 'google.container_v1.types.cluster_service',
+    'KubernetesDashboard': 'google.container_v1.types.cluster_service',
+    'LegacyAbac': 'google.container_v1.types.cluster_service',
+    'ListClustersRequest': 'google.container_v1.types.cluster_service',
+    'ListClustersResponse': 'google.container_v1.types.cluster_service',
+    'ListLocationsRequest': 'google.container_v1.types.cluster_service',
+    'ListLocationsResponse': 'google.container_v1.types.cluster_service',
+    'ListNodePoolsRequest': 'google.container_v1.types.cluster_service',
+    'ListNodePoolsResponse': 'google.container_v1.types.cluster_service',
+    'ListOperationsRequest': 'google.container_v1.types.cluster_service',
+    'ListOperationsResponse': 'google.container_v1.types.cluster_service',
+    'ListUsableSubnetworksRequest': 'google.container_v1.types.cluster_service',
+    'ListUsableSubnetworksResponse': 'google.container_v1.types.cluster_service',
+    'Location': 'google.container_v1.types.cluster_service',
+    'MaintenancePolicy': 'google.container_v1.types.cluster_service',
+    'MaintenanceWindow': 'google.container_v1.types.cluster_service',
+    'MasterAuth': 'google.container_v1.types.cluster_service',
+    'MasterAuthorizedNetworksConfig': 'google.container_v1.types.cluster_service',
+    'MaxPodsConstraint': 'google.container_v1.types.cluster_service',
+    'NetworkConfig': 'google.container_v1.types.cluster_service',
+    'NetworkPolicy': 'google.container_v1.types.cluster_service',
+    'NetworkPolicyConfig': 'google.container_v1.types.cluster_service',
+    'NodeConfig': 'google.container_v1.types.cluster_service',
+    'NodeManagement': 'google.container_v1.types.cluster_service',
+    'NodePool': 'google.container_v1.types.cluster_service',
+    'NodePoolAutoscaling': 'google.container_v1.types.cluster_service',
+    'NodeTaint': 'google.container_v1.types.cluster_service',
+    'Operation': 'google.container_v1.types.cluster_service',
+    'OperationProgress': 'google.container_v1.types.cluster_service',
+    'PodSecurityPolicyConfig': 'google.container_v1.types.cluster_service',
+    'PrivateClusterConfig': 'google.container_v1.types.cluster_service',
+    'RecurringTimeWindow': 'google.container_v1.types.cluster_service',
+    'ResourceLimit': 'google.container_v1.types.cluster_service',
+    'ResourceUsageExportConfig': 'google.container_v1.types.cluster_service',
+    'RollbackNodePoolUpgradeRequest': 'google.container_v1.types.cluster_service',
+    'ServerConfig': 'google.container_v1.types.cluster_service',
+    'SetAddonsConfigRequest': 'google.container_v1.types.cluster_service',
+    'SetLabelsRequest': 'google.container_v1.types.cluster_service',
+    'SetLegacyAbacRequest': 'google.container_v1.types.cluster_service',
+    'SetLocationsRequest': 'google.container_v1.types.cluster_service',
+    'SetLoggingServiceRequest': 'google.container_v1.types.cluster_service',
+    'SetMaintenancePolicyRequest': 'google.container_v1.types.cluster_service',
+    'SetMasterAuthRequest': 'google.container_v1.types.cluster_service',
+    'SetMonitoringServiceRequest': 'google.container_v1.types.cluster_service',
+    'SetNetworkPolicyRequest': 'google.container_v1.types.cluster_service',
+    'SetNodePoolAutoscalingRequest': 'google.container_v1.types.cluster_service',
+    'SetNodePoolManagementRequest': 'google.container_v1.types.cluster_service',
+    'SetNodePoolSizeRequest': 'google.container_v1.types.cluster_service',
+    'ShieldedInstanceConfig': 'google.container_v1.types.cluster_service',
+    'StartIPRotationRequest': 'google.container_v1.types.cluster_service',
+    'StatusCondition': 'google.container_v1.types.cluster_service',
+    'TimeWindow': 'google.container_v1.types.cluster_service',
+    'UpdateClusterRequest': 'google.container_v1.types.cluster_service',
+    'UpdateMasterRequest': 'google.container_v1.types.cluster_service',
+    'UpdateNodePoolRequest': 'google.container_v1.types.cluster_service',
+    'UsableSubnetwork': 'google.container_v1.types.cluster_service',
+    'UsableSubnetworkSecondaryRange': 'google.container_v1.types.cluster_service',
+    'VerticalPodAutoscaling': 'google.container_v1.types.cluster_service',
+    'WorkloadMetadataConfig': 'google.container_v1.types.cluster_service',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        # Subpackages such as ``types`` are bound when first imported.
+        try:
+            return importlib.import_module('.' + name, __name__)
+        except ImportError as exc:
+            if exc.name != __name__ + '.' + name:
+                raise
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-from google.container_v1.services.cluster_manager.client import ClusterManagerClient
-from google.container_v1.types.cluster_service import AcceleratorConfig
-from google.container_v1.types.cluster_service import AddonsConfig
-from google.container_v1.types.cluster_service import AuthenticatorGroupsConfig
-from google.container_v1.types.cluster_service import AutoUpgradeOptions
-from google.container_v1.types.cluster_service import AutoprovisioningNodePoolDefaults
-from google.container_v1.types.cluster_service import BinaryAuthorization
-from google.container_v1.types.cluster_service import CancelOperationRequest
-from google.container_v1.types.cluster_service import ClientCertificateConfig
-from google.container_v1.types.cluster_service import CloudRunConfig
-from google.container_v1.types.cluster_service import Cluster
-from google.container_v1.types.cluster_service import ClusterAutoscaling
-from google.container_v1.types.cluster_service import ClusterUpdate
-from google.container_v1.types.cluster_service import CompleteIPRotationRequest
-from google.container_v1.types.cluster_service import CreateClusterRequest
-from google.container_v1.types.cluster_service import CreateNodePoolRequest
-from google.container_v1.types.cluster_service import DailyMaintenanceWindow
-from google.container_v1.types.cluster_service import DatabaseEncryption
-from google.container_v1.types.cluster_service import DeleteClusterRequest
-from google.container_v1.types.cluster_service import DeleteNodePoolRequest
-from google.container_v1.types.cluster_service import GetClusterRequest
-from google.container_v1.types.cluster_service import GetNodePoolRequest
-from google.container_v1.types.cluster_service import GetOperationRequest
-from google.container_v1.types.cluster_service import GetServerConfigRequest
-from google.container_v1.types.cluster_service import HorizontalPodAutoscaling
-from google.container_v1.types.cluster_service import HttpLoadBalancing
-from google.container_v1.types.cluster_service import IPAllocationPolicy
-from google.container_v1.types.cluster_service import IntraNodeVisibilityConfig
-from google.container_v1.types.cluster_service import IstioConfig
-from google.container_v1.types.cluster_service import KubernetesDashboard
-from google.container_v1.types.cluster_service import LegacyAbac
-from google.container_v1.types.cluster_service import ListClustersRequest
-from google.container_v1.types.cluster_service import ListClustersResponse
-from google.container_v1.types.cluster_service import ListLocationsRequest
-from google.container_v1.types.cluster_service import ListLocationsResponse
-from google.container_v1.types.cluster_service import ListNodePoolsRequest
-from google.container_v1.types.cluster_service import ListNodePoolsResponse
-from google.container_v1.types.cluster_service import ListOperationsRequest
-from google.container_v1.types.cluster_service import ListOperationsResponse
-from google.container_v1.types.cluster_service import ListUsableSubnetworksRequest
-from google.container_v1.types.cluster_service import ListUsableSubnetworksResponse
-from google.container_v1.types.cluster_service import Location
-from google.container_v1.types.cluster_service import MaintenancePolicy
-from google.container_v1.types.cluster_service import MaintenanceWindow
-from google.container_v1.types.cluster_service import MasterAuth
-from google.container_v1.types.cluster_service import MasterAuthorizedNetworksConfig
-from google.container_v1.types.cluster_service import MaxPodsConstraint
-from google.container_v1.types.cluster_service import NetworkConfig
-from google.container_v1.types.cluster_service import NetworkPolicy
-from google.container_v1.types.cluster_service import NetworkPolicyConfig
-from google.container_v1.types.cluster_service import NodeConfig
-from google.container_v1.types.cluster_service import NodeManagement
-from google.container_v1.types.cluster_service import NodePool
-from google.container_v1.types.cluster_service import NodePoolAutoscaling
-from google.container_v1.types.cluster_service import NodeTaint
-from google.container_v1.types.cluster_service import Operation
-from google.container_v1.types.cluster_service import OperationProgress
-from google.container_v1.types.cluster_service import PodSecurityPolicyConfig
-from google.container_v1.types.cluster_service import PrivateClusterConfig
-from google.container_v1.types.cluster_service import RecurringTimeWindow
-from google.container_v1.types.cluster_service import ResourceLimit
-from google.container_v1.types.cluster_service import ResourceUsageExportConfig
-from google.container_v1.types.cluster_service import RollbackNodePoolUpgradeRequest
-from google.container_v1.types.cluster_service import ServerConfig
-from google.container_v1.types.cluster_service import SetAddonsConfigRequest
-from google.container_v1.types.cluster_service import SetLabelsRequest
-from google.container_v1.types.cluster_service import SetLegacyAbacRequest
-from google.container_v1.types.cluster_service import SetLocationsRequest
-from google.container_v1.types.cluster_service import SetLoggingServiceRequest
-from google.container_v1.types.cluster_service import SetMaintenancePolicyRequest
-from google.container_v1.types.cluster_service import SetMasterAuthRequest
-from google.container_v1.types.cluster_service import SetMonitoringServiceRequest
-from google.container_v1.types.cluster_service import SetNetworkPolicyRequest
-from google.container_v1.types.cluster_service import SetNodePoolAutoscalingRequest
-from google.container_v1.types.cluster_service import SetNodePoolManagementRequest
-from google.container_v1.types.cluster_service import SetNodePoolSizeRequest
-from google.container_v1.types.cluster_service import ShieldedInstanceConfig
-from google.container_v1.types.cluster_service import StartIPRotationRequest
-from google.container_v1.types.cluster_service import StatusCondition
-from google.container_v1.types.cluster_service import TimeWindow
-from google.container_v1.types.cluster_service import UpdateClusterRequest
-from google.container_v1.types.cluster_service import UpdateMasterRequest
-from google.container_v1.types.cluster_service import UpdateNodePoolRequest
-from google.container_v1.types.cluster_service import UsableSubnetwork
-from google.container_v1.types.cluster_service import UsableSubnetworkSecondaryRange
-from google.container_v1.types.cluster_service import VerticalPodAutoscaling
-from google.container_v1.types.cluster_service import WorkloadMetadataConfig
 
 __all__ = (
     'AcceleratorConfig',
@@ -116,6 +235,7 @@ __all__ = (
     'CloudRunConfig',
     'Cluster',
     'ClusterAutoscaling',
+    'ClusterManagerAsyncClient',
     'ClusterManagerClient',
     'ClusterUpdate',
     'CompleteIPRotationRequest',
@@ -193,3 +313,10 @@ __all__ = (
     'VerticalPodAutoscaling',
     'WorkloadMetadataConfig',
 )
+
+
+# Module __getattr__ (PEP 562) needs Python 3.7; import eagerly before.
+if sys.version_info < (3, 7):  # pragma: NO COVER
+    for _name in _LAZY_IMPORTS:
+        __getattr__(_name)
+    del _name
@@ -15,94 +15,212 @@
 # limitations under the License.
 #
 
+import importlib
+import sys
+import typing
 
-from .services.cluster_manager import ClusterManagerClient
-from .types.cluster_service import AcceleratorConfig
-from .types.cluster_service import AddonsConfig
-from .types.cluster_service import AuthenticatorGroupsConfig
-from .types.cluster_service import AutoUpgradeOptions
-from .types.cluster_service import AutoprovisioningNodePoolDefaults
-from .types.cluster_service import BinaryAuthorization
-from .types.cluster_service import CancelOperationRequest
-from .types.cluster_service import ClientCertificateConfig
-from .types.cluster_service import CloudRunConfig
-from .types.cluster_service import Cluster
-from .types.cluster_service import ClusterAutoscaling
-from .types.cluster_service import ClusterUpdate
-from .types.cluster_service import CompleteIPRotationRequest
-from .types.cluster_service import CreateClusterRequest
-from .types.cluster_service import CreateNodePoolRequest
-from .types.cluster_service import DailyMaintenanceWindow
-from .types.cluster_service import DatabaseEncryption
-from .types.cluster_service import DeleteClusterRequest
-from .types.cluster_service import DeleteNodePoolRequest
-from .types.cluster_service import GetClusterRequest
-from .types.cluster_service import GetNodePoolRequest
-from .types.cluster_service import GetOperationRequest
-from .types.cluster_service import GetServerConfigRequest
-from .types.cluster_service import HorizontalPodAutoscaling
-from .types.cluster_service import HttpLoadBalancing
-from .types.cluster_service import IPAllocationPolicy
-from .types.cluster_service import IntraNodeVisibilityConfig
-from .types.cluster_service import IstioConfig
-from .types.cluster_service import KubernetesDashboard
-from .types.cluster_service import LegacyAbac
-from .types.cluster_service import ListClustersRequest
-from .types.cluster_service import ListClustersResponse
-from .types.cluster_service import ListLocationsRequest
-from .types.cluster_service import ListLocationsResponse
-from .types.cluster_service import ListNodePoolsRequest
-from .types.cluster_service import ListNodePoolsResponse
-from .types.cluster_service import ListOperationsRequest
-from .types.cluster_service import ListOperationsResponse
-from .types.cluster_service import ListUsableSubnetworksRequest
-from .types.cluster_service import ListUsableSubnetworksResponse
-from .types.cluster_service import Location
-from .types.cluster_service import MaintenancePolicy
-from .types.cluster_service import MaintenanceWindow
-from .types.cluster_service import MasterAuth
-from .types.cluster_service import MasterAuthorizedNetworksConfig
-from .types.cluster_service import MaxPodsConstraint
-from .types.cluster_service import NetworkConfig
-from .types.cluster_service import NetworkPolicy
-from .types.cluster_service import NetworkPolicyConfig
-from .types.cluster_service import NodeConfig
-from .types.cluster_service import NodeManagement
-from .types.cluster_service import NodePool
-from .types.cluster_service import NodePoolAutoscaling
-from .types.cluster_service import NodeTaint
-from .types.cluster_service import Operation
-from .types.cluster_service import OperationProgress
-from .types.cluster_service import PodSecurityPolicyConfig
-from .types.cluster_service import PrivateClusterConfig
-from .types.cluster_service import RecurringTimeWindow
-from .types.cluster_service import ResourceLimit
-from .types.cluster_service import ResourceUsageExportConfig
-from .types.cluster_service import RollbackNodePoolUpgradeRequest
-from .types.cluster_service import ServerConfig
-from .types.cluster_service import SetAddonsConfigRequest
-from .types.cluster_service import SetLabelsRequest
-from .types.cluster_service import SetLegacyAbacRequest
-from .types.cluster_service import SetLocationsRequest
-from .types.cluster_service import SetLoggingServiceRequest
-from .types.cluster_service import SetMaintenancePolicyRequest
-from .types.cluster_service import SetMasterAuthRequest
-from .types.cluster_service import SetMonitoringServiceRequest
-from .types.cluster_service import SetNetworkPolicyRequest
-from .types.cluster_service import SetNodePoolAutoscalingRequest
-from .types.cluster_service import SetNodePoolManagementRequest
-from .types.cluster_service import SetNodePoolSizeRequest
-from .types.cluster_service import ShieldedInstanceConfig
-from .types.cluster_service import StartIPRotationRequest
-from .types.cluster_service import StatusCondition
-from .types.cluster_service import TimeWindow
-from .types.cluster_service import UpdateClusterRequest
-from .types.cluster_service import UpdateMasterRequest
-from .types.cluster_service import UpdateNodePoolRequest
-from .types.cluster_service import UsableSubnetwork
-from .types.cluster_service import UsableSubnetworkSecondaryRange
-from .types.cluster_service import VerticalPodAutoscaling
-from .types.cluster_service import WorkloadMetadataConfig
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    from .services.cluster_manager import ClusterManagerAsyncClient
+    from .services.cluster_manager import ClusterManagerClient
+    from .types.cluster_service import AcceleratorConfig
+    from .types.cluster_service import AddonsConfig
+    from .types.cluster_service import AuthenticatorGroupsConfig
+    from .types.cluster_service import AutoUpgradeOptions
+    from .types.cluster_service import AutoprovisioningNodePoolDefaults
+    from .types.cluster_service import BinaryAuthorization
+    from .types.cluster_service import CancelOperationRequest
+    from .types.cluster_service import ClientCertificateConfig
+    from .types.cluster_service import CloudRunConfig
+    from .types.cluster_service import Cluster
+    from .types.cluster_service import ClusterAutoscaling
+    from .types.cluster_service import ClusterUpdate
+    from .types.cluster_service import CompleteIPRotationRequest
+    from .types.cluster_service import CreateClusterRequest
+    from .types.cluster_service import CreateNodePoolRequest
+    from .types.cluster_service import DailyMaintenanceWindow
+    from .types.cluster_service import DatabaseEncryption
+    from .types.cluster_service import DeleteClusterRequest
+    from .types.cluster_service import DeleteNodePoolRequest
+    from .types.cluster_service import GetClusterRequest
+    from .types.cluster_service import GetNodePoolRequest
+    from .types.cluster_service import GetOperationRequest
+    from .types.cluster_service import GetServerConfigRequest
+    from .types.cluster_service import HorizontalPodAutoscaling
+    from .types.cluster_service import HttpLoadBalancing
+    from .types.cluster_service import IPAllocationPolicy
+    from .types.cluster_service import IntraNodeVisibilityConfig
+    from .types.cluster_service import IstioConfig
+    from .types.cluster_service import KubernetesDashboard
+    from .types.cluster_service import LegacyAbac
+    from .types.cluster_service import ListClustersRequest
+    from .types.cluster_service import ListClustersResponse
+    from .types.cluster_service import ListLocationsRequest
+    from .types.cluster_service import ListLocationsResponse
+    from .types.cluster_service import ListNodePoolsRequest
+    from .types.cluster_service import ListNodePoolsResponse
+    from .types.cluster_service import ListOperationsRequest
+    from .types.cluster_service import ListOperationsResponse
+    from .types.cluster_service import ListUsableSubnetworksRequest
+    from .types.cluster_service import ListUsableSubnetworksResponse
+    from .types.cluster_service import Location
+    from .types.cluster_service import MaintenancePolicy
+    from .types.cluster_service import MaintenanceWindow
+    from .types.cluster_service import MasterAuth
+    from .types.cluster_service import MasterAuthorizedNetworksConfig
+    from .types.cluster_service import MaxPodsConstraint
+    from .types.cluster_service import NetworkConfig
+    from .types.cluster_service import NetworkPolicy
+    from .types.cluster_service import NetworkPolicyConfig
+    from .types.cluster_service import NodeConfig
+    from .types.cluster_service import NodeManagement
+    from .types.cluster_service import NodePool
+    from .types.cluster_service import NodePoolAutoscaling
+    from .types.cluster_service import NodeTaint
+    from .types.cluster_service import Operation
+    from .types.cluster_service import OperationProgress
+    from .types.cluster_service import PodSecurityPolicyConfig
+    from .types.cluster_service import PrivateClusterConfig
+    from .types.cluster_service import RecurringTimeWindow
+    from .types.cluster_service import ResourceLimit
+    from .types.cluster_service import ResourceUsageExportConfig
+    from .types.cluster_service import RollbackNodePoolUpgradeRequest
+    from .types.cluster_service import ServerConfig
+    from .types.cluster_service import SetAddonsConfigRequest
+    from .types.cluster_service import SetLabelsRequest
+    from .types.cluster_service import SetLegacyAbacRequest
+    from .types.cluster_service import SetLocationsRequest
+    from .types.cluster_service import SetLoggingServiceRequest
+    from .types.cluster_service import SetMaintenancePolicyRequest
+    from .types.cluster_service import SetMasterAuthRequest
+    from .types.cluster_service import SetMonitoringServiceRequest
+    from .types.cluster_service import SetNetworkPolicyRequest
+    from .types.cluster_service import SetNodePoolAutoscalingRequest
+    from .types.cluster_service import SetNodePoolManagementRequest
+    from .types.cluster_service import SetNodePoolSizeRequest
+    from .types.cluster_service import ShieldedInstanceConfig
+    from .types.cluster_service import StartIPRotationRequest
+    from .types.cluster_service import StatusCondition
+    from .types.cluster_service import TimeWindow
+    from .types.cluster_service import UpdateClusterRequest
+    from .types.cluster_service import UpdateMasterRequest
+    from .types.cluster_service import UpdateNodePoolRequest
+    from .types.cluster_service import UsableSubnetwork
+    from .types.cluster_service import UsableSubnetworkSecondaryRange
+    from .types.cluster_service import VerticalPodAutoscaling
+    from .types.cluster_service import WorkloadMetadataConfig
+
+# The module defining each public name. Names are imported on first
+# access, so that importing this package does not load the client, the
+# gRPC transport or the message types until they are used.
+_LAZY_IMPORTS = {
+    'ClusterManagerAsyncClient': '.services.cluster_manager',
+    'ClusterManagerClient': '.services.cluster_manager',
+    'AcceleratorConfig': '.types.cluster_service',
+    'AddonsConfig': '.types.cluster_service',
+    'AuthenticatorGroupsConfig': '.types.cluster_service',
+    'AutoUpgradeOptions': '.types.cluster_service',
+    'AutoprovisioningNodePoolDefaults': '.types.cluster_service',
+    'BinaryAuthorization': '.types.cluster_service',
+    'CancelOperationRequest': '.types.cluster_service',
+    'ClientCertificateConfig': '.types.cluster_service',
+    'CloudRunConfig': '.types.cluster_service',
+    'Cluster': '.types.cluster_service',
+    'ClusterAutoscaling': '.types.cluster_service',
+    'ClusterUpdate': '.types.cluster_service',
+    'CompleteIPRotationRequest': '.types.cluster_service',
+    'CreateClusterRequest': '.types.cluster_service',
+    'CreateNodePoolRequest': '.types.cluster_service',
+    'DailyMaintenanceWindow': '.types.cluster_service',
+    'DatabaseEncryption': '.types.cluster_service',
+    'DeleteClusterRequest': '.types.cluster_service',
+    'DeleteNodePoolRequest': '.types.cluster_service',
+    'GetClusterRequest': '.types.cluster_service',
+    'GetNodePoolRequest': '.types.cluster_service',
+    'GetOperationRequest': '.types.cluster_service',
+    'GetServerConfigRequest': '.types.cluster_service',
+    'HorizontalPodAutoscaling': '.types.cluster_service',
+    'HttpLoadBalancing': '.types.cluster_service',
+    'IPAllocationPolicy': '.types.cluster_service',
+    'IntraNodeVisibilityConfig': '.types.cluster_service',
+    'IstioConfig': '.types.cluster_service',
+    'KubernetesDashboard': '.types.cluster_service',
+    'LegacyAbac': '.types.cluster_service',
+    'ListClustersRequest': '.types.cluster_service',
+    'ListClustersResponse': '.types.cluster_service',
+    'ListLocationsRequest': '.types.cluster_service',
+    'ListLocationsResponse': '.types.cluster_service',
+    'ListNodePoolsRequest': '.types.cluster_service',
+    'ListNodePoolsResponse': '.types.cluster_service',
+    'ListOperationsRequest': '.types.cluster_service',
+    'ListOperationsResponse': '.types.cluster_service',
+    'ListUsableSubnetworksRequest': '.types.cluster_service',
+    'ListUsableSubnetworksResponse': '.types.cluster_service',
+    'Location': '.types.cluster_service',
+    'MaintenancePolicy': '.types.cluster_service',
+    'MaintenanceWindow': '.types.cluster_service',
+    'MasterAuth': '.types.cluster_service',
+    'MasterAuthorizedNetworksConfig': '.types.cluster_service',
+    'MaxPodsConstraint': '.types.cluster_service',
+    'NetworkConfig': '.types.cluster_service',
+    'NetworkPolicy': '.types.cluster_service',
+    'NetworkPolicyConfig': '.types.cluster_service',
+    'NodeConfig': '.types.cluster_service',
+    'NodeManagement': '.types.cluster_service',
+    'NodePool': '.types.cluster_service',
+    'NodePoolAutoscaling': '.types.cluster_service',
+    'NodeTaint': '.types.cluster_service',
+    'Operation': '.types.cluster_service',
+    'OperationProgress': '.types.cluster_service',
+    'PodSecurityPolicyConfig': '.types.cluster_service',
+    'PrivateClusterConfig': '.types.cluster_service',
+    'RecurringTimeWindow': '.types.cluster_service',
+    'ResourceLimit': '.types.cluster_service',
+    'ResourceUsageExportConfig': '.types.cluster_service',
+    'RollbackNodePoolUpgradeRequest': '.types.cluster_service',
+    'ServerConfig': '.types.cluster_service',
+    'SetAddonsConfigRequest': '.types.cluster_service',
+    'SetLabelsRequest': '.types.cluster_service',
+    'SetLegacyAbacRequest': '.types.cluster_service',
+    'SetLocationsRequest': '.types.cluster_service',
+    'SetLoggingServiceRequest': '.types.cluster_service',
+    'SetMaintenancePolicyRequest': '.types.cluster_service',
+    'SetMasterAuthRequest': '.types.cluster_service',
+    'SetMonitoringServiceRequest': '.types.cluster_service',
+    'SetNetworkPolicyRequest': '.types.cluster_service',
+    'SetNodePoolAutoscalingRequest': '.types.cluster_service',
+    'SetNodePoolManagementRequest': '.types.cluster_service',
+    'SetNodePoolSizeRequest': '.types.cluster_service',
+    'ShieldedInstanceConfig': '.types.cluster_service',
+    'StartIPRotationRequest': '.types.cluster_service',
+    'StatusCondition': '.types.cluster_service',
+    'TimeWindow': '.types.cluster_service',
+    'UpdateClusterRequest': '.types.cluster_service',
+    'UpdateMasterRequest': '.types.cluster_service',
+    'UpdateNodePoolRequest': '.types.cluster_service',
+    'UsableSubnetwork': '.types.cluster_service',
+    'UsableSubnetworkSecondaryRange': '.types.cluster_service',
+    'VerticalPodAutoscaling': '.types.cluster_service',
+    'WorkloadMetadataConfig': '.types.cluster_service',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        # Subpackages such as ``types`` are bound when first imported.
+        try:
+            return importlib.import_module('.' + name, __name__)
+        except ImportError as exc:
+            if exc.name != __name__ + '.' + name:
+                raise
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 __all__ = (
@@ -117,6 +235,7 @@ __all__ = (
     'CloudRunConfig',
     'Cluster',
     'ClusterAutoscaling',
+    'ClusterManagerAsyncClient',
     'ClusterManagerClient',
     'ClusterUpdate',
     'CompleteIPRotationRequest',
@@ -193,5 +312,13 @@ __all__ = (
     'UsableSubnetworkSecondaryRange',
     'VerticalPodAutoscaling',
     'WorkloadMetadataConfig',
-'ClusterManagerClient',
+    'ClusterManagerAsyncClient',
+    'ClusterManagerClient',
 )
+
+
+# Module __getattr__ (PEP 562) needs Python 3.7; import eagerly before.
+if sys.version_info < (3, 7):  # pragma: NO COVER
+    for _name in _LAZY_IMPORTS:
+        __getattr__(_name)
+    del _name
@@ -16,7 +16,9 @@
 #
 
 from .client import ClusterManagerClient
+from .async_client import ClusterManagerAsyncClient
 
 __all__ = (
     'ClusterManagerClient',
+    'ClusterManagerAsyncClient',
 )
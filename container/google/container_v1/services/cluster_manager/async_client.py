@@ -0,0 +1,3033 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from collections import OrderedDict
+import functools
+import re
+from typing import Dict, Sequence, Tuple, Type, Union
+
+import google.api_core.client_options as ClientOptions # type: ignore
+from google.api_core import exceptions                 # type: ignore
+from google.api_core import gapic_v1                   # type: ignore
+from google.api_core import retry as retries           # type: ignore
+from google.auth import credentials                    # type: ignore
+from google.oauth2 import service_account              # type: ignore
+
+from google.container_v1.services.cluster_manager import pagers
+from google.container_v1.types import cluster_service
+
+from .transports.base import ClusterManagerTransport
+from .transports.grpc_asyncio import ClusterManagerGrpcAsyncIOTransport
+from .transports.interceptors import Interceptor
+from .client import ClusterManagerClient
+from .client import _routing_metadata
+
+
+class ClusterManagerAsyncClient:
+    """Google Kubernetes Engine Cluster Manager v1"""
+
+    _client: ClusterManagerClient
+
+    DEFAULT_ENDPOINT = ClusterManagerClient.DEFAULT_ENDPOINT
+    DEFAULT_MTLS_ENDPOINT = ClusterManagerClient.DEFAULT_MTLS_ENDPOINT
+
+    from_service_account_file = classmethod(ClusterManagerClient.from_service_account_file.__func__)  # type: ignore
+    from_service_account_json = from_service_account_file
+
+    get_transport_class = functools.partial(type(ClusterManagerClient).get_transport_class,
+        type(ClusterManagerClient))
+
+    def __init__(self, *,
+            credentials: credentials.Credentials = None,
+            transport: Union[str, ClusterManagerTransport] = 'grpc_asyncio',
+            client_options: ClientOptions = None,
+            interceptors: Sequence[Interceptor] = (),
+            ) -> None:
+        """Instantiate the cluster manager client.
+
+        Args:
+            credentials (Optional[google.auth.credentials.Credentials]): The
+                authorization credentials to attach to requests. These
+                credentials identify the application to the service; if none
+                are specified, the client will attempt to ascertain the
+                credentials from the environment.
+            transport (Union[str, ~.ClusterManagerTransport]): The
+                transport to use. Defaults to the gRPC AsyncIO transport.
+            client_options (ClientOptions): Custom options for the client.
+                (1) The ``api_endpoint`` property can be used to override the
+                default endpoint provided by the client.
+                (2) If ``transport`` argument is None, ``client_options`` can be
+                used to create a mutual TLS transport. If ``client_cert_source``
+                is provided, mutual TLS transport will be created with the given
+                ``api_endpoint`` or the default mTLS endpoint, and the client
+                SSL credentials obtained from ``client_cert_source``.
+                (3) The ``method_configs`` property, or dictionary key, can
+                be used to override the default retry and timeout of each
+                RPC method. Retries must be
+                :class:`google.api_core.retry_async.AsyncRetry` instances.
+                (4) The ``metrics`` property, or dictionary key, can be
+                set to ``True`` or to a :class:`~.metrics.TransportMetrics`
+                to record the calls, status codes, calls in flight and
+                latencies of each method, available from the transport's
+                ``metrics``.
+                (5) The ``interceptors`` property, or dictionary key, can
+                hold more interceptors, which run inside those given as
+                the ``interceptors`` argument.
+                (6) The ``refresh_credentials`` property, or dictionary
+                key, can be set to ``True`` or to a number of seconds to
+                refresh the access token in a background thread that
+                long before it expires, by default
+                :data:`~.refresh.DEFAULT_MARGIN`, rather than on a call.
+                Clients built from the same credentials share the token.
+            interceptors (Sequence[~.interceptors.Interceptor]): The
+                interceptors every call of the client passes through, in
+                order, the first one outermost.
+
+        Raises:
+            google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
+                creation failed for any reason.
+            ValueError: If ``method_configs`` names an unknown RPC method or
+                setting.
+        """
+
+        self._client = ClusterManagerClient(
+            credentials=credentials,
+            transport=transport,
+            client_options=client_options,
+            interceptors=interceptors,
+        )
+
+    async def list_clusters(self,
+            request: cluster_service.ListClustersRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            parent: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.ListClustersResponse:
+        r"""Lists all clusters owned by a project in either the
+        specified zone or all zones.
+
+        Args:
+            request (:class:`~.cluster_service.ListClustersRequest`):
+                The request object. ListClustersRequest lists clusters.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://support.google.com/cloud/answer/6158840>`__.
+                This field has been deprecated and replaced by the
+                parent field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides, or "-" for all zones. This
+                field has been deprecated and replaced by the parent
+                field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            parent (:class:`str`):
+                The parent (project and location) where the clusters
+                will be listed. Specified in the format
+                ``projects/*/locations/*``. Location "-" matches all
+                zones and all regions.
+                This corresponds to the ``parent`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.ListClustersResponse:
+                ListClustersResponse is the result of
+                ListClustersRequest.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, parent]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.ListClustersRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if parent is not None:
+            request.parent = parent
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['list_clusters']
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            _routing_metadata('parent', request.parent),
+        )
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def get_cluster(self,
+            request: cluster_service.GetClusterRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            cluster_id: str = None,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Cluster:
+        r"""Gets the details of a specific cluster.
+
+        Args:
+            request (:class:`~.cluster_service.GetClusterRequest`):
+                The request object. GetClusterRequest gets the settings
+                of a cluster.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://support.google.com/cloud/answer/6158840>`__.
+                This field has been deprecated and replaced by the name
+                field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides. This field has been
+                deprecated and replaced by the name field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            cluster_id (:class:`str`):
+                Deprecated. The name of the cluster
+                to retrieve. This field has been
+                deprecated and replaced by the name
+                field.
+                This corresponds to the ``cluster_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            name (:class:`str`):
+                The name (project, location, cluster) of the cluster to
+                retrieve. Specified in the format
+                ``projects/*/locations/*/clusters/*``.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Cluster:
+                A Google Kubernetes Engine cluster.
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, cluster_id, name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.GetClusterRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if cluster_id is not None:
+            request.cluster_id = cluster_id
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['get_cluster']
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            _routing_metadata('name', request.name),
+        )
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def create_cluster(self,
+            request: cluster_service.CreateClusterRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            cluster: cluster_service.Cluster = None,
+            parent: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Creates a cluster, consisting of the specified number and type
+        of Google Compute Engine instances.
+
+        By default, the cluster is created in the project's `default
+        network <https://cloud.google.com/compute/docs/networks-and-firewalls#networks>`__.
+
+        One firewall is added for the cluster. After cluster creation,
+        the Kubelet creates routes for each node to allow the containers
+        on that node to communicate with all other instances in the
+        cluster.
+
+        Finally, an entry is added to the project's global metadata
+        indicating which CIDR range the cluster is using.
+
+        Args:
+            request (:class:`~.cluster_service.CreateClusterRequest`):
+                The request object. CreateClusterRequest creates a
+                cluster.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://support.google.com/cloud/answer/6158840>`__.
+                This field has been deprecated and replaced by the
+                parent field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides. This field has been
+                deprecated and replaced by the parent field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            cluster (:class:`~.cluster_service.Cluster`):
+                Required. A `cluster
+                resource <https://cloud.google.com/container-engine/reference/rest/v1/projects.zones.clusters>`__
+                This corresponds to the ``cluster`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            parent (:class:`str`):
+                The parent (project and location) where the cluster will
+                be created. Specified in the format
+                ``projects/*/locations/*``.
+                This corresponds to the ``parent`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, cluster, parent]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.CreateClusterRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if cluster is not None:
+            request.cluster = cluster
+        if parent is not None:
+            request.parent = parent
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['create_cluster']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def update_cluster(self,
+            request: cluster_service.UpdateClusterRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            cluster_id: str = None,
+            update: cluster_service.ClusterUpdate = None,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Updates the settings of a specific cluster.
+
+        Args:
+            request (:class:`~.cluster_service.UpdateClusterRequest`):
+                The request object. UpdateClusterRequest updates the
+                settings of a cluster.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://support.google.com/cloud/answer/6158840>`__.
+                This field has been deprecated and replaced by the name
+                field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides. This field has been
+                deprecated and replaced by the name field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            cluster_id (:class:`str`):
+                Deprecated. The name of the cluster
+                to upgrade. This field has been
+                deprecated and replaced by the name
+                field.
+                This corresponds to the ``cluster_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            update (:class:`~.cluster_service.ClusterUpdate`):
+                Required. A description of the
+                update.
+                This corresponds to the ``update`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            name (:class:`str`):
+                The name (project, location, cluster) of the cluster to
+                update. Specified in the format
+                ``projects/*/locations/*/clusters/*``.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, cluster_id, update, name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.UpdateClusterRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if cluster_id is not None:
+            request.cluster_id = cluster_id
+        if update is not None:
+            request.update = update
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['update_cluster']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def update_node_pool(self,
+            request: cluster_service.UpdateNodePoolRequest = None,
+            *,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Updates the version and/or image type for the
+        specified node pool.
+
+        Args:
+            request (:class:`~.cluster_service.UpdateNodePoolRequest`):
+                The request object. UpdateNodePoolRequests update a node
+                pool's image and/or version.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+
+        request = cluster_service.UpdateNodePoolRequest(request)
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['update_node_pool']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def set_node_pool_autoscaling(self,
+            request: cluster_service.SetNodePoolAutoscalingRequest = None,
+            *,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Sets the autoscaling settings for the specified node
+        pool.
+
+        Args:
+            request (:class:`~.cluster_service.SetNodePoolAutoscalingRequest`):
+                The request object. SetNodePoolAutoscalingRequest sets
+                the autoscaler settings of a node pool.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+
+        request = cluster_service.SetNodePoolAutoscalingRequest(request)
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['set_node_pool_autoscaling']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def set_logging_service(self,
+            request: cluster_service.SetLoggingServiceRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            cluster_id: str = None,
+            logging_service: str = None,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Sets the logging service for a specific cluster.
+
+        Args:
+            request (:class:`~.cluster_service.SetLoggingServiceRequest`):
+                The request object. SetLoggingServiceRequest sets the
+                logging service of a cluster.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://support.google.com/cloud/answer/6158840>`__.
+                This field has been deprecated and replaced by the name
+                field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides. This field has been
+                deprecated and replaced by the name field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            cluster_id (:class:`str`):
+                Deprecated. The name of the cluster
+                to upgrade. This field has been
+                deprecated and replaced by the name
+                field.
+                This corresponds to the ``cluster_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            logging_service (:class:`str`):
+                Required. The logging service the cluster should use to
+                write metrics. Currently available options:
+
+                -  "logging.googleapis.com" - the Google Cloud Logging
+                   service
+                -  "none" - no metrics will be exported from the cluster
+                This corresponds to the ``logging_service`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            name (:class:`str`):
+                The name (project, location, cluster) of the cluster to
+                set logging. Specified in the format
+                ``projects/*/locations/*/clusters/*``.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, cluster_id, logging_service, name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.SetLoggingServiceRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if cluster_id is not None:
+            request.cluster_id = cluster_id
+        if logging_service is not None:
+            request.logging_service = logging_service
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['set_logging_service']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def set_monitoring_service(self,
+            request: cluster_service.SetMonitoringServiceRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            cluster_id: str = None,
+            monitoring_service: str = None,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Sets the monitoring service for a specific cluster.
+
+        Args:
+            request (:class:`~.cluster_service.SetMonitoringServiceRequest`):
+                The request object. SetMonitoringServiceRequest sets the
+                monitoring service of a cluster.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://support.google.com/cloud/answer/6158840>`__.
+                This field has been deprecated and replaced by the name
+                field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides. This field has been
+                deprecated and replaced by the name field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            cluster_id (:class:`str`):
+                Deprecated. The name of the cluster
+                to upgrade. This field has been
+                deprecated and replaced by the name
+                field.
+                This corresponds to the ``cluster_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            monitoring_service (:class:`str`):
+                Required. The monitoring service the cluster should use
+                to write metrics. Currently available options:
+
+                -  "monitoring.googleapis.com/kubernetes" - the Google
+                   Cloud Monitoring service with Kubernetes-native
+                   resource model
+                -  "monitoring.googleapis.com" - the Google Cloud
+                   Monitoring service
+                -  "none" - no metrics will be exported from the cluster
+                This corresponds to the ``monitoring_service`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            name (:class:`str`):
+                The name (project, location, cluster) of the cluster to
+                set monitoring. Specified in the format
+                ``projects/*/locations/*/clusters/*``.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, cluster_id, monitoring_service, name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.SetMonitoringServiceRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if cluster_id is not None:
+            request.cluster_id = cluster_id
+        if monitoring_service is not None:
+            request.monitoring_service = monitoring_service
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['set_monitoring_service']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def set_addons_config(self,
+            request: cluster_service.SetAddonsConfigRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            cluster_id: str = None,
+            addons_config: cluster_service.AddonsConfig = None,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Sets the addons for a specific cluster.
+
+        Args:
+            request (:class:`~.cluster_service.SetAddonsConfigRequest`):
+                The request object. SetAddonsConfigRequest sets the
+                addons associated with the cluster.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://support.google.com/cloud/answer/6158840>`__.
+                This field has been deprecated and replaced by the name
+                field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides. This field has been
+                deprecated and replaced by the name field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            cluster_id (:class:`str`):
+                Deprecated. The name of the cluster
+                to upgrade. This field has been
+                deprecated and replaced by the name
+                field.
+                This corresponds to the ``cluster_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            addons_config (:class:`~.cluster_service.AddonsConfig`):
+                Required. The desired configurations
+                for the various addons available to run
+                in the cluster.
+                This corresponds to the ``addons_config`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            name (:class:`str`):
+                The name (project, location, cluster) of the cluster to
+                set addons. Specified in the format
+                ``projects/*/locations/*/clusters/*``.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, cluster_id, addons_config, name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.SetAddonsConfigRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if cluster_id is not None:
+            request.cluster_id = cluster_id
+        if addons_config is not None:
+            request.addons_config = addons_config
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['set_addons_config']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def set_locations(self,
+            request: cluster_service.SetLocationsRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            cluster_id: str = None,
+            locations: Sequence[str] = None,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Sets the locations for a specific cluster.
+
+        Args:
+            request (:class:`~.cluster_service.SetLocationsRequest`):
+                The request object. SetLocationsRequest sets the
+                locations of the cluster.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://support.google.com/cloud/answer/6158840>`__.
+                This field has been deprecated and replaced by the name
+                field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides. This field has been
+                deprecated and replaced by the name field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            cluster_id (:class:`str`):
+                Deprecated. The name of the cluster
+                to upgrade. This field has been
+                deprecated and replaced by the name
+                field.
+                This corresponds to the ``cluster_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            locations (:class:`Sequence[str]`):
+                Required. The desired list of Google Compute Engine
+                `zones <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster's nodes should be located. Changing
+                the locations a cluster is in will result in nodes being
+                either created or removed from the cluster, depending on
+                whether locations are being added or removed.
+
+                This list must always include the cluster's primary
+                zone.
+                This corresponds to the ``locations`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            name (:class:`str`):
+                The name (project, location, cluster) of the cluster to
+                set locations. Specified in the format
+                ``projects/*/locations/*/clusters/*``.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, cluster_id, locations, name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.SetLocationsRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if cluster_id is not None:
+            request.cluster_id = cluster_id
+        if locations is not None:
+            request.locations = locations
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['set_locations']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def update_master(self,
+            request: cluster_service.UpdateMasterRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            cluster_id: str = None,
+            master_version: str = None,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Updates the master for a specific cluster.
+
+        Args:
+            request (:class:`~.cluster_service.UpdateMasterRequest`):
+                The request object. UpdateMasterRequest updates the
+                master of the cluster.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://support.google.com/cloud/answer/6158840>`__.
+                This field has been deprecated and replaced by the name
+                field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides. This field has been
+                deprecated and replaced by the name field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            cluster_id (:class:`str`):
+                Deprecated. The name of the cluster
+                to upgrade. This field has been
+                deprecated and replaced by the name
+                field.
+                This corresponds to the ``cluster_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            master_version (:class:`str`):
+                Required. The Kubernetes version to
+                change the master to.
+                Users may specify either explicit
+                versions offered by Kubernetes Engine or
+                version aliases, which have the
+                following behavior:
+                - "latest": picks the highest valid
+                Kubernetes version - "1.X": picks the
+                highest valid patch+gke.N patch in the
+                1.X version - "1.X.Y": picks the highest
+                valid gke.N patch in the 1.X.Y version -
+                "1.X.Y-gke.N": picks an explicit
+                Kubernetes version - "-": picks the
+                default Kubernetes version
+                This corresponds to the ``master_version`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            name (:class:`str`):
+                The name (project, location, cluster) of the cluster to
+                update. Specified in the format
+                ``projects/*/locations/*/clusters/*``.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, cluster_id, master_version, name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.UpdateMasterRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if cluster_id is not None:
+            request.cluster_id = cluster_id
+        if master_version is not None:
+            request.master_version = master_version
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['update_master']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def set_master_auth(self,
+            request: cluster_service.SetMasterAuthRequest = None,
+            *,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Sets master auth materials. Currently supports
+        changing the admin password or a specific cluster,
+        either via password generation or explicitly setting the
+        password.
+
+        Args:
+            request (:class:`~.cluster_service.SetMasterAuthRequest`):
+                The request object. SetMasterAuthRequest updates the
+                admin password of a cluster.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+
+        request = cluster_service.SetMasterAuthRequest(request)
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['set_master_auth']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def delete_cluster(self,
+            request: cluster_service.DeleteClusterRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            cluster_id: str = None,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Deletes the cluster, including the Kubernetes
+        endpoint and all worker nodes.
+
+        Firewalls and routes that were configured during cluster
+        creation are also deleted.
+
+        Other Google Compute Engine resources that might be in
+        use by the cluster, such as load balancer resources, are
+        not deleted if they weren't present when the cluster was
+        initially created.
+
+        Args:
+            request (:class:`~.cluster_service.DeleteClusterRequest`):
+                The request object. DeleteClusterRequest deletes a
+                cluster.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://support.google.com/cloud/answer/6158840>`__.
+                This field has been deprecated and replaced by the name
+                field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides. This field has been
+                deprecated and replaced by the name field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            cluster_id (:class:`str`):
+                Deprecated. The name of the cluster
+                to delete. This field has been
+                deprecated and replaced by the name
+                field.
+                This corresponds to the ``cluster_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            name (:class:`str`):
+                The name (project, location, cluster) of the cluster to
+                delete. Specified in the format
+                ``projects/*/locations/*/clusters/*``.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, cluster_id, name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.DeleteClusterRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if cluster_id is not None:
+            request.cluster_id = cluster_id
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['delete_cluster']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def list_operations(self,
+            request: cluster_service.ListOperationsRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.ListOperationsResponse:
+        r"""Lists all operations in a project in a specific zone
+        or all zones.
+
+        Args:
+            request (:class:`~.cluster_service.ListOperationsRequest`):
+                The request object. ListOperationsRequest lists
+                operations.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://support.google.com/cloud/answer/6158840>`__.
+                This field has been deprecated and replaced by the
+                parent field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                to return operations for, or ``-`` for all zones. This
+                field has been deprecated and replaced by the parent
+                field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.ListOperationsResponse:
+                ListOperationsResponse is the result
+                of ListOperationsRequest.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.ListOperationsRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['list_operations']
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            _routing_metadata('parent', request.parent),
+        )
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def get_operation(self,
+            request: cluster_service.GetOperationRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            operation_id: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Gets the specified operation.
+
+        Args:
+            request (:class:`~.cluster_service.GetOperationRequest`):
+                The request object. GetOperationRequest gets a single
+                operation.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://support.google.com/cloud/answer/6158840>`__.
+                This field has been deprecated and replaced by the name
+                field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides. This field has been
+                deprecated and replaced by the name field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            operation_id (:class:`str`):
+                Deprecated. The server-assigned ``name`` of the
+                operation. This field has been deprecated and replaced
+                by the name field.
+                This corresponds to the ``operation_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, operation_id]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.GetOperationRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if operation_id is not None:
+            request.operation_id = operation_id
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['get_operation']
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            _routing_metadata('name', request.name),
+        )
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def cancel_operation(self,
+            request: cluster_service.CancelOperationRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            operation_id: str = None,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> None:
+        r"""Cancels the specified operation.
+
+        Args:
+            request (:class:`~.cluster_service.CancelOperationRequest`):
+                The request object. CancelOperationRequest cancels a
+                single operation.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://support.google.com/cloud/answer/6158840>`__.
+                This field has been deprecated and replaced by the name
+                field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the operation resides. This field has been
+                deprecated and replaced by the name field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            operation_id (:class:`str`):
+                Deprecated. The server-assigned ``name`` of the
+                operation. This field has been deprecated and replaced
+                by the name field.
+                This corresponds to the ``operation_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            name (:class:`str`):
+                The name (project, location, operation id) of the
+                operation to cancel. Specified in the format
+                ``projects/*/locations/*/operations/*``.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, operation_id, name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.CancelOperationRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if operation_id is not None:
+            request.operation_id = operation_id
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['cancel_operation']
+
+        # Send the request.
+        await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+    async def get_server_config(self,
+            request: cluster_service.GetServerConfigRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.ServerConfig:
+        r"""Returns configuration info about the Google
+        Kubernetes Engine service.
+
+        Args:
+            request (:class:`~.cluster_service.GetServerConfigRequest`):
+                The request object. Gets the current Kubernetes Engine
+                service configuration.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://support.google.com/cloud/answer/6158840>`__.
+                This field has been deprecated and replaced by the name
+                field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                to return operations for. This field has been deprecated
+                and replaced by the name field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            name (:class:`str`):
+                The name (project and location) of the server config to
+                get, specified in the format ``projects/*/locations/*``.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.ServerConfig:
+                Kubernetes Engine service
+                configuration.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.GetServerConfigRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['get_server_config']
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            _routing_metadata('name', request.name),
+        )
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def list_node_pools(self,
+            request: cluster_service.ListNodePoolsRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            cluster_id: str = None,
+            parent: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.ListNodePoolsResponse:
+        r"""Lists the node pools for a cluster.
+
+        Args:
+            request (:class:`~.cluster_service.ListNodePoolsRequest`):
+                The request object. ListNodePoolsRequest lists the node
+                pool(s) for a cluster.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://developers.google.com/console/help/new/#projectnumber>`__.
+                This field has been deprecated and replaced by the
+                parent field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides. This field has been
+                deprecated and replaced by the parent field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            cluster_id (:class:`str`):
+                Deprecated. The name of the cluster.
+                This field has been deprecated and
+                replaced by the parent field.
+                This corresponds to the ``cluster_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            parent (:class:`str`):
+                The parent (project, location, cluster id) where the
+                node pools will be listed. Specified in the format
+                ``projects/*/locations/*/clusters/*``.
+                This corresponds to the ``parent`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.ListNodePoolsResponse:
+                ListNodePoolsResponse is the result
+                of ListNodePoolsRequest.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, cluster_id, parent]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.ListNodePoolsRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if cluster_id is not None:
+            request.cluster_id = cluster_id
+        if parent is not None:
+            request.parent = parent
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['list_node_pools']
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            _routing_metadata('parent', request.parent),
+        )
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def get_node_pool(self,
+            request: cluster_service.GetNodePoolRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            cluster_id: str = None,
+            node_pool_id: str = None,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.NodePool:
+        r"""Retrieves the requested node pool.
+
+        Args:
+            request (:class:`~.cluster_service.GetNodePoolRequest`):
+                The request object. GetNodePoolRequest retrieves a node
+                pool for a cluster.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://developers.google.com/console/help/new/#projectnumber>`__.
+                This field has been deprecated and replaced by the name
+                field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides. This field has been
+                deprecated and replaced by the name field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            cluster_id (:class:`str`):
+                Deprecated. The name of the cluster.
+                This field has been deprecated and
+                replaced by the name field.
+                This corresponds to the ``cluster_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            node_pool_id (:class:`str`):
+                Deprecated. The name of the node
+                pool. This field has been deprecated and
+                replaced by the name field.
+                This corresponds to the ``node_pool_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            name (:class:`str`):
+                The name (project, location, cluster, node pool id) of
+                the node pool to get. Specified in the format
+                ``projects/*/locations/*/clusters/*/nodePools/*``.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.NodePool:
+                NodePool contains the name and
+                configuration for a cluster's node pool.
+                Node pools are a set of nodes (i.e.
+                VM's), with a common configuration and
+                specification, under the control of the
+                cluster master. They may have a set of
+                Kubernetes labels applied to them, which
+                may be used to reference them during pod
+                scheduling. They may also be resized up
+                or down, to accommodate the workload.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, cluster_id, node_pool_id, name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.GetNodePoolRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if cluster_id is not None:
+            request.cluster_id = cluster_id
+        if node_pool_id is not None:
+            request.node_pool_id = node_pool_id
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['get_node_pool']
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            _routing_metadata('name', request.name),
+        )
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def create_node_pool(self,
+            request: cluster_service.CreateNodePoolRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            cluster_id: str = None,
+            node_pool: cluster_service.NodePool = None,
+            parent: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Creates a node pool for a cluster.
+
+        Args:
+            request (:class:`~.cluster_service.CreateNodePoolRequest`):
+                The request object. CreateNodePoolRequest creates a node
+                pool for a cluster.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://developers.google.com/console/help/new/#projectnumber>`__.
+                This field has been deprecated and replaced by the
+                parent field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides. This field has been
+                deprecated and replaced by the parent field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            cluster_id (:class:`str`):
+                Deprecated. The name of the cluster.
+                This field has been deprecated and
+                replaced by the parent field.
+                This corresponds to the ``cluster_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            node_pool (:class:`~.cluster_service.NodePool`):
+                Required. The node pool to create.
+                This corresponds to the ``node_pool`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            parent (:class:`str`):
+                The parent (project, location, cluster id) where the
+                node pool will be created. Specified in the format
+                ``projects/*/locations/*/clusters/*``.
+                This corresponds to the ``parent`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, cluster_id, node_pool, parent]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.CreateNodePoolRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if cluster_id is not None:
+            request.cluster_id = cluster_id
+        if node_pool is not None:
+            request.node_pool = node_pool
+        if parent is not None:
+            request.parent = parent
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['create_node_pool']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def delete_node_pool(self,
+            request: cluster_service.DeleteNodePoolRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            cluster_id: str = None,
+            node_pool_id: str = None,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Deletes a node pool from a cluster.
+
+        Args:
+            request (:class:`~.cluster_service.DeleteNodePoolRequest`):
+                The request object. DeleteNodePoolRequest deletes a node
+                pool for a cluster.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://developers.google.com/console/help/new/#projectnumber>`__.
+                This field has been deprecated and replaced by the name
+                field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides. This field has been
+                deprecated and replaced by the name field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            cluster_id (:class:`str`):
+                Deprecated. The name of the cluster.
+                This field has been deprecated and
+                replaced by the name field.
+                This corresponds to the ``cluster_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            node_pool_id (:class:`str`):
+                Deprecated. The name of the node pool
+                to delete. This field has been
+                deprecated and replaced by the name
+                field.
+                This corresponds to the ``node_pool_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            name (:class:`str`):
+                The name (project, location, cluster, node pool id) of
+                the node pool to delete. Specified in the format
+                ``projects/*/locations/*/clusters/*/nodePools/*``.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, cluster_id, node_pool_id, name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.DeleteNodePoolRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if cluster_id is not None:
+            request.cluster_id = cluster_id
+        if node_pool_id is not None:
+            request.node_pool_id = node_pool_id
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['delete_node_pool']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def rollback_node_pool_upgrade(self,
+            request: cluster_service.RollbackNodePoolUpgradeRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            cluster_id: str = None,
+            node_pool_id: str = None,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Rolls back a previously Aborted or Failed NodePool
+        upgrade. This makes no changes if the last upgrade
+        successfully completed.
+
+        Args:
+            request (:class:`~.cluster_service.RollbackNodePoolUpgradeRequest`):
+                The request object. RollbackNodePoolUpgradeRequest
+                rollbacks the previously Aborted or Failed NodePool
+                upgrade. This will be an no-op if the last upgrade
+                successfully completed.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://support.google.com/cloud/answer/6158840>`__.
+                This field has been deprecated and replaced by the name
+                field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides. This field has been
+                deprecated and replaced by the name field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            cluster_id (:class:`str`):
+                Deprecated. The name of the cluster
+                to rollback. This field has been
+                deprecated and replaced by the name
+                field.
+                This corresponds to the ``cluster_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            node_pool_id (:class:`str`):
+                Deprecated. The name of the node pool
+                to rollback. This field has been
+                deprecated and replaced by the name
+                field.
+                This corresponds to the ``node_pool_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            name (:class:`str`):
+                The name (project, location, cluster, node pool id) of
+                the node poll to rollback upgrade. Specified in the
+                format
+                ``projects/*/locations/*/clusters/*/nodePools/*``.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, cluster_id, node_pool_id, name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.RollbackNodePoolUpgradeRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if cluster_id is not None:
+            request.cluster_id = cluster_id
+        if node_pool_id is not None:
+            request.node_pool_id = node_pool_id
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['rollback_node_pool_upgrade']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def set_node_pool_management(self,
+            request: cluster_service.SetNodePoolManagementRequest = None,
+            *,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Sets the NodeManagement options for a node pool.
+
+        Args:
+            request (:class:`~.cluster_service.SetNodePoolManagementRequest`):
+                The request object. SetNodePoolManagementRequest sets
+                the node management properties of a node pool.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+
+        request = cluster_service.SetNodePoolManagementRequest(request)
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['set_node_pool_management']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def set_labels(self,
+            request: cluster_service.SetLabelsRequest = None,
+            *,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Sets labels on a cluster.
+
+        Args:
+            request (:class:`~.cluster_service.SetLabelsRequest`):
+                The request object. SetLabelsRequest sets the Google
+                Cloud Platform labels on a Google Container Engine
+                cluster, which will in turn set them for Google Compute
+                Engine resources used by that cluster
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+
+        request = cluster_service.SetLabelsRequest(request)
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['set_labels']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def set_legacy_abac(self,
+            request: cluster_service.SetLegacyAbacRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            cluster_id: str = None,
+            enabled: bool = None,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Enables or disables the ABAC authorization mechanism
+        on a cluster.
+
+        Args:
+            request (:class:`~.cluster_service.SetLegacyAbacRequest`):
+                The request object. SetLegacyAbacRequest enables or
+                disables the ABAC authorization mechanism for a cluster.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://support.google.com/cloud/answer/6158840>`__.
+                This field has been deprecated and replaced by the name
+                field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides. This field has been
+                deprecated and replaced by the name field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            cluster_id (:class:`str`):
+                Deprecated. The name of the cluster
+                to update. This field has been
+                deprecated and replaced by the name
+                field.
+                This corresponds to the ``cluster_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            enabled (:class:`bool`):
+                Required. Whether ABAC authorization
+                will be enabled in the cluster.
+                This corresponds to the ``enabled`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            name (:class:`str`):
+                The name (project, location, cluster id) of the cluster
+                to set legacy abac. Specified in the format
+                ``projects/*/locations/*/clusters/*``.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, cluster_id, enabled, name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.SetLegacyAbacRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if cluster_id is not None:
+            request.cluster_id = cluster_id
+        if enabled is not None:
+            request.enabled = enabled
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['set_legacy_abac']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def start_ip_rotation(self,
+            request: cluster_service.StartIPRotationRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            cluster_id: str = None,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Starts master IP rotation.
+
+        Args:
+            request (:class:`~.cluster_service.StartIPRotationRequest`):
+                The request object. StartIPRotationRequest creates a new
+                IP for the cluster and then performs a node upgrade on
+                each node pool to point to the new IP.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://developers.google.com/console/help/new/#projectnumber>`__.
+                This field has been deprecated and replaced by the name
+                field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides. This field has been
+                deprecated and replaced by the name field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            cluster_id (:class:`str`):
+                Deprecated. The name of the cluster.
+                This field has been deprecated and
+                replaced by the name field.
+                This corresponds to the ``cluster_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            name (:class:`str`):
+                The name (project, location, cluster id) of the cluster
+                to start IP rotation. Specified in the format
+                ``projects/*/locations/*/clusters/*``.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, cluster_id, name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.StartIPRotationRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if cluster_id is not None:
+            request.cluster_id = cluster_id
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['start_ip_rotation']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def complete_ip_rotation(self,
+            request: cluster_service.CompleteIPRotationRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            cluster_id: str = None,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Completes master IP rotation.
+
+        Args:
+            request (:class:`~.cluster_service.CompleteIPRotationRequest`):
+                The request object. CompleteIPRotationRequest moves the
+                cluster master back into single-IP mode.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://developers.google.com/console/help/new/#projectnumber>`__.
+                This field has been deprecated and replaced by the name
+                field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides. This field has been
+                deprecated and replaced by the name field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            cluster_id (:class:`str`):
+                Deprecated. The name of the cluster.
+                This field has been deprecated and
+                replaced by the name field.
+                This corresponds to the ``cluster_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            name (:class:`str`):
+                The name (project, location, cluster id) of the cluster
+                to complete IP rotation. Specified in the format
+                ``projects/*/locations/*/clusters/*``.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, cluster_id, name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.CompleteIPRotationRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if cluster_id is not None:
+            request.cluster_id = cluster_id
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['complete_ip_rotation']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def set_node_pool_size(self,
+            request: cluster_service.SetNodePoolSizeRequest = None,
+            *,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Sets the size for a specific node pool.
+
+        Args:
+            request (:class:`~.cluster_service.SetNodePoolSizeRequest`):
+                The request object. SetNodePoolSizeRequest sets the size
+                a node pool.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+
+        request = cluster_service.SetNodePoolSizeRequest(request)
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['set_node_pool_size']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def set_network_policy(self,
+            request: cluster_service.SetNetworkPolicyRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            cluster_id: str = None,
+            network_policy: cluster_service.NetworkPolicy = None,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Enables or disables Network Policy for a cluster.
+
+        Args:
+            request (:class:`~.cluster_service.SetNetworkPolicyRequest`):
+                The request object. SetNetworkPolicyRequest
+                enables/disables network policy for a cluster.
+            project_id (:class:`str`):
+                Deprecated. The Google Developers Console `project ID or
+                project
+                number <https://developers.google.com/console/help/new/#projectnumber>`__.
+                This field has been deprecated and replaced by the name
+                field.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Deprecated. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides. This field has been
+                deprecated and replaced by the name field.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            cluster_id (:class:`str`):
+                Deprecated. The name of the cluster.
+                This field has been deprecated and
+                replaced by the name field.
+                This corresponds to the ``cluster_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            network_policy (:class:`~.cluster_service.NetworkPolicy`):
+                Required. Configuration options for
+                the NetworkPolicy feature.
+                This corresponds to the ``network_policy`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            name (:class:`str`):
+                The name (project, location, cluster id) of the cluster
+                to set networking policy. Specified in the format
+                ``projects/*/locations/*/clusters/*``.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, cluster_id, network_policy, name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.SetNetworkPolicyRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if cluster_id is not None:
+            request.cluster_id = cluster_id
+        if network_policy is not None:
+            request.network_policy = network_policy
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['set_network_policy']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def set_maintenance_policy(self,
+            request: cluster_service.SetMaintenancePolicyRequest = None,
+            *,
+            project_id: str = None,
+            zone: str = None,
+            cluster_id: str = None,
+            maintenance_policy: cluster_service.MaintenancePolicy = None,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> cluster_service.Operation:
+        r"""Sets the maintenance policy for a cluster.
+
+        Args:
+            request (:class:`~.cluster_service.SetMaintenancePolicyRequest`):
+                The request object. SetMaintenancePolicyRequest sets the
+                maintenance policy for a cluster.
+            project_id (:class:`str`):
+                Required. The Google Developers Console `project ID or
+                project
+                number <https://support.google.com/cloud/answer/6158840>`__.
+                This corresponds to the ``project_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (:class:`str`):
+                Required. The name of the Google Compute Engine
+                `zone <https://cloud.google.com/compute/docs/zones#available>`__
+                in which the cluster resides.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            cluster_id (:class:`str`):
+                Required. The name of the cluster to
+                update.
+                This corresponds to the ``cluster_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            maintenance_policy (:class:`~.cluster_service.MaintenancePolicy`):
+                Required. The maintenance policy to
+                be set for the cluster. An empty field
+                clears the existing maintenance policy.
+                This corresponds to the ``maintenance_policy`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            name (:class:`str`):
+                The name (project, location, cluster id) of the cluster
+                to set maintenance policy. Specified in the format
+                ``projects/*/locations/*/clusters/*``.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.cluster_service.Operation:
+                This operation resource represents
+                operations that may have happened or are
+                happening on the cluster. All fields are
+                output only.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([project_id, zone, cluster_id, maintenance_policy, name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = cluster_service.SetMaintenancePolicyRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if cluster_id is not None:
+            request.cluster_id = cluster_id
+        if maintenance_policy is not None:
+            request.maintenance_policy = maintenance_policy
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['set_maintenance_policy']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def list_usable_subnetworks(self,
+            request: cluster_service.ListUsableSubnetworksRequest = None,
+            *,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> pagers.ListUsableSubnetworksAsyncPager:
+        r"""Lists subnetworks that are usable for creating
+        clusters in a project.
+
+        Args:
+            request (:class:`~.cluster_service.ListUsableSubnetworksRequest`):
+                The request object. ListUsableSubnetworksRequest
+                requests the list of usable subnetworks available to a
+                user for creating clusters.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.pagers.ListUsableSubnetworksAsyncPager:
+                ListUsableSubnetworksResponse is the
+                response of
+                ListUsableSubnetworksRequest.
+
+                Iterating over this object will yield
+                results and resolve additional pages
+                automatically.
+
+        """
+        # Create or coerce a protobuf request object.
+
+        request = cluster_service.ListUsableSubnetworksRequest(request)
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['list_usable_subnetworks']
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            _routing_metadata('parent', request.parent),
+        )
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # This method is paged; wrap the response in a pager, which provides
+        # an `__aiter__` convenience method.
+        response = pagers.ListUsableSubnetworksAsyncPager(
+            method=rpc,
+            request=request,
+            response=response,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def warmup(self, timeout: float = None) -> None:
+        r"""Prepare the client for its first call.
+
+        Fetch an access token, create the stub of every RPC method, and
+        connect the channel and wait until it is ready, so that the
+        first calls do not pay for them. It can serve as a readiness
+        probe.
+
+        Args:
+            timeout (Optional[float]): The seconds to wait for the
+                channel, or ``None`` to wait as long as it takes.
+
+        Raises:
+            google.api_core.exceptions.DeadlineExceeded: If the channel
+                is not ready within ``timeout``.
+            google.auth.exceptions.RefreshError: If the access token
+                could not be fetched.
+        """
+        await self._client._transport.warmup(timeout=timeout)
+
+
+__all__ = (
+    'ClusterManagerAsyncClient',
+)
@@ -16,9 +16,9 @@
 #
 
 from collections import OrderedDict
+import functools
 import re
-from typing import Callable, Dict, Sequence, Tuple, Type, Union
-import pkg_resources
+from typing import Callable, Dict, Optional, Sequence, Tuple, Type, Union
 
 import google.api_core.client_options as ClientOptions # type: ignore
 from google.api_core import exceptions                 # type: ignore
@@ -28,10 +28,14 @@ from google.auth import credentials                    # type: ignore
 from google.oauth2 import service_account              # type: ignore
 
 from google.container_v1.services.cluster_manager import pagers
+from google.container_v1.services.cluster_manager.transports import metrics
+from google.container_v1.services.cluster_manager.transports import refresh
 from google.container_v1.types import cluster_service
 
 from .transports.base import ClusterManagerTransport
 from .transports.grpc import ClusterManagerGrpcTransport
+from .transports.grpc_asyncio import ClusterManagerGrpcAsyncIOTransport
+from .transports.interceptors import Interceptor
 
 
 class ClusterManagerClientMeta(type):
@@ -43,6 +47,7 @@ class ClusterManagerClientMeta(type):
     """
     _transport_registry = OrderedDict()  # type: Dict[str, Type[ClusterManagerTransport]]
     _transport_registry['grpc'] = ClusterManagerGrpcTransport
+    _transport_registry['grpc_asyncio'] = ClusterManagerGrpcAsyncIOTransport
 
     def get_transport_class(cls,
             label: str = None,
@@ -127,6 +132,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             credentials: credentials.Credentials = None,
             transport: Union[str, ClusterManagerTransport] = None,
             client_options: ClientOptions = None,
+            interceptors: Sequence[Interceptor] = (),
             ) -> None:
         """Instantiate the cluster manager client.
 
@@ -147,22 +153,64 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
                 is provided, mutual TLS transport will be created with the given
                 ``api_endpoint`` or the default mTLS endpoint, and the client
                 SSL credentials obtained from ``client_cert_source``.
+                (3) The ``method_configs`` property, or dictionary key, can
+                be used to override the default retry and timeout of each
+                RPC method, e.g. ``{'get_cluster': {'timeout': 5.0}}``.
+                (4) The ``metrics`` property, or dictionary key, can be
+                set to ``True`` or to a :class:`~.metrics.TransportMetrics`
+                to record the calls, status codes, calls in flight and
+                latencies of each method, available from the transport's
+                ``metrics``.
+                (5) The ``interceptors`` property, or dictionary key, can
+                hold more interceptors, which run inside those given as
+                the ``interceptors`` argument.
+                (6) The ``refresh_credentials`` property, or dictionary
+                key, can be set to ``True`` or to a number of seconds to
+                refresh the access token in a background thread that
+                long before it expires, by default
+                :data:`~.refresh.DEFAULT_MARGIN`, rather than on a call.
+                Clients built from the same credentials share the token.
+            interceptors (Sequence[~.interceptors.Interceptor]): The
+                interceptors every call of the client passes through, in
+                order, the first one outermost.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
                 creation failed for any reason.
+            ValueError: If ``method_configs`` names an unknown RPC method or
+                setting; or if options that wrap the RPC methods are given
+                along with a transport instance that another client uses.
         """
         if isinstance(client_options, dict):
+            client_options = dict(client_options)
+            method_configs = client_options.pop('method_configs', None)
+            more_interceptors = client_options.pop('interceptors', ())
+            transport_metrics = client_options.pop('metrics', None)
+            refresh_credentials = client_options.pop('refresh_credentials', None)
             client_options = ClientOptions.from_dict(client_options)
+        else:
+            method_configs = getattr(client_options, 'method_configs', None)
+            more_interceptors = getattr(client_options, 'interceptors', ())
+            transport_metrics = getattr(client_options, 'metrics', None)
+            refresh_credentials = getattr(client_options, 'refresh_credentials', None)
 
         # Save or instantiate the transport.
         # Ordinarily, we provide the transport, but allowing a custom transport
         # instance provides an extensibility point for unusual situations.
+        prepared = False
         if isinstance(transport, ClusterManagerTransport):
             # transport is a ClusterManagerTransport instance.
             if credentials:
                 raise ValueError('When providing a transport instance, '
                                  'provide its credentials directly.')
+            # The methods of a transport that another client uses are
+            # wrapped already, with that client's options.
+            prepared = hasattr(transport, '_wrapped_methods')
+            if prepared and any((
+                    method_configs, transport_metrics, interceptors, more_interceptors)):
+                raise ValueError('When providing a transport instance that '
+                                 'another client uses, configure its methods '
+                                 'on that client.')
             self._transport = transport
         elif client_options is None or (
             client_options.api_endpoint is None
@@ -192,13 +240,29 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
                 else self.DEFAULT_ENDPOINT
             )
 
-            self._transport = ClusterManagerGrpcTransport(
+            Transport = type(self).get_transport_class(transport)
+            self._transport = Transport(
                 credentials=credentials,
                 host=api_endpoint,
                 api_mtls_endpoint=api_mtls_endpoint,
                 client_cert_source=client_options.client_cert_source,
             )
 
+        # Refresh the access token ahead of its expiry, if so configured.
+        margin = refresh.from_option(refresh_credentials)
+        if margin is not None:
+            self._transport._refresh_in_background(margin)
+
+        # Wrap each RPC method once for this transport instead of on
+        # every call.
+        if not prepared:
+            self._transport._prep_wrapped_messages(
+                _client_info,
+                method_configs=method_configs,
+                metrics=metrics.from_option(transport_metrics),
+                interceptors=tuple(interceptors) + tuple(more_interceptors or ()),
+            )
+
     def list_clusters(self,
             request: cluster_service.ListClustersRequest = None,
             *,
@@ -206,7 +270,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             zone: str = None,
             parent: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.ListClustersResponse:
         r"""Lists all clusters owned by a project in either the
@@ -273,20 +337,14 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if parent is not None:
             request.parent = parent
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.list_clusters,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['list_clusters']
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((
-                ('parent', request.parent),
-            )),
+            _routing_metadata('parent', request.parent),
         )
 
         # Send the request.
@@ -308,7 +366,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             cluster_id: str = None,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Cluster:
         r"""Gets the details of a specific cluster.
@@ -381,20 +439,14 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.get_cluster,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['get_cluster']
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((
-                ('name', request.name),
-            )),
+            _routing_metadata('name', request.name),
         )
 
         # Send the request.
@@ -416,7 +468,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             cluster: cluster_service.Cluster = None,
             parent: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Creates a cluster, consisting of the specified number and type
@@ -503,13 +555,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if parent is not None:
             request.parent = parent
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.create_cluster,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['create_cluster']
 
         # Send the request.
         response = rpc(
@@ -531,7 +579,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             update: cluster_service.ClusterUpdate = None,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Updates the settings of a specific cluster.
@@ -616,13 +664,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.update_cluster,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['update_cluster']
 
         # Send the request.
         response = rpc(
@@ -639,7 +683,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             request: cluster_service.UpdateNodePoolRequest = None,
             *,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Updates the version and/or image type for the
@@ -668,13 +712,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         request = cluster_service.UpdateNodePoolRequest(request)
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.update_node_pool,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['update_node_pool']
 
         # Send the request.
         response = rpc(
@@ -691,7 +731,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             request: cluster_service.SetNodePoolAutoscalingRequest = None,
             *,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Sets the autoscaling settings for the specified node
@@ -720,13 +760,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         request = cluster_service.SetNodePoolAutoscalingRequest(request)
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.set_node_pool_autoscaling,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['set_node_pool_autoscaling']
 
         # Send the request.
         response = rpc(
@@ -748,7 +784,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             logging_service: str = None,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Sets the logging service for a specific cluster.
@@ -837,13 +873,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.set_logging_service,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['set_logging_service']
 
         # Send the request.
         response = rpc(
@@ -865,7 +897,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             monitoring_service: str = None,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Sets the monitoring service for a specific cluster.
@@ -957,13 +989,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.set_monitoring_service,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['set_monitoring_service']
 
         # Send the request.
         response = rpc(
@@ -985,7 +1013,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             addons_config: cluster_service.AddonsConfig = None,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Sets the addons for a specific cluster.
@@ -1071,13 +1099,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.set_addons_config,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['set_addons_config']
 
         # Send the request.
         response = rpc(
@@ -1099,7 +1123,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             locations: Sequence[str] = None,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Sets the locations for a specific cluster.
@@ -1191,13 +1215,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.set_locations,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['set_locations']
 
         # Send the request.
         response = rpc(
@@ -1219,7 +1239,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             master_version: str = None,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Updates the master for a specific cluster.
@@ -1316,13 +1336,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.update_master,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['update_master']
 
         # Send the request.
         response = rpc(
@@ -1339,7 +1355,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             request: cluster_service.SetMasterAuthRequest = None,
             *,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Sets master auth materials. Currently supports
@@ -1370,13 +1386,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         request = cluster_service.SetMasterAuthRequest(request)
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.set_master_auth,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['set_master_auth']
 
         # Send the request.
         response = rpc(
@@ -1397,7 +1409,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             cluster_id: str = None,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Deletes the cluster, including the Kubernetes
@@ -1483,13 +1495,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.delete_cluster,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['delete_cluster']
 
         # Send the request.
         response = rpc(
@@ -1508,7 +1516,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             project_id: str = None,
             zone: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.ListOperationsResponse:
         r"""Lists all operations in a project in a specific zone
@@ -1566,20 +1574,14 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if zone is not None:
             request.zone = zone
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.list_operations,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['list_operations']
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((
-                ('parent', request.parent),
-            )),
+            _routing_metadata('parent', request.parent),
         )
 
         # Send the request.
@@ -1600,7 +1602,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             zone: str = None,
             operation_id: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Gets the specified operation.
@@ -1667,20 +1669,14 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if operation_id is not None:
             request.operation_id = operation_id
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.get_operation,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['get_operation']
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((
-                ('name', request.name),
-            )),
+            _routing_metadata('name', request.name),
         )
 
         # Send the request.
@@ -1702,7 +1698,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             operation_id: str = None,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> None:
         r"""Cancels the specified operation.
@@ -1770,13 +1766,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.cancel_operation,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['cancel_operation']
 
         # Send the request.
         rpc(
@@ -1793,7 +1785,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             zone: str = None,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.ServerConfig:
         r"""Returns configuration info about the Google
@@ -1858,20 +1850,14 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.get_server_config,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['get_server_config']
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((
-                ('name', request.name),
-            )),
+            _routing_metadata('name', request.name),
         )
 
         # Send the request.
@@ -1893,7 +1879,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             cluster_id: str = None,
             parent: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.ListNodePoolsResponse:
         r"""Lists the node pools for a cluster.
@@ -1967,20 +1953,14 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if parent is not None:
             request.parent = parent
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.list_node_pools,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['list_node_pools']
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((
-                ('parent', request.parent),
-            )),
+            _routing_metadata('parent', request.parent),
         )
 
         # Send the request.
@@ -2003,7 +1983,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             node_pool_id: str = None,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.NodePool:
         r"""Retrieves the requested node pool.
@@ -2094,20 +2074,14 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.get_node_pool,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['get_node_pool']
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((
-                ('name', request.name),
-            )),
+            _routing_metadata('name', request.name),
         )
 
         # Send the request.
@@ -2130,7 +2104,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             node_pool: cluster_service.NodePool = None,
             parent: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Creates a node pool for a cluster.
@@ -2213,13 +2187,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if parent is not None:
             request.parent = parent
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.create_node_pool,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['create_node_pool']
 
         # Send the request.
         response = rpc(
@@ -2241,7 +2211,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             node_pool_id: str = None,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Deletes a node pool from a cluster.
@@ -2327,13 +2297,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.delete_node_pool,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['delete_node_pool']
 
         # Send the request.
         response = rpc(
@@ -2355,7 +2321,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             node_pool_id: str = None,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Rolls back a previously Aborted or Failed NodePool
@@ -2447,13 +2413,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.rollback_node_pool_upgrade,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['rollback_node_pool_upgrade']
 
         # Send the request.
         response = rpc(
@@ -2470,7 +2432,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             request: cluster_service.SetNodePoolManagementRequest = None,
             *,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Sets the NodeManagement options for a node pool.
@@ -2498,13 +2460,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         request = cluster_service.SetNodePoolManagementRequest(request)
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.set_node_pool_management,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['set_node_pool_management']
 
         # Send the request.
         response = rpc(
@@ -2521,7 +2479,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             request: cluster_service.SetLabelsRequest = None,
             *,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Sets labels on a cluster.
@@ -2551,13 +2509,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         request = cluster_service.SetLabelsRequest(request)
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.set_labels,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['set_labels']
 
         # Send the request.
         response = rpc(
@@ -2579,7 +2533,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             enabled: bool = None,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Enables or disables the ABAC authorization mechanism
@@ -2665,13 +2619,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.set_legacy_abac,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['set_legacy_abac']
 
         # Send the request.
         response = rpc(
@@ -2692,7 +2642,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             cluster_id: str = None,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Starts master IP rotation.
@@ -2769,13 +2719,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.start_ip_rotation,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['start_ip_rotation']
 
         # Send the request.
         response = rpc(
@@ -2796,7 +2742,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             cluster_id: str = None,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Completes master IP rotation.
@@ -2872,13 +2818,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.complete_ip_rotation,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['complete_ip_rotation']
 
         # Send the request.
         response = rpc(
@@ -2895,7 +2837,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             request: cluster_service.SetNodePoolSizeRequest = None,
             *,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Sets the size for a specific node pool.
@@ -2923,13 +2865,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         request = cluster_service.SetNodePoolSizeRequest(request)
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.set_node_pool_size,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['set_node_pool_size']
 
         # Send the request.
         response = rpc(
@@ -2951,7 +2889,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             network_policy: cluster_service.NetworkPolicy = None,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Enables or disables Network Policy for a cluster.
@@ -3035,13 +2973,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.set_network_policy,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['set_network_policy']
 
         # Send the request.
         response = rpc(
@@ -3063,7 +2997,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             maintenance_policy: cluster_service.MaintenancePolicy = None,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> cluster_service.Operation:
         r"""Sets the maintenance policy for a cluster.
@@ -3144,13 +3078,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.set_maintenance_policy,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['set_maintenance_policy']
 
         # Send the request.
         response = rpc(
@@ -3167,7 +3097,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             request: cluster_service.ListUsableSubnetworksRequest = None,
             *,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> pagers.ListUsableSubnetworksPager:
         r"""Lists subnetworks that are usable for creating
@@ -3200,20 +3130,14 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         request = cluster_service.ListUsableSubnetworksRequest(request)
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.list_usable_subnetworks,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['list_usable_subnetworks']
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((
-                ('parent', request.parent),
-            )),
+            _routing_metadata('parent', request.parent),
         )
 
         # Send the request.
@@ -3235,18 +3159,70 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         # Done; return the response.
         return response
 
+    def warmup(self, timeout: float = None) -> None:
+        r"""Prepare the client for its first call.
 
+        Fetch an access token, create the stub of every RPC method, and
+        connect the channel and wait until it is ready, so that the
+        first calls do not pay for them. It can serve as a readiness
+        probe.
 
+        Args:
+            timeout (Optional[float]): The seconds to wait for the
+                channel, or ``None`` to wait as long as it takes.
+
+        Raises:
+            google.api_core.exceptions.DeadlineExceeded: If the channel
+                is not ready within ``timeout``.
+            google.auth.exceptions.RefreshError: If the access token
+                could not be fetched.
+        """
+        self._transport.warmup(timeout=timeout)
 
 
-try:
-    _client_info = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution(
-            'google-container',
-        ).version,
-    )
-except pkg_resources.DistributionNotFound:
-    _client_info = gapic_v1.client_info.ClientInfo()
+@functools.lru_cache(maxsize=1024)
+def _routing_metadata(key: str, value: str) -> Tuple[str, str]:
+    """Return the routing header for a single request field.
+
+    The same resource names are sent over and over, so the encoded
+    header is cached instead of being rebuilt for every request.
+    """
+    return gapic_v1.routing_header.to_grpc_metadata(((key, value),))
+
+
+@functools.lru_cache(maxsize=None)
+def _distribution_version() -> Optional[str]:
+    """Return the version of the installed distribution, if it is installed.
+
+    Scanning the installed distributions is slow, so it is done when the
+    first call builds its user agent rather than on import.
+    """
+    try:
+        from importlib import metadata
+    except ImportError:  # pragma: NO COVER
+        # Python < 3.8.
+        import pkg_resources
+        try:
+            return pkg_resources.get_distribution('google-cloud-container').version
+        except pkg_resources.DistributionNotFound:
+            return None
+    try:
+        return metadata.version('google-cloud-container')
+    except metadata.PackageNotFoundError:
+        return None
+
+
+class _ClientInfo(gapic_v1.client_info.ClientInfo):
+    """Client info whose ``gapic_version`` defaults to the version of the
+    installed distribution, looked up when the user agent is first built."""
+
+    def to_user_agent(self) -> str:
+        if self.gapic_version is None:
+            self.gapic_version = _distribution_version()
+        return super().to_user_agent()
+
+
+_client_info = _ClientInfo()
 
 
 __all__ = (
@@ -20,14 +20,17 @@ from typing import Dict, Type
 
 from .base import ClusterManagerTransport
 from .grpc import ClusterManagerGrpcTransport
+from .grpc_asyncio import ClusterManagerGrpcAsyncIOTransport
 
 
 # Compile a registry of transports.
 _transport_registry = OrderedDict()  # type: Dict[str, Type[ClusterManagerTransport]]
 _transport_registry['grpc'] = ClusterManagerGrpcTransport
+_transport_registry['grpc_asyncio'] = ClusterManagerGrpcAsyncIOTransport
 
 
 __all__ = (
     'ClusterManagerTransport',
     'ClusterManagerGrpcTransport',
+    'ClusterManagerGrpcAsyncIOTransport',
 )
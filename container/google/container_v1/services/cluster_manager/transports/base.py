@@ -16,18 +16,107 @@
 #
 
 import abc
+import functools
 import typing
 
 from google import auth
+from google.api_core import exceptions  # type: ignore
+from google.api_core import gapic_v1  # type: ignore
+from google.api_core import retry as retries  # type: ignore
 from google.auth import credentials  # type: ignore
+from google.auth.transport import requests as auth_requests  # type: ignore
 
 from google.container_v1.types import cluster_service
 from google.protobuf import empty_pb2 as empty  # type: ignore
 
+from . import refresh
+
+
+class _WrappedMethods(dict):
+    """Mapping of RPC method names to their wrapped callables.
+
+    A method is wrapped the first time it is looked up and the result is
+    kept for the lifetime of the transport.
+    """
+    def __init__(self,
+            transport: 'ClusterManagerTransport',
+            client_info: gapic_v1.client_info.ClientInfo,
+            method_configs: typing.Dict[str, typing.Dict[str, typing.Any]],
+            metrics: typing.Any = None,
+            interceptors: typing.Sequence[typing.Any] = ()) -> None:
+        super().__init__()
+        self._transport = transport
+        self._client_info = client_info
+        self._method_configs = method_configs
+        self._metrics = metrics
+        self._interceptors = tuple(interceptors)
+
+    def __missing__(self, name: str) -> typing.Callable:
+        config = self._method_configs[name]
+        rpc = self._transport._wrap_method(
+            getattr(self._transport, name),
+            default_retry=config['retry'],
+            default_timeout=config['timeout'],
+            client_info=self._client_info,
+        )
+        if self._interceptors:
+            rpc = self._transport._intercepted_class(rpc, self._interceptors, name)
+        if self._metrics is not None:
+            rpc = self._transport._instrumented_class(rpc, self._metrics, name)
+        self[name] = rpc
+        return rpc
+
+
+class _Intercepted:
+    """Pass each call through a chain of interceptors, the first outermost."""
+    def __init__(self, rpc: typing.Callable, interceptors, name: str) -> None:
+        self._rpc = rpc
+        self._interceptors = interceptors
+        self._name = name
+
+    def __call__(self, request, *, metadata=(), **kwargs):
+        return self._proceed(0, kwargs, request, tuple(metadata))
+
+    def _proceed(self, index, kwargs, request, metadata):
+        if index == len(self._interceptors):
+            return self._rpc(request, metadata=metadata, **kwargs)
+        return self._interceptors[index].intercept(
+            self._name, request, metadata,
+            functools.partial(self._proceed, index + 1, kwargs))
+
+
+class _Instrumented:
+    """Record the latency and outcome of each call in the transport metrics."""
+    def __init__(self, rpc: typing.Callable, metrics, name: str) -> None:
+        self._rpc = rpc
+        self._metrics = metrics
+        self._name = name
+
+    def __call__(self, request, **kwargs):
+        started = self._metrics.start(self._name)
+        try:
+            response = self._rpc(request, **kwargs)
+        except BaseException as exc:
+            self._metrics.finish(self._name, started, exc)
+            raise
+        self._metrics.finish(self._name, started)
+        return response
+
 
 class ClusterManagerTransport(metaclass=abc.ABCMeta):
     """Abstract transport class for ClusterManager."""
 
+    # The function used to add retry, timeout and error handling to the
+    # RPC methods of this transport, the type of its default retries, and
+    # the wrappers that run the interceptors and record metrics.
+    _wrap_method = staticmethod(gapic_v1.method.wrap_method)
+    _retry_class = retries.Retry
+    _instrumented_class = _Instrumented
+    _intercepted_class = _Intercepted
+
+    # The per-method call metrics, when enabled.
+    metrics = None
+
     AUTH_SCOPES = (
         'https://www.googleapis.com/auth/cloud-platform',
     )
@@ -36,6 +125,7 @@ class ClusterManagerTransport(metaclass=abc.ABCMeta):
             self, *,
             host: str = 'container.googleapis.com',
             credentials: credentials.Credentials = None,
+            refresh_credentials: float = None,
             ) -> None:
         """Instantiate the transport.
 
@@ -46,6 +136,10 @@ class ClusterManagerTransport(metaclass=abc.ABCMeta):
                 credentials identify the application to the service; if none
                 are specified, the client will attempt to ascertain the
                 credentials from the environment.
+            refresh_credentials (Optional[float]): If set, the access
+                token is refreshed in a background thread this many
+                seconds before it expires, e.g.
+                :data:`~.refresh.DEFAULT_MARGIN`, instead of by a call.
         """
         # Save the hostname. Default to port 443 (HTTPS) if none is specified.
         if ':' not in host:
@@ -57,8 +151,137 @@ class ClusterManagerTransport(metaclass=abc.ABCMeta):
         if credentials is None:
             credentials, _ = auth.default(scopes=self.AUTH_SCOPES)
 
-        # Save the credentials.
-        self._credentials = credentials
+        # Scope the credentials here rather than when the channel is
+        # created, so that they are the ones the channel authorizes its
+        # calls with and a token fetched ahead of time is used. The
+        # scoped copy, and its token, is shared with every transport
+        # built from the same credentials.
+        self._credentials = refresh.shared_credentials(
+            credentials, self.AUTH_SCOPES)
+        self._credentials_refresher = None
+        if refresh_credentials is not None:
+            self._refresh_in_background(refresh_credentials)
+
+    def _refresh_in_background(self, margin: float) -> None:
+        """Refresh the access token ``margin`` seconds before it expires,
+        in the thread shared by the transports with these credentials."""
+        self._credentials_refresher = refresh.refresh_in_background(
+            self._credentials, margin)
+
+    def _refresh_credentials(self) -> None:
+        """Fetch an access token unless the credentials hold a valid one."""
+        if self._credentials and not self._credentials.valid:
+            self._credentials.refresh(auth_requests.Request())
+
+    def _create_stubs(self) -> None:
+        """Create the stub of every RPC method, and wrap it if the
+        client has prepared the wrapped methods."""
+        wrapped_methods = getattr(self, '_wrapped_methods', None)
+        for name in self._default_method_configs():
+            if wrapped_methods is not None:
+                wrapped_methods[name]
+            else:
+                getattr(self, name)
+
+    def warmup(self, timeout: float = None) -> None:
+        """Prepare the transport for its first call; see the concrete
+        transports."""
+        raise NotImplementedError
+
+    def _default_method_configs(self) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        """Return the default retry and timeout of each RPC method.
+
+        Methods without side effects are retried on transient errors.
+        Methods that change state are never retried by default.
+        """
+        retry = self._retry_class(
+            initial=0.1,
+            maximum=60.0,
+            multiplier=1.3,
+            predicate=retries.if_exception_type(
+                exceptions.DeadlineExceeded,
+                exceptions.ServiceUnavailable,
+            ),
+            deadline=20.0,
+        )
+        return {
+            'list_clusters': {'retry': retry, 'timeout': 20.0},
+            'get_cluster': {'retry': retry, 'timeout': 20.0},
+            'create_cluster': {'retry': None, 'timeout': 45.0},
+            'update_cluster': {'retry': None, 'timeout': 45.0},
+            'update_node_pool': {'retry': None, 'timeout': 45.0},
+            'set_node_pool_autoscaling': {'retry': None, 'timeout': 45.0},
+            'set_logging_service': {'retry': None, 'timeout': 45.0},
+            'set_monitoring_service': {'retry': None, 'timeout': 45.0},
+            'set_addons_config': {'retry': None, 'timeout': 45.0},
+            'set_locations': {'retry': None, 'timeout': 45.0},
+            'update_master': {'retry': None, 'timeout': 45.0},
+            'set_master_auth': {'retry': None, 'timeout': 45.0},
+            'delete_cluster': {'retry': None, 'timeout': 45.0},
+            'list_operations': {'retry': retry, 'timeout': 20.0},
+            'get_operation': {'retry': retry, 'timeout': 20.0},
+            'cancel_operation': {'retry': None, 'timeout': 45.0},
+            'get_server_config': {'retry': retry, 'timeout': 20.0},
+            'list_node_pools': {'retry': retry, 'timeout': 20.0},
+            'get_node_pool': {'retry': retry, 'timeout': 20.0},
+            'create_node_pool': {'retry': None, 'timeout': 45.0},
+            'delete_node_pool': {'retry': None, 'timeout': 45.0},
+            'rollback_node_pool_upgrade': {'retry': None, 'timeout': 45.0},
+            'set_node_pool_management': {'retry': None, 'timeout': 45.0},
+            'set_labels': {'retry': None, 'timeout': 45.0},
+            'set_legacy_abac': {'retry': None, 'timeout': 45.0},
+            'start_ip_rotation': {'retry': None, 'timeout': 45.0},
+            'complete_ip_rotation': {'retry': None, 'timeout': 45.0},
+            'set_node_pool_size': {'retry': None, 'timeout': 45.0},
+            'set_network_policy': {'retry': None, 'timeout': 45.0},
+            'set_maintenance_policy': {'retry': None, 'timeout': 45.0},
+            'list_usable_subnetworks': {'retry': retry, 'timeout': 20.0},
+        }
+
+    def _prep_wrapped_messages(self,
+            client_info: gapic_v1.client_info.ClientInfo,
+            method_configs: typing.Mapping[str, typing.Mapping[str, typing.Any]] = None,
+            metrics: typing.Any = None,
+            interceptors: typing.Sequence[typing.Any] = (),
+            ) -> None:
+        """Prepare the table of wrapped RPC methods used by the client.
+
+        Wrapping an RPC method is comparatively expensive, so it is done
+        once per transport rather than on every call. Each method is
+        wrapped on first use, which keeps channel and stub creation lazy.
+
+        Args:
+            client_info (google.api_core.gapic_v1.client_info.ClientInfo):
+                The client info sent as ``x-goog-api-client`` metadata
+                with every request.
+            method_configs (Optional[Mapping[str, Mapping[str, Any]]]):
+                Overrides of the default retry and timeout, keyed by RPC
+                method name. Each value may set ``retry`` and ``timeout``;
+                a ``retry`` of ``None`` disables retries for that method.
+            metrics (Optional[~.metrics.TransportMetrics]): Where to
+                record the latency and outcome of every call. It is also
+                exposed as :attr:`metrics`.
+            interceptors (Sequence[~.interceptors.Interceptor]): The
+                interceptors every call passes through, the first one
+                outermost.
+
+        Raises:
+            ValueError: If ``method_configs`` names an unknown RPC method
+                or setting.
+        """
+        configs = self._default_method_configs()
+        for name, config in (method_configs or {}).items():
+            if name not in configs:
+                raise ValueError('Unknown RPC method in method_configs: '
+                                 '{!r}.'.format(name))
+            unknown = set(config) - {'retry', 'timeout'}
+            if unknown:
+                raise ValueError('Unknown settings for {!r} in method_configs: '
+                                 '{}.'.format(name, ', '.join(sorted(unknown))))
+            configs[name] = dict(configs[name], **config)
+        self.metrics = metrics
+        self._wrapped_methods = _WrappedMethods(
+            self, client_info, configs, metrics, interceptors)
 
     @property
     def list_clusters(self) -> typing.Callable[
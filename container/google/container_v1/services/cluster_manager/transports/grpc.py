@@ -15,8 +15,11 @@
 # limitations under the License.
 #
 
+import functools
+import time
 from typing import Callable, Dict, Tuple
 
+from google.api_core import exceptions     # type: ignore
 from google.api_core import grpc_helpers   # type: ignore
 from google.auth import credentials        # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
@@ -28,6 +31,8 @@ from google.container_v1.types import cluster_service
 from google.protobuf import empty_pb2 as empty  # type: ignore
 
 from .base import ClusterManagerTransport
+from .pool import ChannelPool
+from .pool import POLICIES
 
 
 class ClusterManagerGrpcTransport(ClusterManagerTransport):
@@ -47,7 +52,10 @@ class ClusterManagerGrpcTransport(ClusterManagerTransport):
             credentials: credentials.Credentials = None,
             channel: grpc.Channel = None,
             api_mtls_endpoint: str = None,
-            client_cert_source: Callable[[], Tuple[bytes, bytes]] = None) -> None:
+            client_cert_source: Callable[[], Tuple[bytes, bytes]] = None,
+            pool_size: int = 1,
+            pool_policy: str = 'round_robin',
+            refresh_credentials: float = None) -> None:
         """Instantiate the transport.
 
         Args:
@@ -68,11 +76,30 @@ class ClusterManagerGrpcTransport(ClusterManagerTransport):
                 callback to provide client SSL certificate bytes and private key
                 bytes, both in PEM format. It is ignored if ``api_mtls_endpoint``
                 is None.
+            pool_size (int): The number of channels to spread calls over.
+                Above 1, the channel is a :class:`~.pool.ChannelPool`.
+                This argument is ignored if ``channel`` is provided.
+            pool_policy (str): How the pool picks a channel for each
+                call: ``'round_robin'`` or ``'least_outstanding'``.
+            refresh_credentials (Optional[float]): If set, the access
+                token is refreshed in a background thread this many
+                seconds before it expires, instead of by a call; see
+                :mod:`~.refresh`. The thread is shared by the transports
+                built from the same credentials.
 
         Raises:
           google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
               creation failed for any reason.
+          ValueError: If ``pool_size`` is less than 1 or ``pool_policy`` is
+              unknown.
         """
+        if pool_size < 1:
+            raise ValueError('pool_size must be at least 1.')
+        if pool_policy not in POLICIES:
+            raise ValueError('pool_policy must be one of {}, got {!r}.'.format(
+                ', '.join(POLICIES), pool_policy))
+        self._pool_size = pool_size
+        self._pool_policy = pool_policy
         if channel:
             # Sanity check: Ensure that channel and credentials are not both
             # provided.
@@ -93,17 +120,20 @@ class ClusterManagerGrpcTransport(ClusterManagerTransport):
             else:
                 ssl_credentials = SslCredentials().ssl_credentials
 
+        # Run the base constructor.
+        super().__init__(host=host, credentials=credentials,
+                         refresh_credentials=refresh_credentials)
+        self._stubs = {}  # type: Dict[str, Callable]
+
+        if not channel and api_mtls_endpoint:
             # create a new channel. The provided one is ignored.
-            self._grpc_channel = grpc_helpers.create_channel(
+            self._grpc_channel = self._pool_channels(functools.partial(
+                grpc_helpers.create_channel,
                 host,
-                credentials=credentials,
+                credentials=self._credentials,
                 ssl_credentials=ssl_credentials,
                 scopes=self.AUTH_SCOPES,
-            )
-
-        # Run the base constructor.
-        super().__init__(host=host, credentials=credentials)
-        self._stubs = {}  # type: Dict[str, Callable]
+            ))
 
     @classmethod
     def create_channel(cls,
@@ -130,6 +160,12 @@ class ClusterManagerGrpcTransport(ClusterManagerTransport):
             **kwargs
         )
 
+    def _pool_channels(self, create_channel: Callable[[], grpc.Channel]) -> grpc.Channel:
+        """Create one channel, or a pool of them if so configured."""
+        if self._pool_size == 1:
+            return create_channel()
+        return ChannelPool(create_channel, self._pool_size, self._pool_policy)
+
     @property
     def grpc_channel(self) -> grpc.Channel:
         """Create the channel designed to connect to this service.
@@ -140,14 +176,51 @@ class ClusterManagerGrpcTransport(ClusterManagerTransport):
         # Sanity check: Only create a new channel if we do not already
         # have one.
         if not hasattr(self, '_grpc_channel'):
-            self._grpc_channel = self.create_channel(
+            self._grpc_channel = self._pool_channels(functools.partial(
+                self.create_channel,
                 self._host,
                 credentials=self._credentials,
-            )
+            ))
 
         # Return the channel from cache.
         return self._grpc_channel
 
+    def warmup(self, timeout: float = None) -> None:
+        """Prepare the transport for its first call.
+
+        Fetch an access token unless the credentials hold a valid one,
+        create and wrap the stub of every RPC method, then connect the
+        channel, or every channel of the pool, and wait until it is
+        ready. The first calls then do not pay for any of it. Warming up
+        again only waits for the channels, so this suits a readiness
+        probe.
+
+        Args:
+            timeout (Optional[float]): The seconds to wait for the
+                channels, or ``None`` to wait as long as it takes.
+
+        Raises:
+            google.api_core.exceptions.DeadlineExceeded: If a channel is
+                not ready within ``timeout``.
+            google.auth.exceptions.RefreshError: If the access token
+                could not be fetched.
+        """
+        self._refresh_credentials()
+        self._create_stubs()
+        channel = self.grpc_channel
+        channels = channel.channels if isinstance(channel, ChannelPool) else [channel]
+        ready = [grpc.channel_ready_future(channel) for channel in channels]
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            for future in ready:
+                future.result(timeout=None if deadline is None
+                              else max(0.0, deadline - time.monotonic()))
+        except grpc.FutureTimeoutError:
+            for future in ready:
+                future.cancel()
+            raise exceptions.DeadlineExceeded(
+                'The channel was not ready within {} seconds.'.format(timeout))
+
     @property
     def list_clusters(self) -> Callable[
             [cluster_service.ListClustersRequest],
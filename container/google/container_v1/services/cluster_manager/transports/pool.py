@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""A pool of gRPC channels that behaves as a single channel.
+
+Each channel is one HTTP/2 connection with its own concurrent stream
+limit. :class:`ChannelPool` spreads calls over several channels, picking
+one per call, so that the stubs built on it are not limited by a single
+connection.
+"""
+
+import itertools
+import threading
+from typing import Callable, Dict, List
+
+import grpc  # type: ignore
+
+
+POLICIES = ('round_robin', 'least_outstanding')
+
+# Errors that indicate a broken connection rather than a failed request.
+_UNHEALTHY_CODES = frozenset([grpc.StatusCode.UNAVAILABLE])
+
+
+class _Member:
+    """A channel of the pool and its load and health."""
+    def __init__(self, channel: grpc.Channel) -> None:
+        self.channel = channel
+        self.outstanding = 0
+        self.failures = 0
+        self.replacing = False
+        self.evicted = False
+        self.callables = {}  # type: Dict[tuple, Callable]
+
+    def callable(self, kind: str, args: tuple, kwargs: dict):
+        key = (kind, args, tuple(sorted(kwargs.items())))
+        if key not in self.callables:
+            self.callables[key] = getattr(self.channel, kind)(*args, **kwargs)
+        return self.callables[key]
+
+
+class _PooledMultiCallable:
+    """A multi-callable that sends each call on a channel of the pool.
+
+    For streaming methods, a call counts as outstanding until the
+    multi-callable returns, not until the stream ends.
+    """
+    _kind = ''
+
+    def __init__(self, pool: 'ChannelPool', args: tuple, kwargs: dict) -> None:
+        self._pool = pool
+        self._args = args
+        self._kwargs = kwargs
+
+    def _invoke(self, attr: str, *args, **kwargs):
+        member = self._pool._acquire()
+        try:
+            multicallable = member.callable(self._kind, self._args, self._kwargs)
+            result = getattr(multicallable, attr)(*args, **kwargs)
+        except Exception as exc:
+            self._pool._release(member, exc)
+            raise
+        self._pool._release(member, None)
+        return result
+
+    def __call__(self, *args, **kwargs):
+        return self._invoke('__call__', *args, **kwargs)
+
+    def with_call(self, *args, **kwargs):
+        return self._invoke('with_call', *args, **kwargs)
+
+    def future(self, *args, **kwargs):
+        member = self._pool._acquire()
+        try:
+            multicallable = member.callable(self._kind, self._args, self._kwargs)
+            future = multicallable.future(*args, **kwargs)
+        except Exception as exc:
+            self._pool._release(member, exc)
+            raise
+
+        def done(future):
+            self._pool._release(
+                member, None if future.cancelled() else future.exception())
+
+        future.add_done_callback(done)
+        return future
+
+
+# Subclass the gRPC interfaces so that api-core wraps the errors of
+# each kind of call appropriately.
+class _PooledUnaryUnary(_PooledMultiCallable, grpc.UnaryUnaryMultiCallable):
+    _kind = 'unary_unary'
+
+
+class _PooledUnaryStream(_PooledMultiCallable, grpc.UnaryStreamMultiCallable):
+    _kind = 'unary_stream'
+
+
+class _PooledStreamUnary(_PooledMultiCallable, grpc.StreamUnaryMultiCallable):
+    _kind = 'stream_unary'
+
+
+class _PooledStreamStream(_PooledMultiCallable, grpc.StreamStreamMultiCallable):
+    _kind = 'stream_stream'
+
+
+class ChannelPool(grpc.Channel):
+    """A fixed-size pool of channels to the same target.
+
+    Every call is sent on one channel, chosen by ``policy``:
+
+    - ``'round_robin'``: the channels are used in turn.
+    - ``'least_outstanding'``: the channel with the fewest calls in
+      flight is used, in turn among equally loaded channels.
+
+    A channel whose last ``max_failures`` calls all failed with
+    ``UNAVAILABLE`` is replaced by a new one, and closed once its calls
+    in flight have completed.
+
+    Args:
+        create_channel (Callable[[], grpc.Channel]): Creates one channel.
+        size (int): The number of channels.
+        policy (str): One of :data:`POLICIES`.
+        max_failures (int): The number of consecutive ``UNAVAILABLE``
+            errors after which a channel is replaced.
+
+    Raises:
+        ValueError: If ``size`` or ``max_failures`` is less than 1, or
+            ``policy`` is unknown.
+    """
+    def __init__(self,
+            create_channel: Callable[[], grpc.Channel],
+            size: int,
+            policy: str = 'round_robin',
+            max_failures: int = 3) -> None:
+        if size < 1:
+            raise ValueError('size must be at least 1.')
+        if policy not in POLICIES:
+            raise ValueError('policy must be one of {}, got {!r}.'.format(
+                ', '.join(POLICIES), policy))
+        if max_failures < 1:
+            raise ValueError('max_failures must be at least 1.')
+        self._create_channel = create_channel
+        self._policy = policy
+        self._max_failures = max_failures
+        self._members = [_Member(create_channel()) for _ in range(size)]
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._evictions = 0
+
+    @property
+    def channels(self) -> List[grpc.Channel]:
+        """The channels currently in the pool."""
+        return [member.channel for member in self._members]
+
+    def stats(self) -> dict:
+        """Return the calls in flight per channel and the eviction count."""
+        with self._lock:
+            return {
+                'outstanding': [member.outstanding for member in self._members],
+                'evictions': self._evictions,
+            }
+
+    def _acquire(self) -> _Member:
+        with self._lock:
+            start = next(self._counter) % len(self._members)
+            members = self._members[start:] + self._members[:start]
+            if self._policy == 'least_outstanding':
+                member = min(members, key=lambda m: m.outstanding)
+            else:
+                member = members[0]
+            member.outstanding += 1
+            return member
+
+    def _release(self, member: _Member, error) -> None:
+        close = None
+        with self._lock:
+            member.outstanding -= 1
+            code = getattr(error, 'code', None)
+            if callable(code) and code() in _UNHEALTHY_CODES:
+                member.failures += 1
+            else:
+                member.failures = 0
+            replace = (not member.replacing
+                       and member.failures >= self._max_failures)
+            if replace:
+                member.replacing = True
+            elif member.evicted and not member.outstanding:
+                close = member.channel
+        if replace:
+            # Create the channel without blocking the choice of channels
+            # for other calls, which use the failing one meanwhile.
+            channel = self._create_channel()
+            with self._lock:
+                self._members[self._members.index(member)] = _Member(channel)
+                member.evicted = True
+                self._evictions += 1
+                if not member.outstanding:
+                    close = member.channel
+        if close is not None:
+            close.close()
+
+    def unary_unary(self, *args, **kwargs):
+        return _PooledUnaryUnary(self, args, kwargs)
+
+    def unary_stream(self, *args, **kwargs):
+        return _PooledUnaryStream(self, args, kwargs)
+
+    def stream_unary(self, *args, **kwargs):
+        return _PooledStreamUnary(self, args, kwargs)
+
+    def stream_stream(self, *args, **kwargs):
+        return _PooledStreamStream(self, args, kwargs)
+
+    def subscribe(self, callback, try_to_connect=False):
+        for channel in self.channels:
+            channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        for channel in self.channels:
+            channel.unsubscribe(callback)
+
+    def close(self):
+        for channel in self.channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+__all__ = (
+    'ChannelPool',
+    'POLICIES',
+)
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Credentials shared between transports and refreshed in the background.
+
+Transports built from the same credentials share one copy of them,
+scoped to the service, and so one access token. By default that token
+is refreshed by whichever call finds it about to expire, which then
+waits for the token endpoint.
+
+A :class:`CredentialsRefresher` instead refreshes it in a daemon thread
+``margin`` seconds before it expires, early enough that calls never
+refresh it themselves. A failed refresh is retried; should the token
+expire regardless, calls fall back to refreshing it.
+"""
+
+import datetime
+import threading
+import weakref
+from typing import Optional, Sequence
+
+from google.auth import credentials as auth_credentials  # type: ignore
+from google.auth.transport import requests as auth_requests  # type: ignore
+
+
+DEFAULT_MARGIN = 300.0
+"""The default seconds before expiry at which a token is refreshed.
+
+google-auth refreshes tokens that expire within 3 minutes 45 seconds
+on the calling thread, so the margin must be longer than that.
+"""
+
+_lock = threading.Lock()
+# The scoped copies of credentials, per scopes; and the refresher of
+# each shared copy. Neither keeps the credentials alive.
+_scoped = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+_refreshers = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+
+
+def shared_credentials(credentials: auth_credentials.Credentials,
+        scopes: Sequence[str]) -> auth_credentials.Credentials:
+    """Return ``credentials`` scoped to ``scopes``.
+
+    Credentials that require scopes are copied once per ``scopes``, and
+    the copy is shared by every caller, so that they share its token.
+    Other credentials are returned as they are.
+    """
+    if not (isinstance(credentials, auth_credentials.Scoped)
+            and credentials.requires_scopes):
+        return credentials
+    scopes = tuple(scopes)
+    with _lock:
+        copies = _scoped.setdefault(credentials, {})
+        if scopes not in copies:
+            copies[scopes] = credentials.with_scopes(scopes)
+        return copies[scopes]
+
+
+class CredentialsRefresher:
+    """Refresh credentials in a daemon thread shortly before they expire.
+
+    Only a weak reference to the credentials is kept; the thread ends
+    once they have been garbage collected, or once they turn out not to
+    expire.
+
+    Args:
+        credentials (google.auth.credentials.Credentials): The
+            credentials to refresh. Invalid credentials are refreshed
+            right away.
+        margin (float): The seconds before expiry at which to refresh.
+        retry_delay (float): The seconds to wait after a failed
+            refresh, and at least between two refreshes.
+
+    Raises:
+        ValueError: If ``margin`` or ``retry_delay`` is not positive.
+    """
+    def __init__(self,
+            credentials: auth_credentials.Credentials,
+            margin: float = DEFAULT_MARGIN,
+            retry_delay: float = 10.0) -> None:
+        if margin <= 0 or retry_delay <= 0:
+            raise ValueError('margin and retry_delay must be positive.')
+        self._credentials = weakref.ref(credentials)
+        self._margin = margin
+        self._retry_delay = retry_delay
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name='credentials-refresher', daemon=True)
+        self.refreshes = 0
+        self.failures = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the thread is running."""
+        return self._thread.is_alive()
+
+    def start(self) -> 'CredentialsRefresher':
+        """Start the thread; return the refresher."""
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = None) -> None:
+        """Stop the thread and wait up to ``timeout`` seconds for it."""
+        self._stopped.set()
+        if self.running:
+            self._thread.join(timeout)
+
+    def _next_refresh(self) -> Optional[float]:
+        """Return the seconds until the next refresh, or ``None`` if the
+        credentials are gone or do not expire."""
+        credentials = self._credentials()
+        if credentials is None:
+            return None
+        if not credentials.valid:
+            return 0.0
+        if credentials.expiry is None:
+            return None
+        remaining = credentials.expiry - datetime.datetime.utcnow()
+        return remaining.total_seconds() - self._margin
+
+    def _refresh(self) -> Optional[float]:
+        """Refresh the credentials; return the seconds until the next
+        refresh, as :meth:`_next_refresh` does."""
+        credentials = self._credentials()
+        if credentials is None:
+            return None
+        try:
+            credentials.refresh(auth_requests.Request())
+        except Exception:
+            self.failures += 1
+            return self._retry_delay
+        self.refreshes += 1
+        delay = self._next_refresh()
+        return None if delay is None else max(delay, self._retry_delay)
+
+    def _run(self) -> None:
+        delay = self._next_refresh()
+        while delay is not None and not self._stopped.wait(max(0.0, delay)):
+            delay = self._refresh()
+
+
+def refresh_in_background(credentials: auth_credentials.Credentials,
+        margin: float = DEFAULT_MARGIN) -> Optional[CredentialsRefresher]:
+    """Return the running refresher of ``credentials``, starting one if
+    there is none.
+
+    Every transport sharing the credentials shares their refresher, and
+    the ``margin`` of the first one applies. Returns ``None`` for
+    anonymous credentials, which have no token.
+    """
+    if not credentials or isinstance(credentials, auth_credentials.AnonymousCredentials):
+        return None
+    with _lock:
+        refresher = _refreshers.get(credentials)
+        if refresher is None or not refresher.running:
+            refresher = _refreshers[credentials] = CredentialsRefresher(
+                credentials, margin).start()
+        return refresher
+
+
+def from_option(option) -> Optional[float]:
+    """Resolve the ``refresh_credentials`` client option to a margin."""
+    if option is True:
+        return DEFAULT_MARGIN
+    if option:
+        return float(option)
+    return None
+
+
+__all__ = (
+    'CredentialsRefresher',
+    'DEFAULT_MARGIN',
+)
@@ -27,9 +27,9 @@ setuptools.setup(
     include_package_data=True,
     install_requires=(
         'google-auth >= 1.14.0',
-        'google-api-core >= 1.17.0, < 2.0.0dev',
+        'google-api-core >= 1.22.0, < 2.0.0dev',
         'googleapis-common-protos >= 1.5.8',
-        'grpcio >= 1.10.0',
+        'grpcio >= 1.32.0',
         'proto-plus >= 0.4.0',
     ),
     python_requires='>=3.6',
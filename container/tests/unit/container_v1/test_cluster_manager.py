@@ -15,19 +15,32 @@
 # limitations under the License.
 #
 
+import asyncio
+from concurrent import futures
+import datetime
+import gc
+import sys
+import time
 from unittest import mock
 
 import grpc
+from grpc import aio
 import math
 import pytest
 
 from google import auth
 from google.api_core import client_options
+from google.api_core import exceptions
 from google.api_core import grpc_helpers
+from google.api_core import grpc_helpers_async
 from google.auth import credentials
+from google.container_v1.services.cluster_manager import ClusterManagerAsyncClient
 from google.container_v1.services.cluster_manager import ClusterManagerClient
 from google.container_v1.services.cluster_manager import pagers
 from google.container_v1.services.cluster_manager import transports
+from google.container_v1.services.cluster_manager.transports import interceptors
+from google.container_v1.services.cluster_manager.transports import metrics
+from google.container_v1.services.cluster_manager.transports import refresh
 from google.container_v1.types import cluster_service
 from google.oauth2 import service_account
 from google.protobuf import timestamp_pb2 as timestamp  # type: ignore
@@ -37,6 +50,22 @@ def client_cert_source_callback():
     return b"cert bytes", b"key bytes"
 
 
+class AwaitableMock(mock.Mock):
+    """A mock whose calls return awaitables, as ``mock.AsyncMock`` does
+    on Python 3.8 and later."""
+    def __call__(self, *args, **kwargs):
+        try:
+            result, error = super().__call__(*args, **kwargs), None
+        except Exception as exc:
+            result, error = None, exc
+
+        async def call():
+            if error is not None:
+                raise error
+            return result
+        return call()
+
+
 def test__get_default_mtls_endpoint():
     api_endpoint = "example.googleapis.com"
     api_mtls_endpoint = "example.mtls.googleapis.com"
@@ -172,6 +201,39 @@ def test_list_clusters(transport: str = 'grpc'):
     assert response.missing_zones == ['missing_zones_value']
 
 
+@pytest.mark.asyncio
+async def test_list_clusters_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.ListClustersRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_clusters),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.ListClustersResponse(
+            missing_zones=['missing_zones_value'],
+        ))
+
+        response = await client.list_clusters(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.ListClustersResponse)
+    assert response.missing_zones == ['missing_zones_value']
+
+
 def test_list_clusters_field_headers():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
@@ -203,6 +265,38 @@ def test_list_clusters_field_headers():
     ) in kw['metadata']
 
 
+@pytest.mark.asyncio
+async def test_list_clusters_field_headers_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = cluster_service.ListClustersRequest(
+        parent='parent/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_clusters),
+            '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.ListClustersResponse())
+        await client.list_clusters(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'parent=parent/value',
+    ) in kw['metadata']
+
+
 def test_list_clusters_flattened():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
@@ -232,6 +326,36 @@ def test_list_clusters_flattened():
         assert args[0].parent == 'parent_value'
 
 
+@pytest.mark.asyncio
+async def test_list_clusters_flattened_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_clusters),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.ListClustersResponse())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.list_clusters(
+            project_id='project_id_value',
+            zone='zone_value',
+            parent='parent_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].parent == 'parent_value'
+
+
 def test_list_clusters_flattened_error():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
@@ -248,6 +372,23 @@ def test_list_clusters_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_list_clusters_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.list_clusters(
+            cluster_service.ListClustersRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            parent='parent_value',
+        )
+
+
 def test_get_cluster(transport: str = 'grpc'):
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
@@ -336,6 +477,95 @@ def test_get_cluster(transport: str = 'grpc'):
     assert response.tpu_ipv4_cidr_block == 'tpu_ipv4_cidr_block_value'
 
 
+@pytest.mark.asyncio
+async def test_get_cluster_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.GetClusterRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_cluster),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Cluster(
+            name='name_value',
+            description='description_value',
+            initial_node_count=1911,
+            logging_service='logging_service_value',
+            monitoring_service='monitoring_service_value',
+            network='network_value',
+            cluster_ipv4_cidr='cluster_ipv4_cidr_value',
+            subnetwork='subnetwork_value',
+            locations=['locations_value'],
+            enable_kubernetes_alpha=True,
+            label_fingerprint='label_fingerprint_value',
+            self_link='self_link_value',
+            zone='zone_value',
+            endpoint='endpoint_value',
+            initial_cluster_version='initial_cluster_version_value',
+            current_master_version='current_master_version_value',
+            current_node_version='current_node_version_value',
+            create_time='create_time_value',
+            status=cluster_service.Cluster.Status.PROVISIONING,
+            status_message='status_message_value',
+            node_ipv4_cidr_size=1955,
+            services_ipv4_cidr='services_ipv4_cidr_value',
+            instance_group_urls=['instance_group_urls_value'],
+            current_node_count=1936,
+            expire_time='expire_time_value',
+            location='location_value',
+            enable_tpu=True,
+            tpu_ipv4_cidr_block='tpu_ipv4_cidr_block_value',
+        ))
+
+        response = await client.get_cluster(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Cluster)
+    assert response.name == 'name_value'
+    assert response.description == 'description_value'
+    assert response.initial_node_count == 1911
+    assert response.logging_service == 'logging_service_value'
+    assert response.monitoring_service == 'monitoring_service_value'
+    assert response.network == 'network_value'
+    assert response.cluster_ipv4_cidr == 'cluster_ipv4_cidr_value'
+    assert response.subnetwork == 'subnetwork_value'
+    assert response.locations == ['locations_value']
+
+    assert response.enable_kubernetes_alpha is True
+    assert response.label_fingerprint == 'label_fingerprint_value'
+    assert response.self_link == 'self_link_value'
+    assert response.zone == 'zone_value'
+    assert response.endpoint == 'endpoint_value'
+    assert response.initial_cluster_version == 'initial_cluster_version_value'
+    assert response.current_master_version == 'current_master_version_value'
+    assert response.current_node_version == 'current_node_version_value'
+    assert response.create_time == 'create_time_value'
+    assert response.status == cluster_service.Cluster.Status.PROVISIONING
+    assert response.status_message == 'status_message_value'
+    assert response.node_ipv4_cidr_size == 1955
+    assert response.services_ipv4_cidr == 'services_ipv4_cidr_value'
+    assert response.instance_group_urls == ['instance_group_urls_value']
+    assert response.current_node_count == 1936
+    assert response.expire_time == 'expire_time_value'
+    assert response.location == 'location_value'
+
+    assert response.enable_tpu is True
+    assert response.tpu_ipv4_cidr_block == 'tpu_ipv4_cidr_block_value'
+
+
 def test_get_cluster_field_headers():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
@@ -367,6 +597,38 @@ def test_get_cluster_field_headers():
     ) in kw['metadata']
 
 
+@pytest.mark.asyncio
+async def test_get_cluster_field_headers_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = cluster_service.GetClusterRequest(
+        name='name/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_cluster),
+            '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Cluster())
+        await client.get_cluster(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'name=name/value',
+    ) in kw['metadata']
+
+
 def test_get_cluster_flattened():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
@@ -398,6 +660,38 @@ def test_get_cluster_flattened():
         assert args[0].name == 'name_value'
 
 
+@pytest.mark.asyncio
+async def test_get_cluster_flattened_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_cluster),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Cluster())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.get_cluster(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].name == 'name_value'
+
+
 def test_get_cluster_flattened_error():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
@@ -415,6 +709,24 @@ def test_get_cluster_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_get_cluster_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.get_cluster(
+            cluster_service.GetClusterRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            name='name_value',
+        )
+
+
 def test_create_cluster(transport: str = 'grpc'):
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
@@ -467,22 +779,107 @@ def test_create_cluster(transport: str = 'grpc'):
     assert response.end_time == 'end_time_value'
 
 
-def test_create_cluster_flattened():
-    client = ClusterManagerClient(
+@pytest.mark.asyncio
+async def test_create_cluster_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
         credentials=credentials.AnonymousCredentials(),
+        transport=transport,
     )
 
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.CreateClusterRequest()
+
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.create_cluster),
+            type(client._client._transport.create_cluster),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation()
-
-        # Call the method with a truthy value for each flattened field,
-        # using the keyword arguments to the method.
-        response = client.create_cluster(
-            project_id='project_id_value',
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        ))
+
+        response = await client.create_cluster(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+def test_create_cluster_flattened():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.create_cluster),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.Operation()
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = client.create_cluster(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster=cluster_service.Cluster(name='name_value'),
+            parent='parent_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster == cluster_service.Cluster(name='name_value')
+        assert args[0].parent == 'parent_value'
+
+
+@pytest.mark.asyncio
+async def test_create_cluster_flattened_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.create_cluster),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.create_cluster(
+            project_id='project_id_value',
             zone='zone_value',
             cluster=cluster_service.Cluster(name='name_value'),
             parent='parent_value',
@@ -515,6 +912,24 @@ def test_create_cluster_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_create_cluster_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.create_cluster(
+            cluster_service.CreateClusterRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster=cluster_service.Cluster(name='name_value'),
+            parent='parent_value',
+        )
+
+
 def test_update_cluster(transport: str = 'grpc'):
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
@@ -567,6 +982,59 @@ def test_update_cluster(transport: str = 'grpc'):
     assert response.end_time == 'end_time_value'
 
 
+@pytest.mark.asyncio
+async def test_update_cluster_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.UpdateClusterRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.update_cluster),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        ))
+
+        response = await client.update_cluster(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
 def test_update_cluster_flattened():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
@@ -600,6 +1068,40 @@ def test_update_cluster_flattened():
         assert args[0].name == 'name_value'
 
 
+@pytest.mark.asyncio
+async def test_update_cluster_flattened_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.update_cluster),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.update_cluster(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            update=cluster_service.ClusterUpdate(desired_node_version='desired_node_version_value'),
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].update == cluster_service.ClusterUpdate(desired_node_version='desired_node_version_value')
+        assert args[0].name == 'name_value'
+
+
 def test_update_cluster_flattened_error():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
@@ -618,6 +1120,25 @@ def test_update_cluster_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_update_cluster_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.update_cluster(
+            cluster_service.UpdateClusterRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            update=cluster_service.ClusterUpdate(desired_node_version='desired_node_version_value'),
+            name='name_value',
+        )
+
+
 def test_update_node_pool(transport: str = 'grpc'):
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
@@ -670,22 +1191,23 @@ def test_update_node_pool(transport: str = 'grpc'):
     assert response.end_time == 'end_time_value'
 
 
-def test_set_node_pool_autoscaling(transport: str = 'grpc'):
-    client = ClusterManagerClient(
+@pytest.mark.asyncio
+async def test_update_node_pool_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
         credentials=credentials.AnonymousCredentials(),
         transport=transport,
     )
 
     # Everything is optional in proto3 as far as the runtime is concerned,
     # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.SetNodePoolAutoscalingRequest()
+    request = cluster_service.UpdateNodePoolRequest()
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.set_node_pool_autoscaling),
+            type(client._client._transport.update_node_pool),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation(
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
             name='name_value',
             zone='zone_value',
             operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
@@ -697,9 +1219,9 @@ def test_set_node_pool_autoscaling(transport: str = 'grpc'):
             location='location_value',
             start_time='start_time_value',
             end_time='end_time_value',
-        )
+        ))
 
-        response = client.set_node_pool_autoscaling(request)
+        response = await client.update_node_pool(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
@@ -722,7 +1244,7 @@ def test_set_node_pool_autoscaling(transport: str = 'grpc'):
     assert response.end_time == 'end_time_value'
 
 
-def test_set_logging_service(transport: str = 'grpc'):
+def test_set_node_pool_autoscaling(transport: str = 'grpc'):
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
         transport=transport,
@@ -730,11 +1252,11 @@ def test_set_logging_service(transport: str = 'grpc'):
 
     # Everything is optional in proto3 as far as the runtime is concerned,
     # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.SetLoggingServiceRequest()
+    request = cluster_service.SetNodePoolAutoscalingRequest()
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.set_logging_service),
+            type(client._transport.set_node_pool_autoscaling),
             '__call__') as call:
         # Designate an appropriate return value for the call.
         call.return_value = cluster_service.Operation(
@@ -751,7 +1273,7 @@ def test_set_logging_service(transport: str = 'grpc'):
             end_time='end_time_value',
         )
 
-        response = client.set_logging_service(request)
+        response = client.set_node_pool_autoscaling(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
@@ -774,73 +1296,23 @@ def test_set_logging_service(transport: str = 'grpc'):
     assert response.end_time == 'end_time_value'
 
 
-def test_set_logging_service_flattened():
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-    )
-
-    # Mock the actual call within the gRPC stub, and fake the request.
-    with mock.patch.object(
-            type(client._transport.set_logging_service),
-            '__call__') as call:
-        # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation()
-
-        # Call the method with a truthy value for each flattened field,
-        # using the keyword arguments to the method.
-        response = client.set_logging_service(
-            project_id='project_id_value',
-            zone='zone_value',
-            cluster_id='cluster_id_value',
-            logging_service='logging_service_value',
-            name='name_value',
-        )
-
-        # Establish that the underlying call was made with the expected
-        # request object values.
-        assert len(call.mock_calls) == 1
-        _, args, _ = call.mock_calls[0]
-        assert args[0].project_id == 'project_id_value'
-        assert args[0].zone == 'zone_value'
-        assert args[0].cluster_id == 'cluster_id_value'
-        assert args[0].logging_service == 'logging_service_value'
-        assert args[0].name == 'name_value'
-
-
-def test_set_logging_service_flattened_error():
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.set_logging_service(
-            cluster_service.SetLoggingServiceRequest(),
-            project_id='project_id_value',
-            zone='zone_value',
-            cluster_id='cluster_id_value',
-            logging_service='logging_service_value',
-            name='name_value',
-        )
-
-
-def test_set_monitoring_service(transport: str = 'grpc'):
-    client = ClusterManagerClient(
+@pytest.mark.asyncio
+async def test_set_node_pool_autoscaling_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
         credentials=credentials.AnonymousCredentials(),
         transport=transport,
     )
 
     # Everything is optional in proto3 as far as the runtime is concerned,
     # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.SetMonitoringServiceRequest()
+    request = cluster_service.SetNodePoolAutoscalingRequest()
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.set_monitoring_service),
+            type(client._client._transport.set_node_pool_autoscaling),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation(
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
             name='name_value',
             zone='zone_value',
             operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
@@ -852,9 +1324,9 @@ def test_set_monitoring_service(transport: str = 'grpc'):
             location='location_value',
             start_time='start_time_value',
             end_time='end_time_value',
-        )
+        ))
 
-        response = client.set_monitoring_service(request)
+        response = await client.set_node_pool_autoscaling(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
@@ -877,58 +1349,7 @@ def test_set_monitoring_service(transport: str = 'grpc'):
     assert response.end_time == 'end_time_value'
 
 
-def test_set_monitoring_service_flattened():
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-    )
-
-    # Mock the actual call within the gRPC stub, and fake the request.
-    with mock.patch.object(
-            type(client._transport.set_monitoring_service),
-            '__call__') as call:
-        # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation()
-
-        # Call the method with a truthy value for each flattened field,
-        # using the keyword arguments to the method.
-        response = client.set_monitoring_service(
-            project_id='project_id_value',
-            zone='zone_value',
-            cluster_id='cluster_id_value',
-            monitoring_service='monitoring_service_value',
-            name='name_value',
-        )
-
-        # Establish that the underlying call was made with the expected
-        # request object values.
-        assert len(call.mock_calls) == 1
-        _, args, _ = call.mock_calls[0]
-        assert args[0].project_id == 'project_id_value'
-        assert args[0].zone == 'zone_value'
-        assert args[0].cluster_id == 'cluster_id_value'
-        assert args[0].monitoring_service == 'monitoring_service_value'
-        assert args[0].name == 'name_value'
-
-
-def test_set_monitoring_service_flattened_error():
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.set_monitoring_service(
-            cluster_service.SetMonitoringServiceRequest(),
-            project_id='project_id_value',
-            zone='zone_value',
-            cluster_id='cluster_id_value',
-            monitoring_service='monitoring_service_value',
-            name='name_value',
-        )
-
-
-def test_set_addons_config(transport: str = 'grpc'):
+def test_set_logging_service(transport: str = 'grpc'):
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
         transport=transport,
@@ -936,11 +1357,11 @@ def test_set_addons_config(transport: str = 'grpc'):
 
     # Everything is optional in proto3 as far as the runtime is concerned,
     # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.SetAddonsConfigRequest()
+    request = cluster_service.SetLoggingServiceRequest()
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.set_addons_config),
+            type(client._transport.set_logging_service),
             '__call__') as call:
         # Designate an appropriate return value for the call.
         call.return_value = cluster_service.Operation(
@@ -957,7 +1378,7 @@ def test_set_addons_config(transport: str = 'grpc'):
             end_time='end_time_value',
         )
 
-        response = client.set_addons_config(request)
+        response = client.set_logging_service(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
@@ -980,73 +1401,23 @@ def test_set_addons_config(transport: str = 'grpc'):
     assert response.end_time == 'end_time_value'
 
 
-def test_set_addons_config_flattened():
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-    )
-
-    # Mock the actual call within the gRPC stub, and fake the request.
-    with mock.patch.object(
-            type(client._transport.set_addons_config),
-            '__call__') as call:
-        # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation()
-
-        # Call the method with a truthy value for each flattened field,
-        # using the keyword arguments to the method.
-        response = client.set_addons_config(
-            project_id='project_id_value',
-            zone='zone_value',
-            cluster_id='cluster_id_value',
-            addons_config=cluster_service.AddonsConfig(http_load_balancing=cluster_service.HttpLoadBalancing(disabled=True)),
-            name='name_value',
-        )
-
-        # Establish that the underlying call was made with the expected
-        # request object values.
-        assert len(call.mock_calls) == 1
-        _, args, _ = call.mock_calls[0]
-        assert args[0].project_id == 'project_id_value'
-        assert args[0].zone == 'zone_value'
-        assert args[0].cluster_id == 'cluster_id_value'
-        assert args[0].addons_config == cluster_service.AddonsConfig(http_load_balancing=cluster_service.HttpLoadBalancing(disabled=True))
-        assert args[0].name == 'name_value'
-
-
-def test_set_addons_config_flattened_error():
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.set_addons_config(
-            cluster_service.SetAddonsConfigRequest(),
-            project_id='project_id_value',
-            zone='zone_value',
-            cluster_id='cluster_id_value',
-            addons_config=cluster_service.AddonsConfig(http_load_balancing=cluster_service.HttpLoadBalancing(disabled=True)),
-            name='name_value',
-        )
-
-
-def test_set_locations(transport: str = 'grpc'):
-    client = ClusterManagerClient(
+@pytest.mark.asyncio
+async def test_set_logging_service_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
         credentials=credentials.AnonymousCredentials(),
         transport=transport,
     )
 
     # Everything is optional in proto3 as far as the runtime is concerned,
     # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.SetLocationsRequest()
+    request = cluster_service.SetLoggingServiceRequest()
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.set_locations),
+            type(client._client._transport.set_logging_service),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation(
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
             name='name_value',
             zone='zone_value',
             operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
@@ -1058,9 +1429,9 @@ def test_set_locations(transport: str = 'grpc'):
             location='location_value',
             start_time='start_time_value',
             end_time='end_time_value',
-        )
+        ))
 
-        response = client.set_locations(request)
+        response = await client.set_logging_service(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
@@ -1083,25 +1454,25 @@ def test_set_locations(transport: str = 'grpc'):
     assert response.end_time == 'end_time_value'
 
 
-def test_set_locations_flattened():
+def test_set_logging_service_flattened():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
     )
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.set_locations),
+            type(client._transport.set_logging_service),
             '__call__') as call:
         # Designate an appropriate return value for the call.
         call.return_value = cluster_service.Operation()
 
         # Call the method with a truthy value for each flattened field,
         # using the keyword arguments to the method.
-        response = client.set_locations(
+        response = client.set_logging_service(
             project_id='project_id_value',
             zone='zone_value',
             cluster_id='cluster_id_value',
-            locations=['locations_value'],
+            logging_service='logging_service_value',
             name='name_value',
         )
 
@@ -1112,99 +1483,30 @@ def test_set_locations_flattened():
         assert args[0].project_id == 'project_id_value'
         assert args[0].zone == 'zone_value'
         assert args[0].cluster_id == 'cluster_id_value'
-        assert args[0].locations == ['locations_value']
+        assert args[0].logging_service == 'logging_service_value'
         assert args[0].name == 'name_value'
 
 
-def test_set_locations_flattened_error():
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.set_locations(
-            cluster_service.SetLocationsRequest(),
-            project_id='project_id_value',
-            zone='zone_value',
-            cluster_id='cluster_id_value',
-            locations=['locations_value'],
-            name='name_value',
-        )
-
-
-def test_update_master(transport: str = 'grpc'):
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-        transport=transport,
-    )
-
-    # Everything is optional in proto3 as far as the runtime is concerned,
-    # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.UpdateMasterRequest()
-
-    # Mock the actual call within the gRPC stub, and fake the request.
-    with mock.patch.object(
-            type(client._transport.update_master),
-            '__call__') as call:
-        # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation(
-            name='name_value',
-            zone='zone_value',
-            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
-            status=cluster_service.Operation.Status.PENDING,
-            detail='detail_value',
-            status_message='status_message_value',
-            self_link='self_link_value',
-            target_link='target_link_value',
-            location='location_value',
-            start_time='start_time_value',
-            end_time='end_time_value',
-        )
-
-        response = client.update_master(request)
-
-        # Establish that the underlying gRPC stub method was called.
-        assert len(call.mock_calls) == 1
-        _, args, _ = call.mock_calls[0]
-
-        assert args[0] == request
-
-    # Establish that the response is the type that we expect.
-    assert isinstance(response, cluster_service.Operation)
-    assert response.name == 'name_value'
-    assert response.zone == 'zone_value'
-    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
-    assert response.status == cluster_service.Operation.Status.PENDING
-    assert response.detail == 'detail_value'
-    assert response.status_message == 'status_message_value'
-    assert response.self_link == 'self_link_value'
-    assert response.target_link == 'target_link_value'
-    assert response.location == 'location_value'
-    assert response.start_time == 'start_time_value'
-    assert response.end_time == 'end_time_value'
-
-
-def test_update_master_flattened():
-    client = ClusterManagerClient(
+@pytest.mark.asyncio
+async def test_set_logging_service_flattened_async():
+    client = ClusterManagerAsyncClient(
         credentials=credentials.AnonymousCredentials(),
     )
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.update_master),
+            type(client._client._transport.set_logging_service),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation()
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation())
 
         # Call the method with a truthy value for each flattened field,
         # using the keyword arguments to the method.
-        response = client.update_master(
+        response = await client.set_logging_service(
             project_id='project_id_value',
             zone='zone_value',
             cluster_id='cluster_id_value',
-            master_version='master_version_value',
+            logging_service='logging_service_value',
             name='name_value',
         )
 
@@ -1215,11 +1517,11 @@ def test_update_master_flattened():
         assert args[0].project_id == 'project_id_value'
         assert args[0].zone == 'zone_value'
         assert args[0].cluster_id == 'cluster_id_value'
-        assert args[0].master_version == 'master_version_value'
+        assert args[0].logging_service == 'logging_service_value'
         assert args[0].name == 'name_value'
 
 
-def test_update_master_flattened_error():
+def test_set_logging_service_flattened_error():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
     )
@@ -1227,17 +1529,36 @@ def test_update_master_flattened_error():
     # Attempting to call a method with both a request object and flattened
     # fields is an error.
     with pytest.raises(ValueError):
-        client.update_master(
-            cluster_service.UpdateMasterRequest(),
+        client.set_logging_service(
+            cluster_service.SetLoggingServiceRequest(),
             project_id='project_id_value',
             zone='zone_value',
             cluster_id='cluster_id_value',
-            master_version='master_version_value',
+            logging_service='logging_service_value',
             name='name_value',
         )
 
 
-def test_set_master_auth(transport: str = 'grpc'):
+@pytest.mark.asyncio
+async def test_set_logging_service_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.set_logging_service(
+            cluster_service.SetLoggingServiceRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            logging_service='logging_service_value',
+            name='name_value',
+        )
+
+
+def test_set_monitoring_service(transport: str = 'grpc'):
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
         transport=transport,
@@ -1245,11 +1566,11 @@ def test_set_master_auth(transport: str = 'grpc'):
 
     # Everything is optional in proto3 as far as the runtime is concerned,
     # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.SetMasterAuthRequest()
+    request = cluster_service.SetMonitoringServiceRequest()
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.set_master_auth),
+            type(client._transport.set_monitoring_service),
             '__call__') as call:
         # Designate an appropriate return value for the call.
         call.return_value = cluster_service.Operation(
@@ -1266,7 +1587,7 @@ def test_set_master_auth(transport: str = 'grpc'):
             end_time='end_time_value',
         )
 
-        response = client.set_master_auth(request)
+        response = client.set_monitoring_service(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
@@ -1289,22 +1610,23 @@ def test_set_master_auth(transport: str = 'grpc'):
     assert response.end_time == 'end_time_value'
 
 
-def test_delete_cluster(transport: str = 'grpc'):
-    client = ClusterManagerClient(
+@pytest.mark.asyncio
+async def test_set_monitoring_service_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
         credentials=credentials.AnonymousCredentials(),
         transport=transport,
     )
 
     # Everything is optional in proto3 as far as the runtime is concerned,
     # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.DeleteClusterRequest()
+    request = cluster_service.SetMonitoringServiceRequest()
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.delete_cluster),
+            type(client._client._transport.set_monitoring_service),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation(
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
             name='name_value',
             zone='zone_value',
             operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
@@ -1316,9 +1638,9 @@ def test_delete_cluster(transport: str = 'grpc'):
             location='location_value',
             start_time='start_time_value',
             end_time='end_time_value',
-        )
+        ))
 
-        response = client.delete_cluster(request)
+        response = await client.set_monitoring_service(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
@@ -1341,24 +1663,25 @@ def test_delete_cluster(transport: str = 'grpc'):
     assert response.end_time == 'end_time_value'
 
 
-def test_delete_cluster_flattened():
+def test_set_monitoring_service_flattened():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
     )
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.delete_cluster),
+            type(client._transport.set_monitoring_service),
             '__call__') as call:
         # Designate an appropriate return value for the call.
         call.return_value = cluster_service.Operation()
 
         # Call the method with a truthy value for each flattened field,
         # using the keyword arguments to the method.
-        response = client.delete_cluster(
+        response = client.set_monitoring_service(
             project_id='project_id_value',
             zone='zone_value',
             cluster_id='cluster_id_value',
+            monitoring_service='monitoring_service_value',
             name='name_value',
         )
 
@@ -1369,106 +1692,31 @@ def test_delete_cluster_flattened():
         assert args[0].project_id == 'project_id_value'
         assert args[0].zone == 'zone_value'
         assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].monitoring_service == 'monitoring_service_value'
         assert args[0].name == 'name_value'
 
 
-def test_delete_cluster_flattened_error():
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.delete_cluster(
-            cluster_service.DeleteClusterRequest(),
-            project_id='project_id_value',
-            zone='zone_value',
-            cluster_id='cluster_id_value',
-            name='name_value',
-        )
-
-
-def test_list_operations(transport: str = 'grpc'):
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-        transport=transport,
-    )
-
-    # Everything is optional in proto3 as far as the runtime is concerned,
-    # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.ListOperationsRequest()
-
-    # Mock the actual call within the gRPC stub, and fake the request.
-    with mock.patch.object(
-            type(client._transport.list_operations),
-            '__call__') as call:
-        # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.ListOperationsResponse(
-            missing_zones=['missing_zones_value'],
-        )
-
-        response = client.list_operations(request)
-
-        # Establish that the underlying gRPC stub method was called.
-        assert len(call.mock_calls) == 1
-        _, args, _ = call.mock_calls[0]
-
-        assert args[0] == request
-
-    # Establish that the response is the type that we expect.
-    assert isinstance(response, cluster_service.ListOperationsResponse)
-    assert response.missing_zones == ['missing_zones_value']
-
-
-def test_list_operations_field_headers():
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-  )
-
-    # Any value that is part of the HTTP/1.1 URI should be sent as
-    # a field header. Set these to a non-empty value.
-    request = cluster_service.ListOperationsRequest(
-        parent='parent/value',
-    )
-
-    # Mock the actual call within the gRPC stub, and fake the request.
-    with mock.patch.object(
-            type(client._transport.list_operations),
-            '__call__') as call:
-        call.return_value = cluster_service.ListOperationsResponse()
-        client.list_operations(request)
-
-        # Establish that the underlying gRPC stub method was called.
-        assert len(call.mock_calls) == 1
-        _, args, _ = call.mock_calls[0]
-        assert args[0] == request
-
-    # Establish that the field header was sent.
-    _, _, kw = call.mock_calls[0]
-    assert (
-        'x-goog-request-params',
-        'parent=parent/value',
-    ) in kw['metadata']
-
-
-def test_list_operations_flattened():
-    client = ClusterManagerClient(
+@pytest.mark.asyncio
+async def test_set_monitoring_service_flattened_async():
+    client = ClusterManagerAsyncClient(
         credentials=credentials.AnonymousCredentials(),
     )
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.list_operations),
+            type(client._client._transport.set_monitoring_service),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.ListOperationsResponse()
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation())
 
         # Call the method with a truthy value for each flattened field,
         # using the keyword arguments to the method.
-        response = client.list_operations(
+        response = await client.set_monitoring_service(
             project_id='project_id_value',
             zone='zone_value',
+            cluster_id='cluster_id_value',
+            monitoring_service='monitoring_service_value',
+            name='name_value',
         )
 
         # Establish that the underlying call was made with the expected
@@ -1477,9 +1725,12 @@ def test_list_operations_flattened():
         _, args, _ = call.mock_calls[0]
         assert args[0].project_id == 'project_id_value'
         assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].monitoring_service == 'monitoring_service_value'
+        assert args[0].name == 'name_value'
 
 
-def test_list_operations_flattened_error():
+def test_set_monitoring_service_flattened_error():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
     )
@@ -1487,14 +1738,36 @@ def test_list_operations_flattened_error():
     # Attempting to call a method with both a request object and flattened
     # fields is an error.
     with pytest.raises(ValueError):
-        client.list_operations(
-            cluster_service.ListOperationsRequest(),
+        client.set_monitoring_service(
+            cluster_service.SetMonitoringServiceRequest(),
             project_id='project_id_value',
             zone='zone_value',
+            cluster_id='cluster_id_value',
+            monitoring_service='monitoring_service_value',
+            name='name_value',
         )
 
 
-def test_get_operation(transport: str = 'grpc'):
+@pytest.mark.asyncio
+async def test_set_monitoring_service_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.set_monitoring_service(
+            cluster_service.SetMonitoringServiceRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            monitoring_service='monitoring_service_value',
+            name='name_value',
+        )
+
+
+def test_set_addons_config(transport: str = 'grpc'):
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
         transport=transport,
@@ -1502,11 +1775,11 @@ def test_get_operation(transport: str = 'grpc'):
 
     # Everything is optional in proto3 as far as the runtime is concerned,
     # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.GetOperationRequest()
+    request = cluster_service.SetAddonsConfigRequest()
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.get_operation),
+            type(client._transport.set_addons_config),
             '__call__') as call:
         # Designate an appropriate return value for the call.
         call.return_value = cluster_service.Operation(
@@ -1523,7 +1796,7 @@ def test_get_operation(transport: str = 'grpc'):
             end_time='end_time_value',
         )
 
-        response = client.get_operation(request)
+        response = client.set_addons_config(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
@@ -1546,55 +1819,79 @@ def test_get_operation(transport: str = 'grpc'):
     assert response.end_time == 'end_time_value'
 
 
-def test_get_operation_field_headers():
-    client = ClusterManagerClient(
+@pytest.mark.asyncio
+async def test_set_addons_config_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
         credentials=credentials.AnonymousCredentials(),
-  )
-
-    # Any value that is part of the HTTP/1.1 URI should be sent as
-    # a field header. Set these to a non-empty value.
-    request = cluster_service.GetOperationRequest(
-        name='name/value',
+        transport=transport,
     )
 
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.SetAddonsConfigRequest()
+
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.get_operation),
+            type(client._client._transport.set_addons_config),
             '__call__') as call:
-        call.return_value = cluster_service.Operation()
-        client.get_operation(request)
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        ))
+
+        response = await client.set_addons_config(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
         _, args, _ = call.mock_calls[0]
+
         assert args[0] == request
 
-    # Establish that the field header was sent.
-    _, _, kw = call.mock_calls[0]
-    assert (
-        'x-goog-request-params',
-        'name=name/value',
-    ) in kw['metadata']
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
 
 
-def test_get_operation_flattened():
+def test_set_addons_config_flattened():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
     )
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.get_operation),
+            type(client._transport.set_addons_config),
             '__call__') as call:
         # Designate an appropriate return value for the call.
         call.return_value = cluster_service.Operation()
 
         # Call the method with a truthy value for each flattened field,
         # using the keyword arguments to the method.
-        response = client.get_operation(
+        response = client.set_addons_config(
             project_id='project_id_value',
             zone='zone_value',
-            operation_id='operation_id_value',
+            cluster_id='cluster_id_value',
+            addons_config=cluster_service.AddonsConfig(http_load_balancing=cluster_service.HttpLoadBalancing(disabled=True)),
+            name='name_value',
         )
 
         # Establish that the underlying call was made with the expected
@@ -1603,72 +1900,31 @@ def test_get_operation_flattened():
         _, args, _ = call.mock_calls[0]
         assert args[0].project_id == 'project_id_value'
         assert args[0].zone == 'zone_value'
-        assert args[0].operation_id == 'operation_id_value'
-
-
-def test_get_operation_flattened_error():
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.get_operation(
-            cluster_service.GetOperationRequest(),
-            project_id='project_id_value',
-            zone='zone_value',
-            operation_id='operation_id_value',
-        )
-
-
-def test_cancel_operation(transport: str = 'grpc'):
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-        transport=transport,
-    )
-
-    # Everything is optional in proto3 as far as the runtime is concerned,
-    # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.CancelOperationRequest()
-
-    # Mock the actual call within the gRPC stub, and fake the request.
-    with mock.patch.object(
-            type(client._transport.cancel_operation),
-            '__call__') as call:
-        # Designate an appropriate return value for the call.
-        call.return_value = None
-
-        response = client.cancel_operation(request)
-
-        # Establish that the underlying gRPC stub method was called.
-        assert len(call.mock_calls) == 1
-        _, args, _ = call.mock_calls[0]
-
-        assert args[0] == request
-
-    # Establish that the response is the type that we expect.
-    assert response is None
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].addons_config == cluster_service.AddonsConfig(http_load_balancing=cluster_service.HttpLoadBalancing(disabled=True))
+        assert args[0].name == 'name_value'
 
 
-def test_cancel_operation_flattened():
-    client = ClusterManagerClient(
+@pytest.mark.asyncio
+async def test_set_addons_config_flattened_async():
+    client = ClusterManagerAsyncClient(
         credentials=credentials.AnonymousCredentials(),
     )
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.cancel_operation),
+            type(client._client._transport.set_addons_config),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = None
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation())
 
         # Call the method with a truthy value for each flattened field,
         # using the keyword arguments to the method.
-        response = client.cancel_operation(
+        response = await client.set_addons_config(
             project_id='project_id_value',
             zone='zone_value',
-            operation_id='operation_id_value',
+            cluster_id='cluster_id_value',
+            addons_config=cluster_service.AddonsConfig(http_load_balancing=cluster_service.HttpLoadBalancing(disabled=True)),
             name='name_value',
         )
 
@@ -1678,11 +1934,12 @@ def test_cancel_operation_flattened():
         _, args, _ = call.mock_calls[0]
         assert args[0].project_id == 'project_id_value'
         assert args[0].zone == 'zone_value'
-        assert args[0].operation_id == 'operation_id_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].addons_config == cluster_service.AddonsConfig(http_load_balancing=cluster_service.HttpLoadBalancing(disabled=True))
         assert args[0].name == 'name_value'
 
 
-def test_cancel_operation_flattened_error():
+def test_set_addons_config_flattened_error():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
     )
@@ -1690,39 +1947,65 @@ def test_cancel_operation_flattened_error():
     # Attempting to call a method with both a request object and flattened
     # fields is an error.
     with pytest.raises(ValueError):
-        client.cancel_operation(
-            cluster_service.CancelOperationRequest(),
+        client.set_addons_config(
+            cluster_service.SetAddonsConfigRequest(),
             project_id='project_id_value',
             zone='zone_value',
-            operation_id='operation_id_value',
+            cluster_id='cluster_id_value',
+            addons_config=cluster_service.AddonsConfig(http_load_balancing=cluster_service.HttpLoadBalancing(disabled=True)),
             name='name_value',
         )
 
 
-def test_get_server_config(transport: str = 'grpc'):
-    client = ClusterManagerClient(
+@pytest.mark.asyncio
+async def test_set_addons_config_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.set_addons_config(
+            cluster_service.SetAddonsConfigRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            addons_config=cluster_service.AddonsConfig(http_load_balancing=cluster_service.HttpLoadBalancing(disabled=True)),
+            name='name_value',
+        )
+
+
+def test_set_locations(transport: str = 'grpc'):
+    client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
         transport=transport,
     )
 
     # Everything is optional in proto3 as far as the runtime is concerned,
     # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.GetServerConfigRequest()
+    request = cluster_service.SetLocationsRequest()
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.get_server_config),
+            type(client._transport.set_locations),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.ServerConfig(
-            default_cluster_version='default_cluster_version_value',
-            valid_node_versions=['valid_node_versions_value'],
-            default_image_type='default_image_type_value',
-            valid_image_types=['valid_image_types_value'],
-            valid_master_versions=['valid_master_versions_value'],
+        call.return_value = cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
         )
 
-        response = client.get_server_config(request)
+        response = client.set_locations(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
@@ -1731,62 +2014,92 @@ def test_get_server_config(transport: str = 'grpc'):
         assert args[0] == request
 
     # Establish that the response is the type that we expect.
-    assert isinstance(response, cluster_service.ServerConfig)
-    assert response.default_cluster_version == 'default_cluster_version_value'
-    assert response.valid_node_versions == ['valid_node_versions_value']
-    assert response.default_image_type == 'default_image_type_value'
-    assert response.valid_image_types == ['valid_image_types_value']
-    assert response.valid_master_versions == ['valid_master_versions_value']
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
 
 
-def test_get_server_config_field_headers():
-    client = ClusterManagerClient(
+@pytest.mark.asyncio
+async def test_set_locations_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
         credentials=credentials.AnonymousCredentials(),
-  )
-
-    # Any value that is part of the HTTP/1.1 URI should be sent as
-    # a field header. Set these to a non-empty value.
-    request = cluster_service.GetServerConfigRequest(
-        name='name/value',
+        transport=transport,
     )
 
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.SetLocationsRequest()
+
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.get_server_config),
+            type(client._client._transport.set_locations),
             '__call__') as call:
-        call.return_value = cluster_service.ServerConfig()
-        client.get_server_config(request)
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        ))
+
+        response = await client.set_locations(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
         _, args, _ = call.mock_calls[0]
+
         assert args[0] == request
 
-    # Establish that the field header was sent.
-    _, _, kw = call.mock_calls[0]
-    assert (
-        'x-goog-request-params',
-        'name=name/value',
-    ) in kw['metadata']
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
 
 
-def test_get_server_config_flattened():
+def test_set_locations_flattened():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
     )
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.get_server_config),
+            type(client._transport.set_locations),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.ServerConfig()
+        call.return_value = cluster_service.Operation()
 
         # Call the method with a truthy value for each flattened field,
         # using the keyword arguments to the method.
-        response = client.get_server_config(
+        response = client.set_locations(
             project_id='project_id_value',
             zone='zone_value',
+            cluster_id='cluster_id_value',
+            locations=['locations_value'],
             name='name_value',
         )
 
@@ -1796,105 +2109,32 @@ def test_get_server_config_flattened():
         _, args, _ = call.mock_calls[0]
         assert args[0].project_id == 'project_id_value'
         assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].locations == ['locations_value']
         assert args[0].name == 'name_value'
 
 
-def test_get_server_config_flattened_error():
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.get_server_config(
-            cluster_service.GetServerConfigRequest(),
-            project_id='project_id_value',
-            zone='zone_value',
-            name='name_value',
-        )
-
-
-def test_list_node_pools(transport: str = 'grpc'):
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-        transport=transport,
-    )
-
-    # Everything is optional in proto3 as far as the runtime is concerned,
-    # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.ListNodePoolsRequest()
-
-    # Mock the actual call within the gRPC stub, and fake the request.
-    with mock.patch.object(
-            type(client._transport.list_node_pools),
-            '__call__') as call:
-        # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.ListNodePoolsResponse(
-        )
-
-        response = client.list_node_pools(request)
-
-        # Establish that the underlying gRPC stub method was called.
-        assert len(call.mock_calls) == 1
-        _, args, _ = call.mock_calls[0]
-
-        assert args[0] == request
-
-    # Establish that the response is the type that we expect.
-    assert isinstance(response, cluster_service.ListNodePoolsResponse)
-
-
-def test_list_node_pools_field_headers():
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-  )
-
-    # Any value that is part of the HTTP/1.1 URI should be sent as
-    # a field header. Set these to a non-empty value.
-    request = cluster_service.ListNodePoolsRequest(
-        parent='parent/value',
-    )
-
-    # Mock the actual call within the gRPC stub, and fake the request.
-    with mock.patch.object(
-            type(client._transport.list_node_pools),
-            '__call__') as call:
-        call.return_value = cluster_service.ListNodePoolsResponse()
-        client.list_node_pools(request)
-
-        # Establish that the underlying gRPC stub method was called.
-        assert len(call.mock_calls) == 1
-        _, args, _ = call.mock_calls[0]
-        assert args[0] == request
-
-    # Establish that the field header was sent.
-    _, _, kw = call.mock_calls[0]
-    assert (
-        'x-goog-request-params',
-        'parent=parent/value',
-    ) in kw['metadata']
-
-
-def test_list_node_pools_flattened():
-    client = ClusterManagerClient(
+@pytest.mark.asyncio
+async def test_set_locations_flattened_async():
+    client = ClusterManagerAsyncClient(
         credentials=credentials.AnonymousCredentials(),
     )
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.list_node_pools),
+            type(client._client._transport.set_locations),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.ListNodePoolsResponse()
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation())
 
         # Call the method with a truthy value for each flattened field,
         # using the keyword arguments to the method.
-        response = client.list_node_pools(
+        response = await client.set_locations(
             project_id='project_id_value',
             zone='zone_value',
             cluster_id='cluster_id_value',
-            parent='parent_value',
+            locations=['locations_value'],
+            name='name_value',
         )
 
         # Establish that the underlying call was made with the expected
@@ -1904,10 +2144,11 @@ def test_list_node_pools_flattened():
         assert args[0].project_id == 'project_id_value'
         assert args[0].zone == 'zone_value'
         assert args[0].cluster_id == 'cluster_id_value'
-        assert args[0].parent == 'parent_value'
+        assert args[0].locations == ['locations_value']
+        assert args[0].name == 'name_value'
 
 
-def test_list_node_pools_flattened_error():
+def test_set_locations_flattened_error():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
     )
@@ -1915,16 +2156,36 @@ def test_list_node_pools_flattened_error():
     # Attempting to call a method with both a request object and flattened
     # fields is an error.
     with pytest.raises(ValueError):
-        client.list_node_pools(
-            cluster_service.ListNodePoolsRequest(),
+        client.set_locations(
+            cluster_service.SetLocationsRequest(),
             project_id='project_id_value',
             zone='zone_value',
             cluster_id='cluster_id_value',
-            parent='parent_value',
+            locations=['locations_value'],
+            name='name_value',
         )
 
 
-def test_get_node_pool(transport: str = 'grpc'):
+@pytest.mark.asyncio
+async def test_set_locations_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.set_locations(
+            cluster_service.SetLocationsRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            locations=['locations_value'],
+            name='name_value',
+        )
+
+
+def test_update_master(transport: str = 'grpc'):
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
         transport=transport,
@@ -1932,25 +2193,28 @@ def test_get_node_pool(transport: str = 'grpc'):
 
     # Everything is optional in proto3 as far as the runtime is concerned,
     # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.GetNodePoolRequest()
+    request = cluster_service.UpdateMasterRequest()
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.get_node_pool),
+            type(client._transport.update_master),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.NodePool(
+        call.return_value = cluster_service.Operation(
             name='name_value',
-            initial_node_count=1911,
-            self_link='self_link_value',
-            version='version_value',
-            instance_group_urls=['instance_group_urls_value'],
-            status=cluster_service.NodePool.Status.PROVISIONING,
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
             status_message='status_message_value',
-            pod_ipv4_cidr_size=1856,
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
         )
 
-        response = client.get_node_pool(request)
+        response = client.update_master(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
@@ -1959,115 +2223,37 @@ def test_get_node_pool(transport: str = 'grpc'):
         assert args[0] == request
 
     # Establish that the response is the type that we expect.
-    assert isinstance(response, cluster_service.NodePool)
+    assert isinstance(response, cluster_service.Operation)
     assert response.name == 'name_value'
-    assert response.initial_node_count == 1911
-    assert response.self_link == 'self_link_value'
-    assert response.version == 'version_value'
-    assert response.instance_group_urls == ['instance_group_urls_value']
-    assert response.status == cluster_service.NodePool.Status.PROVISIONING
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
     assert response.status_message == 'status_message_value'
-    assert response.pod_ipv4_cidr_size == 1856
-
-
-def test_get_node_pool_field_headers():
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-  )
-
-    # Any value that is part of the HTTP/1.1 URI should be sent as
-    # a field header. Set these to a non-empty value.
-    request = cluster_service.GetNodePoolRequest(
-        name='name/value',
-    )
-
-    # Mock the actual call within the gRPC stub, and fake the request.
-    with mock.patch.object(
-            type(client._transport.get_node_pool),
-            '__call__') as call:
-        call.return_value = cluster_service.NodePool()
-        client.get_node_pool(request)
-
-        # Establish that the underlying gRPC stub method was called.
-        assert len(call.mock_calls) == 1
-        _, args, _ = call.mock_calls[0]
-        assert args[0] == request
-
-    # Establish that the field header was sent.
-    _, _, kw = call.mock_calls[0]
-    assert (
-        'x-goog-request-params',
-        'name=name/value',
-    ) in kw['metadata']
-
-
-def test_get_node_pool_flattened():
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-    )
-
-    # Mock the actual call within the gRPC stub, and fake the request.
-    with mock.patch.object(
-            type(client._transport.get_node_pool),
-            '__call__') as call:
-        # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.NodePool()
-
-        # Call the method with a truthy value for each flattened field,
-        # using the keyword arguments to the method.
-        response = client.get_node_pool(
-            project_id='project_id_value',
-            zone='zone_value',
-            cluster_id='cluster_id_value',
-            node_pool_id='node_pool_id_value',
-            name='name_value',
-        )
-
-        # Establish that the underlying call was made with the expected
-        # request object values.
-        assert len(call.mock_calls) == 1
-        _, args, _ = call.mock_calls[0]
-        assert args[0].project_id == 'project_id_value'
-        assert args[0].zone == 'zone_value'
-        assert args[0].cluster_id == 'cluster_id_value'
-        assert args[0].node_pool_id == 'node_pool_id_value'
-        assert args[0].name == 'name_value'
-
-
-def test_get_node_pool_flattened_error():
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.get_node_pool(
-            cluster_service.GetNodePoolRequest(),
-            project_id='project_id_value',
-            zone='zone_value',
-            cluster_id='cluster_id_value',
-            node_pool_id='node_pool_id_value',
-            name='name_value',
-        )
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
 
 
-def test_create_node_pool(transport: str = 'grpc'):
-    client = ClusterManagerClient(
+@pytest.mark.asyncio
+async def test_update_master_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
         credentials=credentials.AnonymousCredentials(),
         transport=transport,
     )
 
     # Everything is optional in proto3 as far as the runtime is concerned,
     # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.CreateNodePoolRequest()
+    request = cluster_service.UpdateMasterRequest()
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.create_node_pool),
+            type(client._client._transport.update_master),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation(
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
             name='name_value',
             zone='zone_value',
             operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
@@ -2079,9 +2265,9 @@ def test_create_node_pool(transport: str = 'grpc'):
             location='location_value',
             start_time='start_time_value',
             end_time='end_time_value',
-        )
+        ))
 
-        response = client.create_node_pool(request)
+        response = await client.update_master(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
@@ -2104,26 +2290,26 @@ def test_create_node_pool(transport: str = 'grpc'):
     assert response.end_time == 'end_time_value'
 
 
-def test_create_node_pool_flattened():
+def test_update_master_flattened():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
     )
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.create_node_pool),
+            type(client._transport.update_master),
             '__call__') as call:
         # Designate an appropriate return value for the call.
         call.return_value = cluster_service.Operation()
 
         # Call the method with a truthy value for each flattened field,
         # using the keyword arguments to the method.
-        response = client.create_node_pool(
+        response = client.update_master(
             project_id='project_id_value',
             zone='zone_value',
             cluster_id='cluster_id_value',
-            node_pool=cluster_service.NodePool(name='name_value'),
-            parent='parent_value',
+            master_version='master_version_value',
+            name='name_value',
         )
 
         # Establish that the underlying call was made with the expected
@@ -2133,11 +2319,45 @@ def test_create_node_pool_flattened():
         assert args[0].project_id == 'project_id_value'
         assert args[0].zone == 'zone_value'
         assert args[0].cluster_id == 'cluster_id_value'
-        assert args[0].node_pool == cluster_service.NodePool(name='name_value')
-        assert args[0].parent == 'parent_value'
+        assert args[0].master_version == 'master_version_value'
+        assert args[0].name == 'name_value'
 
 
-def test_create_node_pool_flattened_error():
+@pytest.mark.asyncio
+async def test_update_master_flattened_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.update_master),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.update_master(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            master_version='master_version_value',
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].master_version == 'master_version_value'
+        assert args[0].name == 'name_value'
+
+
+def test_update_master_flattened_error():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
     )
@@ -2145,17 +2365,36 @@ def test_create_node_pool_flattened_error():
     # Attempting to call a method with both a request object and flattened
     # fields is an error.
     with pytest.raises(ValueError):
-        client.create_node_pool(
-            cluster_service.CreateNodePoolRequest(),
+        client.update_master(
+            cluster_service.UpdateMasterRequest(),
             project_id='project_id_value',
             zone='zone_value',
             cluster_id='cluster_id_value',
-            node_pool=cluster_service.NodePool(name='name_value'),
-            parent='parent_value',
+            master_version='master_version_value',
+            name='name_value',
         )
 
 
-def test_delete_node_pool(transport: str = 'grpc'):
+@pytest.mark.asyncio
+async def test_update_master_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.update_master(
+            cluster_service.UpdateMasterRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            master_version='master_version_value',
+            name='name_value',
+        )
+
+
+def test_set_master_auth(transport: str = 'grpc'):
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
         transport=transport,
@@ -2163,11 +2402,11 @@ def test_delete_node_pool(transport: str = 'grpc'):
 
     # Everything is optional in proto3 as far as the runtime is concerned,
     # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.DeleteNodePoolRequest()
+    request = cluster_service.SetMasterAuthRequest()
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.delete_node_pool),
+            type(client._transport.set_master_auth),
             '__call__') as call:
         # Designate an appropriate return value for the call.
         call.return_value = cluster_service.Operation(
@@ -2184,7 +2423,7 @@ def test_delete_node_pool(transport: str = 'grpc'):
             end_time='end_time_value',
         )
 
-        response = client.delete_node_pool(request)
+        response = client.set_master_auth(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
@@ -2207,73 +2446,23 @@ def test_delete_node_pool(transport: str = 'grpc'):
     assert response.end_time == 'end_time_value'
 
 
-def test_delete_node_pool_flattened():
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-    )
-
-    # Mock the actual call within the gRPC stub, and fake the request.
-    with mock.patch.object(
-            type(client._transport.delete_node_pool),
-            '__call__') as call:
-        # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation()
-
-        # Call the method with a truthy value for each flattened field,
-        # using the keyword arguments to the method.
-        response = client.delete_node_pool(
-            project_id='project_id_value',
-            zone='zone_value',
-            cluster_id='cluster_id_value',
-            node_pool_id='node_pool_id_value',
-            name='name_value',
-        )
-
-        # Establish that the underlying call was made with the expected
-        # request object values.
-        assert len(call.mock_calls) == 1
-        _, args, _ = call.mock_calls[0]
-        assert args[0].project_id == 'project_id_value'
-        assert args[0].zone == 'zone_value'
-        assert args[0].cluster_id == 'cluster_id_value'
-        assert args[0].node_pool_id == 'node_pool_id_value'
-        assert args[0].name == 'name_value'
-
-
-def test_delete_node_pool_flattened_error():
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.delete_node_pool(
-            cluster_service.DeleteNodePoolRequest(),
-            project_id='project_id_value',
-            zone='zone_value',
-            cluster_id='cluster_id_value',
-            node_pool_id='node_pool_id_value',
-            name='name_value',
-        )
-
-
-def test_rollback_node_pool_upgrade(transport: str = 'grpc'):
-    client = ClusterManagerClient(
+@pytest.mark.asyncio
+async def test_set_master_auth_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
         credentials=credentials.AnonymousCredentials(),
         transport=transport,
     )
 
     # Everything is optional in proto3 as far as the runtime is concerned,
     # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.RollbackNodePoolUpgradeRequest()
+    request = cluster_service.SetMasterAuthRequest()
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.rollback_node_pool_upgrade),
+            type(client._client._transport.set_master_auth),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation(
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
             name='name_value',
             zone='zone_value',
             operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
@@ -2285,9 +2474,9 @@ def test_rollback_node_pool_upgrade(transport: str = 'grpc'):
             location='location_value',
             start_time='start_time_value',
             end_time='end_time_value',
-        )
+        ))
 
-        response = client.rollback_node_pool_upgrade(request)
+        response = await client.set_master_auth(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
@@ -2310,70 +2499,19 @@ def test_rollback_node_pool_upgrade(transport: str = 'grpc'):
     assert response.end_time == 'end_time_value'
 
 
-def test_rollback_node_pool_upgrade_flattened():
+def test_delete_cluster(transport: str = 'grpc'):
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
+        transport=transport,
     )
 
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.DeleteClusterRequest()
+
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.rollback_node_pool_upgrade),
-            '__call__') as call:
-        # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation()
-
-        # Call the method with a truthy value for each flattened field,
-        # using the keyword arguments to the method.
-        response = client.rollback_node_pool_upgrade(
-            project_id='project_id_value',
-            zone='zone_value',
-            cluster_id='cluster_id_value',
-            node_pool_id='node_pool_id_value',
-            name='name_value',
-        )
-
-        # Establish that the underlying call was made with the expected
-        # request object values.
-        assert len(call.mock_calls) == 1
-        _, args, _ = call.mock_calls[0]
-        assert args[0].project_id == 'project_id_value'
-        assert args[0].zone == 'zone_value'
-        assert args[0].cluster_id == 'cluster_id_value'
-        assert args[0].node_pool_id == 'node_pool_id_value'
-        assert args[0].name == 'name_value'
-
-
-def test_rollback_node_pool_upgrade_flattened_error():
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.rollback_node_pool_upgrade(
-            cluster_service.RollbackNodePoolUpgradeRequest(),
-            project_id='project_id_value',
-            zone='zone_value',
-            cluster_id='cluster_id_value',
-            node_pool_id='node_pool_id_value',
-            name='name_value',
-        )
-
-
-def test_set_node_pool_management(transport: str = 'grpc'):
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-        transport=transport,
-    )
-
-    # Everything is optional in proto3 as far as the runtime is concerned,
-    # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.SetNodePoolManagementRequest()
-
-    # Mock the actual call within the gRPC stub, and fake the request.
-    with mock.patch.object(
-            type(client._transport.set_node_pool_management),
+            type(client._transport.delete_cluster),
             '__call__') as call:
         # Designate an appropriate return value for the call.
         call.return_value = cluster_service.Operation(
@@ -2390,7 +2528,7 @@ def test_set_node_pool_management(transport: str = 'grpc'):
             end_time='end_time_value',
         )
 
-        response = client.set_node_pool_management(request)
+        response = client.delete_cluster(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
@@ -2413,22 +2551,23 @@ def test_set_node_pool_management(transport: str = 'grpc'):
     assert response.end_time == 'end_time_value'
 
 
-def test_set_labels(transport: str = 'grpc'):
-    client = ClusterManagerClient(
+@pytest.mark.asyncio
+async def test_delete_cluster_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
         credentials=credentials.AnonymousCredentials(),
         transport=transport,
     )
 
     # Everything is optional in proto3 as far as the runtime is concerned,
     # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.SetLabelsRequest()
+    request = cluster_service.DeleteClusterRequest()
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.set_labels),
+            type(client._client._transport.delete_cluster),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation(
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
             name='name_value',
             zone='zone_value',
             operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
@@ -2440,9 +2579,9 @@ def test_set_labels(transport: str = 'grpc'):
             location='location_value',
             start_time='start_time_value',
             end_time='end_time_value',
-        )
+        ))
 
-        response = client.set_labels(request)
+        response = await client.delete_cluster(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
@@ -2465,77 +2604,56 @@ def test_set_labels(transport: str = 'grpc'):
     assert response.end_time == 'end_time_value'
 
 
-def test_set_legacy_abac(transport: str = 'grpc'):
+def test_delete_cluster_flattened():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
-        transport=transport,
     )
 
-    # Everything is optional in proto3 as far as the runtime is concerned,
-    # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.SetLegacyAbacRequest()
-
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.set_legacy_abac),
+            type(client._transport.delete_cluster),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation(
-            name='name_value',
+        call.return_value = cluster_service.Operation()
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = client.delete_cluster(
+            project_id='project_id_value',
             zone='zone_value',
-            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
-            status=cluster_service.Operation.Status.PENDING,
-            detail='detail_value',
-            status_message='status_message_value',
-            self_link='self_link_value',
-            target_link='target_link_value',
-            location='location_value',
-            start_time='start_time_value',
-            end_time='end_time_value',
+            cluster_id='cluster_id_value',
+            name='name_value',
         )
 
-        response = client.set_legacy_abac(request)
-
-        # Establish that the underlying gRPC stub method was called.
+        # Establish that the underlying call was made with the expected
+        # request object values.
         assert len(call.mock_calls) == 1
         _, args, _ = call.mock_calls[0]
-
-        assert args[0] == request
-
-    # Establish that the response is the type that we expect.
-    assert isinstance(response, cluster_service.Operation)
-    assert response.name == 'name_value'
-    assert response.zone == 'zone_value'
-    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
-    assert response.status == cluster_service.Operation.Status.PENDING
-    assert response.detail == 'detail_value'
-    assert response.status_message == 'status_message_value'
-    assert response.self_link == 'self_link_value'
-    assert response.target_link == 'target_link_value'
-    assert response.location == 'location_value'
-    assert response.start_time == 'start_time_value'
-    assert response.end_time == 'end_time_value'
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].name == 'name_value'
 
 
-def test_set_legacy_abac_flattened():
-    client = ClusterManagerClient(
+@pytest.mark.asyncio
+async def test_delete_cluster_flattened_async():
+    client = ClusterManagerAsyncClient(
         credentials=credentials.AnonymousCredentials(),
     )
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.set_legacy_abac),
+            type(client._client._transport.delete_cluster),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation()
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation())
 
         # Call the method with a truthy value for each flattened field,
         # using the keyword arguments to the method.
-        response = client.set_legacy_abac(
+        response = await client.delete_cluster(
             project_id='project_id_value',
             zone='zone_value',
             cluster_id='cluster_id_value',
-            enabled=True,
             name='name_value',
         )
 
@@ -2546,11 +2664,10 @@ def test_set_legacy_abac_flattened():
         assert args[0].project_id == 'project_id_value'
         assert args[0].zone == 'zone_value'
         assert args[0].cluster_id == 'cluster_id_value'
-        assert args[0].enabled == True
         assert args[0].name == 'name_value'
 
 
-def test_set_legacy_abac_flattened_error():
+def test_delete_cluster_flattened_error():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
     )
@@ -2558,17 +2675,34 @@ def test_set_legacy_abac_flattened_error():
     # Attempting to call a method with both a request object and flattened
     # fields is an error.
     with pytest.raises(ValueError):
-        client.set_legacy_abac(
-            cluster_service.SetLegacyAbacRequest(),
+        client.delete_cluster(
+            cluster_service.DeleteClusterRequest(),
             project_id='project_id_value',
             zone='zone_value',
             cluster_id='cluster_id_value',
-            enabled=True,
             name='name_value',
         )
 
 
-def test_start_ip_rotation(transport: str = 'grpc'):
+@pytest.mark.asyncio
+async def test_delete_cluster_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.delete_cluster(
+            cluster_service.DeleteClusterRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            name='name_value',
+        )
+
+
+def test_list_operations(transport: str = 'grpc'):
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
         transport=transport,
@@ -2576,28 +2710,18 @@ def test_start_ip_rotation(transport: str = 'grpc'):
 
     # Everything is optional in proto3 as far as the runtime is concerned,
     # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.StartIPRotationRequest()
+    request = cluster_service.ListOperationsRequest()
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.start_ip_rotation),
+            type(client._transport.list_operations),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation(
-            name='name_value',
-            zone='zone_value',
-            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
-            status=cluster_service.Operation.Status.PENDING,
-            detail='detail_value',
-            status_message='status_message_value',
-            self_link='self_link_value',
-            target_link='target_link_value',
-            location='location_value',
-            start_time='start_time_value',
-            end_time='end_time_value',
+        call.return_value = cluster_service.ListOperationsResponse(
+            missing_zones=['missing_zones_value'],
         )
 
-        response = client.start_ip_rotation(request)
+        response = client.list_operations(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
@@ -2606,139 +2730,123 @@ def test_start_ip_rotation(transport: str = 'grpc'):
         assert args[0] == request
 
     # Establish that the response is the type that we expect.
-    assert isinstance(response, cluster_service.Operation)
-    assert response.name == 'name_value'
-    assert response.zone == 'zone_value'
-    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
-    assert response.status == cluster_service.Operation.Status.PENDING
-    assert response.detail == 'detail_value'
-    assert response.status_message == 'status_message_value'
-    assert response.self_link == 'self_link_value'
-    assert response.target_link == 'target_link_value'
-    assert response.location == 'location_value'
-    assert response.start_time == 'start_time_value'
-    assert response.end_time == 'end_time_value'
+    assert isinstance(response, cluster_service.ListOperationsResponse)
+    assert response.missing_zones == ['missing_zones_value']
 
 
-def test_start_ip_rotation_flattened():
-    client = ClusterManagerClient(
+@pytest.mark.asyncio
+async def test_list_operations_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
         credentials=credentials.AnonymousCredentials(),
+        transport=transport,
     )
 
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.ListOperationsRequest()
+
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.start_ip_rotation),
+            type(client._client._transport.list_operations),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation()
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.ListOperationsResponse(
+            missing_zones=['missing_zones_value'],
+        ))
 
-        # Call the method with a truthy value for each flattened field,
-        # using the keyword arguments to the method.
-        response = client.start_ip_rotation(
-            project_id='project_id_value',
-            zone='zone_value',
-            cluster_id='cluster_id_value',
-            name='name_value',
-        )
+        response = await client.list_operations(request)
 
-        # Establish that the underlying call was made with the expected
-        # request object values.
+        # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
         _, args, _ = call.mock_calls[0]
-        assert args[0].project_id == 'project_id_value'
-        assert args[0].zone == 'zone_value'
-        assert args[0].cluster_id == 'cluster_id_value'
-        assert args[0].name == 'name_value'
 
+        assert args[0] == request
 
-def test_start_ip_rotation_flattened_error():
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.start_ip_rotation(
-            cluster_service.StartIPRotationRequest(),
-            project_id='project_id_value',
-            zone='zone_value',
-            cluster_id='cluster_id_value',
-            name='name_value',
-        )
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.ListOperationsResponse)
+    assert response.missing_zones == ['missing_zones_value']
 
 
-def test_complete_ip_rotation(transport: str = 'grpc'):
+def test_list_operations_field_headers():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
-        transport=transport,
-    )
+  )
 
-    # Everything is optional in proto3 as far as the runtime is concerned,
-    # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.CompleteIPRotationRequest()
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = cluster_service.ListOperationsRequest(
+        parent='parent/value',
+    )
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.complete_ip_rotation),
+            type(client._transport.list_operations),
             '__call__') as call:
-        # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation(
-            name='name_value',
-            zone='zone_value',
-            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
-            status=cluster_service.Operation.Status.PENDING,
-            detail='detail_value',
-            status_message='status_message_value',
-            self_link='self_link_value',
-            target_link='target_link_value',
-            location='location_value',
-            start_time='start_time_value',
-            end_time='end_time_value',
-        )
-
-        response = client.complete_ip_rotation(request)
+        call.return_value = cluster_service.ListOperationsResponse()
+        client.list_operations(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
         _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'parent=parent/value',
+    ) in kw['metadata']
+
+
+@pytest.mark.asyncio
+async def test_list_operations_field_headers_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
 
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = cluster_service.ListOperationsRequest(
+        parent='parent/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_operations),
+            '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.ListOperationsResponse())
+        await client.list_operations(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
         assert args[0] == request
 
-    # Establish that the response is the type that we expect.
-    assert isinstance(response, cluster_service.Operation)
-    assert response.name == 'name_value'
-    assert response.zone == 'zone_value'
-    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
-    assert response.status == cluster_service.Operation.Status.PENDING
-    assert response.detail == 'detail_value'
-    assert response.status_message == 'status_message_value'
-    assert response.self_link == 'self_link_value'
-    assert response.target_link == 'target_link_value'
-    assert response.location == 'location_value'
-    assert response.start_time == 'start_time_value'
-    assert response.end_time == 'end_time_value'
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'parent=parent/value',
+    ) in kw['metadata']
 
 
-def test_complete_ip_rotation_flattened():
+def test_list_operations_flattened():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
     )
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.complete_ip_rotation),
+            type(client._transport.list_operations),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation()
+        call.return_value = cluster_service.ListOperationsResponse()
 
         # Call the method with a truthy value for each flattened field,
         # using the keyword arguments to the method.
-        response = client.complete_ip_rotation(
+        response = client.list_operations(
             project_id='project_id_value',
             zone='zone_value',
-            cluster_id='cluster_id_value',
-            name='name_value',
         )
 
         # Establish that the underlying call was made with the expected
@@ -2747,11 +2855,37 @@ def test_complete_ip_rotation_flattened():
         _, args, _ = call.mock_calls[0]
         assert args[0].project_id == 'project_id_value'
         assert args[0].zone == 'zone_value'
-        assert args[0].cluster_id == 'cluster_id_value'
-        assert args[0].name == 'name_value'
 
 
-def test_complete_ip_rotation_flattened_error():
+@pytest.mark.asyncio
+async def test_list_operations_flattened_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_operations),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.ListOperationsResponse())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.list_operations(
+            project_id='project_id_value',
+            zone='zone_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+
+
+def test_list_operations_flattened_error():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
     )
@@ -2759,16 +2893,30 @@ def test_complete_ip_rotation_flattened_error():
     # Attempting to call a method with both a request object and flattened
     # fields is an error.
     with pytest.raises(ValueError):
-        client.complete_ip_rotation(
-            cluster_service.CompleteIPRotationRequest(),
+        client.list_operations(
+            cluster_service.ListOperationsRequest(),
             project_id='project_id_value',
             zone='zone_value',
-            cluster_id='cluster_id_value',
-            name='name_value',
         )
 
 
-def test_set_node_pool_size(transport: str = 'grpc'):
+@pytest.mark.asyncio
+async def test_list_operations_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.list_operations(
+            cluster_service.ListOperationsRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+        )
+
+
+def test_get_operation(transport: str = 'grpc'):
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
         transport=transport,
@@ -2776,11 +2924,11 @@ def test_set_node_pool_size(transport: str = 'grpc'):
 
     # Everything is optional in proto3 as far as the runtime is concerned,
     # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.SetNodePoolSizeRequest()
+    request = cluster_service.GetOperationRequest()
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.set_node_pool_size),
+            type(client._transport.get_operation),
             '__call__') as call:
         # Designate an appropriate return value for the call.
         call.return_value = cluster_service.Operation(
@@ -2797,7 +2945,7 @@ def test_set_node_pool_size(transport: str = 'grpc'):
             end_time='end_time_value',
         )
 
-        response = client.set_node_pool_size(request)
+        response = client.get_operation(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
@@ -2820,22 +2968,23 @@ def test_set_node_pool_size(transport: str = 'grpc'):
     assert response.end_time == 'end_time_value'
 
 
-def test_set_network_policy(transport: str = 'grpc'):
-    client = ClusterManagerClient(
+@pytest.mark.asyncio
+async def test_get_operation_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
         credentials=credentials.AnonymousCredentials(),
         transport=transport,
     )
 
     # Everything is optional in proto3 as far as the runtime is concerned,
     # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.SetNetworkPolicyRequest()
+    request = cluster_service.GetOperationRequest()
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.set_network_policy),
+            type(client._client._transport.get_operation),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation(
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
             name='name_value',
             zone='zone_value',
             operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
@@ -2847,9 +2996,9 @@ def test_set_network_policy(transport: str = 'grpc'):
             location='location_value',
             start_time='start_time_value',
             end_time='end_time_value',
-        )
+        ))
 
-        response = client.set_network_policy(request)
+        response = await client.get_operation(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
@@ -2872,129 +3021,87 @@ def test_set_network_policy(transport: str = 'grpc'):
     assert response.end_time == 'end_time_value'
 
 
-def test_set_network_policy_flattened():
+def test_get_operation_field_headers():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = cluster_service.GetOperationRequest(
+        name='name/value',
     )
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.set_network_policy),
+            type(client._transport.get_operation),
             '__call__') as call:
-        # Designate an appropriate return value for the call.
         call.return_value = cluster_service.Operation()
+        client.get_operation(request)
 
-        # Call the method with a truthy value for each flattened field,
-        # using the keyword arguments to the method.
-        response = client.set_network_policy(
-            project_id='project_id_value',
-            zone='zone_value',
-            cluster_id='cluster_id_value',
-            network_policy=cluster_service.NetworkPolicy(provider=cluster_service.NetworkPolicy.Provider.CALICO),
-            name='name_value',
-        )
-
-        # Establish that the underlying call was made with the expected
-        # request object values.
+        # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
         _, args, _ = call.mock_calls[0]
-        assert args[0].project_id == 'project_id_value'
-        assert args[0].zone == 'zone_value'
-        assert args[0].cluster_id == 'cluster_id_value'
-        assert args[0].network_policy == cluster_service.NetworkPolicy(provider=cluster_service.NetworkPolicy.Provider.CALICO)
-        assert args[0].name == 'name_value'
-
-
-def test_set_network_policy_flattened_error():
-    client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials(),
-    )
+        assert args[0] == request
 
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.set_network_policy(
-            cluster_service.SetNetworkPolicyRequest(),
-            project_id='project_id_value',
-            zone='zone_value',
-            cluster_id='cluster_id_value',
-            network_policy=cluster_service.NetworkPolicy(provider=cluster_service.NetworkPolicy.Provider.CALICO),
-            name='name_value',
-        )
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'name=name/value',
+    ) in kw['metadata']
 
 
-def test_set_maintenance_policy(transport: str = 'grpc'):
-    client = ClusterManagerClient(
+@pytest.mark.asyncio
+async def test_get_operation_field_headers_async():
+    client = ClusterManagerAsyncClient(
         credentials=credentials.AnonymousCredentials(),
-        transport=transport,
-    )
+  )
 
-    # Everything is optional in proto3 as far as the runtime is concerned,
-    # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.SetMaintenancePolicyRequest()
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = cluster_service.GetOperationRequest(
+        name='name/value',
+    )
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.set_maintenance_policy),
+            type(client._client._transport.get_operation),
             '__call__') as call:
-        # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.Operation(
-            name='name_value',
-            zone='zone_value',
-            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
-            status=cluster_service.Operation.Status.PENDING,
-            detail='detail_value',
-            status_message='status_message_value',
-            self_link='self_link_value',
-            target_link='target_link_value',
-            location='location_value',
-            start_time='start_time_value',
-            end_time='end_time_value',
-        )
-
-        response = client.set_maintenance_policy(request)
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation())
+        await client.get_operation(request)
 
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
         _, args, _ = call.mock_calls[0]
-
         assert args[0] == request
 
-    # Establish that the response is the type that we expect.
-    assert isinstance(response, cluster_service.Operation)
-    assert response.name == 'name_value'
-    assert response.zone == 'zone_value'
-    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
-    assert response.status == cluster_service.Operation.Status.PENDING
-    assert response.detail == 'detail_value'
-    assert response.status_message == 'status_message_value'
-    assert response.self_link == 'self_link_value'
-    assert response.target_link == 'target_link_value'
-    assert response.location == 'location_value'
-    assert response.start_time == 'start_time_value'
-    assert response.end_time == 'end_time_value'
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'name=name/value',
+    ) in kw['metadata']
 
 
-def test_set_maintenance_policy_flattened():
+def test_get_operation_flattened():
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
     )
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.set_maintenance_policy),
+            type(client._transport.get_operation),
             '__call__') as call:
         # Designate an appropriate return value for the call.
         call.return_value = cluster_service.Operation()
 
         # Call the method with a truthy value for each flattened field,
         # using the keyword arguments to the method.
-        response = client.set_maintenance_policy(
+        response = client.get_operation(
             project_id='project_id_value',
             zone='zone_value',
-            cluster_id='cluster_id_value',
-            maintenance_policy=cluster_service.MaintenancePolicy(window=cluster_service.MaintenanceWindow(daily_maintenance_window=cluster_service.DailyMaintenanceWindow(start_time='start_time_value'))),
-            name='name_value',
+            operation_id='operation_id_value',
         )
 
         # Establish that the underlying call was made with the expected
@@ -3003,30 +3110,73 @@ def test_set_maintenance_policy_flattened():
         _, args, _ = call.mock_calls[0]
         assert args[0].project_id == 'project_id_value'
         assert args[0].zone == 'zone_value'
-        assert args[0].cluster_id == 'cluster_id_value'
-        assert args[0].maintenance_policy == cluster_service.MaintenancePolicy(window=cluster_service.MaintenanceWindow(daily_maintenance_window=cluster_service.DailyMaintenanceWindow(start_time='start_time_value')))
-        assert args[0].name == 'name_value'
+        assert args[0].operation_id == 'operation_id_value'
 
 
-def test_set_maintenance_policy_flattened_error():
-    client = ClusterManagerClient(
+@pytest.mark.asyncio
+async def test_get_operation_flattened_async():
+    client = ClusterManagerAsyncClient(
         credentials=credentials.AnonymousCredentials(),
     )
 
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.set_maintenance_policy(
-            cluster_service.SetMaintenancePolicyRequest(),
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_operation),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.get_operation(
             project_id='project_id_value',
             zone='zone_value',
-            cluster_id='cluster_id_value',
-            maintenance_policy=cluster_service.MaintenancePolicy(window=cluster_service.MaintenanceWindow(daily_maintenance_window=cluster_service.DailyMaintenanceWindow(start_time='start_time_value'))),
-            name='name_value',
+            operation_id='operation_id_value',
         )
 
-
-def test_list_usable_subnetworks(transport: str = 'grpc'):
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].operation_id == 'operation_id_value'
+
+
+def test_get_operation_flattened_error():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.get_operation(
+            cluster_service.GetOperationRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            operation_id='operation_id_value',
+        )
+
+
+@pytest.mark.asyncio
+async def test_get_operation_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.get_operation(
+            cluster_service.GetOperationRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            operation_id='operation_id_value',
+        )
+
+
+def test_cancel_operation(transport: str = 'grpc'):
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
         transport=transport,
@@ -3034,145 +3184,3956 @@ def test_list_usable_subnetworks(transport: str = 'grpc'):
 
     # Everything is optional in proto3 as far as the runtime is concerned,
     # and we are mocking out the actual API, so just send an empty request.
-    request = cluster_service.ListUsableSubnetworksRequest()
+    request = cluster_service.CancelOperationRequest()
 
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.list_usable_subnetworks),
+            type(client._transport.cancel_operation),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = cluster_service.ListUsableSubnetworksResponse(
-            next_page_token='next_page_token_value',
+        call.return_value = None
+
+        response = client.cancel_operation(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert response is None
+
+
+@pytest.mark.asyncio
+async def test_cancel_operation_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.CancelOperationRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.cancel_operation),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(None)
+
+        response = await client.cancel_operation(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert response is None
+
+
+def test_cancel_operation_flattened():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.cancel_operation),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = None
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = client.cancel_operation(
+            project_id='project_id_value',
+            zone='zone_value',
+            operation_id='operation_id_value',
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].operation_id == 'operation_id_value'
+        assert args[0].name == 'name_value'
+
+
+@pytest.mark.asyncio
+async def test_cancel_operation_flattened_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.cancel_operation),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(None)
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.cancel_operation(
+            project_id='project_id_value',
+            zone='zone_value',
+            operation_id='operation_id_value',
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].operation_id == 'operation_id_value'
+        assert args[0].name == 'name_value'
+
+
+def test_cancel_operation_flattened_error():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.cancel_operation(
+            cluster_service.CancelOperationRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            operation_id='operation_id_value',
+            name='name_value',
+        )
+
+
+@pytest.mark.asyncio
+async def test_cancel_operation_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.cancel_operation(
+            cluster_service.CancelOperationRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            operation_id='operation_id_value',
+            name='name_value',
+        )
+
+
+def test_get_server_config(transport: str = 'grpc'):
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.GetServerConfigRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.get_server_config),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.ServerConfig(
+            default_cluster_version='default_cluster_version_value',
+            valid_node_versions=['valid_node_versions_value'],
+            default_image_type='default_image_type_value',
+            valid_image_types=['valid_image_types_value'],
+            valid_master_versions=['valid_master_versions_value'],
+        )
+
+        response = client.get_server_config(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.ServerConfig)
+    assert response.default_cluster_version == 'default_cluster_version_value'
+    assert response.valid_node_versions == ['valid_node_versions_value']
+    assert response.default_image_type == 'default_image_type_value'
+    assert response.valid_image_types == ['valid_image_types_value']
+    assert response.valid_master_versions == ['valid_master_versions_value']
+
+
+@pytest.mark.asyncio
+async def test_get_server_config_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.GetServerConfigRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_server_config),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.ServerConfig(
+            default_cluster_version='default_cluster_version_value',
+            valid_node_versions=['valid_node_versions_value'],
+            default_image_type='default_image_type_value',
+            valid_image_types=['valid_image_types_value'],
+            valid_master_versions=['valid_master_versions_value'],
+        ))
+
+        response = await client.get_server_config(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.ServerConfig)
+    assert response.default_cluster_version == 'default_cluster_version_value'
+    assert response.valid_node_versions == ['valid_node_versions_value']
+    assert response.default_image_type == 'default_image_type_value'
+    assert response.valid_image_types == ['valid_image_types_value']
+    assert response.valid_master_versions == ['valid_master_versions_value']
+
+
+def test_get_server_config_field_headers():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = cluster_service.GetServerConfigRequest(
+        name='name/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.get_server_config),
+            '__call__') as call:
+        call.return_value = cluster_service.ServerConfig()
+        client.get_server_config(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'name=name/value',
+    ) in kw['metadata']
+
+
+@pytest.mark.asyncio
+async def test_get_server_config_field_headers_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = cluster_service.GetServerConfigRequest(
+        name='name/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_server_config),
+            '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.ServerConfig())
+        await client.get_server_config(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'name=name/value',
+    ) in kw['metadata']
+
+
+def test_get_server_config_flattened():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.get_server_config),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.ServerConfig()
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = client.get_server_config(
+            project_id='project_id_value',
+            zone='zone_value',
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].name == 'name_value'
+
+
+@pytest.mark.asyncio
+async def test_get_server_config_flattened_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_server_config),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.ServerConfig())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.get_server_config(
+            project_id='project_id_value',
+            zone='zone_value',
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].name == 'name_value'
+
+
+def test_get_server_config_flattened_error():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.get_server_config(
+            cluster_service.GetServerConfigRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            name='name_value',
+        )
+
+
+@pytest.mark.asyncio
+async def test_get_server_config_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.get_server_config(
+            cluster_service.GetServerConfigRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            name='name_value',
+        )
+
+
+def test_list_node_pools(transport: str = 'grpc'):
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.ListNodePoolsRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.list_node_pools),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.ListNodePoolsResponse(
+        )
+
+        response = client.list_node_pools(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.ListNodePoolsResponse)
+
+
+@pytest.mark.asyncio
+async def test_list_node_pools_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.ListNodePoolsRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_node_pools),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.ListNodePoolsResponse(
+        ))
+
+        response = await client.list_node_pools(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.ListNodePoolsResponse)
+
+
+def test_list_node_pools_field_headers():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = cluster_service.ListNodePoolsRequest(
+        parent='parent/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.list_node_pools),
+            '__call__') as call:
+        call.return_value = cluster_service.ListNodePoolsResponse()
+        client.list_node_pools(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'parent=parent/value',
+    ) in kw['metadata']
+
+
+@pytest.mark.asyncio
+async def test_list_node_pools_field_headers_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = cluster_service.ListNodePoolsRequest(
+        parent='parent/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_node_pools),
+            '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.ListNodePoolsResponse())
+        await client.list_node_pools(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'parent=parent/value',
+    ) in kw['metadata']
+
+
+def test_list_node_pools_flattened():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.list_node_pools),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.ListNodePoolsResponse()
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = client.list_node_pools(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            parent='parent_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].parent == 'parent_value'
+
+
+@pytest.mark.asyncio
+async def test_list_node_pools_flattened_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_node_pools),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.ListNodePoolsResponse())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.list_node_pools(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            parent='parent_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].parent == 'parent_value'
+
+
+def test_list_node_pools_flattened_error():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.list_node_pools(
+            cluster_service.ListNodePoolsRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            parent='parent_value',
+        )
+
+
+@pytest.mark.asyncio
+async def test_list_node_pools_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.list_node_pools(
+            cluster_service.ListNodePoolsRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            parent='parent_value',
+        )
+
+
+def test_get_node_pool(transport: str = 'grpc'):
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.GetNodePoolRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.get_node_pool),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.NodePool(
+            name='name_value',
+            initial_node_count=1911,
+            self_link='self_link_value',
+            version='version_value',
+            instance_group_urls=['instance_group_urls_value'],
+            status=cluster_service.NodePool.Status.PROVISIONING,
+            status_message='status_message_value',
+            pod_ipv4_cidr_size=1856,
+        )
+
+        response = client.get_node_pool(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.NodePool)
+    assert response.name == 'name_value'
+    assert response.initial_node_count == 1911
+    assert response.self_link == 'self_link_value'
+    assert response.version == 'version_value'
+    assert response.instance_group_urls == ['instance_group_urls_value']
+    assert response.status == cluster_service.NodePool.Status.PROVISIONING
+    assert response.status_message == 'status_message_value'
+    assert response.pod_ipv4_cidr_size == 1856
+
+
+@pytest.mark.asyncio
+async def test_get_node_pool_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.GetNodePoolRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_node_pool),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.NodePool(
+            name='name_value',
+            initial_node_count=1911,
+            self_link='self_link_value',
+            version='version_value',
+            instance_group_urls=['instance_group_urls_value'],
+            status=cluster_service.NodePool.Status.PROVISIONING,
+            status_message='status_message_value',
+            pod_ipv4_cidr_size=1856,
+        ))
+
+        response = await client.get_node_pool(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.NodePool)
+    assert response.name == 'name_value'
+    assert response.initial_node_count == 1911
+    assert response.self_link == 'self_link_value'
+    assert response.version == 'version_value'
+    assert response.instance_group_urls == ['instance_group_urls_value']
+    assert response.status == cluster_service.NodePool.Status.PROVISIONING
+    assert response.status_message == 'status_message_value'
+    assert response.pod_ipv4_cidr_size == 1856
+
+
+def test_get_node_pool_field_headers():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = cluster_service.GetNodePoolRequest(
+        name='name/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.get_node_pool),
+            '__call__') as call:
+        call.return_value = cluster_service.NodePool()
+        client.get_node_pool(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'name=name/value',
+    ) in kw['metadata']
+
+
+@pytest.mark.asyncio
+async def test_get_node_pool_field_headers_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = cluster_service.GetNodePoolRequest(
+        name='name/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_node_pool),
+            '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.NodePool())
+        await client.get_node_pool(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'name=name/value',
+    ) in kw['metadata']
+
+
+def test_get_node_pool_flattened():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.get_node_pool),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.NodePool()
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = client.get_node_pool(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            node_pool_id='node_pool_id_value',
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].node_pool_id == 'node_pool_id_value'
+        assert args[0].name == 'name_value'
+
+
+@pytest.mark.asyncio
+async def test_get_node_pool_flattened_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_node_pool),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.NodePool())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.get_node_pool(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            node_pool_id='node_pool_id_value',
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].node_pool_id == 'node_pool_id_value'
+        assert args[0].name == 'name_value'
+
+
+def test_get_node_pool_flattened_error():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.get_node_pool(
+            cluster_service.GetNodePoolRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            node_pool_id='node_pool_id_value',
+            name='name_value',
+        )
+
+
+@pytest.mark.asyncio
+async def test_get_node_pool_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.get_node_pool(
+            cluster_service.GetNodePoolRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            node_pool_id='node_pool_id_value',
+            name='name_value',
+        )
+
+
+def test_create_node_pool(transport: str = 'grpc'):
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.CreateNodePoolRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.create_node_pool),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        )
+
+        response = client.create_node_pool(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+@pytest.mark.asyncio
+async def test_create_node_pool_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.CreateNodePoolRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.create_node_pool),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        ))
+
+        response = await client.create_node_pool(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+def test_create_node_pool_flattened():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.create_node_pool),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.Operation()
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = client.create_node_pool(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            node_pool=cluster_service.NodePool(name='name_value'),
+            parent='parent_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].node_pool == cluster_service.NodePool(name='name_value')
+        assert args[0].parent == 'parent_value'
+
+
+@pytest.mark.asyncio
+async def test_create_node_pool_flattened_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.create_node_pool),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.create_node_pool(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            node_pool=cluster_service.NodePool(name='name_value'),
+            parent='parent_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].node_pool == cluster_service.NodePool(name='name_value')
+        assert args[0].parent == 'parent_value'
+
+
+def test_create_node_pool_flattened_error():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.create_node_pool(
+            cluster_service.CreateNodePoolRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            node_pool=cluster_service.NodePool(name='name_value'),
+            parent='parent_value',
+        )
+
+
+@pytest.mark.asyncio
+async def test_create_node_pool_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.create_node_pool(
+            cluster_service.CreateNodePoolRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            node_pool=cluster_service.NodePool(name='name_value'),
+            parent='parent_value',
+        )
+
+
+def test_delete_node_pool(transport: str = 'grpc'):
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.DeleteNodePoolRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.delete_node_pool),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        )
+
+        response = client.delete_node_pool(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+@pytest.mark.asyncio
+async def test_delete_node_pool_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.DeleteNodePoolRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.delete_node_pool),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        ))
+
+        response = await client.delete_node_pool(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+def test_delete_node_pool_flattened():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.delete_node_pool),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.Operation()
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = client.delete_node_pool(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            node_pool_id='node_pool_id_value',
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].node_pool_id == 'node_pool_id_value'
+        assert args[0].name == 'name_value'
+
+
+@pytest.mark.asyncio
+async def test_delete_node_pool_flattened_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.delete_node_pool),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.delete_node_pool(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            node_pool_id='node_pool_id_value',
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].node_pool_id == 'node_pool_id_value'
+        assert args[0].name == 'name_value'
+
+
+def test_delete_node_pool_flattened_error():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.delete_node_pool(
+            cluster_service.DeleteNodePoolRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            node_pool_id='node_pool_id_value',
+            name='name_value',
+        )
+
+
+@pytest.mark.asyncio
+async def test_delete_node_pool_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.delete_node_pool(
+            cluster_service.DeleteNodePoolRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            node_pool_id='node_pool_id_value',
+            name='name_value',
+        )
+
+
+def test_rollback_node_pool_upgrade(transport: str = 'grpc'):
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.RollbackNodePoolUpgradeRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.rollback_node_pool_upgrade),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        )
+
+        response = client.rollback_node_pool_upgrade(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+@pytest.mark.asyncio
+async def test_rollback_node_pool_upgrade_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.RollbackNodePoolUpgradeRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.rollback_node_pool_upgrade),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        ))
+
+        response = await client.rollback_node_pool_upgrade(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+def test_rollback_node_pool_upgrade_flattened():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.rollback_node_pool_upgrade),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.Operation()
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = client.rollback_node_pool_upgrade(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            node_pool_id='node_pool_id_value',
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].node_pool_id == 'node_pool_id_value'
+        assert args[0].name == 'name_value'
+
+
+@pytest.mark.asyncio
+async def test_rollback_node_pool_upgrade_flattened_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.rollback_node_pool_upgrade),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.rollback_node_pool_upgrade(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            node_pool_id='node_pool_id_value',
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].node_pool_id == 'node_pool_id_value'
+        assert args[0].name == 'name_value'
+
+
+def test_rollback_node_pool_upgrade_flattened_error():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.rollback_node_pool_upgrade(
+            cluster_service.RollbackNodePoolUpgradeRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            node_pool_id='node_pool_id_value',
+            name='name_value',
+        )
+
+
+@pytest.mark.asyncio
+async def test_rollback_node_pool_upgrade_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.rollback_node_pool_upgrade(
+            cluster_service.RollbackNodePoolUpgradeRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            node_pool_id='node_pool_id_value',
+            name='name_value',
+        )
+
+
+def test_set_node_pool_management(transport: str = 'grpc'):
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.SetNodePoolManagementRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.set_node_pool_management),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        )
+
+        response = client.set_node_pool_management(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+@pytest.mark.asyncio
+async def test_set_node_pool_management_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.SetNodePoolManagementRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.set_node_pool_management),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        ))
+
+        response = await client.set_node_pool_management(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+def test_set_labels(transport: str = 'grpc'):
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.SetLabelsRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.set_labels),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        )
+
+        response = client.set_labels(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+@pytest.mark.asyncio
+async def test_set_labels_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.SetLabelsRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.set_labels),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        ))
+
+        response = await client.set_labels(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+def test_set_legacy_abac(transport: str = 'grpc'):
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.SetLegacyAbacRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.set_legacy_abac),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        )
+
+        response = client.set_legacy_abac(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+@pytest.mark.asyncio
+async def test_set_legacy_abac_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.SetLegacyAbacRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.set_legacy_abac),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        ))
+
+        response = await client.set_legacy_abac(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+def test_set_legacy_abac_flattened():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.set_legacy_abac),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.Operation()
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = client.set_legacy_abac(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            enabled=True,
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].enabled == True
+        assert args[0].name == 'name_value'
+
+
+@pytest.mark.asyncio
+async def test_set_legacy_abac_flattened_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.set_legacy_abac),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.set_legacy_abac(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            enabled=True,
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].enabled == True
+        assert args[0].name == 'name_value'
+
+
+def test_set_legacy_abac_flattened_error():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.set_legacy_abac(
+            cluster_service.SetLegacyAbacRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            enabled=True,
+            name='name_value',
+        )
+
+
+@pytest.mark.asyncio
+async def test_set_legacy_abac_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.set_legacy_abac(
+            cluster_service.SetLegacyAbacRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            enabled=True,
+            name='name_value',
+        )
+
+
+def test_start_ip_rotation(transport: str = 'grpc'):
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.StartIPRotationRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.start_ip_rotation),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        )
+
+        response = client.start_ip_rotation(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+@pytest.mark.asyncio
+async def test_start_ip_rotation_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.StartIPRotationRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.start_ip_rotation),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        ))
+
+        response = await client.start_ip_rotation(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+def test_start_ip_rotation_flattened():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.start_ip_rotation),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.Operation()
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = client.start_ip_rotation(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].name == 'name_value'
+
+
+@pytest.mark.asyncio
+async def test_start_ip_rotation_flattened_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.start_ip_rotation),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.start_ip_rotation(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].name == 'name_value'
+
+
+def test_start_ip_rotation_flattened_error():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.start_ip_rotation(
+            cluster_service.StartIPRotationRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            name='name_value',
+        )
+
+
+@pytest.mark.asyncio
+async def test_start_ip_rotation_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.start_ip_rotation(
+            cluster_service.StartIPRotationRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            name='name_value',
+        )
+
+
+def test_complete_ip_rotation(transport: str = 'grpc'):
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.CompleteIPRotationRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.complete_ip_rotation),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        )
+
+        response = client.complete_ip_rotation(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+@pytest.mark.asyncio
+async def test_complete_ip_rotation_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.CompleteIPRotationRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.complete_ip_rotation),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        ))
+
+        response = await client.complete_ip_rotation(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+def test_complete_ip_rotation_flattened():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.complete_ip_rotation),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.Operation()
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = client.complete_ip_rotation(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].name == 'name_value'
+
+
+@pytest.mark.asyncio
+async def test_complete_ip_rotation_flattened_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.complete_ip_rotation),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.complete_ip_rotation(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].name == 'name_value'
+
+
+def test_complete_ip_rotation_flattened_error():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.complete_ip_rotation(
+            cluster_service.CompleteIPRotationRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            name='name_value',
+        )
+
+
+@pytest.mark.asyncio
+async def test_complete_ip_rotation_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.complete_ip_rotation(
+            cluster_service.CompleteIPRotationRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            name='name_value',
+        )
+
+
+def test_set_node_pool_size(transport: str = 'grpc'):
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.SetNodePoolSizeRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.set_node_pool_size),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        )
+
+        response = client.set_node_pool_size(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+@pytest.mark.asyncio
+async def test_set_node_pool_size_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.SetNodePoolSizeRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.set_node_pool_size),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        ))
+
+        response = await client.set_node_pool_size(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+def test_set_network_policy(transport: str = 'grpc'):
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.SetNetworkPolicyRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.set_network_policy),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        )
+
+        response = client.set_network_policy(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+@pytest.mark.asyncio
+async def test_set_network_policy_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.SetNetworkPolicyRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.set_network_policy),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        ))
+
+        response = await client.set_network_policy(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+def test_set_network_policy_flattened():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.set_network_policy),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.Operation()
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = client.set_network_policy(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            network_policy=cluster_service.NetworkPolicy(provider=cluster_service.NetworkPolicy.Provider.CALICO),
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].network_policy == cluster_service.NetworkPolicy(provider=cluster_service.NetworkPolicy.Provider.CALICO)
+        assert args[0].name == 'name_value'
+
+
+@pytest.mark.asyncio
+async def test_set_network_policy_flattened_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.set_network_policy),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.set_network_policy(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            network_policy=cluster_service.NetworkPolicy(provider=cluster_service.NetworkPolicy.Provider.CALICO),
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].network_policy == cluster_service.NetworkPolicy(provider=cluster_service.NetworkPolicy.Provider.CALICO)
+        assert args[0].name == 'name_value'
+
+
+def test_set_network_policy_flattened_error():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.set_network_policy(
+            cluster_service.SetNetworkPolicyRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            network_policy=cluster_service.NetworkPolicy(provider=cluster_service.NetworkPolicy.Provider.CALICO),
+            name='name_value',
+        )
+
+
+@pytest.mark.asyncio
+async def test_set_network_policy_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.set_network_policy(
+            cluster_service.SetNetworkPolicyRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            network_policy=cluster_service.NetworkPolicy(provider=cluster_service.NetworkPolicy.Provider.CALICO),
+            name='name_value',
+        )
+
+
+def test_set_maintenance_policy(transport: str = 'grpc'):
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.SetMaintenancePolicyRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.set_maintenance_policy),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        )
+
+        response = client.set_maintenance_policy(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+@pytest.mark.asyncio
+async def test_set_maintenance_policy_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.SetMaintenancePolicyRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.set_maintenance_policy),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation(
+            name='name_value',
+            zone='zone_value',
+            operation_type=cluster_service.Operation.Type.CREATE_CLUSTER,
+            status=cluster_service.Operation.Status.PENDING,
+            detail='detail_value',
+            status_message='status_message_value',
+            self_link='self_link_value',
+            target_link='target_link_value',
+            location='location_value',
+            start_time='start_time_value',
+            end_time='end_time_value',
+        ))
+
+        response = await client.set_maintenance_policy(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, cluster_service.Operation)
+    assert response.name == 'name_value'
+    assert response.zone == 'zone_value'
+    assert response.operation_type == cluster_service.Operation.Type.CREATE_CLUSTER
+    assert response.status == cluster_service.Operation.Status.PENDING
+    assert response.detail == 'detail_value'
+    assert response.status_message == 'status_message_value'
+    assert response.self_link == 'self_link_value'
+    assert response.target_link == 'target_link_value'
+    assert response.location == 'location_value'
+    assert response.start_time == 'start_time_value'
+    assert response.end_time == 'end_time_value'
+
+
+def test_set_maintenance_policy_flattened():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.set_maintenance_policy),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.Operation()
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = client.set_maintenance_policy(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            maintenance_policy=cluster_service.MaintenancePolicy(window=cluster_service.MaintenanceWindow(daily_maintenance_window=cluster_service.DailyMaintenanceWindow(start_time='start_time_value'))),
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].maintenance_policy == cluster_service.MaintenancePolicy(window=cluster_service.MaintenanceWindow(daily_maintenance_window=cluster_service.DailyMaintenanceWindow(start_time='start_time_value')))
+        assert args[0].name == 'name_value'
+
+
+@pytest.mark.asyncio
+async def test_set_maintenance_policy_flattened_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.set_maintenance_policy),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Operation())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.set_maintenance_policy(
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            maintenance_policy=cluster_service.MaintenancePolicy(window=cluster_service.MaintenanceWindow(daily_maintenance_window=cluster_service.DailyMaintenanceWindow(start_time='start_time_value'))),
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].project_id == 'project_id_value'
+        assert args[0].zone == 'zone_value'
+        assert args[0].cluster_id == 'cluster_id_value'
+        assert args[0].maintenance_policy == cluster_service.MaintenancePolicy(window=cluster_service.MaintenanceWindow(daily_maintenance_window=cluster_service.DailyMaintenanceWindow(start_time='start_time_value')))
+        assert args[0].name == 'name_value'
+
+
+def test_set_maintenance_policy_flattened_error():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.set_maintenance_policy(
+            cluster_service.SetMaintenancePolicyRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            maintenance_policy=cluster_service.MaintenancePolicy(window=cluster_service.MaintenanceWindow(daily_maintenance_window=cluster_service.DailyMaintenanceWindow(start_time='start_time_value'))),
+            name='name_value',
+        )
+
+
+@pytest.mark.asyncio
+async def test_set_maintenance_policy_flattened_error_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.set_maintenance_policy(
+            cluster_service.SetMaintenancePolicyRequest(),
+            project_id='project_id_value',
+            zone='zone_value',
+            cluster_id='cluster_id_value',
+            maintenance_policy=cluster_service.MaintenancePolicy(window=cluster_service.MaintenanceWindow(daily_maintenance_window=cluster_service.DailyMaintenanceWindow(start_time='start_time_value'))),
+            name='name_value',
+        )
+
+
+def test_list_usable_subnetworks(transport: str = 'grpc'):
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.ListUsableSubnetworksRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.list_usable_subnetworks),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = cluster_service.ListUsableSubnetworksResponse(
+            next_page_token='next_page_token_value',
+        )
+
+        response = client.list_usable_subnetworks(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.ListUsableSubnetworksPager)
+    assert response.next_page_token == 'next_page_token_value'
+
+
+@pytest.mark.asyncio
+async def test_list_usable_subnetworks_async(transport: str = 'grpc_asyncio'):
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = cluster_service.ListUsableSubnetworksRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_usable_subnetworks),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.ListUsableSubnetworksResponse(
+            next_page_token='next_page_token_value',
+        ))
+
+        response = await client.list_usable_subnetworks(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.ListUsableSubnetworksAsyncPager)
+    assert response.next_page_token == 'next_page_token_value'
+
+
+def test_list_usable_subnetworks_field_headers():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = cluster_service.ListUsableSubnetworksRequest(
+        parent='parent/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.list_usable_subnetworks),
+            '__call__') as call:
+        call.return_value = cluster_service.ListUsableSubnetworksResponse()
+        client.list_usable_subnetworks(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'parent=parent/value',
+    ) in kw['metadata']
+
+
+@pytest.mark.asyncio
+async def test_list_usable_subnetworks_field_headers_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = cluster_service.ListUsableSubnetworksRequest(
+        parent='parent/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_usable_subnetworks),
+            '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.ListUsableSubnetworksResponse())
+        await client.list_usable_subnetworks(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'parent=parent/value',
+    ) in kw['metadata']
+
+
+def test_list_usable_subnetworks_pager():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.list_usable_subnetworks),
+            '__call__') as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[
+                    cluster_service.UsableSubnetwork(),
+                    cluster_service.UsableSubnetwork(),
+                    cluster_service.UsableSubnetwork(),
+                ],
+                next_page_token='abc',
+            ),
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[],
+                next_page_token='def',
+            ),
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[
+                    cluster_service.UsableSubnetwork(),
+                ],
+                next_page_token='ghi',
+            ),
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[
+                    cluster_service.UsableSubnetwork(),
+                    cluster_service.UsableSubnetwork(),
+                ],
+            ),
+            RuntimeError,
+        )
+        results = [i for i in client.list_usable_subnetworks(
+            request={},
+        )]
+        assert len(results) == 6
+        assert all(isinstance(i, cluster_service.UsableSubnetwork)
+                   for i in results)
+
+def test_list_usable_subnetworks_pages():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.list_usable_subnetworks),
+            '__call__') as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[
+                    cluster_service.UsableSubnetwork(),
+                    cluster_service.UsableSubnetwork(),
+                    cluster_service.UsableSubnetwork(),
+                ],
+                next_page_token='abc',
+            ),
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[],
+                next_page_token='def',
+            ),
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[
+                    cluster_service.UsableSubnetwork(),
+                ],
+                next_page_token='ghi',
+            ),
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[
+                    cluster_service.UsableSubnetwork(),
+                    cluster_service.UsableSubnetwork(),
+                ],
+            ),
+            RuntimeError,
+        )
+        pages = list(client.list_usable_subnetworks(request={}).pages)
+        for page, token in zip(pages, ['abc','def','ghi', '']):
+            assert page.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_list_usable_subnetworks_async_pager():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_usable_subnetworks),
+            '__call__', new_callable=AwaitableMock) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[
+                    cluster_service.UsableSubnetwork(),
+                    cluster_service.UsableSubnetwork(),
+                    cluster_service.UsableSubnetwork(),
+                ],
+                next_page_token='abc',
+            ),
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[],
+                next_page_token='def',
+            ),
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[
+                    cluster_service.UsableSubnetwork(),
+                ],
+                next_page_token='ghi',
+            ),
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[
+                    cluster_service.UsableSubnetwork(),
+                    cluster_service.UsableSubnetwork(),
+                ],
+            ),
+            RuntimeError,
+        )
+        async_pager = await client.list_usable_subnetworks(request={},)
+        assert async_pager.next_page_token == 'abc'
+        responses = []
+        async for response in async_pager:
+            responses.append(response)
+
+        assert len(responses) == 6
+        assert all(isinstance(i, cluster_service.UsableSubnetwork)
+                   for i in responses)
+
+
+@pytest.mark.asyncio
+async def test_list_usable_subnetworks_async_pages():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_usable_subnetworks),
+            '__call__', new_callable=AwaitableMock) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[
+                    cluster_service.UsableSubnetwork(),
+                    cluster_service.UsableSubnetwork(),
+                    cluster_service.UsableSubnetwork(),
+                ],
+                next_page_token='abc',
+            ),
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[],
+                next_page_token='def',
+            ),
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[
+                    cluster_service.UsableSubnetwork(),
+                ],
+                next_page_token='ghi',
+            ),
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[
+                    cluster_service.UsableSubnetwork(),
+                    cluster_service.UsableSubnetwork(),
+                ],
+            ),
+            RuntimeError,
+        )
+        pages = []
+        async for page in (await client.list_usable_subnetworks(request={})).pages:
+            pages.append(page)
+        for page, token in zip(pages, ['abc','def','ghi', '']):
+            assert page.raw_page.next_page_token == token
+
+
+def test_wrapped_methods_cached_per_transport():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.list_node_pools),
+            '__call__') as call:
+        call.return_value = cluster_service.ListNodePoolsResponse()
+        client.list_node_pools(cluster_service.ListNodePoolsRequest(parent='parent/value'))
+        rpc = client._transport._wrapped_methods['list_node_pools']
+        client.list_node_pools(cluster_service.ListNodePoolsRequest(parent='parent/value'))
+
+        # The RPC method is wrapped only once and reused afterwards.
+        assert client._transport._wrapped_methods['list_node_pools'] is rpc
+        assert list(client._transport._wrapped_methods) == ['list_node_pools']
+
+        # The routing header is sent with every call.
+        assert len(call.mock_calls) == 2
+        for _, _, kw in call.mock_calls:
+            assert (
+                'x-goog-request-params',
+                'parent=parent/value',
+            ) in kw['metadata']
+
+
+def test_get_operation_default_retry():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.get_operation),
+            '__call__') as call, mock.patch('time.sleep'):
+        call.side_effect = (
+            exceptions.ServiceUnavailable('unavailable'),
+            cluster_service.Operation(),
+        )
+        response = client.get_operation(cluster_service.GetOperationRequest())
+
+        # Idempotent methods are retried on transient errors.
+        assert len(call.mock_calls) == 2
+        _, _, kw = call.mock_calls[0]
+        assert kw['timeout'] == pytest.approx(20.0, abs=1)
+    assert isinstance(response, cluster_service.Operation)
+
+
+def test_set_node_pool_size_default_no_retry():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.set_node_pool_size),
+            '__call__') as call:
+        call.side_effect = exceptions.ServiceUnavailable('unavailable')
+
+        # Methods that change state are never retried by default.
+        with pytest.raises(exceptions.ServiceUnavailable):
+            client.set_node_pool_size(cluster_service.SetNodePoolSizeRequest())
+        assert len(call.mock_calls) == 1
+        _, _, kw = call.mock_calls[0]
+        assert kw['timeout'] == pytest.approx(45.0, abs=1)
+
+
+@pytest.mark.asyncio
+async def test_get_operation_default_retry_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_operation),
+            '__call__', new_callable=AwaitableMock) as call, \
+            mock.patch('asyncio.sleep', new_callable=AwaitableMock):
+        call.side_effect = (
+            exceptions.ServiceUnavailable('unavailable'),
+            cluster_service.Operation(),
+        )
+        response = await client.get_operation(cluster_service.GetOperationRequest())
+
+        # Idempotent methods are retried on transient errors.
+        assert len(call.mock_calls) == 2
+    assert isinstance(response, cluster_service.Operation)
+
+
+def test_method_configs_from_dict():
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={
+            'method_configs': {
+                'get_operation': {'retry': None, 'timeout': 5.0},
+            },
+        },
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.get_operation),
+            '__call__') as call:
+        call.side_effect = exceptions.ServiceUnavailable('unavailable')
+
+        # The overridden retry and timeout are used instead of the defaults.
+        with pytest.raises(exceptions.ServiceUnavailable):
+            client.get_operation(cluster_service.GetOperationRequest())
+        assert len(call.mock_calls) == 1
+        _, _, kw = call.mock_calls[0]
+        assert kw['timeout'] == pytest.approx(5.0, abs=1)
+
+
+def test_method_configs_from_client_options():
+    options = client_options.ClientOptions()
+    options.method_configs = {'set_node_pool_size': {'timeout': 7.0}}
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options=options,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.set_node_pool_size),
+            '__call__') as call:
+        call.return_value = cluster_service.Operation()
+        client.set_node_pool_size(cluster_service.SetNodePoolSizeRequest())
+
+        _, _, kw = call.mock_calls[0]
+        assert kw['timeout'] == pytest.approx(7.0, abs=1)
+
+
+def test_method_configs_unknown():
+    with pytest.raises(ValueError):
+        ClusterManagerClient(
+            credentials=credentials.AnonymousCredentials(),
+            client_options={'method_configs': {'not_a_method': {}}},
+        )
+    with pytest.raises(ValueError):
+        ClusterManagerClient(
+            credentials=credentials.AnonymousCredentials(),
+            client_options={'method_configs': {'get_operation': {'deadline': 1.0}}},
+        )
+
+
+class FakeChannel:
+    """A channel whose calls succeed, or fail with ``error`` if set."""
+    def __init__(self):
+        self.calls = []
+        self.error = None
+        self.closed = False
+        self.subscribed = []
+        self.ready = False
+
+    def _callable(self, method, *args, **kwargs):
+        channel = self
+
+        class MultiCallable:
+            def __call__(self, request, **kwargs):
+                channel.calls.append(method)
+                if channel.error is not None:
+                    raise channel.error
+                return request
+
+            def with_call(self, request, **kwargs):
+                return self(request), None
+
+            def future(self, request, **kwargs):
+                channel.calls.append(method)
+                return futures.Future()
+
+        return MultiCallable()
+
+    unary_unary = unary_stream = stream_unary = stream_stream = _callable
+
+    def subscribe(self, callback, try_to_connect=False):
+        self.subscribed.append(callback)
+        if self.ready:
+            callback(grpc.ChannelConnectivity.READY)
+
+    def unsubscribe(self, callback):
+        self.subscribed.remove(callback)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeRpcError(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+def test_transport_grpc_pool():
+    channels = []
+
+    def create_channel(*args, **kwargs):
+        channels.append(FakeChannel())
+        return channels[-1]
+
+    with mock.patch.object(grpc_helpers, 'create_channel', side_effect=create_channel) as create:
+        transport = transports.ClusterManagerGrpcTransport(
+            credentials=credentials.AnonymousCredentials(),
+            pool_size=3,
         )
+        assert isinstance(transport.grpc_channel, transports.pool.ChannelPool)
+        assert transport.grpc_channel.channels == channels
+        assert create.call_count == 3
 
-        response = client.list_usable_subnetworks(request)
+        client = ClusterManagerClient(transport=transport)
+        for _ in range(6):
+            client.get_cluster(name='name_value')
+        assert [len(c.calls) for c in channels] == [2, 2, 2]
+        assert channels[0].calls[0] == '/google.container.v1.ClusterManager/GetCluster'
 
-        # Establish that the underlying gRPC stub method was called.
-        assert len(call.mock_calls) == 1
-        _, args, _ = call.mock_calls[0]
+    with mock.patch.object(grpc_helpers, 'create_channel', side_effect=create_channel), \
+            mock.patch('grpc.ssl_channel_credentials', autospec=True):
+        transport = transports.ClusterManagerGrpcTransport(
+            credentials=credentials.AnonymousCredentials(),
+            api_mtls_endpoint='mtls.squid.clam.whelk',
+            client_cert_source=client_cert_source_callback,
+            pool_size=2,
+            pool_policy='least_outstanding',
+        )
+        assert len(transport.grpc_channel.channels) == 2
 
-        assert args[0] == request
 
-    # Establish that the response is the type that we expect.
-    assert isinstance(response, pagers.ListUsableSubnetworksPager)
-    assert response.next_page_token == 'next_page_token_value'
+@pytest.mark.parametrize('kwargs', [
+    {'pool_size': 0},
+    {'pool_size': 2, 'pool_policy': 'random'},
+])
+def test_transport_grpc_pool_invalid(kwargs):
+    with pytest.raises(ValueError):
+        transports.ClusterManagerGrpcTransport(
+            credentials=credentials.AnonymousCredentials(),
+            **kwargs
+        )
 
 
-def test_list_usable_subnetworks_field_headers():
+@pytest.mark.parametrize('kwargs', [
+    {'size': 0},
+    {'policy': 'random'},
+    {'max_failures': 0},
+])
+def test_channel_pool_invalid(kwargs):
+    kwargs = dict({'size': 2}, **kwargs)
+    with pytest.raises(ValueError):
+        transports.pool.ChannelPool(FakeChannel, **kwargs)
+
+
+def test_channel_pool_least_outstanding():
+    pool = transports.pool.ChannelPool(FakeChannel, 3, 'least_outstanding')
+    rpc = pool.unary_unary('/Service/Method')
+    pending = [rpc.future('request') for _ in range(2)]
+    assert pool.stats()['outstanding'] == [1, 1, 0]
+
+    # Idle channels are preferred until the load is even.
+    assert rpc('request') == 'request'
+    assert rpc.with_call('request') == ('request', None)
+    rpc.future('request')
+    assert pool.stats()['outstanding'] == [1, 1, 1]
+
+    pending[0].cancel()
+    pending[1].set_exception(FakeRpcError(grpc.StatusCode.NOT_FOUND))
+    assert pool.stats()['outstanding'] == [0, 0, 1]
+    assert [len(c.calls) for c in pool.channels] == [1, 1, 3]
+
+
+def test_channel_pool_eviction():
+    pool = transports.pool.ChannelPool(FakeChannel, 1, max_failures=2)
+    rpc = pool.unary_unary('/Service/Method')
+    first = pool.channels[0]
+    first.error = FakeRpcError(grpc.StatusCode.UNAVAILABLE)
+
+    # A call in flight keeps the evicted channel open until it completes.
+    pending = rpc.future('request')
+    for _ in range(2):
+        with pytest.raises(grpc.RpcError):
+            rpc('request')
+    assert pool.stats()['evictions'] == 1
+    second = pool.channels[0]
+    assert second is not first
+    assert not first.closed
+    pending.set_exception(FakeRpcError(grpc.StatusCode.UNAVAILABLE))
+    assert first.closed
+
+    # Successes and other errors reset the count of failures.
+    for error in (None, FakeRpcError(grpc.StatusCode.PERMISSION_DENIED)):
+        second.error = FakeRpcError(grpc.StatusCode.UNAVAILABLE)
+        with pytest.raises(grpc.RpcError):
+            rpc('request')
+        second.error = error
+        try:
+            rpc('request')
+        except grpc.RpcError:
+            pass
+    assert pool.channels[0] is second
+
+    # An evicted channel with nothing in flight is closed at once.
+    second.error = FakeRpcError(grpc.StatusCode.UNAVAILABLE)
+    for _ in range(2):
+        with pytest.raises(grpc.RpcError):
+            rpc('request')
+    assert second.closed
+    assert pool.stats() == {'outstanding': [0], 'evictions': 2}
+
+
+def test_channel_pool_future_error():
+    pool = transports.pool.ChannelPool(FakeChannel, 1)
+    rpc = pool.stream_unary('/Service/Method')
+    with mock.patch.object(FakeChannel, 'stream_unary', side_effect=RuntimeError):
+        with pytest.raises(RuntimeError):
+            rpc.future(iter(()))
+    assert pool.stats()['outstanding'] == [0]
+
+
+def test_channel_pool_channel_methods():
+    pool = transports.pool.ChannelPool(FakeChannel, 2)
+    assert isinstance(pool.unary_unary('/S/M'), grpc.UnaryUnaryMultiCallable)
+    assert isinstance(pool.unary_stream('/S/M'), grpc.UnaryStreamMultiCallable)
+    assert isinstance(pool.stream_unary('/S/M'), grpc.StreamUnaryMultiCallable)
+    assert isinstance(pool.stream_stream('/S/M'), grpc.StreamStreamMultiCallable)
+    assert pool.stream_stream('/S/M')(iter(())) is not None
+
+    callback = mock.Mock()
+    pool.subscribe(callback)
+    assert all(c.subscribed == [callback] for c in pool.channels)
+    pool.unsubscribe(callback)
+    assert all(c.subscribed == [] for c in pool.channels)
+    pool.close()
+    assert all(c.closed for c in pool.channels)
+
+
+def test_channel_pool_context_manager():
+    with transports.pool.ChannelPool(FakeChannel, 2) as pool:
+        assert not any(c.closed for c in pool.channels)
+    assert all(c.closed for c in pool.channels)
+
+
+def test_channel_pool_eviction_outside_lock():
+    channels = []
+
+    def create_channel():
+        # Other calls may pick a channel while this one is created.
+        if channels:
+            assert pool._lock.acquire(blocking=False)
+            pool._lock.release()
+            assert pool.stats()['outstanding'] == [0]
+        channels.append(FakeChannel())
+        return channels[-1]
+
+    pool = transports.pool.ChannelPool(create_channel, 1, max_failures=1)
+    rpc = pool.unary_unary('/Service/Method')
+    pending = rpc.future('request')
+    pending.set_exception(FakeRpcError(grpc.StatusCode.UNAVAILABLE))
+    assert pool.channels == [channels[1]]
+    assert channels[0].closed
+
+
+def test_metrics_histogram():
+    histogram = metrics.Histogram()
+    assert histogram.percentile(50) is None
+    assert histogram.snapshot() == {
+        'count': 0, 'min': None, 'max': None, 'mean': None,
+        'p50': None, 'p90': None, 'p99': None, 'p99.9': None,
+    }
+
+    # Short durations are exact...
+    histogram.record(0.0001)
+    assert histogram.percentile(50) == 0.0001
+
+    # ... and percentiles are within 1% otherwise.
+    histogram = metrics.Histogram()
+    for micros in range(1, 100001):
+        histogram.record(micros / 1e6)
+    for percentile in metrics.PERCENTILES:
+        expected = percentile / 100 * 0.1
+        assert abs(histogram.percentile(percentile) - expected) <= 0.01 * expected
+    assert histogram.percentile(100) == 0.1
+    snapshot = histogram.snapshot()
+    assert snapshot['count'] == 100000
+    assert snapshot['min'] == 1e-6
+    assert snapshot['max'] == 0.1
+    assert snapshot['mean'] == pytest.approx(0.05, rel=1e-3)
+
+
+def test_transport_metrics():
+    records = []
     client = ClusterManagerClient(
         credentials=credentials.AnonymousCredentials(),
-  )
-
-    # Any value that is part of the HTTP/1.1 URI should be sent as
-    # a field header. Set these to a non-empty value.
-    request = cluster_service.ListUsableSubnetworksRequest(
-        parent='parent/value',
+        client_options={'metrics': metrics.TransportMetrics(
+            sink=lambda *args: records.append(args))},
     )
+    snapshots = []
 
-    # Mock the actual call within the gRPC stub, and fake the request.
-    with mock.patch.object(
-            type(client._transport.list_usable_subnetworks),
-            '__call__') as call:
-        call.return_value = cluster_service.ListUsableSubnetworksResponse()
-        client.list_usable_subnetworks(request)
+    def rpc(request, **kwargs):
+        snapshots.append(client._transport.metrics.snapshot())
+        return cluster_service.Cluster(name='name_value')
 
-        # Establish that the underlying gRPC stub method was called.
-        assert len(call.mock_calls) == 1
-        _, args, _ = call.mock_calls[0]
-        assert args[0] == request
+    with mock.patch.object(
+            type(client._transport.get_cluster), '__call__') as call:
+        call.side_effect = rpc
+        client.get_cluster(name='name_value')
+        call.side_effect = exceptions.NotFound('not found')
+        with pytest.raises(exceptions.NotFound):
+            client.get_cluster(name='name_value')
+        call.side_effect = RuntimeError('boom')
+        with pytest.raises(RuntimeError):
+            client.get_cluster(name='name_value')
+
+    assert snapshots[0]['get_cluster']['in_flight'] == 1
+    snapshot = client._transport.metrics.snapshot()
+    assert list(snapshot) == ['get_cluster']
+    assert snapshot['get_cluster']['calls'] == 3
+    assert snapshot['get_cluster']['in_flight'] == 0
+    assert snapshot['get_cluster']['codes'] == {'OK': 1, 'NOT_FOUND': 1, 'UNKNOWN': 1}
+    assert snapshot['get_cluster']['latency']['count'] == 3
+    assert [(r[0], r[2]) for r in records] == [
+        ('get_cluster', 'OK'), ('get_cluster', 'NOT_FOUND'), ('get_cluster', 'UNKNOWN'),
+    ]
 
-    # Establish that the field header was sent.
-    _, _, kw = call.mock_calls[0]
-    assert (
-        'x-goog-request-params',
-        'parent=parent/value',
-    ) in kw['metadata']
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'metrics': True},
+    )
+    assert isinstance(client._transport.metrics, metrics.TransportMetrics)
+    client = ClusterManagerClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+    assert client._transport.metrics is None
 
 
-def test_list_usable_subnetworks_pager():
+@pytest.mark.asyncio
+async def test_transport_metrics_async():
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'metrics': True},
+    )
+    with mock.patch.object(
+            type(client._client._transport.get_cluster), '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(
+            cluster_service.Cluster(name='name_value'))
+        await client.get_cluster(name='name_value')
+        call.side_effect = asyncio.CancelledError()
+        with pytest.raises(asyncio.CancelledError):
+            await client.get_cluster(name='name_value')
+
+    snapshot = client._client._transport.metrics.snapshot()['get_cluster']
+    assert snapshot['calls'] == 2
+    assert snapshot['in_flight'] == 0
+    assert snapshot['codes'] == {'OK': 1, 'CANCELLED': 1}
+
+
+class Recorder(interceptors.Interceptor):
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+
+    def _before(self, method, request, metadata):
+        self.log.append((self.name, method, request.name))
+        return metadata + (('x-' + self.name, '1'),)
+
+    def intercept(self, method, request, metadata, proceed):
+        metadata = self._before(method, request, metadata)
+        try:
+            response = proceed(request, metadata)
+        except exceptions.GoogleAPICallError as exc:
+            self.log.append((self.name, type(exc).__name__))
+            raise
+        self.log.append((self.name, response.name))
+        return response
+
+    async def intercept_async(self, method, request, metadata, proceed):
+        metadata = self._before(method, request, metadata)
+        try:
+            response = await proceed(request, metadata)
+        except exceptions.GoogleAPICallError as exc:
+            self.log.append((self.name, type(exc).__name__))
+            raise
+        self.log.append((self.name, response.name))
+        return response
+
+
+class Cached(interceptors.Interceptor):
+    def intercept(self, method, request, metadata, proceed):
+        return cluster_service.Cluster(name='cached')
+
+    async def intercept_async(self, method, request, metadata, proceed):
+        return cluster_service.Cluster(name='cached')
+
+
+def test_interceptors():
+    log = []
     client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials,
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'interceptors': [Recorder('inner', log)]},
+        interceptors=[Recorder('outer', log), interceptors.Interceptor()],
     )
-
-    # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.list_usable_subnetworks),
-            '__call__') as call:
-        # Set the response to a series of pages.
-        call.side_effect = (
-            cluster_service.ListUsableSubnetworksResponse(
-                subnetworks=[
-                    cluster_service.UsableSubnetwork(),
-                    cluster_service.UsableSubnetwork(),
-                    cluster_service.UsableSubnetwork(),
-                ],
-                next_page_token='abc',
-            ),
-            cluster_service.ListUsableSubnetworksResponse(
-                subnetworks=[],
-                next_page_token='def',
-            ),
-            cluster_service.ListUsableSubnetworksResponse(
-                subnetworks=[
-                    cluster_service.UsableSubnetwork(),
-                ],
-                next_page_token='ghi',
-            ),
-            cluster_service.ListUsableSubnetworksResponse(
-                subnetworks=[
-                    cluster_service.UsableSubnetwork(),
-                    cluster_service.UsableSubnetwork(),
-                ],
-            ),
-            RuntimeError,
-        )
-        results = [i for i in client.list_usable_subnetworks(
-            request={},
-        )]
-        assert len(results) == 6
-        assert all(isinstance(i, cluster_service.UsableSubnetwork)
-                   for i in results)
-
-def test_list_usable_subnetworks_pages():
+            type(client._transport.get_cluster), '__call__') as call:
+        call.return_value = cluster_service.Cluster(name='response')
+        response = client.get_cluster(name='name_value')
+        assert response.name == 'response'
+        _, args, kw = call.mock_calls[0]
+        assert ('x-outer', '1') in kw['metadata']
+        assert ('x-inner', '1') in kw['metadata']
+        assert log == [
+            ('outer', 'get_cluster', 'name_value'),
+            ('inner', 'get_cluster', 'name_value'),
+            ('inner', 'response'),
+            ('outer', 'response'),
+        ]
+
+        log.clear()
+        call.side_effect = exceptions.NotFound('not found')
+        with pytest.raises(exceptions.NotFound):
+            client.get_cluster(name='name_value')
+        assert log[2:] == [('inner', 'NotFound'), ('outer', 'NotFound')]
+
+    # An interceptor can answer calls itself.
     client = ClusterManagerClient(
-        credentials=credentials.AnonymousCredentials,
+        credentials=credentials.AnonymousCredentials(),
+        client_options=client_options.ClientOptions(),
+        interceptors=[Cached()],
     )
+    with mock.patch.object(
+            type(client._transport.get_cluster), '__call__') as call:
+        assert client.get_cluster(name='name_value').name == 'cached'
+    call.assert_not_called()
 
-    # Mock the actual call within the gRPC stub, and fake the request.
+
+@pytest.mark.asyncio
+async def test_interceptors_async():
+    log = []
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'interceptors': [Recorder('inner', log)]},
+        interceptors=[Recorder('outer', log), interceptors.Interceptor()],
+    )
     with mock.patch.object(
-            type(client._transport.list_usable_subnetworks),
-            '__call__') as call:
-        # Set the response to a series of pages.
-        call.side_effect = (
-            cluster_service.ListUsableSubnetworksResponse(
-                subnetworks=[
-                    cluster_service.UsableSubnetwork(),
-                    cluster_service.UsableSubnetwork(),
-                    cluster_service.UsableSubnetwork(),
-                ],
-                next_page_token='abc',
-            ),
-            cluster_service.ListUsableSubnetworksResponse(
-                subnetworks=[],
-                next_page_token='def',
-            ),
-            cluster_service.ListUsableSubnetworksResponse(
-                subnetworks=[
-                    cluster_service.UsableSubnetwork(),
-                ],
-                next_page_token='ghi',
-            ),
-            cluster_service.ListUsableSubnetworksResponse(
-                subnetworks=[
-                    cluster_service.UsableSubnetwork(),
-                    cluster_service.UsableSubnetwork(),
-                ],
-            ),
-            RuntimeError,
+            type(client._client._transport.get_cluster), '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(
+            cluster_service.Cluster(name='response'))
+        response = await client.get_cluster(name='name_value')
+        assert response.name == 'response'
+        _, args, kw = call.mock_calls[0]
+        assert ('x-outer', '1') in kw['metadata']
+        assert ('x-inner', '1') in kw['metadata']
+        assert log == [
+            ('outer', 'get_cluster', 'name_value'),
+            ('inner', 'get_cluster', 'name_value'),
+            ('inner', 'response'),
+            ('outer', 'response'),
+        ]
+
+        log.clear()
+        call.side_effect = exceptions.NotFound('not found')
+        with pytest.raises(exceptions.NotFound):
+            await client.get_cluster(name='name_value')
+        assert log[2:] == [('inner', 'NotFound'), ('outer', 'NotFound')]
+
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        interceptors=[Cached()],
+    )
+    with mock.patch.object(
+            type(client._client._transport.get_cluster), '__call__') as call:
+        assert (await client.get_cluster(name='name_value')).name == 'cached'
+    call.assert_not_called()
+
+
+def test_warmup():
+    creds = mock.Mock(spec=credentials.Credentials, valid=False)
+    channel = FakeChannel()
+    channel.ready = True
+    with mock.patch.object(grpc_helpers, 'create_channel', return_value=channel) as create:
+        client = ClusterManagerClient(credentials=creds)
+        create.assert_not_called()
+        client.warmup(timeout=1)
+        create.assert_called_once()
+    creds.refresh.assert_called_once()
+    transport = client._transport
+    assert set(transport._stubs) == set(transport._default_method_configs())
+    assert set(transport._wrapped_methods) == set(transport._stubs)
+    assert not channel.subscribed
+
+    # Valid credentials are not refreshed.
+    creds.valid = True
+    client.warmup()
+    creds.refresh.assert_called_once()
+
+
+def test_warmup_pool_timeout():
+    channels = []
+
+    def create_channel(*args, **kwargs):
+        channels.append(FakeChannel())
+        return channels[-1]
+
+    with mock.patch.object(grpc_helpers, 'create_channel', side_effect=create_channel):
+        transport = transports.ClusterManagerGrpcTransport(
+            credentials=credentials.AnonymousCredentials(),
+            pool_size=2,
         )
-        pages = list(client.list_usable_subnetworks(request={}).pages)
-        for page, token in zip(pages, ['abc','def','ghi', '']):
-            assert page.raw_page.next_page_token == token
+        transport.grpc_channel
+    channels[0].ready = True
+    with pytest.raises(exceptions.DeadlineExceeded):
+        transport.warmup(timeout=0.01)
+    # Without a client, the stubs are created but not wrapped.
+    assert len(transport._stubs) == len(transport._default_method_configs())
+    assert not hasattr(transport, '_wrapped_methods')
+    assert not channels[0].subscribed and not channels[1].subscribed
+
+    channels[1].ready = True
+    transport.warmup(timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_warmup_async():
+    creds = mock.Mock(spec=credentials.Credentials, valid=False)
+    client = ClusterManagerAsyncClient(credentials=creds)
+    transport = client._client._transport
+    with mock.patch.object(type(transport.grpc_channel), 'channel_ready',
+            new_callable=AwaitableMock) as ready:
+        await client.warmup(timeout=1)
+    ready.assert_called_once_with()
+    creds.refresh.assert_called_once()
+    assert set(transport._stubs) == set(transport._default_method_configs())
+    assert set(transport._wrapped_methods) == set(transport._stubs)
+
+    transport = transports.ClusterManagerGrpcAsyncIOTransport(
+        channel=aio.insecure_channel('localhost:1'),
+    )
+    with pytest.raises(exceptions.DeadlineExceeded):
+        await transport.warmup(timeout=0.01)
+
+
+def test_warmup_abstract():
+    transport = transports.ClusterManagerTransport(
+        credentials=credentials.AnonymousCredentials(),
+    )
+    with pytest.raises(NotImplementedError):
+        transport.warmup()
+
+
+class ScopedCredentials(credentials.Scoped, credentials.Credentials):
+    """Credentials that need scopes, and whose tokens last ``lifetime``
+    seconds, or forever if it is ``None``."""
+    def __init__(self, scopes=None, lifetime=3600.0, errors=0):
+        super().__init__()
+        self._scopes = scopes
+        self.lifetime = lifetime
+        self.errors = errors
+
+    @property
+    def requires_scopes(self):
+        return not self._scopes
+
+    def with_scopes(self, scopes, default_scopes=None):
+        return ScopedCredentials(scopes, self.lifetime, self.errors)
+
+    def refresh(self, request):
+        if self.errors:
+            self.errors -= 1
+            raise ValueError('refresh failed')
+        self.token = 'token'
+        if self.lifetime is not None:
+            self.expiry = datetime.datetime.utcnow() + datetime.timedelta(
+                seconds=self.lifetime)
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_shared_credentials():
+    creds = ScopedCredentials()
+    transport = transports.ClusterManagerGrpcTransport(credentials=creds)
+    client = ClusterManagerClient(credentials=creds)
+    scoped = transport._credentials
+    assert scoped is not creds
+    assert scoped.scopes == transport.AUTH_SCOPES
+    assert client._transport._credentials is scoped
+    assert refresh.shared_credentials(creds, ('scope',)) is not scoped
+
+    # The channel uses the shared copy as it is.
+    with mock.patch.object(grpc_helpers, 'create_channel') as create:
+        transport.grpc_channel
+    assert create.call_args[1]['credentials'] is scoped
+
+    anonymous = credentials.AnonymousCredentials()
+    assert refresh.shared_credentials(anonymous, ('scope',)) is anonymous
+    assert refresh.shared_credentials(False, ('scope',)) is False
+
+
+def test_credentials_refresher():
+    with pytest.raises(ValueError):
+        refresh.CredentialsRefresher(ScopedCredentials(), margin=0)
+
+    # Invalid credentials are refreshed right away, then before expiry.
+    creds = ScopedCredentials(('scope',), errors=1)
+    refresher = refresh.CredentialsRefresher(creds, retry_delay=0.01).start()
+    wait_until(lambda: creds.valid)
+    assert (refresher.failures, refresher.refreshes) == (1, 1)
+    assert 3250 < refresher._next_refresh() <= 3300
+    assert refresher.running
+    refresher.stop(timeout=5)
+    assert not refresher.running
+
+    # Tokens that expire within the margin are refreshed no more often
+    # than the retry delay.
+    creds = ScopedCredentials(('scope',), lifetime=0.0)
+    refresher = refresh.CredentialsRefresher(creds, retry_delay=0.01).start()
+    wait_until(lambda: refresher.refreshes >= 3)
+    refresher.stop(timeout=5)
+
+    # The thread ends if the token does not expire...
+    creds = ScopedCredentials(('scope',), lifetime=None)
+    refresher = refresh.CredentialsRefresher(creds).start()
+    wait_until(lambda: not refresher.running)
+    assert creds.valid and refresher.refreshes == 1
+
+    # ... or once the credentials are gone.
+    refresher = refresh.CredentialsRefresher(ScopedCredentials(('scope',)))
+    gc.collect()
+    assert refresher._next_refresh() is None
+    assert refresher._refresh() is None
+    refresher.stop()
+
+
+@pytest.mark.asyncio
+async def test_refresh_in_background():
+    assert refresh.from_option(True) == refresh.DEFAULT_MARGIN
+    assert refresh.from_option(60) == 60.0
+    assert refresh.from_option(None) is None
+
+    creds = ScopedCredentials()
+    transport = transports.ClusterManagerGrpcTransport(
+        credentials=creds, refresh_credentials=refresh.DEFAULT_MARGIN)
+    refresher = transport._credentials_refresher
+    wait_until(lambda: transport._credentials.valid)
+    assert refresher.running and refresher.refreshes == 1
+
+    # Clients built from the same credentials share the refresher.
+    client = ClusterManagerClient(
+        credentials=creds,
+        client_options={'refresh_credentials': True},
+    )
+    assert client._transport._credentials_refresher is refresher
+    client = ClusterManagerAsyncClient(
+        credentials=creds,
+        client_options={'refresh_credentials': 60},
+    )
+    assert client._client._transport._credentials_refresher is refresher
+    assert ClusterManagerClient(
+        credentials=creds)._transport._credentials_refresher is None
+
+    # A stopped refresher is replaced.
+    refresher.stop(timeout=5)
+    transport._refresh_in_background(60)
+    assert transport._credentials_refresher is not refresher
+    assert transport._credentials_refresher.running
+    transport._credentials_refresher.stop(timeout=5)
+
+    # Anonymous credentials, or a channel's own, have no token to refresh.
+    transport = transports.ClusterManagerGrpcTransport(
+        credentials=credentials.AnonymousCredentials(), refresh_credentials=60)
+    assert transport._credentials_refresher is None
+    transport = transports.ClusterManagerGrpcAsyncIOTransport(
+        channel=aio.insecure_channel('localhost:1'), refresh_credentials=60)
+    assert transport._credentials_refresher is None
+
+
+def test_client_info_gapic_version():
+    from importlib import metadata
+    module = sys.modules[ClusterManagerClient.__module__]
+
+    # The version is looked up once, when a user agent is first built.
+    module._distribution_version.cache_clear()
+    with mock.patch.object(metadata, 'version', return_value='1.2.3') as version:
+        client_info = module._ClientInfo()
+        version.assert_not_called()
+        assert client_info.gapic_version is None
+        assert 'gapic/1.2.3' in client_info.to_user_agent()
+        assert client_info.gapic_version == '1.2.3'
+    version.assert_called_once_with('google-cloud-container')
+
+    module._distribution_version.cache_clear()
+    with mock.patch.object(metadata, 'version',
+            side_effect=metadata.PackageNotFoundError('google-cloud-container')):
+        assert 'gapic/' not in module._ClientInfo().to_user_agent()
+        client_info = module._ClientInfo(gapic_version='4.5.6')
+        assert 'gapic/4.5.6' in client_info.to_user_agent()
+    module._distribution_version.cache_clear()
 
 
 def test_credentials_transport_error():
@@ -3196,6 +7157,31 @@ def test_transport_instance():
     assert client._transport is transport
 
 
+def test_transport_instance_shared():
+    # A second client of a transport keeps the methods the first wrapped.
+    transport = transports.ClusterManagerGrpcTransport(
+        credentials=credentials.AnonymousCredentials(),
+    )
+    ClusterManagerClient(
+        transport=transport,
+        client_options={'method_configs': {'get_cluster': {'timeout': 5.0}}},
+    )
+    wrapped = transport._wrapped_methods
+    ClusterManagerClient(transport=transport, client_options={'refresh_credentials': False})
+    assert transport._wrapped_methods is wrapped
+
+    # Options that wrap the methods would conflict with the first client's.
+    for client_options in (
+            {'method_configs': {'get_cluster': {'timeout': 1.0}}},
+            {'metrics': True},
+            {'interceptors': [mock.Mock()]}):
+        with pytest.raises(ValueError):
+            ClusterManagerClient(transport=transport, client_options=client_options)
+    with pytest.raises(ValueError):
+        ClusterManagerClient(transport=transport, interceptors=[mock.Mock()])
+    assert transport._wrapped_methods is wrapped
+
+
 def test_transport_grpc_default():
     # A client should use the gRPC transport by default.
     client = ClusterManagerClient(
@@ -3207,6 +7193,34 @@ def test_transport_grpc_default():
     )
 
 
+def test_transport_grpc_asyncio_default():
+    # The async client should use the gRPC AsyncIO transport by default.
+    client = ClusterManagerAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+    assert isinstance(
+        client._client._transport,
+        transports.ClusterManagerGrpcAsyncIOTransport,
+    )
+
+
+def test_cluster_manager_async_client_client_options():
+    # Check mTLS is triggered with the AsyncIO transport if
+    # client_cert_source is provided.
+    options = client_options.ClientOptions(
+        client_cert_source=client_cert_source_callback
+    )
+    with mock.patch('google.container_v1.services.cluster_manager.transports.ClusterManagerGrpcAsyncIOTransport.__init__') as grpc_transport:
+        grpc_transport.return_value = None
+        client = ClusterManagerAsyncClient(client_options=options)
+        grpc_transport.assert_called_once_with(
+            api_mtls_endpoint=client.DEFAULT_MTLS_ENDPOINT,
+            client_cert_source=client_cert_source_callback,
+            credentials=None,
+            host=client.DEFAULT_ENDPOINT,
+        )
+
+
 def test_cluster_manager_base_transport():
     # Instantiate the base transport.
     transport = transports.ClusterManagerTransport(
@@ -3368,3 +7382,93 @@ def test_cluster_manager_grpc_transport_channel_mtls_with_adc(
             ),
         )
         assert transport.grpc_channel == mock_grpc_channel
+
+
+@pytest.mark.asyncio
+async def test_cluster_manager_grpc_asyncio_transport_channel():
+    channel = aio.insecure_channel('http://localhost/')
+
+    # Check that if channel is provided, mtls endpoint and client_cert_source
+    # won't be used.
+    callback = mock.MagicMock()
+    transport = transports.ClusterManagerGrpcAsyncIOTransport(
+        host="squid.clam.whelk",
+        channel=channel,
+        api_mtls_endpoint="mtls.squid.clam.whelk",
+        client_cert_source=callback,
+    )
+    assert transport.grpc_channel == channel
+    assert transport._host == "squid.clam.whelk:443"
+    assert not callback.called
+
+
+@mock.patch("grpc.ssl_channel_credentials", autospec=True)
+@mock.patch("google.api_core.grpc_helpers_async.create_channel", autospec=True)
+def test_cluster_manager_grpc_asyncio_transport_channel_mtls_with_client_cert_source(
+    grpc_create_channel, grpc_ssl_channel_cred
+):
+    # Check that if channel is None, but api_mtls_endpoint and client_cert_source
+    # are provided, then a mTLS channel will be created.
+    mock_cred = mock.Mock()
+
+    mock_ssl_cred = mock.Mock()
+    grpc_ssl_channel_cred.return_value = mock_ssl_cred
+
+    mock_grpc_channel = mock.Mock()
+    grpc_create_channel.return_value = mock_grpc_channel
+
+    transport = transports.ClusterManagerGrpcAsyncIOTransport(
+        host="squid.clam.whelk",
+        credentials=mock_cred,
+        api_mtls_endpoint="mtls.squid.clam.whelk",
+        client_cert_source=client_cert_source_callback,
+    )
+    grpc_ssl_channel_cred.assert_called_once_with(
+        certificate_chain=b"cert bytes", private_key=b"key bytes"
+    )
+    grpc_create_channel.assert_called_once_with(
+        "mtls.squid.clam.whelk:443",
+        credentials=mock_cred,
+        ssl_credentials=mock_ssl_cred,
+        scopes=(
+            'https://www.googleapis.com/auth/cloud-platform',
+        ),
+    )
+    assert transport.grpc_channel == mock_grpc_channel
+
+
+@pytest.mark.parametrize(
+    "api_mtls_endpoint", ["mtls.squid.clam.whelk", "mtls.squid.clam.whelk:443"]
+)
+@mock.patch("google.api_core.grpc_helpers_async.create_channel", autospec=True)
+def test_cluster_manager_grpc_asyncio_transport_channel_mtls_with_adc(
+    grpc_create_channel, api_mtls_endpoint
+):
+    # Check that if channel and client_cert_source are None, but api_mtls_endpoint
+    # is provided, then a mTLS channel will be created with SSL ADC.
+    mock_grpc_channel = mock.Mock()
+    grpc_create_channel.return_value = mock_grpc_channel
+
+    # Mock google.auth.transport.grpc.SslCredentials class.
+    mock_ssl_cred = mock.Mock()
+    with mock.patch.multiple(
+        "google.auth.transport.grpc.SslCredentials",
+        __init__=mock.Mock(return_value=None),
+        ssl_credentials=mock.PropertyMock(return_value=mock_ssl_cred),
+    ):
+        mock_cred = mock.Mock()
+        transport = transports.ClusterManagerGrpcAsyncIOTransport(
+            host="squid.clam.whelk",
+            credentials=mock_cred,
+            api_mtls_endpoint=api_mtls_endpoint,
+            client_cert_source=None,
+        )
+        grpc_create_channel.assert_called_once_with(
+            "mtls.squid.clam.whelk:443",
+            credentials=mock_cred,
+            ssl_credentials=mock_ssl_cred,
+            scopes=(
+                'https://www.googleapis.com/auth/cloud-platform',
+            ),
+        )
+        assert transport.grpc_channel == mock_grpc_channel
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import subprocess
+import sys
+from unittest import mock
+
+import pytest
+
+from google import container
+from google import container_v1
+from google.container_v1.services.cluster_manager import ClusterManagerClient
+from google.container_v1.types import cluster_service
+
+
+def loaded_modules(statement):
+    """Return the modules loaded by ``statement`` in a fresh interpreter."""
+    output = subprocess.check_output([
+        sys.executable, '-c',
+        'import sys; before = set(sys.modules); {}; '
+        'print(" ".join(set(sys.modules) - before))'.format(statement),
+    ], universal_newlines=True)
+    return set(output.split())
+
+
+@pytest.mark.parametrize('package', [container, container_v1])
+def test_lazy_attributes(package):
+    assert package.Cluster is cluster_service.Cluster
+    assert package.GetClusterRequest is cluster_service.GetClusterRequest
+    assert package.ClusterManagerClient is ClusterManagerClient
+    assert set(package.__all__) <= set(dir(package))
+    with pytest.raises(AttributeError):
+        package.NoSuchThing
+
+
+def test_subpackages():
+    # Subpackages are reachable by attribute access alone.
+    modules = loaded_modules('from google import container_v1; container_v1.types.Cluster')
+    assert 'google.container_v1.types.cluster_service' in modules
+
+    # A failing import is not mistaken for a missing subpackage.
+    with mock.patch('importlib.import_module',
+                    side_effect=ImportError('broken', name='grpc')):
+        with pytest.raises(ImportError):
+            container_v1.no_such_module
+
+
+def test_lazy_imports():
+    modules = loaded_modules('import google.container')
+    assert 'google.container_v1.types.cluster_service' not in modules
+    assert 'grpc' not in modules
+
+    modules = loaded_modules('import google.container; google.container.Cluster')
+    assert 'google.container_v1.types.cluster_service' in modules
+    assert 'google.container_v1.services.cluster_manager.client' not in modules
+    assert 'grpc' not in modules
+
+
+def test_no_pkg_resources():
+    # Importing pkg_resources scans every installed distribution.
+    modules = loaded_modules('import google.container_v1; google.container_v1.ClusterManagerClient')
+    assert 'google.container_v1.services.cluster_manager.client' in modules
+    assert 'pkg_resources' not in modules
+
+
+@pytest.mark.parametrize('package', ['google.container', 'google.container_v1'])
+def test_bare_import(package):
+    # The package import alone loads none of its modules.
+    modules = loaded_modules('import ' + package)
+    assert not any(m.startswith('google.container_v1.') for m in modules)
+    assert 'pkg_resources' not in modules
@@ -15,50 +15,125 @@
 # limitations under the License.
 #
 
+import importlib
+import sys
+import typing
+
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    from google.cloud.kms_v1.services.key_management_service.async_client import KeyManagementServiceAsyncClient
+    from google.cloud.kms_v1.services.key_management_service.client import KeyManagementServiceClient
+    from google.cloud.kms_v1.types.resources import CryptoKey
+    from google.cloud.kms_v1.types.resources import CryptoKeyVersion
+    from google.cloud.kms_v1.types.resources import CryptoKeyVersionTemplate
+    from google.cloud.kms_v1.types.resources import ExternalProtectionLevelOptions
+    from google.cloud.kms_v1.types.resources import ImportJob
+    from google.cloud.kms_v1.types.resources import KeyOperationAttestation
+    from google.cloud.kms_v1.types.resources import KeyRing
+    from google.cloud.kms_v1.types.resources import ProtectionLevel
+    from google.cloud.kms_v1.types.resources import PublicKey
+    from google.cloud.kms_v1.types.service import AsymmetricDecryptRequest
+    from google.cloud.kms_v1.types.service import AsymmetricDecryptResponse
+    from google.cloud.kms_v1.types.service import AsymmetricSignRequest
+    from google.cloud.kms_v1.types.service import AsymmetricSignResponse
+    from google.cloud.kms_v1.types.service import CreateCryptoKeyRequest
+    from google.cloud.kms_v1.types.service import CreateCryptoKeyVersionRequest
+    from google.cloud.kms_v1.types.service import CreateImportJobRequest
+    from google.cloud.kms_v1.types.service import CreateKeyRingRequest
+    from google.cloud.kms_v1.types.service import DecryptRequest
+    from google.cloud.kms_v1.types.service import DecryptResponse
+    from google.cloud.kms_v1.types.service import DestroyCryptoKeyVersionRequest
+    from google.cloud.kms_v1.types.service import Digest
+    from google.cloud.kms_v1.types.service import EncryptRequest
+    from google.cloud.kms_v1.types.service import EncryptResponse
+    from google.cloud.kms_v1.types.service import GetCryptoKeyRequest
+    from google.cloud.kms_v1.types.service import GetCryptoKeyVersionRequest
+    from google.cloud.kms_v1.types.service import GetImportJobRequest
+    from google.cloud.kms_v1.types.service import GetKeyRingRequest
+    from google.cloud.kms_v1.types.service import GetPublicKeyRequest
+    from google.cloud.kms_v1.types.service import ImportCryptoKeyVersionRequest
+    from google.cloud.kms_v1.types.service import ListCryptoKeyVersionsRequest
+    from google.cloud.kms_v1.types.service import ListCryptoKeyVersionsResponse
+    from google.cloud.kms_v1.types.service import ListCryptoKeysRequest
+    from google.cloud.kms_v1.types.service import ListCryptoKeysResponse
+    from google.cloud.kms_v1.types.service import ListImportJobsRequest
+    from google.cloud.kms_v1.types.service import ListImportJobsResponse
+    from google.cloud.kms_v1.types.service import ListKeyRingsRequest
+    from google.cloud.kms_v1.types.service import ListKeyRingsResponse
+    from google.cloud.kms_v1.types.service import LocationMetadata
+    from google.cloud.kms_v1.types.service import RestoreCryptoKeyVersionRequest
+    from google.cloud.kms_v1.types.service import UpdateCryptoKeyPrimaryVersionRequest
+    from google.cloud.kms_v1.types.service import UpdateCryptoKeyRequest
+    from google.cloud.kms_v1.types.service import UpdateCryptoKeyVersionRequest
+
+# The module defining each public name. Names are imported on first
+# access, so that importing this package does not load the client, the
+# gRPC transport or the message types until they are used.
+_LAZY_IMPORTS = {
+    'KeyManagementServiceAsyncClient': 'google.cloud.kms_v1.services.key_management_service.async_client',
+    'KeyManagementServiceClient': 'google.cloud.kms_v1.services.key_management_service.client',
+    'CryptoKey': 'google.cloud.kms_v1.types.resources',
+    'CryptoKeyVersion': 'google.cloud.kms_v1.types.resources',
+    'CryptoKeyVersionTemplate': 'google.cloud.kms_v1.types.resources',
+    'ExternalProtectionLevelOptions': 'google.cloud.kms_v1.types.resources',
+    'ImportJob': 'google.cloud.kms_v1.types.resources',
+    'KeyOperationAttestation': 'google.cloud.kms_v1.types.resources',
+    'KeyRing': 'google.cloud.kms_v1.types.resources',
+    'ProtectionLevel': 'google.cloud.kms_v1.types.resources',
+    'PublicKey': 'google.cloud.kms_v1.types.resources',
+    'AsymmetricDecryptRequest': 'google.cloud.kms_v1.types.service',
+    'AsymmetricDecryptResponse': 'google.cloud.kms_v1.types.service',
+    'AsymmetricSignRequest': 'google.cloud.kms_v1.types.service',
+    'AsymmetricSignResponse': 'google.cloud.kms_v1.types.service',
+    'CreateCryptoKeyRequest': 'google.cloud.kms_v1.types.service',
+    'CreateCryptoKeyVersionRequest': 'google.cloud.kms_v1.types.service',
+    'CreateImportJobRequest': 'google.cloud.kms_v1.types.service',
+    'CreateKeyRingRequest': 'google.cloud.kms_v1.types.service',
+    'DecryptRequest': 'google.cloud.kms_v1.types.service',
+    'DecryptResponse': 'google.cloud.kms_v1.types.service',
+    'DestroyCryptoKeyVersionRequest': 'google.cloud.kms_v1.types.service',
+    'Digest': 'google.cloud.kms_v1.types.service',
+    'EncryptRequest': 'google.cloud.kms_v1.types.service',
+    'EncryptResponse': 'google.cloud.kms_v1.types.service',
+    'GetCryptoKeyRequest': 'google.cloud.kms_v1.types.service',
+    'GetCryptoKeyVersionRequest': 'google.cloud.kms_v1.types.service',
+    'GetImportJobRequest': 'google.cloud.kms_v1.types.service',
+    'GetKeyRingRequest': 'google.cloud.kms_v1.types.service',
+    'GetPublicKeyRequest': 'google.cloud.kms_v1.types.service',
+    'ImportCryptoKeyVersionRequest': 'google.cloud.kms_v1.types.service',
+    'ListCryptoKeyVersionsRequest': 'google.cloud.kms_v1.types.service',
+    'ListCryptoKeyVersionsResponse': 'google.cloud.kms_v1.types.service',
+    'ListCryptoKeysRequest': 'google.cloud.kms_v1.types.service',
+    'ListCryptoKeysResponse': 'google.cloud.kms_v1.types.service',
+    'ListImportJobsRequest': 'google.cloud.kms_v1.types.service',
+    'ListImportJobsResponse': 'google.cloud.kms_v1.types.service',
+    'ListKeyRingsRequest': 'google.cloud.kms_v1.types.service',
+    'ListKeyRingsResponse': 'google.cloud.kms_v1.types.service',
+    'LocationMetadata': 'google.cloud.kms_v1.types.service',
+    'RestoreCryptoKeyVersionRequest': 'google.cloud.kms_v1.types.service',
+    'UpdateCryptoKeyPrimaryVersionRequest': 'google.cloud.kms_v1.types.service',
+    'UpdateCryptoKeyRequest': 'google.cloud.kms_v1.types.service',
+    'UpdateCryptoKeyVersionRequest': 'google.cloud.kms_v1.types.service',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        # Subpackages such as ``types`` are bound when first imported.
+        try:
+            return importlib.import_module('.' + name, __name__)
+        except ImportError as exc:
+            if exc.name != __name__ + '.' + name:
+                raise
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-from google.cloud.kms_v1.services.key_management_service.client import KeyManagementServiceClient
-from google.cloud.kms_v1.types.resources import CryptoKey
-from google.cloud.kms_v1.types.resources import CryptoKeyVersion
-from google.cloud.kms_v1.types.resources import CryptoKeyVersionTemplate
-from google.cloud.kms_v1.types.resources import ExternalProtectionLevelOptions
-from google.cloud.kms_v1.types.resources import ImportJob
-from google.cloud.kms_v1.types.resources import KeyOperationAttestation
-from google.cloud.kms_v1.types.resources import KeyRing
-from google.cloud.kms_v1.types.resources import ProtectionLevel
-from google.cloud.kms_v1.types.resources import PublicKey
-from google.cloud.kms_v1.types.service import AsymmetricDecryptRequest
-from google.cloud.kms_v1.types.service import AsymmetricDecryptResponse
-from google.cloud.kms_v1.types.service import AsymmetricSignRequest
-from google.cloud.kms_v1.types.service import AsymmetricSignResponse
-from google.cloud.kms_v1.types.service import CreateCryptoKeyRequest
-from google.cloud.kms_v1.types.service import CreateCryptoKeyVersionRequest
-from google.cloud.kms_v1.types.service import CreateImportJobRequest
-from google.cloud.kms_v1.types.service import CreateKeyRingRequest
-from google.cloud.kms_v1.types.service import DecryptRequest
-from google.cloud.kms_v1.types.service import DecryptResponse
-from google.cloud.kms_v1.types.service import DestroyCryptoKeyVersionRequest
-from google.cloud.kms_v1.types.service import Digest
-from google.cloud.kms_v1.types.service import EncryptRequest
-from google.cloud.kms_v1.types.service import EncryptResponse
-from google.cloud.kms_v1.types.service import GetCryptoKeyRequest
-from google.cloud.kms_v1.types.service import GetCryptoKeyVersionRequest
-from google.cloud.kms_v1.types.service import GetImportJobRequest
-from google.cloud.kms_v1.types.service import GetKeyRingRequest
-from google.cloud.kms_v1.types.service import GetPublicKeyRequest
-from google.cloud.kms_v1.types.service import ImportCryptoKeyVersionRequest
-from google.cloud.kms_v1.types.service import ListCryptoKeyVersionsRequest
-from google.cloud.kms_v1.types.service import ListCryptoKeyVersionsResponse
-from google.cloud.kms_v1.types.service import ListCryptoKeysRequest
-from google.cloud.kms_v1.types.service import ListCryptoKeysResponse
-from google.cloud.kms_v1.types.service import ListImportJobsRequest
-from google.cloud.kms_v1.types.service import ListImportJobsResponse
-from google.cloud.kms_v1.types.service import ListKeyRingsRequest
-from google.cloud.kms_v1.types.service import ListKeyRingsResponse
-from google.cloud.kms_v1.types.service import LocationMetadata
-from google.cloud.kms_v1.types.service import RestoreCryptoKeyVersionRequest
-from google.cloud.kms_v1.types.service import UpdateCryptoKeyPrimaryVersionRequest
-from google.cloud.kms_v1.types.service import UpdateCryptoKeyRequest
-from google.cloud.kms_v1.types.service import UpdateCryptoKeyVersionRequest
 
 __all__ = (
     'AsymmetricDecryptRequest',
@@ -86,6 +161,7 @@ __all__ = (
     'GetPublicKeyRequest',
     'ImportCryptoKeyVersionRequest',
     'ImportJob',
+    'KeyManagementServiceAsyncClient',
     'KeyManagementServiceClient',
     'KeyOperationAttestation',
     'KeyRing',
@@ -105,3 +181,10 @@ __all__ = (
     'UpdateCryptoKeyRequest',
     'UpdateCryptoKeyVersionRequest',
 )
+
+
+# Module __getattr__ (PEP 562) needs Python 3.7; import eagerly before.
+if sys.version_info < (3, 7):  # pragma: NO COVER
+    for _name in _LAZY_IMPORTS:
+        __getattr__(_name)
+    del _name
@@ -15,50 +15,124 @@
 # limitations under the License.
 #
 
+import importlib
+import sys
+import typing
 
-from .services.key_management_service import KeyManagementServiceClient
-from .types.resources import CryptoKey
-from .types.resources import CryptoKeyVersion
-from .types.resources import CryptoKeyVersionTemplate
-from .types.resources import ExternalProtectionLevelOptions
-from .types.resources import ImportJob
-from .types.resources import KeyOperationAttestation
-from .types.resources import KeyRing
-from .types.resources import ProtectionLevel
-from .types.resources import PublicKey
-from .types.service import AsymmetricDecryptRequest
-from .types.service import AsymmetricDecryptResponse
-from .types.service import AsymmetricSignRequest
-from .types.service import AsymmetricSignResponse
-from .types.service import CreateCryptoKeyRequest
-from .types.service import CreateCryptoKeyVersionRequest
-from .types.service import CreateImportJobRequest
-from .types.service import CreateKeyRingRequest
-from .types.service import DecryptRequest
-from .types.service import DecryptResponse
-from .types.service import DestroyCryptoKeyVersionRequest
-from .types.service import Digest
-from .types.service import EncryptRequest
-from .types.service import EncryptResponse
-from .types.service import GetCryptoKeyRequest
-from .types.service import GetCryptoKeyVersionRequest
-from .types.service import GetImportJobRequest
-from .types.service import GetKeyRingRequest
-from .types.service import GetPublicKeyRequest
-from .types.service import ImportCryptoKeyVersionRequest
-from .types.service import ListCryptoKeyVersionsRequest
-from .types.service import ListCryptoKeyVersionsResponse
-from .types.service import ListCryptoKeysRequest
-from .types.service import ListCryptoKeysResponse
-from .types.service import ListImportJobsRequest
-from .types.service import ListImportJobsResponse
-from .types.service import ListKeyRingsRequest
-from .types.service import ListKeyRingsResponse
-from .types.service import LocationMetadata
-from .types.service import RestoreCryptoKeyVersionRequest
-from .types.service import UpdateCryptoKeyPrimaryVersionRequest
-from .types.service import UpdateCryptoKeyRequest
-from .types.service import UpdateCryptoKeyVersionRequest
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    from .services.key_management_service import KeyManagementServiceAsyncClient
+    from .services.key_management_service import KeyManagementServiceClient
+    from .types.resources import CryptoKey
+    from .types.resources import CryptoKeyVersion
+    from .types.resources import CryptoKeyVersionTemplate
+    from .types.resources import ExternalProtectionLevelOptions
+    from .types.resources import ImportJob
+    from .types.resources import KeyOperationAttestation
+    from .types.resources import KeyRing
+    from .types.resources import ProtectionLevel
+    from .types.resources import PublicKey
+    from .types.service import AsymmetricDecryptRequest
+    from .types.service import AsymmetricDecryptResponse
+    from .types.service import AsymmetricSignRequest
+    from .types.service import AsymmetricSignResponse
+    from .types.service import CreateCryptoKeyRequest
+    from .types.service import CreateCryptoKeyVersionRequest
+    from .types.service import CreateImportJobRequest
+    from .types.service import CreateKeyRingRequest
+    from .types.service import DecryptRequest
+    from .types.service import DecryptResponse
+    from .types.service import DestroyCryptoKeyVersionRequest
+    from .types.service import Digest
+    from .types.service import EncryptRequest
+    from .types.service import EncryptResponse
+    from .types.service import GetCryptoKeyRequest
+    from .types.service import GetCryptoKeyVersionRequest
+    from .types.service import GetImportJobRequest
+    from .types.service import GetKeyRingRequest
+    from .types.service import GetPublicKeyRequest
+    from .types.service import ImportCryptoKeyVersionRequest
+    from .types.service import ListCryptoKeyVersionsRequest
+    from .types.service import ListCryptoKeyVersionsResponse
+    from .types.service import ListCryptoKeysRequest
+    from .types.service import ListCryptoKeysResponse
+    from .types.service import ListImportJobsRequest
+    from .types.service import ListImportJobsResponse
+    from .types.service import ListKeyRingsRequest
+    from .types.service import ListKeyRingsResponse
+    from .types.service import LocationMetadata
+    from .types.service import RestoreCryptoKeyVersionRequest
+    from .types.service import UpdateCryptoKeyPrimaryVersionRequest
+    from .types.service import UpdateCryptoKeyRequest
+    from .types.service import UpdateCryptoKeyVersionRequest
+
+# The module defining each public name. Names are imported on first
+# access, so that importing this package does not load the client, the
+# gRPC transport or the message types until they are used.
+_LAZY_IMPORTS = {
+    'KeyManagementServiceAsyncClient': '.services.key_management_service',
+    'KeyManagementServiceClient': '.services.key_management_service',
+    'CryptoKey': '.types.resources',
+    'CryptoKeyVersion': '.types.resources',
+    'CryptoKeyVersionTemplate': '.types.resources',
+    'ExternalProtectionLevelOptions': '.types.resources',
+    'ImportJob': '.types.resources',
+    'KeyOperationAttestation': '.types.resources',
+    'KeyRing': '.types.resources',
+    'ProtectionLevel': '.types.resources',
+    'PublicKey': '.types.resources',
+    'AsymmetricDecryptRequest': '.types.service',
+    'AsymmetricDecryptResponse': '.types.service',
+    'AsymmetricSignRequest': '.types.service',
+    'AsymmetricSignResponse': '.types.service',
+    'CreateCryptoKeyRequest': '.types.service',
+    'CreateCryptoKeyVersionRequest': '.types.service',
+    'CreateImportJobRequest': '.types.service',
+    'CreateKeyRingRequest': '.types.service',
+    'DecryptRequest': '.types.service',
+    'DecryptResponse': '.types.service',
+    'DestroyCryptoKeyVersionRequest': '.types.service',
+    'Digest': '.types.service',
+    'EncryptRequest': '.types.service',
+    'EncryptResponse': '.types.service',
+    'GetCryptoKeyRequest': '.types.service',
+    'GetCryptoKeyVersionRequest': '.types.service',
+    'GetImportJobRequest': '.types.service',
+    'GetKeyRingRequest': '.types.service',
+    'GetPublicKeyRequest': '.types.service',
+    'ImportCryptoKeyVersionRequest': '.types.service',
+    'ListCryptoKeyVersionsRequest': '.types.service',
+    'ListCryptoKeyVersionsResponse': '.types.service',
+    'ListCryptoKeysRequest': '.types.service',
+    'ListCryptoKeysResponse': '.types.service',
+    'ListImportJobsRequest': '.types.service',
+    'ListImportJobsResponse': '.types.service',
+    'ListKeyRingsRequest': '.types.service',
+    'ListKeyRingsResponse': '.types.service',
+    'LocationMetadata': '.types.service',
+    'RestoreCryptoKeyVersionRequest': '.types.service',
+    'UpdateCryptoKeyPrimaryVersionRequest': '.types.service',
+    'UpdateCryptoKeyRequest': '.types.service',
+    'UpdateCryptoKeyVersionRequest': '.types.service',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        # Subpackages such as ``types`` are bound when first imported.
+        try:
+            return importlib.import_module('.' + name, __name__)
+        except ImportError as exc:
+            if exc.name != __name__ + '.' + name:
+                raise
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 __all__ = (
@@ -104,5 +178,13 @@ __all__ = (
     'UpdateCryptoKeyPrimaryVersionRequest',
     'UpdateCryptoKeyRequest',
     'UpdateCryptoKeyVersionRequest',
-'KeyManagementServiceClient',
+    'KeyManagementServiceAsyncClient',
+    'KeyManagementServiceClient',
 )
+
+
+# Module __getattr__ (PEP 562) needs Python 3.7; import eagerly before.
+if sys.version_info < (3, 7):  # pragma: NO COVER
+    for _name in _LAZY_IMPORTS:
+        __getattr__(_name)
+    del _name
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Local public-key operations for asymmetric CryptoKeyVersions.
+
+Only the private half of an asymmetric key lives in Cloud KMS. The
+public half, returned by
+[GetPublicKey][google.cloud.kms.v1.KeyManagementService.GetPublicKey],
+is enough to verify signatures and to encrypt data locally. A
+[CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion] never changes
+its key material, so each public key is fetched and parsed only once.
+
+This module requires the ``cryptography`` package.
+"""
+
+import collections
+import threading
+from typing import Any, Iterable, List, Mapping, NamedTuple, Union
+
+try:
+    from cryptography.exceptions import InvalidSignature  # type: ignore
+    from cryptography.hazmat.backends import default_backend  # type: ignore
+    from cryptography.hazmat.primitives import hashes  # type: ignore
+    from cryptography.hazmat.primitives import serialization  # type: ignore
+    from cryptography.hazmat.primitives.asymmetric import ec  # type: ignore
+    from cryptography.hazmat.primitives.asymmetric import padding  # type: ignore
+    from cryptography.hazmat.primitives.asymmetric import utils  # type: ignore
+except ImportError:  # pragma: NO COVER
+    hashes = None
+
+from google.cloud.kms_v1.services.key_management_service import KeyManagementServiceClient
+from google.cloud.kms_v1.types import resources
+from google.cloud.kms_v1.types import service
+
+
+_Algorithm = resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm
+
+
+class PublicKey(NamedTuple):
+    """A parsed public key.
+
+    Attributes:
+        name (str): The name of the
+            [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion].
+        algorithm (~.resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm):
+            The algorithm of the key version.
+        key (Any): The key, as loaded by ``cryptography``.
+    """
+    name: str
+    algorithm: _Algorithm
+    key: Any
+
+
+def _digest_name(algorithm: _Algorithm) -> str:
+    return algorithm.name.rsplit('_', 1)[-1].lower()
+
+
+def _hash(algorithm: _Algorithm) -> 'hashes.HashAlgorithm':
+    return getattr(hashes, _digest_name(algorithm).upper())()
+
+
+class PublicKeyCache:
+    """A thread-safe cache of parsed public keys, keyed by
+    [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion] name.
+
+    Key material is immutable, so entries never expire; the least
+    recently used key is dropped once ``max_size`` keys are cached.
+
+    Args:
+        client (~.KeyManagementServiceClient): The client used to fetch
+            public keys.
+        max_size (int): The maximum number of cached public keys.
+    """
+    def __init__(self,
+            client: KeyManagementServiceClient,
+            max_size: int = 1024) -> None:
+        if hashes is None:  # pragma: NO COVER
+            raise ImportError('Local public-key operations require the '
+                              '"cryptography" package.')
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1.')
+        self._client = client
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._keys = collections.OrderedDict()  # type: collections.OrderedDict
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def get(self, name: str) -> PublicKey:
+        """Return the public key of a CryptoKeyVersion.
+
+        The key is fetched with ``get_public_key`` and parsed the first
+        time it is requested. The lock is not held while fetching.
+
+        Args:
+            name (str): The name of the
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion].
+
+        Returns:
+            ~.PublicKey: The parsed key and its algorithm.
+        """
+        with self._lock:
+            key = self._keys.get(name)
+            if key is not None:
+                self._keys.move_to_end(name)
+                return key
+        response = self._client.get_public_key(name=name)
+        key = PublicKey(
+            name=name,
+            algorithm=_Algorithm(response.algorithm),
+            key=serialization.load_pem_public_key(
+                response.pem.encode('ascii'),
+                # cryptography < 3.1 requires the backend.
+                backend=default_backend()),
+        )
+        with self._lock:
+            self._keys[name] = key
+            self._keys.move_to_end(name)
+            while len(self._keys) > self._max_size:
+                self._keys.popitem(last=False)
+        return key
+
+    def invalidate(self, name: str = None) -> None:
+        """Drop the key of ``name``, or every key if ``name`` is omitted."""
+        with self._lock:
+            if name is None:
+                self._keys.clear()
+            else:
+                self._keys.pop(name, None)
+
+    def verify(self,
+            name: str,
+            digest: Union[service.Digest, Mapping[str, bytes]],
+            signature: bytes) -> bool:
+        """Verify a signature produced by ``asymmetric_sign``.
+
+        Args:
+            name (str): The name of the
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                that signed the digest.
+            digest (Union[~.service.Digest, Mapping[str, bytes]]): The
+                digest that was signed, as passed to ``asymmetric_sign``.
+            signature (bytes): The signature returned by
+                ``asymmetric_sign``.
+
+        Returns:
+            bool: Whether the signature is valid.
+
+        Raises:
+            ValueError: If the key version is not an RSA or EC signing
+                key, or if ``digest`` does not hold a digest of the
+                algorithm the key version uses.
+        """
+        key = self.get(name)
+        algorithm = key.algorithm.name
+        if not algorithm.startswith(('RSA_SIGN_', 'EC_SIGN_')):
+            raise ValueError('{} is not a signing key version: {}.'.format(
+                name, algorithm))
+
+        if not isinstance(digest, service.Digest):
+            digest = service.Digest(digest)
+        digest_bytes = getattr(digest, _digest_name(key.algorithm))
+        if not digest_bytes:
+            raise ValueError('{} requires a {} digest.'.format(
+                algorithm, _digest_name(key.algorithm).upper()))
+
+        hash_ = _hash(key.algorithm)
+        prehashed = utils.Prehashed(hash_)
+        try:
+            if algorithm.startswith('EC_SIGN_'):
+                key.key.verify(signature, digest_bytes, ec.ECDSA(prehashed))
+            elif algorithm.startswith('RSA_SIGN_PSS_'):
+                key.key.verify(
+                    signature,
+                    digest_bytes,
+                    padding.PSS(
+                        mgf=padding.MGF1(hash_),
+                        salt_length=hash_.digest_size,
+                    ),
+                    prehashed,
+                )
+            else:
+                key.key.verify(signature, digest_bytes, padding.PKCS1v15(),
+                               prehashed)
+        except InvalidSignature:
+            return False
+        return True
+
+    def encrypt(self, name: str, plaintext: bytes) -> bytes:
+        """Encrypt data for ``asymmetric_decrypt`` with RSA-OAEP.
+
+        Args:
+            name (str): The name of a
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                with an ``RSA_DECRYPT_OAEP_*`` algorithm.
+            plaintext (bytes): The data to encrypt. Its size is limited by
+                the modulus and digest of the key version, e.g. 190 bytes
+                for ``RSA_DECRYPT_OAEP_2048_SHA256``.
+
+        Returns:
+            bytes: The ciphertext, ready to be passed to
+            ``asymmetric_decrypt``.
+
+        Raises:
+            ValueError: If the key version is not an RSA-OAEP key, or if
+                ``plaintext`` is too long.
+        """
+        return self.encrypt_batch(name, (plaintext,))[0]
+
+    def encrypt_batch(self, name: str,
+            plaintexts: Iterable[bytes]) -> List[bytes]:
+        """Encrypt several messages with the same key version.
+
+        The key is looked up once for the whole batch. See
+        :meth:`encrypt` for details.
+
+        Returns:
+            List[bytes]: The ciphertexts, in the order of ``plaintexts``.
+        """
+        key = self.get(name)
+        if not key.algorithm.name.startswith('RSA_DECRYPT_OAEP_'):
+            raise ValueError('{} is not an RSA-OAEP key version: {}.'.format(
+                name, key.algorithm.name))
+        hash_ = _hash(key.algorithm)
+        oaep = padding.OAEP(
+            mgf=padding.MGF1(hash_),
+            algorithm=hash_,
+            label=None,
+        )
+        return [key.key.encrypt(plaintext, oaep) for plaintext in plaintexts]
+
+
+__all__ = (
+    'PublicKey',
+    'PublicKeyCache',
+)
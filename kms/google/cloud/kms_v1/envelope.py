@@ -0,0 +1,503 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Envelope encryption with locally generated data encryption keys.
+
+A random AES-256 data encryption key (DEK) is generated locally and
+wrapped once by Cloud KMS with
+[Encrypt][google.cloud.kms.v1.KeyManagementService.Encrypt]. Payloads are
+then encrypted locally with AES-GCM, so neither the size limit of
+``Encrypt`` nor its round trip applies to each record. A DEK is reused
+until it reaches its maximum number of uses or its maximum age.
+
+Each ciphertext draws a random 56-bit nonce prefix, so a DEK is used
+for at most :data:`MAX_DEK_USES` (2**12) ciphertexts: the chance that
+two of them share a prefix, which would break the confidentiality and
+authenticity of AES-GCM, then stays below 2**-33 per DEK.
+
+Every ciphertext starts with a self-describing header::
+
+    magic (4) | version (1) | key name length (2) | CryptoKey name
+    | wrapped DEK length (2) | wrapped DEK | segment size (4)
+    | nonce prefix (7)
+
+The payload follows as a sequence of AES-GCM segments of
+``segment_size`` plaintext bytes each. The nonce of a segment is the
+nonce prefix, the segment index and a flag marking the final segment,
+which rules out reordering and truncation. The header and the caller's
+associated data are authenticated with every segment.
+
+Decryption unwraps the DEK of each ciphertext with
+[Decrypt][google.cloud.kms.v1.KeyManagementService.Decrypt]; a
+:class:`DekCache` avoids repeating that call for DEKs seen before.
+
+This module requires the ``cryptography`` package.
+"""
+
+import collections
+import io
+import os
+import struct
+import threading
+import time
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Optional, Tuple
+
+try:
+    from cryptography.exceptions import InvalidTag  # type: ignore
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM  # type: ignore
+except ImportError:  # pragma: NO COVER
+    AESGCM = None
+
+from google.cloud.kms_v1.services.key_management_service import KeyManagementServiceClient
+
+
+MAGIC = b'GKE1'
+VERSION = 1
+DEK_SIZE = 32
+DEFAULT_SEGMENT_SIZE = 1 << 20
+MAX_DEK_USES = 1 << 12
+"""The largest number of ciphertexts encrypted with one DEK.
+
+By the birthday bound on the random nonce prefixes, n ciphertexts
+under one DEK collide with a chance of about n**2 / 2**57.
+"""
+
+_TAG_SIZE = 16
+_NONCE_PREFIX_SIZE = 7
+_MAX_SEGMENTS = 1 << 32
+_PREAMBLE = struct.Struct('>4sBH')
+_WRAPPED_LENGTH = struct.Struct('>H')
+_SEGMENT = struct.Struct('>I')
+_SEGMENT_NONCE = struct.Struct('>IB')
+
+
+class EnvelopeHeader:
+    """The parsed header of an envelope ciphertext.
+
+    Attributes:
+        key_name (str): The name of the
+            [CryptoKey][google.cloud.kms.v1.CryptoKey] that wrapped the DEK.
+        wrapped_dek (bytes): The DEK, as encrypted by Cloud KMS.
+        segment_size (int): The number of plaintext bytes per segment.
+        nonce_prefix (bytes): The random nonce prefix of this ciphertext.
+        raw (bytes): The encoded header.
+    """
+    def __init__(self, key_name: str, wrapped_dek: bytes,
+            segment_size: int, nonce_prefix: bytes) -> None:
+        self.key_name = key_name
+        self.wrapped_dek = wrapped_dek
+        self.segment_size = segment_size
+        self.nonce_prefix = nonce_prefix
+        name = key_name.encode('utf-8')
+        self.raw = b''.join((
+            _PREAMBLE.pack(MAGIC, VERSION, len(name)),
+            name,
+            _WRAPPED_LENGTH.pack(len(wrapped_dek)),
+            wrapped_dek,
+            _SEGMENT.pack(segment_size),
+            nonce_prefix,
+        ))
+
+    @classmethod
+    def read(cls, stream: BinaryIO) -> 'EnvelopeHeader':
+        """Read a header from the start of ``stream``.
+
+        Raises:
+            ValueError: If the stream does not start with a valid header.
+        """
+        magic, version, name_length = _PREAMBLE.unpack(
+            _read_exactly(stream, _PREAMBLE.size))
+        if magic != MAGIC:
+            raise ValueError('Not an envelope ciphertext.')
+        if version != VERSION:
+            raise ValueError(
+                'Unsupported envelope version: {}.'.format(version))
+        key_name = _read_exactly(stream, name_length).decode('utf-8')
+        wrapped_length, = _WRAPPED_LENGTH.unpack(
+            _read_exactly(stream, _WRAPPED_LENGTH.size))
+        wrapped_dek = _read_exactly(stream, wrapped_length)
+        segment_size, = _SEGMENT.unpack(_read_exactly(stream, _SEGMENT.size))
+        if not segment_size:
+            raise ValueError('Invalid envelope segment size.')
+        nonce_prefix = _read_exactly(stream, _NONCE_PREFIX_SIZE)
+        return cls(key_name, wrapped_dek, segment_size, nonce_prefix)
+
+    @classmethod
+    def parse(cls, ciphertext: bytes) -> 'EnvelopeHeader':
+        """Parse the header at the start of ``ciphertext``."""
+        return cls.read(io.BytesIO(ciphertext))
+
+
+class DekCache:
+    """A thread-safe cache of unwrapped DEKs.
+
+    Bulk decryption sees the same wrapped DEK over and over; the cache
+    saves a [Decrypt][google.cloud.kms.v1.KeyManagementService.Decrypt]
+    round trip for every repeat. Entries are keyed by the
+    [CryptoKey][google.cloud.kms.v1.CryptoKey] name, the wrapped DEK and
+    the additional authenticated data passed to KMS, so a DEK unwrapped
+    under one context is never handed out under another.
+
+    Entries are evicted least recently used first once ``max_size`` is
+    reached, when they are older than ``max_age`` seconds, and after they
+    have been handed out ``max_uses`` times.
+
+    Args:
+        max_size (int): The maximum number of cached DEKs.
+        max_age (float): The number of seconds a DEK stays cached, or
+            ``None`` for no limit.
+        max_uses (int): The number of lookups an entry serves before it
+            is evicted, or ``None`` for no limit.
+    """
+    def __init__(self,
+            max_size: int = 1024,
+            max_age: Optional[float] = 300.0,
+            max_uses: Optional[int] = None) -> None:
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1.')
+        if max_uses is not None and max_uses < 1:
+            raise ValueError('max_uses must be at least 1.')
+        self._max_size = max_size
+        self._max_age = max_age
+        self._max_uses = max_uses
+        self._lock = threading.Lock()
+        # Maps keys to [value, creation time, remaining uses].
+        self._entries = collections.OrderedDict()  # type: collections.OrderedDict
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key_name: str, wrapped_dek: bytes, associated_data: bytes,
+            load: Callable[[], Any]) -> Any:
+        """Return the cached DEK, calling ``load`` to fetch it on a miss.
+
+        ``load`` is called without holding the cache lock, so concurrent
+        misses for different DEKs do not wait on each other.
+        """
+        key = (key_name, wrapped_dek, associated_data)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry):
+                del self._entries[key]
+                self.evictions += 1
+                entry = None
+            if entry is not None:
+                self.hits += 1
+                self._use(key, entry)
+                return entry[0]
+            self.misses += 1
+        value = load()
+        self.put(key_name, wrapped_dek, associated_data, value, used=True)
+        return value
+
+    def put(self, key_name: str, wrapped_dek: bytes, associated_data: bytes,
+            value: Any, used: bool = False) -> None:
+        """Add a DEK to the cache, evicting the least recently used one
+        if the cache is full."""
+        key = (key_name, wrapped_dek, associated_data)
+        entry = [value, time.monotonic(), self._max_uses]
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if used:
+                self._use(key, entry)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key_name: str = None, wrapped_dek: bytes = None) -> int:
+        """Remove the matching entries from the cache.
+
+        Args:
+            key_name (Optional[str]): Only remove DEKs wrapped by this
+                CryptoKey.
+            wrapped_dek (Optional[bytes]): Only remove this wrapped DEK.
+
+        Returns:
+            int: The number of entries removed. With no arguments, the
+            cache is cleared.
+        """
+        with self._lock:
+            keys = [key for key in self._entries
+                    if key_name in (None, key[0])
+                    and wrapped_dek in (None, key[1])]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit, miss and eviction counters and the cache size."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+            }
+
+    def _expired(self, entry: list) -> bool:
+        return (self._max_age is not None
+                and time.monotonic() - entry[1] >= self._max_age)
+
+    def _use(self, key: tuple, entry: list) -> None:
+        if entry[2] is None:
+            self._entries.move_to_end(key)
+            return
+        entry[2] -= 1
+        if entry[2] > 0:
+            self._entries.move_to_end(key)
+        else:
+            del self._entries[key]
+            self.evictions += 1
+
+
+class EnvelopeCipher:
+    """Encrypt and decrypt payloads with KMS-wrapped data encryption keys.
+
+    Instances are thread-safe and meant to be long lived: every DEK
+    generated by an instance is wrapped by exactly one ``encrypt`` call,
+    and then used for up to ``max_dek_uses`` payloads or ``max_dek_age``
+    seconds, whichever comes first.
+
+    Args:
+        client (~.KeyManagementServiceClient): The client used to wrap and
+            unwrap DEKs.
+        key_name (Optional[str]): The name of the
+            [CryptoKey][google.cloud.kms.v1.CryptoKey] used to wrap new
+            DEKs. Required for encryption only; decryption uses the name
+            recorded in each ciphertext.
+        max_dek_uses (int): The number of payloads encrypted with one DEK
+            before a new one is generated, at most :data:`MAX_DEK_USES`.
+        max_dek_age (float): The number of seconds a DEK is used for
+            before a new one is generated.
+        segment_size (int): The number of plaintext bytes per AES-GCM
+            segment.
+        kms_associated_data (bytes): Additional authenticated data passed
+            to KMS when wrapping and unwrapping DEKs.
+        dek_cache (Optional[DekCache]): A cache of unwrapped DEKs used
+            when decrypting. It may be shared between ciphers. DEKs
+            generated by this cipher are added to it as well.
+    """
+    def __init__(self,
+            client: KeyManagementServiceClient,
+            key_name: str = None,
+            *,
+            max_dek_uses: int = MAX_DEK_USES,
+            max_dek_age: float = 3600.0,
+            segment_size: int = DEFAULT_SEGMENT_SIZE,
+            kms_associated_data: bytes = b'',
+            dek_cache: DekCache = None) -> None:
+        if AESGCM is None:  # pragma: NO COVER
+            raise ImportError('Envelope encryption requires the '
+                              '"cryptography" package.')
+        if not 1 <= max_dek_uses <= MAX_DEK_USES:
+            raise ValueError('max_dek_uses must be between 1 and '
+                             '{}.'.format(MAX_DEK_USES))
+        if not 0 < segment_size < 1 << 32:
+            raise ValueError('segment_size must be between 1 and 2**32 - 1.')
+        self._client = client
+        self._key_name = key_name
+        self._max_dek_uses = max_dek_uses
+        self._max_dek_age = max_dek_age
+        self._segment_size = segment_size
+        self._kms_associated_data = kms_associated_data
+        self._dek_cache = dek_cache
+        self._lock = threading.Lock()
+        self._dek = None  # type: Optional[Tuple[AESGCM, bytes, float]]
+        self._dek_uses = 0
+
+    def _wrap(self, dek: bytes) -> bytes:
+        return self._client.encrypt(
+            request={
+                'name': self._key_name,
+                'plaintext': dek,
+                'additional_authenticated_data': self._kms_associated_data,
+            },
+        ).ciphertext
+
+    def _unwrap(self, key_name: str, wrapped_dek: bytes) -> bytes:
+        return self._client.decrypt(
+            request={
+                'name': key_name,
+                'ciphertext': wrapped_dek,
+                'additional_authenticated_data': self._kms_associated_data,
+            },
+        ).plaintext
+
+    def _current_dek(self) -> Tuple['AESGCM', bytes]:
+        """Return the DEK to encrypt the next payload with.
+
+        A new DEK is generated and wrapped when the current one has been
+        used ``max_dek_uses`` times or is older than ``max_dek_age``.
+        """
+        if not self._key_name:
+            raise ValueError('A key_name is required to encrypt.')
+        with self._lock:
+            now = time.monotonic()
+            if (self._dek is None
+                    or self._dek_uses >= self._max_dek_uses
+                    or now - self._dek[2] >= self._max_dek_age):
+                dek = AESGCM.generate_key(bit_length=DEK_SIZE * 8)
+                self._dek = (AESGCM(dek), self._wrap(dek), now)
+                self._dek_uses = 0
+                if self._dek_cache is not None:
+                    self._dek_cache.put(self._key_name, self._dek[1],
+                                        self._kms_associated_data,
+                                        self._dek[0])
+            self._dek_uses += 1
+            return self._dek[0], self._dek[1]
+
+    def _decrypter(self, header: EnvelopeHeader) -> 'AESGCM':
+        def load():
+            return AESGCM(self._unwrap(header.key_name, header.wrapped_dek))
+
+        if self._dek_cache is None:
+            return load()
+        return self._dek_cache.get(header.key_name, header.wrapped_dek,
+                                   self._kms_associated_data, load)
+
+    def _header(self, wrapped_dek: bytes) -> EnvelopeHeader:
+        return EnvelopeHeader(
+            self._key_name,
+            wrapped_dek,
+            self._segment_size,
+            os.urandom(_NONCE_PREFIX_SIZE),
+        )
+
+    def encrypt(self, plaintext: bytes, associated_data: bytes = b'') -> bytes:
+        """Encrypt ``plaintext``.
+
+        Args:
+            plaintext (bytes): The data to encrypt. There is no size limit
+                other than available memory; see :meth:`encrypt_stream`
+                for larger payloads.
+            associated_data (bytes): Additional data that is authenticated
+                but not encrypted. The same value must be passed to
+                :meth:`decrypt`.
+
+        Returns:
+            bytes: The header followed by the encrypted segments.
+        """
+        src = io.BytesIO(plaintext)
+        dst = io.BytesIO()
+        self.encrypt_stream(src, dst, associated_data)
+        return dst.getvalue()
+
+    def decrypt(self, ciphertext: bytes, associated_data: bytes = b'') -> bytes:
+        """Decrypt a ciphertext produced by :meth:`encrypt`.
+
+        Args:
+            ciphertext (bytes): The ciphertext, including its header.
+            associated_data (bytes): The associated data that was passed
+                to :meth:`encrypt`.
+
+        Returns:
+            bytes: The plaintext.
+
+        Raises:
+            ValueError: If the ciphertext is malformed, truncated or fails
+                authentication.
+        """
+        dst = io.BytesIO()
+        self.decrypt_stream(io.BytesIO(ciphertext), dst, associated_data)
+        return dst.getvalue()
+
+    def encrypt_stream(self, src: BinaryIO, dst: BinaryIO,
+            associated_data: bytes = b'') -> None:
+        """Encrypt everything read from ``src`` and write it to ``dst``.
+
+        Only a couple of segments are held in memory at a time, which
+        makes this suitable for payloads of many gigabytes.
+        """
+        aead, wrapped_dek = self._current_dek()
+        header = self._header(wrapped_dek)
+        dst.write(header.raw)
+        aad = header.raw + associated_data
+        for index, chunk, last in _segments(src, header.segment_size):
+            dst.write(aead.encrypt(
+                _nonce(header.nonce_prefix, index, last), chunk, aad))
+
+    def decrypt_stream(self, src: BinaryIO, dst: BinaryIO,
+            associated_data: bytes = b'') -> None:
+        """Decrypt everything read from ``src`` and write it to ``dst``.
+
+        Raises:
+            ValueError: If the ciphertext is malformed, truncated or fails
+                authentication. Plaintext of the segments preceding the
+                failure may already have been written to ``dst``.
+        """
+        header = EnvelopeHeader.read(src)
+        aead = self._decrypter(header)
+        aad = header.raw + associated_data
+        segments = _segments(src, header.segment_size + _TAG_SIZE)
+        for index, chunk, last in segments:
+            try:
+                dst.write(aead.decrypt(
+                    _nonce(header.nonce_prefix, index, last), chunk, aad))
+            except InvalidTag:
+                raise ValueError('Envelope ciphertext failed authentication.')
+
+
+def _nonce(prefix: bytes, index: int, last: bool) -> bytes:
+    return prefix + _SEGMENT_NONCE.pack(index, last)
+
+
+def _segments(stream: BinaryIO, size: int) -> Iterator[Tuple[int, bytes, bool]]:
+    """Yield ``(index, chunk, is_last)`` for each ``size`` chunk of a stream.
+
+    An empty stream still yields one (empty) final chunk.
+    """
+    index = 0
+    chunk = _read_up_to(stream, size)
+    while True:
+        following = _read_up_to(stream, size) if len(chunk) == size else b''
+        last = not following
+        yield index, chunk, last
+        if last:
+            return
+        index += 1
+        if index >= _MAX_SEGMENTS:
+            raise ValueError('Too many envelope segments.')
+        chunk = following
+
+
+def _read_up_to(stream: BinaryIO, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = stream.read(size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def _read_exactly(stream: BinaryIO, size: int) -> bytes:
+    data = _read_up_to(stream, size)
+    if len(data) != size:
+        raise ValueError('Truncated envelope header.')
+    return data
+
+
+__all__ = (
+    'DekCache',
+    'EnvelopeCipher',
+    'EnvelopeHeader',
+)
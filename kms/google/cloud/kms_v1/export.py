@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Streaming export of KMS inventories to NDJSON and Parquet.
+
+Rows are read straight from the protobuf messages: given a pager, the
+repeated field of each raw page is walked without creating a proto-plus
+wrapper per resource. Rows are written as they are produced, so memory
+is bounded by one page plus, for Parquet, one row group.
+
+Every row has the columns in :data:`COLUMNS`:
+
+- ``type``: ``KeyRing``, ``CryptoKey``, ``CryptoKeyVersion`` or
+  ``ImportJob``.
+- ``name``: the resource name.
+- ``purpose``: the purpose of a CryptoKey.
+- ``state``: the state of a CryptoKeyVersion or ImportJob, or of the
+  primary version of a CryptoKey.
+- ``algorithm`` and ``protection_level``: those of a CryptoKeyVersion,
+  or of the version template of a CryptoKey. For an ImportJob, the
+  algorithm is its import method.
+- ``create_time`` and ``destroy_time``: UTC datetimes.
+- ``labels``: the labels of a CryptoKey.
+
+Columns that do not apply to a resource, and unset fields, are ``None``.
+Parquet export requires the ``pyarrow`` package.
+"""
+
+import datetime
+import functools
+import json
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, TextIO, Union
+
+try:
+    import pyarrow  # type: ignore
+    from pyarrow import parquet  # type: ignore
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
+
+COLUMNS = (
+    'type',
+    'name',
+    'purpose',
+    'state',
+    'algorithm',
+    'protection_level',
+    'create_time',
+    'destroy_time',
+    'labels',
+)
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+# The repeated field holding the resources of each list response.
+_PAGE_FIELDS = {
+    'ListKeyRingsResponse': 'key_rings',
+    'ListCryptoKeysResponse': 'crypto_keys',
+    'ListCryptoKeyVersionsResponse': 'crypto_key_versions',
+    'ListImportJobsResponse': 'import_jobs',
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _enum_names(enum_descriptor) -> Dict[int, str]:
+    return {v.number: v.name for v in enum_descriptor.values}
+
+
+def _enum(message, field: str):
+    value = getattr(message, field)
+    if not value:
+        return None
+    enum_type = message.DESCRIPTOR.fields_by_name[field].enum_type
+    return _enum_names(enum_type).get(value, str(value))
+
+
+def _time(message, field: str):
+    if not message.HasField(field):
+        return None
+    value = getattr(message, field)
+    return _EPOCH + datetime.timedelta(
+        seconds=value.seconds, microseconds=value.nanos // 1000)
+
+
+def _version_row(pb) -> Dict[str, Any]:
+    return {
+        'type': 'CryptoKeyVersion',
+        'name': pb.name,
+        'purpose': None,
+        'state': _enum(pb, 'state'),
+        'algorithm': _enum(pb, 'algorithm'),
+        'protection_level': _enum(pb, 'protection_level'),
+        'create_time': _time(pb, 'create_time'),
+        'destroy_time': _time(pb, 'destroy_time'),
+        'labels': None,
+    }
+
+
+def _crypto_key_row(pb) -> Dict[str, Any]:
+    template = pb.version_template
+    return {
+        'type': 'CryptoKey',
+        'name': pb.name,
+        'purpose': _enum(pb, 'purpose'),
+        'state': _enum(pb.primary, 'state') if pb.HasField('primary') else None,
+        'algorithm': _enum(template, 'algorithm'),
+        'protection_level': _enum(template, 'protection_level'),
+        'create_time': _time(pb, 'create_time'),
+        'destroy_time': None,
+        'labels': dict(pb.labels),
+    }
+
+
+def _key_ring_row(pb) -> Dict[str, Any]:
+    return {
+        'type': 'KeyRing',
+        'name': pb.name,
+        'purpose': None,
+        'state': None,
+        'algorithm': None,
+        'protection_level': None,
+        'create_time': _time(pb, 'create_time'),
+        'destroy_time': None,
+        'labels': None,
+    }
+
+
+def _import_job_row(pb) -> Dict[str, Any]:
+    return {
+        'type': 'ImportJob',
+        'name': pb.name,
+        'purpose': None,
+        'state': _enum(pb, 'state'),
+        'algorithm': _enum(pb, 'import_method'),
+        'protection_level': _enum(pb, 'protection_level'),
+        'create_time': _time(pb, 'create_time'),
+        'destroy_time': None,
+        'labels': None,
+    }
+
+
+_ROW_BUILDERS = {
+    'KeyRing': _key_ring_row,
+    'CryptoKey': _crypto_key_row,
+    'CryptoKeyVersion': _version_row,
+    'ImportJob': _import_job_row,
+}
+
+
+def to_row(resource) -> Dict[str, Any]:
+    """Convert one resource to a row.
+
+    Args:
+        resource: A :class:`~.resources.KeyRing`,
+            :class:`~.resources.CryptoKey`,
+            :class:`~.resources.CryptoKeyVersion` or
+            :class:`~.resources.ImportJob`, either proto-plus or raw
+            protobuf.
+
+    Returns:
+        Dict[str, Any]: The row, keyed by :data:`COLUMNS`.
+
+    Raises:
+        TypeError: If ``resource`` is of another type.
+    """
+    pb = getattr(type(resource), 'pb', None)
+    if pb is not None:
+        resource = pb(resource)
+    builder = _ROW_BUILDERS.get(type(resource).DESCRIPTOR.name)
+    if builder is None:
+        raise TypeError('Cannot export {}.'.format(type(resource).__name__))
+    return builder(resource)
+
+
+def iter_rows(source: Iterable) -> Iterator[Dict[str, Any]]:
+    """Yield one row per resource of ``source``.
+
+    Args:
+        source (Iterable): A pager returned by ``list_key_rings``,
+            ``list_crypto_keys``, ``list_crypto_key_versions`` or
+            ``list_import_jobs``, whose pages are then read without
+            proto-plus wrappers; or any
+            iterable of resources, such as the output of
+            :func:`google.cloud.kms_v1.inventory.crawl`.
+    """
+    pages = getattr(source, 'pages', None)
+    if pages is None:
+        for resource in source:
+            yield to_row(resource)
+        return
+    for page in pages:
+        pb = type(page).pb(page)
+        builder = None
+        for resource in getattr(pb, _PAGE_FIELDS[pb.DESCRIPTOR.name]):
+            if builder is None:
+                builder = _ROW_BUILDERS[resource.DESCRIPTOR.name]
+            yield builder(resource)
+
+
+def _json_default(value: datetime.datetime) -> str:
+    return value.isoformat().replace('+00:00', 'Z')
+
+
+def write_ndjson(source: Iterable, fp: TextIO) -> int:
+    """Write one JSON object per resource of ``source`` to ``fp``.
+
+    Times are written as RFC 3339 strings.
+
+    Args:
+        source (Iterable): See :func:`iter_rows`.
+        fp (TextIO): The file to write to.
+
+    Returns:
+        int: The number of rows written.
+    """
+    count = 0
+    for row in iter_rows(source):
+        fp.write(json.dumps(row, default=_json_default))
+        fp.write('\n')
+        count += 1
+    return count
+
+
+def _schema():
+    string = pyarrow.string()
+    return pyarrow.schema([
+        ('type', string),
+        ('name', string),
+        ('purpose', string),
+        ('state', string),
+        ('algorithm', string),
+        ('protection_level', string),
+        ('create_time', pyarrow.timestamp('us', tz='UTC')),
+        ('destroy_time', pyarrow.timestamp('us', tz='UTC')),
+        ('labels', pyarrow.map_(string, string)),
+    ])
+
+
+def write_parquet(
+        source: Iterable,
+        where: Union[str, BinaryIO],
+        *,
+        row_group_size: int = 10000) -> int:
+    """Write the resources of ``source`` to a Parquet file.
+
+    Rows are buffered and written one row group at a time.
+
+    Args:
+        source (Iterable): See :func:`iter_rows`.
+        where (Union[str, BinaryIO]): The path or file to write to.
+        row_group_size (int): The number of rows per row group.
+
+    Returns:
+        int: The number of rows written.
+
+    Raises:
+        ValueError: If ``row_group_size`` is less than 1.
+    """
+    if pyarrow is None:  # pragma: NO COVER
+        raise ImportError('Parquet export requires the "pyarrow" package.')
+    if row_group_size < 1:
+        raise ValueError('row_group_size must be at least 1.')
+    schema = _schema()
+    columns = {name: [] for name in COLUMNS}  # type: Dict[str, list]
+    count = 0
+
+    def flush(writer):
+        writer.write_table(pyarrow.table(
+            [columns[name] for name in COLUMNS], schema=schema))
+        for values in columns.values():
+            values.clear()
+
+    with parquet.ParquetWriter(where, schema) as writer:
+        for row in iter_rows(source):
+            for name in COLUMNS:
+                value = row[name]
+                if name == 'labels' and value is not None:
+                    value = list(value.items())
+                columns[name].append(value)
+            count += 1
+            if not count % row_group_size:
+                flush(writer)
+        if count % row_group_size or not count:
+            flush(writer)
+    return count
+
+
+__all__ = (
+    'COLUMNS',
+    'iter_rows',
+    'to_row',
+    'write_ndjson',
+    'write_parquet',
+)
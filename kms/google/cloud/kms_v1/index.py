@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""A local SQLite index of KMS resources, kept up to date incrementally.
+
+:class:`InventoryIndex` stores KeyRings, CryptoKeys, CryptoKeyVersions
+and ImportJobs, with the columns of :data:`~.export.COLUMNS`, in a
+single ``resources`` table that can be queried with :meth:`find` or
+plain SQL.
+
+For every listed parent the index remembers the newest ``create_time``
+it has seen. An incremental :meth:`~.InventoryIndex.sync` only asks for
+resources created since then, using the ``filter`` and ``order_by``
+fields of the list requests. Changes to existing resources, such as a
+version being destroyed, are not visible that way; they are picked up
+by a full reconcile, which :meth:`~.InventoryIndex.sync` runs
+periodically and which also drops resources that no longer exist.
+"""
+
+import datetime
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from google.cloud.kms_v1 import export
+from google.cloud.kms_v1.services.key_management_service import KeyManagementServiceClient
+
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS resources (
+    name TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    parent TEXT NOT NULL,
+    purpose TEXT,
+    state TEXT,
+    algorithm TEXT,
+    protection_level TEXT,
+    create_time REAL,
+    destroy_time REAL,
+    labels TEXT,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS resources_by_parent
+    ON resources (type, parent);
+CREATE INDEX IF NOT EXISTS resources_by_state
+    ON resources (type, state, protection_level, create_time);
+CREATE TABLE IF NOT EXISTS watermarks (
+    method TEXT NOT NULL,
+    parent TEXT NOT NULL,
+    create_time REAL NOT NULL,
+    PRIMARY KEY (method, parent)
+);
+CREATE TABLE IF NOT EXISTS reconciles (
+    location TEXT PRIMARY KEY,
+    reconciled_at REAL NOT NULL
+);
+'''
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _to_seconds(value: Optional[datetime.datetime]) -> Optional[float]:
+    if value is None:
+        return None
+    return (value - _EPOCH).total_seconds()
+
+
+def _from_seconds(value: Optional[float]) -> Optional[datetime.datetime]:
+    if value is None:
+        return None
+    return _EPOCH + datetime.timedelta(seconds=value)
+
+
+class InventoryIndex:
+    """A local index of the KMS resources of some locations.
+
+    Instances can be shared between threads; calls are serialized.
+
+    Args:
+        client (~.KeyManagementServiceClient): The client to list with.
+        database (str): The path of the SQLite database, created if
+            needed. Defaults to an in-memory database.
+        reconcile_interval (float): The number of seconds after which
+            :meth:`sync` reconciles a location in full.
+        page_size (int): The page size of every list request; ``0`` lets
+            the server choose.
+    """
+    def __init__(self,
+            client: KeyManagementServiceClient,
+            database: str = ':memory:',
+            *,
+            reconcile_interval: float = 24 * 3600.0,
+            page_size: int = 0) -> None:
+        self._client = client
+        self._reconcile_interval = reconcile_interval
+        self._page_size = page_size
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(database, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The underlying SQLite connection, for custom queries."""
+        return self._db
+
+    def close(self) -> None:
+        """Close the database."""
+        self._db.close()
+
+    def sync(self,
+            project: str,
+            locations: Iterable[str],
+            *,
+            reconcile: bool = None) -> Dict[str, int]:
+        """Bring the index up to date with KMS.
+
+        Args:
+            project (str): The project ID.
+            locations (Iterable[str]): The location IDs to sync.
+            reconcile (Optional[bool]): Whether to re-list every resource
+                and drop the ones that no longer exist. By default, a
+                location is reconciled when it has not been for
+                ``reconcile_interval`` seconds.
+
+        Returns:
+            Dict[str, int]: The numbers of resources ``listed`` and
+            ``deleted``, and of locations ``reconciled``.
+        """
+        stats = {'listed': 0, 'deleted': 0, 'reconciled': 0}
+        with self._lock:
+            for location in locations:
+                self._sync_location(
+                    'projects/{}/locations/{}'.format(project, location),
+                    reconcile,
+                    stats,
+                )
+        return stats
+
+    def _sync_location(self, location, reconcile, stats):
+        started = time.time()
+        if reconcile is None:
+            row = self._db.execute(
+                'SELECT reconciled_at FROM reconciles WHERE location = ?',
+                (location,)).fetchone()
+            reconcile = (row is None
+                         or started - row[0] >= self._reconcile_interval)
+
+        listed = self._sync_children('list_key_rings', location, reconcile, started)
+        for key_ring in self._names('KeyRing', location):
+            listed += self._sync_children(
+                'list_import_jobs', key_ring, reconcile, started)
+            listed += self._sync_children(
+                'list_crypto_keys', key_ring, reconcile, started)
+            for crypto_key in self._names('CryptoKey', key_ring):
+                listed += self._sync_children(
+                    'list_crypto_key_versions', crypto_key, reconcile, started)
+        stats['listed'] += listed
+
+        if reconcile:
+            with self._db:
+                # Not LIKE, in which '_' is a wildcard and ASCII letters
+                # match either case.
+                prefix = location + '/'
+                deleted = self._db.execute(
+                    'DELETE FROM resources '
+                    'WHERE substr(name, 1, ?) = ? AND synced_at < ?',
+                    (len(prefix), prefix, started)).rowcount
+                self._db.execute(
+                    'INSERT OR REPLACE INTO reconciles VALUES (?, ?)',
+                    (location, started))
+            stats['deleted'] += deleted
+            stats['reconciled'] += 1
+
+    def _names(self, type_: str, parent: str) -> List[str]:
+        return [name for name, in self._db.execute(
+            'SELECT name FROM resources WHERE type = ? AND parent = ?',
+            (type_, parent))]
+
+    def _sync_children(self, method, parent, reconcile, started) -> int:
+        """List the children of ``parent`` and store them.
+
+        Unless reconciling, only children created at or after the
+        newest ``create_time`` seen so far are requested.
+        """
+        request = {
+            'parent': parent,
+            'page_size': self._page_size,
+            'order_by': 'create_time',
+        }
+        row = self._db.execute(
+            'SELECT create_time FROM watermarks WHERE method = ? AND parent = ?',
+            (method, parent)).fetchone()
+        if row is not None and not reconcile:
+            request['filter'] = 'create_time >= "{}"'.format(
+                _from_seconds(row[0]).isoformat().replace('+00:00', 'Z'))
+        newest = row[0] if row is not None else None
+
+        count = 0
+        with self._db:
+            pager = getattr(self._client, method)(request=request)
+            for resource in export.iter_rows(pager):
+                create_time = _to_seconds(resource['create_time'])
+                if create_time is not None and (newest is None or create_time > newest):
+                    newest = create_time
+                labels = resource['labels']
+                self._db.execute(
+                    'INSERT OR REPLACE INTO resources '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', (
+                        resource['name'],
+                        resource['type'],
+                        parent,
+                        resource['purpose'],
+                        resource['state'],
+                        resource['algorithm'],
+                        resource['protection_level'],
+                        create_time,
+                        _to_seconds(resource['destroy_time']),
+                        None if labels is None else json.dumps(labels),
+                        started,
+                    ))
+                count += 1
+            if newest is not None:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?)',
+                    (method, parent, newest))
+        return count
+
+    def find(self,
+            type: str = None,
+            *,
+            parent: str = None,
+            purpose: str = None,
+            state: str = None,
+            algorithm: str = None,
+            protection_level: str = None,
+            created_before: datetime.datetime = None,
+            created_after: datetime.datetime = None) -> List[Dict[str, Any]]:
+        """Return the indexed resources matching every given criterion.
+
+        For example, all enabled HSM versions older than 90 days::
+
+            index.find(
+                'CryptoKeyVersion',
+                state='ENABLED',
+                protection_level='HSM',
+                created_before=now - datetime.timedelta(days=90),
+            )
+
+        Args:
+            type (str): ``KeyRing``, ``CryptoKey``, ``CryptoKeyVersion``
+                or ``ImportJob``.
+            parent (str): The name of the parent resource.
+            purpose, state, algorithm, protection_level (str): Enum value
+                names, as in :data:`~.export.COLUMNS`.
+            created_before, created_after (datetime.datetime): Bounds of
+                the creation time, exclusive. Naive datetimes are taken
+                to be in UTC.
+
+        Returns:
+            List[Dict[str, Any]]: Rows keyed by :data:`~.export.COLUMNS`,
+            ordered by name.
+        """
+        clauses = []
+        params = []  # type: List[Any]
+        for column, value in (
+                ('type', type),
+                ('parent', parent),
+                ('purpose', purpose),
+                ('state', state),
+                ('algorithm', algorithm),
+                ('protection_level', protection_level)):
+            if value is not None:
+                clauses.append('{} = ?'.format(column))
+                params.append(value)
+        for operator, value in (('<', created_before), ('>', created_after)):
+            if value is not None:
+                if value.tzinfo is None:
+                    value = value.replace(tzinfo=datetime.timezone.utc)
+                clauses.append('create_time {} ?'.format(operator))
+                params.append(_to_seconds(value))
+
+        query = 'SELECT {} FROM resources'.format(', '.join(export.COLUMNS))
+        if clauses:
+            query += ' WHERE ' + ' AND '.join(clauses)
+        query += ' ORDER BY name'
+        with self._lock:
+            rows = self._db.execute(query, params).fetchall()
+        return [self._row(row) for row in rows]
+
+    @staticmethod
+    def _row(values) -> Dict[str, Any]:
+        row = dict(zip(export.COLUMNS, values))
+        row['create_time'] = _from_seconds(row['create_time'])
+        row['destroy_time'] = _from_seconds(row['destroy_time'])
+        if row['labels'] is not None:
+            row['labels'] = json.loads(row['labels'])
+        return row
+
+
+__all__ = (
+    'InventoryIndex',
+)
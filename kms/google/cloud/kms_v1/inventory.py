@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Concurrent crawling of the Cloud KMS resource hierarchy.
+
+:func:`crawl` walks ``locations → key rings → crypto keys → versions``
+with a fixed number of worker threads, which also caps the number of
+concurrent RPCs. Each worker lists one parent at a time, page by page,
+and schedules the listing of every child it finds.
+
+Memory stays bounded regardless of the size of the estate: results pass
+through a bounded buffer, so workers pause when the caller falls
+behind, and pending listings are taken depth first, so versions are
+drained before more key rings and keys are discovered. At most
+``_MAX_QUEUED_TASKS`` listings wait in the queue, give or take one per
+worker; beyond that, a worker lists a child itself before it goes on
+with the parent's next page.
+"""
+
+import queue
+import threading
+from typing import Iterable, Iterator, Union
+
+from google.cloud.kms_v1.services.key_management_service import KeyManagementServiceClient
+from google.cloud.kms_v1.types import resources
+from google.cloud.kms_v1.types import service
+
+
+Resource = Union[resources.KeyRing, resources.CryptoKey,
+                 resources.CryptoKeyVersion]
+
+# How often a worker blocked on a full result buffer checks whether the
+# crawl has been stopped.
+_POLL_INTERVAL = 0.1
+
+# The number of pending listings above which workers stop queueing the
+# listings of children and run them themselves.
+_MAX_QUEUED_TASKS = 1000
+
+_DONE = object()
+
+
+class _Crawl:
+    """The shared state of one crawl."""
+    def __init__(self, client, max_concurrency, buffer_size, options):
+        self._client = client
+        self._max_concurrency = max_concurrency
+        self._options = options
+        self._tasks = queue.LifoQueue()  # type: queue.LifoQueue
+        self._max_queued = _MAX_QUEUED_TASKS
+        self._results = queue.Queue(maxsize=buffer_size)  # type: queue.Queue
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    def schedule(self, method: str, request, *, root: bool = False) -> None:
+        """Queue a listing.
+
+        The listing of a child runs on the calling worker instead if the
+        queue is full; waiting for room could deadlock, as every worker
+        may be waiting to schedule.
+        """
+        with self._lock:
+            self._pending += 1
+        if root or self._tasks.qsize() < self._max_queued:
+            self._tasks.put((method, request))
+        else:
+            self._run((method, request))
+
+    def put(self, item) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._results.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _list(self, method: str, request) -> None:
+        options = self._options
+        pager = getattr(self._client, method)(request=request)
+        for page in pager.pages:
+            if method == 'list_key_rings':
+                items = page.key_rings
+            elif method == 'list_crypto_keys':
+                items = page.crypto_keys
+            else:
+                items = page.crypto_key_versions
+            for item in items:
+                if not self.put((item, None)):
+                    return
+                if method == 'list_key_rings':
+                    self.schedule('list_crypto_keys', service.ListCryptoKeysRequest(
+                        parent=item.name,
+                        page_size=options['page_size'],
+                        version_view=options['version_view'],
+                        filter=options['crypto_key_filter'],
+                    ))
+                elif method == 'list_crypto_keys' and options['include_versions']:
+                    self.schedule('list_crypto_key_versions', service.ListCryptoKeyVersionsRequest(
+                        parent=item.name,
+                        page_size=options['page_size'],
+                        view=options['version_view'],
+                        filter=options['crypto_key_version_filter'],
+                    ))
+
+    def _run(self, task) -> None:
+        try:
+            if not self._stop.is_set():
+                self._list(*task)
+        except Exception as exc:
+            self.put((_DONE, exc))
+            self._stop.set()
+        finally:
+            with self._lock:
+                self._pending -= 1
+                done = not self._pending
+            if done:
+                self.put((_DONE, None))
+
+    def work(self) -> None:
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+            self._run(task)
+
+    def run(self) -> Iterator[Resource]:
+        workers = [
+            threading.Thread(target=self.work, name='kms-crawl', daemon=True)
+            for _ in range(self._max_concurrency)
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            while True:
+                item, error = self._results.get()
+                if item is _DONE:
+                    if error is not None:
+                        raise error
+                    return
+                yield item
+        finally:
+            self._stop.set()
+            for _ in workers:
+                self._tasks.put(None)
+
+
+def crawl(
+        client: KeyManagementServiceClient,
+        project: str,
+        locations: Iterable[str],
+        *,
+        max_concurrency: int = 16,
+        buffer_size: int = 1000,
+        key_ring_filter: str = '',
+        crypto_key_filter: str = '',
+        crypto_key_version_filter: str = '',
+        version_view: resources.CryptoKeyVersion.CryptoKeyVersionView = (
+            resources.CryptoKeyVersion.CryptoKeyVersionView.CRYPTO_KEY_VERSION_VIEW_UNSPECIFIED),
+        include_versions: bool = True,
+        page_size: int = 0) -> Iterator[Resource]:
+    r"""Crawl the key rings, crypto keys and versions of a project.
+
+    Results are yielded as they are found, in no particular order; a
+    parent is always yielded before its children. The walk stops when
+    the returned generator is closed.
+
+    Args:
+        client (~.KeyManagementServiceClient): The client to list with.
+        project (str): The project ID.
+        locations (Iterable[str]): The location IDs to crawl, e.g.
+            ``['global', 'us-east1']``.
+        max_concurrency (int): The number of worker threads, and thus the
+            maximum number of RPCs in flight.
+        buffer_size (int): The maximum number of results held before the
+            workers wait for the caller.
+        key_ring_filter (str): The ``filter`` of every
+            ``ListKeyRingsRequest``. The children of filtered-out key
+            rings are not crawled.
+        crypto_key_filter (str): The ``filter`` of every
+            ``ListCryptoKeysRequest``.
+        crypto_key_version_filter (str): The ``filter`` of every
+            ``ListCryptoKeyVersionsRequest``.
+        version_view (~.resources.CryptoKeyVersion.CryptoKeyVersionView):
+            The view of the primary versions of crypto keys and of the
+            crawled versions.
+        include_versions (bool): Whether to list the versions of every
+            crypto key.
+        page_size (int): The page size of every list request; ``0`` lets
+            the server choose.
+
+    Returns:
+        Iterator[Union[~.resources.KeyRing, ~.resources.CryptoKey, ~.resources.CryptoKeyVersion]]:
+            The crawled resources.
+
+    Raises:
+        ValueError: If ``max_concurrency`` or ``buffer_size`` is less
+            than 1.
+        google.api_core.exceptions.GoogleAPICallError: The first error
+            of any list request, raised from the generator after the
+            crawl has been stopped.
+    """
+    if max_concurrency < 1:
+        raise ValueError('max_concurrency must be at least 1.')
+    if buffer_size < 1:
+        raise ValueError('buffer_size must be at least 1.')
+    state = _Crawl(client, max_concurrency, buffer_size, {
+        'page_size': page_size,
+        'crypto_key_filter': crypto_key_filter,
+        'crypto_key_version_filter': crypto_key_version_filter,
+        'version_view': version_view,
+        'include_versions': include_versions,
+    })
+    scheduled = False
+    for location in locations:
+        scheduled = True
+        state.schedule('list_key_rings', service.ListKeyRingsRequest(
+            parent='projects/{}/locations/{}'.format(project, location),
+            page_size=page_size,
+            filter=key_ring_filter,
+        ), root=True)
+    if not scheduled:
+        return iter(())
+    return state.run()
+
+
+__all__ = (
+    'crawl',
+)
@@ -16,7 +16,9 @@
 #
 
 from .client import KeyManagementServiceClient
+from .async_client import KeyManagementServiceAsyncClient
 
 __all__ = (
     'KeyManagementServiceClient',
+    'KeyManagementServiceAsyncClient',
 )
@@ -0,0 +1,2362 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from collections import OrderedDict
+import functools
+import re
+from typing import AsyncIterator, Dict, Iterable, Sequence, Tuple, Type, Union
+
+import google.api_core.client_options as ClientOptions # type: ignore
+from google.api_core import exceptions                 # type: ignore
+from google.api_core import gapic_v1                   # type: ignore
+from google.api_core import retry as retries           # type: ignore
+from google.auth import credentials                    # type: ignore
+from google.oauth2 import service_account              # type: ignore
+
+from google.cloud.kms_v1.services.key_management_service import batch
+from google.cloud.kms_v1.services.key_management_service import pagers
+from google.cloud.kms_v1.types import resources
+from google.cloud.kms_v1.types import service
+from google.protobuf import duration_pb2 as duration  # type: ignore
+from google.protobuf import field_mask_pb2 as field_mask  # type: ignore
+from google.protobuf import timestamp_pb2 as timestamp  # type: ignore
+
+from .transports.base import KeyManagementServiceTransport
+from .transports.grpc_asyncio import KeyManagementServiceGrpcAsyncIOTransport
+from .transports.interceptors import Interceptor
+from .client import KeyManagementServiceClient
+from .client import _routing_metadata
+
+
+class KeyManagementServiceAsyncClient:
+    """Google Cloud Key Management Service
+
+    Manages cryptographic keys and operations using those keys.
+    Implements a REST model with the following objects:
+
+    -  [KeyRing][google.cloud.kms.v1.KeyRing]
+    -  [CryptoKey][google.cloud.kms.v1.CryptoKey]
+    -  [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+    -  [ImportJob][google.cloud.kms.v1.ImportJob]
+
+    If you are using manual gRPC libraries, see `Using gRPC with Cloud
+    KMS <https://cloud.google.com/kms/docs/grpc>`__.
+    """
+
+    _client: KeyManagementServiceClient
+
+    DEFAULT_ENDPOINT = KeyManagementServiceClient.DEFAULT_ENDPOINT
+    DEFAULT_MTLS_ENDPOINT = KeyManagementServiceClient.DEFAULT_MTLS_ENDPOINT
+
+    import_job_path = staticmethod(KeyManagementServiceClient.import_job_path)
+    parse_import_job_path = staticmethod(KeyManagementServiceClient.parse_import_job_path)
+    key_ring_path = staticmethod(KeyManagementServiceClient.key_ring_path)
+    parse_key_ring_path = staticmethod(KeyManagementServiceClient.parse_key_ring_path)
+    crypto_key_version_path = staticmethod(KeyManagementServiceClient.crypto_key_version_path)
+    parse_crypto_key_version_path = staticmethod(KeyManagementServiceClient.parse_crypto_key_version_path)
+    crypto_key_path = staticmethod(KeyManagementServiceClient.crypto_key_path)
+    parse_crypto_key_path = staticmethod(KeyManagementServiceClient.parse_crypto_key_path)
+
+    from_service_account_file = classmethod(KeyManagementServiceClient.from_service_account_file.__func__)  # type: ignore
+    from_service_account_json = from_service_account_file
+
+    get_transport_class = functools.partial(type(KeyManagementServiceClient).get_transport_class,
+        type(KeyManagementServiceClient))
+
+    def __init__(self, *,
+            credentials: credentials.Credentials = None,
+            transport: Union[str, KeyManagementServiceTransport] = 'grpc_asyncio',
+            client_options: ClientOptions = None,
+            interceptors: Sequence[Interceptor] = (),
+            ) -> None:
+        """Instantiate the key management service client.
+
+        Args:
+            credentials (Optional[google.auth.credentials.Credentials]): The
+                authorization credentials to attach to requests. These
+                credentials identify the application to the service; if none
+                are specified, the client will attempt to ascertain the
+                credentials from the environment.
+            transport (Union[str, ~.KeyManagementServiceTransport]): The
+                transport to use. Defaults to the gRPC AsyncIO transport.
+            client_options (ClientOptions): Custom options for the client.
+                (1) The ``api_endpoint`` property can be used to override the
+                default endpoint provided by the client.
+                (2) If ``transport`` argument is None, ``client_options`` can be
+                used to create a mutual TLS transport. If ``client_cert_source``
+                is provided, mutual TLS transport will be created with the given
+                ``api_endpoint`` or the default mTLS endpoint, and the client
+                SSL credentials obtained from ``client_cert_source``.
+                (3) The ``method_configs`` property, or dictionary key, can
+                be used to override the default retry and timeout of each
+                RPC method. Retries must be
+                :class:`google.api_core.retry_async.AsyncRetry` instances.
+                ``{'decrypt': {'coalesce': True}}`` makes identical
+                concurrent requests of a side-effect free method share
+                one call.
+                (4) The ``metadata_cache`` property, or dictionary key, can
+                be set to ``True`` or to a :class:`~.cache.MetadataCache`
+                to cache the responses of ``get_key_ring``,
+                ``get_crypto_key``, ``get_crypto_key_version`` and
+                ``get_import_job``. Entries are invalidated when this
+                client modifies the resource.
+                (5) The ``rate_limiter`` property, or dictionary key, can
+                be set to ``True`` or to a :class:`~.ratelimit.RateLimiter`
+                to make calls await until they fit within the KMS read,
+                write and cryptographic request quotas.
+                (6) The ``concurrency_limiter`` property, or dictionary
+                key, can be set to ``True`` or to a
+                :class:`~.concurrency.AdaptiveLimiter` to adapt the
+                number of calls in flight, including those of
+                ``encrypt_many`` and ``decrypt_many``, to the service's
+                load.
+                (7) The ``hedging`` property, or dictionary key, can be
+                set to ``True`` or to a :class:`~.hedging.HedgingPolicy`
+                to send a second request when a call of ``decrypt``,
+                ``get_public_key`` or ``get_crypto_key_version``, or of
+                the policy's methods, is slower than most, and use the
+                first response.
+                (8) The ``metrics`` property, or dictionary key, can be
+                set to ``True`` or to a :class:`~.metrics.TransportMetrics`
+                to record the calls, status codes, calls in flight and
+                latencies of each method, available from the transport's
+                ``metrics``.
+                (9) The ``interceptors`` property, or dictionary key, can
+                hold more interceptors, which run inside those given as
+                the ``interceptors`` argument.
+                (10) The ``refresh_credentials`` property, or dictionary
+                key, can be set to ``True`` or to a number of seconds to
+                refresh the access token in a background thread that
+                long before it expires, by default
+                :data:`~.refresh.DEFAULT_MARGIN`, rather than on a call.
+                Clients built from the same credentials share the token.
+            interceptors (Sequence[~.interceptors.Interceptor]): The
+                interceptors every call of the client passes through, in
+                order, the first one outermost.
+
+        Raises:
+            google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
+                creation failed for any reason.
+            ValueError: If ``method_configs`` names an unknown RPC method or
+                setting, or ``hedging`` a method with side effects.
+        """
+
+        self._client = KeyManagementServiceClient(
+            credentials=credentials,
+            transport=transport,
+            client_options=client_options,
+            interceptors=interceptors,
+        )
+
+    async def list_key_rings(self,
+            request: service.ListKeyRingsRequest = None,
+            *,
+            parent: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            prefetch: int = 0,
+            ) -> pagers.ListKeyRingsAsyncPager:
+        r"""Lists [KeyRings][google.cloud.kms.v1.KeyRing].
+
+        Args:
+            request (:class:`~.service.ListKeyRingsRequest`):
+                The request object. Request message for
+                [KeyManagementService.ListKeyRings][google.cloud.kms.v1.KeyManagementService.ListKeyRings].
+            parent (:class:`str`):
+                Required. The resource name of the location associated
+                with the [KeyRings][google.cloud.kms.v1.KeyRing], in the
+                format ``projects/*/locations/*``.
+                This corresponds to the ``parent`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+            prefetch (int): The number of further pages to fetch in the
+                background while iterating over the current one.
+
+        Returns:
+            ~.pagers.ListKeyRingsAsyncPager:
+                Response message for
+                [KeyManagementService.ListKeyRings][google.cloud.kms.v1.KeyManagementService.ListKeyRings].
+
+                Iterating over this object will yield results and
+                resolve additional pages automatically.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([parent]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.ListKeyRingsRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if parent is not None:
+            request.parent = parent
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['list_key_rings']
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            _routing_metadata('parent', request.parent),
+        )
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # This method is paged; wrap the response in a pager, which provides
+        # an `__aiter__` convenience method.
+        response = pagers.ListKeyRingsAsyncPager(
+            method=rpc,
+            request=request,
+            response=response,
+            prefetch=prefetch,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def list_crypto_keys(self,
+            request: service.ListCryptoKeysRequest = None,
+            *,
+            parent: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            prefetch: int = 0,
+            ) -> pagers.ListCryptoKeysAsyncPager:
+        r"""Lists [CryptoKeys][google.cloud.kms.v1.CryptoKey].
+
+        Args:
+            request (:class:`~.service.ListCryptoKeysRequest`):
+                The request object. Request message for
+                [KeyManagementService.ListCryptoKeys][google.cloud.kms.v1.KeyManagementService.ListCryptoKeys].
+            parent (:class:`str`):
+                Required. The resource name of the
+                [KeyRing][google.cloud.kms.v1.KeyRing] to list, in the
+                format ``projects/*/locations/*/keyRings/*``.
+                This corresponds to the ``parent`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+            prefetch (int): The number of further pages to fetch in the
+                background while iterating over the current one.
+
+        Returns:
+            ~.pagers.ListCryptoKeysAsyncPager:
+                Response message for
+                [KeyManagementService.ListCryptoKeys][google.cloud.kms.v1.KeyManagementService.ListCryptoKeys].
+
+                Iterating over this object will yield results and
+                resolve additional pages automatically.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([parent]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.ListCryptoKeysRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if parent is not None:
+            request.parent = parent
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['list_crypto_keys']
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            _routing_metadata('parent', request.parent),
+        )
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # This method is paged; wrap the response in a pager, which provides
+        # an `__aiter__` convenience method.
+        response = pagers.ListCryptoKeysAsyncPager(
+            method=rpc,
+            request=request,
+            response=response,
+            prefetch=prefetch,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def list_crypto_key_versions(self,
+            request: service.ListCryptoKeyVersionsRequest = None,
+            *,
+            parent: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            prefetch: int = 0,
+            ) -> pagers.ListCryptoKeyVersionsAsyncPager:
+        r"""Lists [CryptoKeyVersions][google.cloud.kms.v1.CryptoKeyVersion].
+
+        Args:
+            request (:class:`~.service.ListCryptoKeyVersionsRequest`):
+                The request object. Request message for
+                [KeyManagementService.ListCryptoKeyVersions][google.cloud.kms.v1.KeyManagementService.ListCryptoKeyVersions].
+            parent (:class:`str`):
+                Required. The resource name of the
+                [CryptoKey][google.cloud.kms.v1.CryptoKey] to list, in
+                the format
+                ``projects/*/locations/*/keyRings/*/cryptoKeys/*``.
+                This corresponds to the ``parent`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+            prefetch (int): The number of further pages to fetch in the
+                background while iterating over the current one.
+
+        Returns:
+            ~.pagers.ListCryptoKeyVersionsAsyncPager:
+                Response message for
+                [KeyManagementService.ListCryptoKeyVersions][google.cloud.kms.v1.KeyManagementService.ListCryptoKeyVersions].
+
+                Iterating over this object will yield results and
+                resolve additional pages automatically.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([parent]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.ListCryptoKeyVersionsRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if parent is not None:
+            request.parent = parent
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['list_crypto_key_versions']
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            _routing_metadata('parent', request.parent),
+        )
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # This method is paged; wrap the response in a pager, which provides
+        # an `__aiter__` convenience method.
+        response = pagers.ListCryptoKeyVersionsAsyncPager(
+            method=rpc,
+            request=request,
+            response=response,
+            prefetch=prefetch,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def list_import_jobs(self,
+            request: service.ListImportJobsRequest = None,
+            *,
+            parent: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            prefetch: int = 0,
+            ) -> pagers.ListImportJobsAsyncPager:
+        r"""Lists [ImportJobs][google.cloud.kms.v1.ImportJob].
+
+        Args:
+            request (:class:`~.service.ListImportJobsRequest`):
+                The request object. Request message for
+                [KeyManagementService.ListImportJobs][google.cloud.kms.v1.KeyManagementService.ListImportJobs].
+            parent (:class:`str`):
+                Required. The resource name of the
+                [KeyRing][google.cloud.kms.v1.KeyRing] to list, in the
+                format ``projects/*/locations/*/keyRings/*``.
+                This corresponds to the ``parent`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+            prefetch (int): The number of further pages to fetch in the
+                background while iterating over the current one.
+
+        Returns:
+            ~.pagers.ListImportJobsAsyncPager:
+                Response message for
+                [KeyManagementService.ListImportJobs][google.cloud.kms.v1.KeyManagementService.ListImportJobs].
+
+                Iterating over this object will yield results and
+                resolve additional pages automatically.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([parent]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.ListImportJobsRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if parent is not None:
+            request.parent = parent
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['list_import_jobs']
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            _routing_metadata('parent', request.parent),
+        )
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # This method is paged; wrap the response in a pager, which provides
+        # an `__aiter__` convenience method.
+        response = pagers.ListImportJobsAsyncPager(
+            method=rpc,
+            request=request,
+            response=response,
+            prefetch=prefetch,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def get_key_ring(self,
+            request: service.GetKeyRingRequest = None,
+            *,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> resources.KeyRing:
+        r"""Returns metadata for a given
+        [KeyRing][google.cloud.kms.v1.KeyRing].
+
+        Args:
+            request (:class:`~.service.GetKeyRingRequest`):
+                The request object. Request message for
+                [KeyManagementService.GetKeyRing][google.cloud.kms.v1.KeyManagementService.GetKeyRing].
+            name (:class:`str`):
+                Required. The [name][google.cloud.kms.v1.KeyRing.name]
+                of the [KeyRing][google.cloud.kms.v1.KeyRing] to get.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.resources.KeyRing:
+                A [KeyRing][google.cloud.kms.v1.KeyRing] is a toplevel
+                logical grouping of
+                [CryptoKeys][google.cloud.kms.v1.CryptoKey].
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.GetKeyRingRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if name is not None:
+            request.name = name
+
+        # Serve the response from the metadata cache, if enabled.
+        metadata_cache = self._client._metadata_cache
+        if metadata_cache is not None:
+            cached = metadata_cache.get('get_key_ring', request.name)
+            if cached is not None:
+                return cached
+            generation = metadata_cache.generation
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['get_key_ring']
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            _routing_metadata('name', request.name),
+        )
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        if metadata_cache is not None:
+            metadata_cache.put('get_key_ring', request.name, response, generation)
+
+        # Done; return the response.
+        return response
+
+    async def get_crypto_key(self,
+            request: service.GetCryptoKeyRequest = None,
+            *,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> resources.CryptoKey:
+        r"""Returns metadata for a given
+        [CryptoKey][google.cloud.kms.v1.CryptoKey], as well as its
+        [primary][google.cloud.kms.v1.CryptoKey.primary]
+        [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion].
+
+        Args:
+            request (:class:`~.service.GetCryptoKeyRequest`):
+                The request object. Request message for
+                [KeyManagementService.GetCryptoKey][google.cloud.kms.v1.KeyManagementService.GetCryptoKey].
+            name (:class:`str`):
+                Required. The [name][google.cloud.kms.v1.CryptoKey.name]
+                of the [CryptoKey][google.cloud.kms.v1.CryptoKey] to
+                get.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.resources.CryptoKey:
+                A [CryptoKey][google.cloud.kms.v1.CryptoKey] represents
+                a logical key that can be used for cryptographic
+                operations.
+
+                A [CryptoKey][google.cloud.kms.v1.CryptoKey] is made up
+                of one or more
+                [versions][google.cloud.kms.v1.CryptoKeyVersion], which
+                represent the actual key material used in cryptographic
+                operations.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.GetCryptoKeyRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if name is not None:
+            request.name = name
+
+        # Serve the response from the metadata cache, if enabled.
+        metadata_cache = self._client._metadata_cache
+        if metadata_cache is not None:
+            cached = metadata_cache.get('get_crypto_key', request.name)
+            if cached is not None:
+                return cached
+            generation = metadata_cache.generation
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['get_crypto_key']
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            _routing_metadata('name', request.name),
+        )
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        if metadata_cache is not None:
+            metadata_cache.put('get_crypto_key', request.name, response, generation)
+
+        # Done; return the response.
+        return response
+
+    async def get_crypto_key_version(self,
+            request: service.GetCryptoKeyVersionRequest = None,
+            *,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> resources.CryptoKeyVersion:
+        r"""Returns metadata for a given
+        [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion].
+
+        Args:
+            request (:class:`~.service.GetCryptoKeyVersionRequest`):
+                The request object. Request message for
+                [KeyManagementService.GetCryptoKeyVersion][google.cloud.kms.v1.KeyManagementService.GetCryptoKeyVersion].
+            name (:class:`str`):
+                Required. The
+                [name][google.cloud.kms.v1.CryptoKeyVersion.name] of the
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                to get.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.resources.CryptoKeyVersion:
+                A
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                represents an individual cryptographic key, and the
+                associated key material.
+
+                An
+                [ENABLED][google.cloud.kms.v1.CryptoKeyVersion.CryptoKeyVersionState.ENABLED]
+                version can be used for cryptographic operations.
+
+                For security reasons, the raw cryptographic key material
+                represented by a
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                can never be viewed or exported. It can only be used to
+                encrypt, decrypt, or sign data when an authorized user
+                or application invokes Cloud KMS.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.GetCryptoKeyVersionRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if name is not None:
+            request.name = name
+
+        # Serve the response from the metadata cache, if enabled.
+        metadata_cache = self._client._metadata_cache
+        if metadata_cache is not None:
+            cached = metadata_cache.get('get_crypto_key_version', request.name)
+            if cached is not None:
+                return cached
+            generation = metadata_cache.generation
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['get_crypto_key_version']
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            _routing_metadata('name', request.name),
+        )
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        if metadata_cache is not None:
+            metadata_cache.put('get_crypto_key_version', request.name, response, generation)
+
+        # Done; return the response.
+        return response
+
+    async def get_public_key(self,
+            request: service.GetPublicKeyRequest = None,
+            *,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> resources.PublicKey:
+        r"""Returns the public key for the given
+        [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]. The
+        [CryptoKey.purpose][google.cloud.kms.v1.CryptoKey.purpose] must
+        be
+        [ASYMMETRIC_SIGN][google.cloud.kms.v1.CryptoKey.CryptoKeyPurpose.ASYMMETRIC_SIGN]
+        or
+        [ASYMMETRIC_DECRYPT][google.cloud.kms.v1.CryptoKey.CryptoKeyPurpose.ASYMMETRIC_DECRYPT].
+
+        Args:
+            request (:class:`~.service.GetPublicKeyRequest`):
+                The request object. Request message for
+                [KeyManagementService.GetPublicKey][google.cloud.kms.v1.KeyManagementService.GetPublicKey].
+            name (:class:`str`):
+                Required. The
+                [name][google.cloud.kms.v1.CryptoKeyVersion.name] of the
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                public key to get.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.resources.PublicKey:
+                The public key for a given
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion].
+                Obtained via
+                [GetPublicKey][google.cloud.kms.v1.KeyManagementService.GetPublicKey].
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.GetPublicKeyRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['get_public_key']
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            _routing_metadata('name', request.name),
+        )
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def get_import_job(self,
+            request: service.GetImportJobRequest = None,
+            *,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> resources.ImportJob:
+        r"""Returns metadata for a given
+        [ImportJob][google.cloud.kms.v1.ImportJob].
+
+        Args:
+            request (:class:`~.service.GetImportJobRequest`):
+                The request object. Request message for
+                [KeyManagementService.GetImportJob][google.cloud.kms.v1.KeyManagementService.GetImportJob].
+            name (:class:`str`):
+                Required. The [name][google.cloud.kms.v1.ImportJob.name]
+                of the [ImportJob][google.cloud.kms.v1.ImportJob] to
+                get.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.resources.ImportJob:
+                An [ImportJob][google.cloud.kms.v1.ImportJob] can be
+                used to create
+                [CryptoKeys][google.cloud.kms.v1.CryptoKey] and
+                [CryptoKeyVersions][google.cloud.kms.v1.CryptoKeyVersion]
+                using pre-existing key material, generated outside of
+                Cloud KMS.
+
+                When an [ImportJob][google.cloud.kms.v1.ImportJob] is
+                created, Cloud KMS will generate a "wrapping key", which
+                is a public/private key pair. You use the wrapping key
+                to encrypt (also known as wrap) the pre-existing key
+                material to protect it during the import process. The
+                nature of the wrapping key depends on the choice of
+                [import_method][google.cloud.kms.v1.ImportJob.import_method].
+                When the wrapping key generation is complete, the
+                [state][google.cloud.kms.v1.ImportJob.state] will be set
+                to
+                [ACTIVE][google.cloud.kms.v1.ImportJob.ImportJobState.ACTIVE]
+                and the
+                [public_key][google.cloud.kms.v1.ImportJob.public_key]
+                can be fetched. The fetched public key can then be used
+                to wrap your pre-existing key material.
+
+                Once the key material is wrapped, it can be imported
+                into a new
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                in an existing
+                [CryptoKey][google.cloud.kms.v1.CryptoKey] by calling
+                [ImportCryptoKeyVersion][google.cloud.kms.v1.KeyManagementService.ImportCryptoKeyVersion].
+                Multiple
+                [CryptoKeyVersions][google.cloud.kms.v1.CryptoKeyVersion]
+                can be imported with a single
+                [ImportJob][google.cloud.kms.v1.ImportJob]. Cloud KMS
+                uses the private key portion of the wrapping key to
+                unwrap the key material. Only Cloud KMS has access to
+                the private key.
+
+                An [ImportJob][google.cloud.kms.v1.ImportJob] expires 3
+                days after it is created. Once expired, Cloud KMS will
+                no longer be able to import or unwrap any key material
+                that was wrapped with the
+                [ImportJob][google.cloud.kms.v1.ImportJob]'s public key.
+
+                For more information, see `Importing a
+                key <https://cloud.google.com/kms/docs/importing-a-key>`__.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.GetImportJobRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if name is not None:
+            request.name = name
+
+        # Serve the response from the metadata cache, if enabled.
+        metadata_cache = self._client._metadata_cache
+        if metadata_cache is not None:
+            cached = metadata_cache.get('get_import_job', request.name)
+            if cached is not None:
+                return cached
+            generation = metadata_cache.generation
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['get_import_job']
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            _routing_metadata('name', request.name),
+        )
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        if metadata_cache is not None:
+            metadata_cache.put('get_import_job', request.name, response, generation)
+
+        # Done; return the response.
+        return response
+
+    async def create_key_ring(self,
+            request: service.CreateKeyRingRequest = None,
+            *,
+            parent: str = None,
+            key_ring_id: str = None,
+            key_ring: resources.KeyRing = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> resources.KeyRing:
+        r"""Create a new [KeyRing][google.cloud.kms.v1.KeyRing] in a given
+        Project and Location.
+
+        Args:
+            request (:class:`~.service.CreateKeyRingRequest`):
+                The request object. Request message for
+                [KeyManagementService.CreateKeyRing][google.cloud.kms.v1.KeyManagementService.CreateKeyRing].
+            parent (:class:`str`):
+                Required. The resource name of the location associated
+                with the [KeyRings][google.cloud.kms.v1.KeyRing], in the
+                format ``projects/*/locations/*``.
+                This corresponds to the ``parent`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            key_ring_id (:class:`str`):
+                Required. It must be unique within a location and match
+                the regular expression ``[a-zA-Z0-9_-]{1,63}``
+                This corresponds to the ``key_ring_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            key_ring (:class:`~.resources.KeyRing`):
+                Required. A [KeyRing][google.cloud.kms.v1.KeyRing] with
+                initial field values.
+                This corresponds to the ``key_ring`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.resources.KeyRing:
+                A [KeyRing][google.cloud.kms.v1.KeyRing] is a toplevel
+                logical grouping of
+                [CryptoKeys][google.cloud.kms.v1.CryptoKey].
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([parent, key_ring_id, key_ring]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.CreateKeyRingRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if parent is not None:
+            request.parent = parent
+        if key_ring_id is not None:
+            request.key_ring_id = key_ring_id
+        if key_ring is not None:
+            request.key_ring = key_ring
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['create_key_ring']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def create_crypto_key(self,
+            request: service.CreateCryptoKeyRequest = None,
+            *,
+            parent: str = None,
+            crypto_key_id: str = None,
+            crypto_key: resources.CryptoKey = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> resources.CryptoKey:
+        r"""Create a new [CryptoKey][google.cloud.kms.v1.CryptoKey] within a
+        [KeyRing][google.cloud.kms.v1.KeyRing].
+
+        [CryptoKey.purpose][google.cloud.kms.v1.CryptoKey.purpose] and
+        [CryptoKey.version_template.algorithm][google.cloud.kms.v1.CryptoKeyVersionTemplate.algorithm]
+        are required.
+
+        Args:
+            request (:class:`~.service.CreateCryptoKeyRequest`):
+                The request object. Request message for
+                [KeyManagementService.CreateCryptoKey][google.cloud.kms.v1.KeyManagementService.CreateCryptoKey].
+            parent (:class:`str`):
+                Required. The [name][google.cloud.kms.v1.KeyRing.name]
+                of the KeyRing associated with the
+                [CryptoKeys][google.cloud.kms.v1.CryptoKey].
+                This corresponds to the ``parent`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            crypto_key_id (:class:`str`):
+                Required. It must be unique within a KeyRing and match
+                the regular expression ``[a-zA-Z0-9_-]{1,63}``
+                This corresponds to the ``crypto_key_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            crypto_key (:class:`~.resources.CryptoKey`):
+                Required. A [CryptoKey][google.cloud.kms.v1.CryptoKey]
+                with initial field values.
+                This corresponds to the ``crypto_key`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.resources.CryptoKey:
+                A [CryptoKey][google.cloud.kms.v1.CryptoKey] represents
+                a logical key that can be used for cryptographic
+                operations.
+
+                A [CryptoKey][google.cloud.kms.v1.CryptoKey] is made up
+                of one or more
+                [versions][google.cloud.kms.v1.CryptoKeyVersion], which
+                represent the actual key material used in cryptographic
+                operations.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([parent, crypto_key_id, crypto_key]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.CreateCryptoKeyRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if parent is not None:
+            request.parent = parent
+        if crypto_key_id is not None:
+            request.crypto_key_id = crypto_key_id
+        if crypto_key is not None:
+            request.crypto_key = crypto_key
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['create_crypto_key']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def create_crypto_key_version(self,
+            request: service.CreateCryptoKeyVersionRequest = None,
+            *,
+            parent: str = None,
+            crypto_key_version: resources.CryptoKeyVersion = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> resources.CryptoKeyVersion:
+        r"""Create a new
+        [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion] in a
+        [CryptoKey][google.cloud.kms.v1.CryptoKey].
+
+        The server will assign the next sequential id. If unset,
+        [state][google.cloud.kms.v1.CryptoKeyVersion.state] will be set
+        to
+        [ENABLED][google.cloud.kms.v1.CryptoKeyVersion.CryptoKeyVersionState.ENABLED].
+
+        Args:
+            request (:class:`~.service.CreateCryptoKeyVersionRequest`):
+                The request object. Request message for
+                [KeyManagementService.CreateCryptoKeyVersion][google.cloud.kms.v1.KeyManagementService.CreateCryptoKeyVersion].
+            parent (:class:`str`):
+                Required. The [name][google.cloud.kms.v1.CryptoKey.name]
+                of the [CryptoKey][google.cloud.kms.v1.CryptoKey]
+                associated with the
+                [CryptoKeyVersions][google.cloud.kms.v1.CryptoKeyVersion].
+                This corresponds to the ``parent`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            crypto_key_version (:class:`~.resources.CryptoKeyVersion`):
+                Required. A
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                with initial field values.
+                This corresponds to the ``crypto_key_version`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.resources.CryptoKeyVersion:
+                A
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                represents an individual cryptographic key, and the
+                associated key material.
+
+                An
+                [ENABLED][google.cloud.kms.v1.CryptoKeyVersion.CryptoKeyVersionState.ENABLED]
+                version can be used for cryptographic operations.
+
+                For security reasons, the raw cryptographic key material
+                represented by a
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                can never be viewed or exported. It can only be used to
+                encrypt, decrypt, or sign data when an authorized user
+                or application invokes Cloud KMS.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([parent, crypto_key_version]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.CreateCryptoKeyVersionRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if parent is not None:
+            request.parent = parent
+        if crypto_key_version is not None:
+            request.crypto_key_version = crypto_key_version
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['create_crypto_key_version']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def import_crypto_key_version(self,
+            request: service.ImportCryptoKeyVersionRequest = None,
+            *,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> resources.CryptoKeyVersion:
+        r"""Imports a new
+        [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion] into an
+        existing [CryptoKey][google.cloud.kms.v1.CryptoKey] using the
+        wrapped key material provided in the request.
+
+        The version ID will be assigned the next sequential id within
+        the [CryptoKey][google.cloud.kms.v1.CryptoKey].
+
+        Args:
+            request (:class:`~.service.ImportCryptoKeyVersionRequest`):
+                The request object. Request message for
+                [KeyManagementService.ImportCryptoKeyVersion][google.cloud.kms.v1.KeyManagementService.ImportCryptoKeyVersion].
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.resources.CryptoKeyVersion:
+                A
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                represents an individual cryptographic key, and the
+                associated key material.
+
+                An
+                [ENABLED][google.cloud.kms.v1.CryptoKeyVersion.CryptoKeyVersionState.ENABLED]
+                version can be used for cryptographic operations.
+
+                For security reasons, the raw cryptographic key material
+                represented by a
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                can never be viewed or exported. It can only be used to
+                encrypt, decrypt, or sign data when an authorized user
+                or application invokes Cloud KMS.
+
+        """
+        # Create or coerce a protobuf request object.
+
+        request = service.ImportCryptoKeyVersionRequest(request)
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['import_crypto_key_version']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def create_import_job(self,
+            request: service.CreateImportJobRequest = None,
+            *,
+            parent: str = None,
+            import_job_id: str = None,
+            import_job: resources.ImportJob = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> resources.ImportJob:
+        r"""Create a new [ImportJob][google.cloud.kms.v1.ImportJob] within a
+        [KeyRing][google.cloud.kms.v1.KeyRing].
+
+        [ImportJob.import_method][google.cloud.kms.v1.ImportJob.import_method]
+        is required.
+
+        Args:
+            request (:class:`~.service.CreateImportJobRequest`):
+                The request object. Request message for
+                [KeyManagementService.CreateImportJob][google.cloud.kms.v1.KeyManagementService.CreateImportJob].
+            parent (:class:`str`):
+                Required. The [name][google.cloud.kms.v1.KeyRing.name]
+                of the [KeyRing][google.cloud.kms.v1.KeyRing] associated
+                with the [ImportJobs][google.cloud.kms.v1.ImportJob].
+                This corresponds to the ``parent`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            import_job_id (:class:`str`):
+                Required. It must be unique within a KeyRing and match
+                the regular expression ``[a-zA-Z0-9_-]{1,63}``
+                This corresponds to the ``import_job_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            import_job (:class:`~.resources.ImportJob`):
+                Required. An [ImportJob][google.cloud.kms.v1.ImportJob]
+                with initial field values.
+                This corresponds to the ``import_job`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.resources.ImportJob:
+                An [ImportJob][google.cloud.kms.v1.ImportJob] can be
+                used to create
+                [CryptoKeys][google.cloud.kms.v1.CryptoKey] and
+                [CryptoKeyVersions][google.cloud.kms.v1.CryptoKeyVersion]
+                using pre-existing key material, generated outside of
+                Cloud KMS.
+
+                When an [ImportJob][google.cloud.kms.v1.ImportJob] is
+                created, Cloud KMS will generate a "wrapping key", which
+                is a public/private key pair. You use the wrapping key
+                to encrypt (also known as wrap) the pre-existing key
+                material to protect it during the import process. The
+                nature of the wrapping key depends on the choice of
+                [import_method][google.cloud.kms.v1.ImportJob.import_method].
+                When the wrapping key generation is complete, the
+                [state][google.cloud.kms.v1.ImportJob.state] will be set
+                to
+                [ACTIVE][google.cloud.kms.v1.ImportJob.ImportJobState.ACTIVE]
+                and the
+                [public_key][google.cloud.kms.v1.ImportJob.public_key]
+                can be fetched. The fetched public key can then be used
+                to wrap your pre-existing key material.
+
+                Once the key material is wrapped, it can be imported
+                into a new
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                in an existing
+                [CryptoKey][google.cloud.kms.v1.CryptoKey] by calling
+                [ImportCryptoKeyVersion][google.cloud.kms.v1.KeyManagementService.ImportCryptoKeyVersion].
+                Multiple
+                [CryptoKeyVersions][google.cloud.kms.v1.CryptoKeyVersion]
+                can be imported with a single
+                [ImportJob][google.cloud.kms.v1.ImportJob]. Cloud KMS
+                uses the private key portion of the wrapping key to
+                unwrap the key material. Only Cloud KMS has access to
+                the private key.
+
+                An [ImportJob][google.cloud.kms.v1.ImportJob] expires 3
+                days after it is created. Once expired, Cloud KMS will
+                no longer be able to import or unwrap any key material
+                that was wrapped with the
+                [ImportJob][google.cloud.kms.v1.ImportJob]'s public key.
+
+                For more information, see `Importing a
+                key <https://cloud.google.com/kms/docs/importing-a-key>`__.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([parent, import_job_id, import_job]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.CreateImportJobRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if parent is not None:
+            request.parent = parent
+        if import_job_id is not None:
+            request.import_job_id = import_job_id
+        if import_job is not None:
+            request.import_job = import_job
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['create_import_job']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def update_crypto_key(self,
+            request: service.UpdateCryptoKeyRequest = None,
+            *,
+            crypto_key: resources.CryptoKey = None,
+            update_mask: field_mask.FieldMask = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> resources.CryptoKey:
+        r"""Update a [CryptoKey][google.cloud.kms.v1.CryptoKey].
+
+        Args:
+            request (:class:`~.service.UpdateCryptoKeyRequest`):
+                The request object. Request message for
+                [KeyManagementService.UpdateCryptoKey][google.cloud.kms.v1.KeyManagementService.UpdateCryptoKey].
+            crypto_key (:class:`~.resources.CryptoKey`):
+                Required. [CryptoKey][google.cloud.kms.v1.CryptoKey]
+                with updated values.
+                This corresponds to the ``crypto_key`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            update_mask (:class:`~.field_mask.FieldMask`):
+                Required. List of fields to be
+                updated in this request.
+                This corresponds to the ``update_mask`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.resources.CryptoKey:
+                A [CryptoKey][google.cloud.kms.v1.CryptoKey] represents
+                a logical key that can be used for cryptographic
+                operations.
+
+                A [CryptoKey][google.cloud.kms.v1.CryptoKey] is made up
+                of one or more
+                [versions][google.cloud.kms.v1.CryptoKeyVersion], which
+                represent the actual key material used in cryptographic
+                operations.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([crypto_key, update_mask]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.UpdateCryptoKeyRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if crypto_key is not None:
+            request.crypto_key = crypto_key
+        if update_mask is not None:
+            request.update_mask = update_mask
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['update_crypto_key']
+
+        # Send the request.
+        try:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            )
+        finally:
+            # Whatever the outcome, cached copies of the key are stale.
+            if self._client._metadata_cache is not None:
+                self._client._metadata_cache.invalidate(request.crypto_key.name)
+
+        # Done; return the response.
+        return response
+
+    async def update_crypto_key_version(self,
+            request: service.UpdateCryptoKeyVersionRequest = None,
+            *,
+            crypto_key_version: resources.CryptoKeyVersion = None,
+            update_mask: field_mask.FieldMask = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> resources.CryptoKeyVersion:
+        r"""Update a
+        [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]'s
+        metadata.
+
+        [state][google.cloud.kms.v1.CryptoKeyVersion.state] may be
+        changed between
+        [ENABLED][google.cloud.kms.v1.CryptoKeyVersion.CryptoKeyVersionState.ENABLED]
+        and
+        [DISABLED][google.cloud.kms.v1.CryptoKeyVersion.CryptoKeyVersionState.DISABLED]
+        using this method. See
+        [DestroyCryptoKeyVersion][google.cloud.kms.v1.KeyManagementService.DestroyCryptoKeyVersion]
+        and
+        [RestoreCryptoKeyVersion][google.cloud.kms.v1.KeyManagementService.RestoreCryptoKeyVersion]
+        to move between other states.
+
+        Args:
+            request (:class:`~.service.UpdateCryptoKeyVersionRequest`):
+                The request object. Request message for
+                [KeyManagementService.UpdateCryptoKeyVersion][google.cloud.kms.v1.KeyManagementService.UpdateCryptoKeyVersion].
+            crypto_key_version (:class:`~.resources.CryptoKeyVersion`):
+                Required.
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                with updated values.
+                This corresponds to the ``crypto_key_version`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            update_mask (:class:`~.field_mask.FieldMask`):
+                Required. List of fields to be
+                updated in this request.
+                This corresponds to the ``update_mask`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.resources.CryptoKeyVersion:
+                A
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                represents an individual cryptographic key, and the
+                associated key material.
+
+                An
+                [ENABLED][google.cloud.kms.v1.CryptoKeyVersion.CryptoKeyVersionState.ENABLED]
+                version can be used for cryptographic operations.
+
+                For security reasons, the raw cryptographic key material
+                represented by a
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                can never be viewed or exported. It can only be used to
+                encrypt, decrypt, or sign data when an authorized user
+                or application invokes Cloud KMS.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([crypto_key_version, update_mask]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.UpdateCryptoKeyVersionRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if crypto_key_version is not None:
+            request.crypto_key_version = crypto_key_version
+        if update_mask is not None:
+            request.update_mask = update_mask
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['update_crypto_key_version']
+
+        # Send the request.
+        try:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            )
+        finally:
+            # Whatever the outcome, cached copies of the version and
+            # of its crypto key, whose primary it may be, are stale.
+            if self._client._metadata_cache is not None:
+                self._client._metadata_cache.invalidate(
+                    request.crypto_key_version.name,
+                    request.crypto_key_version.name.rsplit('/', 2)[0],
+                )
+
+        # Done; return the response.
+        return response
+
+    async def encrypt(self,
+            request: service.EncryptRequest = None,
+            *,
+            name: str = None,
+            plaintext: bytes = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> service.EncryptResponse:
+        r"""Encrypts data, so that it can only be recovered by a call to
+        [Decrypt][google.cloud.kms.v1.KeyManagementService.Decrypt]. The
+        [CryptoKey.purpose][google.cloud.kms.v1.CryptoKey.purpose] must
+        be
+        [ENCRYPT_DECRYPT][google.cloud.kms.v1.CryptoKey.CryptoKeyPurpose.ENCRYPT_DECRYPT].
+
+        Args:
+            request (:class:`~.service.EncryptRequest`):
+                The request object. Request message for
+                [KeyManagementService.Encrypt][google.cloud.kms.v1.KeyManagementService.Encrypt].
+            name (:class:`str`):
+                Required. The resource name of the
+                [CryptoKey][google.cloud.kms.v1.CryptoKey] or
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                to use for encryption.
+
+                If a [CryptoKey][google.cloud.kms.v1.CryptoKey] is
+                specified, the server will use its [primary
+                version][google.cloud.kms.v1.CryptoKey.primary].
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            plaintext (:class:`bytes`):
+                Required. The data to encrypt. Must be no larger than
+                64KiB.
+
+                The maximum size depends on the key version's
+                [protection_level][google.cloud.kms.v1.CryptoKeyVersionTemplate.protection_level].
+                For
+                [SOFTWARE][google.cloud.kms.v1.ProtectionLevel.SOFTWARE]
+                keys, the plaintext must be no larger than 64KiB. For
+                [HSM][google.cloud.kms.v1.ProtectionLevel.HSM] keys, the
+                combined length of the plaintext and
+                additional_authenticated_data fields must be no larger
+                than 8KiB.
+                This corresponds to the ``plaintext`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.service.EncryptResponse:
+                Response message for
+                [KeyManagementService.Encrypt][google.cloud.kms.v1.KeyManagementService.Encrypt].
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([name, plaintext]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.EncryptRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if name is not None:
+            request.name = name
+        if plaintext is not None:
+            request.plaintext = plaintext
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['encrypt']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def decrypt(self,
+            request: service.DecryptRequest = None,
+            *,
+            name: str = None,
+            ciphertext: bytes = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> service.DecryptResponse:
+        r"""Decrypts data that was protected by
+        [Encrypt][google.cloud.kms.v1.KeyManagementService.Encrypt]. The
+        [CryptoKey.purpose][google.cloud.kms.v1.CryptoKey.purpose] must
+        be
+        [ENCRYPT_DECRYPT][google.cloud.kms.v1.CryptoKey.CryptoKeyPurpose.ENCRYPT_DECRYPT].
+
+        Args:
+            request (:class:`~.service.DecryptRequest`):
+                The request object. Request message for
+                [KeyManagementService.Decrypt][google.cloud.kms.v1.KeyManagementService.Decrypt].
+            name (:class:`str`):
+                Required. The resource name of the
+                [CryptoKey][google.cloud.kms.v1.CryptoKey] to use for
+                decryption. The server will choose the appropriate
+                version.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            ciphertext (:class:`bytes`):
+                Required. The encrypted data originally returned in
+                [EncryptResponse.ciphertext][google.cloud.kms.v1.EncryptResponse.ciphertext].
+                This corresponds to the ``ciphertext`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.service.DecryptResponse:
+                Response message for
+                [KeyManagementService.Decrypt][google.cloud.kms.v1.KeyManagementService.Decrypt].
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([name, ciphertext]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.DecryptRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if name is not None:
+            request.name = name
+        if ciphertext is not None:
+            request.ciphertext = ciphertext
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['decrypt']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def asymmetric_sign(self,
+            request: service.AsymmetricSignRequest = None,
+            *,
+            name: str = None,
+            digest: service.Digest = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> service.AsymmetricSignResponse:
+        r"""Signs data using a
+        [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion] with
+        [CryptoKey.purpose][google.cloud.kms.v1.CryptoKey.purpose]
+        ASYMMETRIC_SIGN, producing a signature that can be verified with
+        the public key retrieved from
+        [GetPublicKey][google.cloud.kms.v1.KeyManagementService.GetPublicKey].
+
+        Args:
+            request (:class:`~.service.AsymmetricSignRequest`):
+                The request object. Request message for
+                [KeyManagementService.AsymmetricSign][google.cloud.kms.v1.KeyManagementService.AsymmetricSign].
+            name (:class:`str`):
+                Required. The resource name of the
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                to use for signing.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            digest (:class:`~.service.Digest`):
+                Required. The digest of the data to sign. The digest
+                must be produced with the same digest algorithm as
+                specified by the key version's
+                [algorithm][google.cloud.kms.v1.CryptoKeyVersion.algorithm].
+                This corresponds to the ``digest`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.service.AsymmetricSignResponse:
+                Response message for
+                [KeyManagementService.AsymmetricSign][google.cloud.kms.v1.KeyManagementService.AsymmetricSign].
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([name, digest]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.AsymmetricSignRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if name is not None:
+            request.name = name
+        if digest is not None:
+            request.digest = digest
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['asymmetric_sign']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def asymmetric_decrypt(self,
+            request: service.AsymmetricDecryptRequest = None,
+            *,
+            name: str = None,
+            ciphertext: bytes = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> service.AsymmetricDecryptResponse:
+        r"""Decrypts data that was encrypted with a public key retrieved
+        from
+        [GetPublicKey][google.cloud.kms.v1.KeyManagementService.GetPublicKey]
+        corresponding to a
+        [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion] with
+        [CryptoKey.purpose][google.cloud.kms.v1.CryptoKey.purpose]
+        ASYMMETRIC_DECRYPT.
+
+        Args:
+            request (:class:`~.service.AsymmetricDecryptRequest`):
+                The request object. Request message for
+                [KeyManagementService.AsymmetricDecrypt][google.cloud.kms.v1.KeyManagementService.AsymmetricDecrypt].
+            name (:class:`str`):
+                Required. The resource name of the
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                to use for decryption.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            ciphertext (:class:`bytes`):
+                Required. The data encrypted with the named
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]'s
+                public key using OAEP.
+                This corresponds to the ``ciphertext`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.service.AsymmetricDecryptResponse:
+                Response message for
+                [KeyManagementService.AsymmetricDecrypt][google.cloud.kms.v1.KeyManagementService.AsymmetricDecrypt].
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([name, ciphertext]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.AsymmetricDecryptRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if name is not None:
+            request.name = name
+        if ciphertext is not None:
+            request.ciphertext = ciphertext
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['asymmetric_decrypt']
+
+        # Send the request.
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def update_crypto_key_primary_version(self,
+            request: service.UpdateCryptoKeyPrimaryVersionRequest = None,
+            *,
+            name: str = None,
+            crypto_key_version_id: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> resources.CryptoKey:
+        r"""Update the version of a
+        [CryptoKey][google.cloud.kms.v1.CryptoKey] that will be used in
+        [Encrypt][google.cloud.kms.v1.KeyManagementService.Encrypt].
+
+        Returns an error if called on an asymmetric key.
+
+        Args:
+            request (:class:`~.service.UpdateCryptoKeyPrimaryVersionRequest`):
+                The request object. Request message for
+                [KeyManagementService.UpdateCryptoKeyPrimaryVersion][google.cloud.kms.v1.KeyManagementService.UpdateCryptoKeyPrimaryVersion].
+            name (:class:`str`):
+                Required. The resource name of the
+                [CryptoKey][google.cloud.kms.v1.CryptoKey] to update.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            crypto_key_version_id (:class:`str`):
+                Required. The id of the child
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                to use as primary.
+                This corresponds to the ``crypto_key_version_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.resources.CryptoKey:
+                A [CryptoKey][google.cloud.kms.v1.CryptoKey] represents
+                a logical key that can be used for cryptographic
+                operations.
+
+                A [CryptoKey][google.cloud.kms.v1.CryptoKey] is made up
+                of one or more
+                [versions][google.cloud.kms.v1.CryptoKeyVersion], which
+                represent the actual key material used in cryptographic
+                operations.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([name, crypto_key_version_id]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.UpdateCryptoKeyPrimaryVersionRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if name is not None:
+            request.name = name
+        if crypto_key_version_id is not None:
+            request.crypto_key_version_id = crypto_key_version_id
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['update_crypto_key_primary_version']
+
+        # Send the request.
+        try:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            )
+        finally:
+            # Whatever the outcome, cached copies of the key are stale.
+            if self._client._metadata_cache is not None:
+                self._client._metadata_cache.invalidate(request.name)
+
+        # Done; return the response.
+        return response
+
+    async def destroy_crypto_key_version(self,
+            request: service.DestroyCryptoKeyVersionRequest = None,
+            *,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> resources.CryptoKeyVersion:
+        r"""Schedule a
+        [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion] for
+        destruction.
+
+        Upon calling this method,
+        [CryptoKeyVersion.state][google.cloud.kms.v1.CryptoKeyVersion.state]
+        will be set to
+        [DESTROY_SCHEDULED][google.cloud.kms.v1.CryptoKeyVersion.CryptoKeyVersionState.DESTROY_SCHEDULED]
+        and
+        [destroy_time][google.cloud.kms.v1.CryptoKeyVersion.destroy_time]
+        will be set to a time 24 hours in the future, at which point the
+        [state][google.cloud.kms.v1.CryptoKeyVersion.state] will be
+        changed to
+        [DESTROYED][google.cloud.kms.v1.CryptoKeyVersion.CryptoKeyVersionState.DESTROYED],
+        and the key material will be irrevocably destroyed.
+
+        Before the
+        [destroy_time][google.cloud.kms.v1.CryptoKeyVersion.destroy_time]
+        is reached,
+        [RestoreCryptoKeyVersion][google.cloud.kms.v1.KeyManagementService.RestoreCryptoKeyVersion]
+        may be called to reverse the process.
+
+        Args:
+            request (:class:`~.service.DestroyCryptoKeyVersionRequest`):
+                The request object. Request message for
+                [KeyManagementService.DestroyCryptoKeyVersion][google.cloud.kms.v1.KeyManagementService.DestroyCryptoKeyVersion].
+            name (:class:`str`):
+                Required. The resource name of the
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                to destroy.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.resources.CryptoKeyVersion:
+                A
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                represents an individual cryptographic key, and the
+                associated key material.
+
+                An
+                [ENABLED][google.cloud.kms.v1.CryptoKeyVersion.CryptoKeyVersionState.ENABLED]
+                version can be used for cryptographic operations.
+
+                For security reasons, the raw cryptographic key material
+                represented by a
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                can never be viewed or exported. It can only be used to
+                encrypt, decrypt, or sign data when an authorized user
+                or application invokes Cloud KMS.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.DestroyCryptoKeyVersionRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['destroy_crypto_key_version']
+
+        # Send the request.
+        try:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            )
+        finally:
+            # Whatever the outcome, cached copies of the version and
+            # of its crypto key, whose primary it may be, are stale.
+            if self._client._metadata_cache is not None:
+                self._client._metadata_cache.invalidate(
+                    request.name,
+                    request.name.rsplit('/', 2)[0],
+                )
+
+        # Done; return the response.
+        return response
+
+    async def restore_crypto_key_version(self,
+            request: service.RestoreCryptoKeyVersionRequest = None,
+            *,
+            name: str = None,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> resources.CryptoKeyVersion:
+        r"""Restore a
+        [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion] in the
+        [DESTROY_SCHEDULED][google.cloud.kms.v1.CryptoKeyVersion.CryptoKeyVersionState.DESTROY_SCHEDULED]
+        state.
+
+        Upon restoration of the CryptoKeyVersion,
+        [state][google.cloud.kms.v1.CryptoKeyVersion.state] will be set
+        to
+        [DISABLED][google.cloud.kms.v1.CryptoKeyVersion.CryptoKeyVersionState.DISABLED],
+        and
+        [destroy_time][google.cloud.kms.v1.CryptoKeyVersion.destroy_time]
+        will be cleared.
+
+        Args:
+            request (:class:`~.service.RestoreCryptoKeyVersionRequest`):
+                The request object. Request message for
+                [KeyManagementService.RestoreCryptoKeyVersion][google.cloud.kms.v1.KeyManagementService.RestoreCryptoKeyVersion].
+            name (:class:`str`):
+                Required. The resource name of the
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                to restore.
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.resources.CryptoKeyVersion:
+                A
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                represents an individual cryptographic key, and the
+                associated key material.
+
+                An
+                [ENABLED][google.cloud.kms.v1.CryptoKeyVersion.CryptoKeyVersionState.ENABLED]
+                version can be used for cryptographic operations.
+
+                For security reasons, the raw cryptographic key material
+                represented by a
+                [CryptoKeyVersion][google.cloud.kms.v1.CryptoKeyVersion]
+                can never be viewed or exported. It can only be used to
+                encrypt, decrypt, or sign data when an authorized user
+                or application invokes Cloud KMS.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([name]):
+            raise ValueError('If the `request` argument is set, then none of '
+                             'the individual field arguments should be set.')
+
+        request = service.RestoreCryptoKeyVersionRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if name is not None:
+            request.name = name
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._client._transport._wrapped_methods['restore_crypto_key_version']
+
+        # Send the request.
+        try:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            )
+        finally:
+            # Whatever the outcome, cached copies of the version and
+            # of its crypto key, whose primary it may be, are stale.
+            if self._client._metadata_cache is not None:
+                self._client._metadata_cache.invalidate(
+                    request.name,
+                    request.name.rsplit('/', 2)[0],
+                )
+
+        # Done; return the response.
+        return response
+
+    def encrypt_many(self,
+            items: Iterable[Sequence],
+            *,
+            max_in_flight: int = 32,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> AsyncIterator[batch.BatchResult]:
+        r"""Encrypt many payloads with at most ``max_in_flight`` concurrent
+        [Encrypt][google.cloud.kms.v1.KeyManagementService.Encrypt] calls.
+
+        Args:
+            items (Iterable[Sequence]): ``(name, plaintext)`` or
+                ``(name, plaintext, additional_authenticated_data)`` tuples.
+                The iterable is consumed lazily.
+            max_in_flight (int): The maximum number of concurrent calls.
+                The client's ``concurrency_limiter``, if any, may allow
+                fewer.
+            retry, timeout, metadata: Applied to every call, as for
+                :meth:`encrypt`.
+
+        Returns:
+            AsyncIterator[~.batch.BatchResult]:
+                One :class:`~.batch.BatchResult` per item, in the order of
+                ``items``. A failed call, or a malformed item, sets
+                ``error`` and does not stop the batch.
+
+        Raises:
+            ValueError: If ``max_in_flight`` is less than 1.
+        """
+        return batch.call_many_async(
+            self.encrypt,
+            items,
+            max_in_flight,
+            functools.partial(batch.to_request, 'plaintext'),
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+    def decrypt_many(self,
+            items: Iterable[Sequence],
+            *,
+            max_in_flight: int = 32,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> AsyncIterator[batch.BatchResult]:
+        r"""Decrypt many payloads with at most ``max_in_flight`` concurrent
+        [Decrypt][google.cloud.kms.v1.KeyManagementService.Decrypt] calls.
+
+        Args:
+            items (Iterable[Sequence]): ``(name, ciphertext)`` or
+                ``(name, ciphertext, additional_authenticated_data)`` tuples.
+                The iterable is consumed lazily.
+            max_in_flight (int): The maximum number of concurrent calls.
+                The client's ``concurrency_limiter``, if any, may allow
+                fewer.
+            retry, timeout, metadata: Applied to every call, as for
+                :meth:`decrypt`.
+
+        Returns:
+            AsyncIterator[~.batch.BatchResult]:
+                One :class:`~.batch.BatchResult` per item, in the order of
+                ``items``. A failed call, or a malformed item, sets
+                ``error`` and does not stop the batch.
+
+        Raises:
+            ValueError: If ``max_in_flight`` is less than 1.
+        """
+        return batch.call_many_async(
+            self.decrypt,
+            items,
+            max_in_flight,
+            functools.partial(batch.to_request, 'ciphertext'),
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+    async def warmup(self, timeout: float = None) -> None:
+        r"""Prepare the client for its first call.
+
+        Fetch an access token, create the stub of every RPC method, and
+        connect the channel and wait until it is ready, so that the
+        first calls do not pay for them. It can serve as a readiness
+        probe.
+
+        Args:
+            timeout (Optional[float]): The seconds to wait for the
+                channel, or ``None`` to wait as long as it takes.
+
+        Raises:
+            google.api_core.exceptions.DeadlineExceeded: If the channel
+                is not ready within ``timeout``.
+            google.auth.exceptions.RefreshError: If the access token
+                could not be fetched.
+        """
+        await self._client._transport.warmup(timeout=timeout)
+
+
+__all__ = (
+    'KeyManagementServiceAsyncClient',
+)
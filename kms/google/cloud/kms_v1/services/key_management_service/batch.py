@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Helpers for issuing many independent RPCs with bounded concurrency.
+
+At most ``max_in_flight`` calls are outstanding at any time, results are
+produced in the order of the input, and the input is consumed lazily, so
+arbitrarily long batches run in bounded memory. A failed call, or an
+item that cannot be converted to a request, is reported in its
+:class:`BatchResult` and does not stop the batch.
+"""
+
+import asyncio
+import collections
+from concurrent import futures
+from typing import (Any, AsyncIterator, Awaitable, Callable, Iterable,
+                    Iterator, NamedTuple, Optional, Sequence)
+
+
+BatchItem = Sequence[Any]
+"""A ``(name, data)`` or ``(name, data, additional_authenticated_data)``
+tuple."""
+
+
+class BatchResult(NamedTuple):
+    """The outcome of one call of a batch.
+
+    Attributes:
+        request (Any): The request that was sent, or the item if it
+            could not be converted to a request.
+        response (Any): The response, or ``None`` if the call failed.
+        error (Optional[Exception]): The exception raised by the call or
+            by the conversion, or ``None`` if the call succeeded.
+    """
+    request: Any
+    response: Any
+    error: Optional[Exception]
+
+
+def to_request(data_field: str, item: BatchItem) -> dict:
+    """Convert a batch item to a request dictionary."""
+    if not 2 <= len(item) <= 3:
+        raise ValueError('Batch items must be (name, data) or '
+                         '(name, data, additional_authenticated_data) '
+                         'tuples, got {!r}.'.format(item))
+    request = {'name': item[0], data_field: item[1]}
+    if len(item) == 3:
+        request['additional_authenticated_data'] = item[2]
+    return request
+
+
+def _check_max_in_flight(max_in_flight: int) -> None:
+    if max_in_flight < 1:
+        raise ValueError('max_in_flight must be at least 1.')
+
+
+def _convert(convert: Callable[[Any], Any], item: Any):
+    """Return ``(request, None)``, or ``(item, error)`` if ``convert``
+    fails."""
+    try:
+        return convert(item), None
+    except Exception as exc:
+        return item, exc
+
+
+def call_many(
+        rpc: Callable[..., Any],
+        items: Iterable[Any],
+        max_in_flight: int,
+        convert: Callable[[Any], Any],
+        **kwargs) -> Iterator[BatchResult]:
+    """Call ``rpc(request=..., **kwargs)`` for every item on a thread pool.
+
+    Each item is converted to its request by ``convert``.
+    Closing the returned generator early cancels the calls that have not
+    started yet and waits for the running ones.
+    """
+    _check_max_in_flight(max_in_flight)
+    return _call_many(rpc, items, max_in_flight, convert, kwargs)
+
+
+def _call_many(rpc, items, max_in_flight, convert, kwargs):
+    def result(request, future):
+        try:
+            return BatchResult(request, future.result(), None)
+        except Exception as exc:
+            return BatchResult(request, None, exc)
+
+    pending = collections.deque()  # type: collections.deque
+    executor = futures.ThreadPoolExecutor(max_workers=max_in_flight)
+    try:
+        for item in items:
+            if len(pending) >= max_in_flight:
+                yield result(*pending.popleft())
+            request, error = _convert(convert, item)
+            if error is None:
+                future = executor.submit(rpc, request=request, **kwargs)
+            else:
+                future = futures.Future()
+                future.set_exception(error)
+            pending.append((request, future))
+        while pending:
+            yield result(*pending.popleft())
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def call_many_async(
+        rpc: Callable[..., Awaitable[Any]],
+        items: Iterable[Any],
+        max_in_flight: int,
+        convert: Callable[[Any], Any],
+        **kwargs) -> AsyncIterator[BatchResult]:
+    """Await ``rpc(request=..., **kwargs)`` for every item as tasks.
+
+    Each item is converted to its request by ``convert``.
+    Closing the returned asynchronous generator early cancels the calls
+    still in flight.
+    """
+    _check_max_in_flight(max_in_flight)
+    return _call_many_async(rpc, items, max_in_flight, convert, kwargs)
+
+
+async def _call_many_async(rpc, items, max_in_flight, convert, kwargs):
+    async def result(request, task, error):
+        if error is not None:
+            return BatchResult(request, None, error)
+        try:
+            return BatchResult(request, await task, None)
+        except Exception as exc:
+            return BatchResult(request, None, exc)
+
+    pending = collections.deque()  # type: collections.deque
+    try:
+        for item in items:
+            if len(pending) >= max_in_flight:
+                yield await result(*pending.popleft())
+            request, error = _convert(convert, item)
+            task = None
+            if error is None:
+                task = asyncio.ensure_future(rpc(request=request, **kwargs))
+            pending.append((request, task, error))
+        while pending:
+            yield await result(*pending.popleft())
+    finally:
+        for _, task, _ in pending:
+            if task is not None:
+                task.cancel()
+
+
+__all__ = (
+    'BatchResult',
+)
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""A client-side cache of resource metadata.
+
+The client consults a :class:`MetadataCache`, when one is configured, in
+``get_key_ring``, ``get_crypto_key``, ``get_crypto_key_version`` and
+``get_import_job``, and invalidates its entries whenever it modifies the
+corresponding resource. Changes made through other clients are seen
+once the entries expire.
+"""
+
+import collections
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+DEFAULT_TTLS = {
+    'get_key_ring': 600.0,
+    'get_crypto_key': 60.0,
+    'get_crypto_key_version': 60.0,
+    'get_import_job': 60.0,
+}
+"""The default number of seconds for which each method's responses are
+reused. Key rings cannot be modified, hence their longer lifetime."""
+
+
+class MetadataCache:
+    """A thread-safe TTL and LRU cache of ``get_*`` responses, by name.
+
+    Args:
+        ttls (Dict[str, float]): The number of seconds for which the
+            responses of each method are reused, overriding
+            :data:`DEFAULT_TTLS`. A TTL of ``0`` disables caching for
+            that method.
+        max_size (int): The maximum number of entries kept per method;
+            the least recently used ones are evicted first.
+
+    Raises:
+        ValueError: If ``ttls`` names an uncached method, or
+            ``max_size`` is less than 1.
+    """
+    def __init__(self, ttls: Dict[str, float] = None, max_size: int = 1024) -> None:
+        unknown = set(ttls or ()) - set(DEFAULT_TTLS)
+        if unknown:
+            raise ValueError('Cannot cache {}.'.format(', '.join(sorted(unknown))))
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1.')
+        self._ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self._max_size = max_size
+        self._entries = {method: collections.OrderedDict() for method in DEFAULT_TTLS}
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def generation(self) -> int:
+        """A counter advanced by every :meth:`invalidate`.
+
+        Pass its value from before a ``get`` RPC to :meth:`put`, so that
+        a response that may predate a concurrent modification is not
+        cached.
+        """
+        return self._generation
+
+    def get(self, method: str, name: str) -> Optional[Any]:
+        """Return a copy of the cached response, or ``None``."""
+        with self._lock:
+            entries = self._entries[method]
+            entry = entries.get(name)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del entries[name]
+                self.misses += 1
+                return None
+            entries.move_to_end(name)
+            self.hits += 1
+            response = entry[1]
+        # Hand out a copy, so that callers may modify what they get.
+        return type(response)(response)
+
+    def put(self, method: str, name: str, response: Any, generation: int) -> None:
+        """Cache ``response`` unless an invalidation happened since ``generation``."""
+        ttl = self._ttls[method]
+        if ttl <= 0:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            entries = self._entries[method]
+            entries[name] = (time.monotonic() + ttl, type(response)(response))
+            entries.move_to_end(name)
+            while len(entries) > self._max_size:
+                entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, *names: str) -> None:
+        """Drop the entries of the given resources, or of all if none is given."""
+        with self._lock:
+            self._generation += 1
+            for entries in self._entries.values():
+                if not names:
+                    entries.clear()
+                for name in names:
+                    entries.pop(name, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit, miss and eviction counts and the current size."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': sum(len(e) for e in self._entries.values()),
+            }
+
+
+def from_option(option) -> Optional[MetadataCache]:
+    """Resolve the ``metadata_cache`` client option."""
+    if isinstance(option, MetadataCache):
+        return option
+    if option:
+        return MetadataCache()
+    return None
+
+
+__all__ = (
+    'DEFAULT_TTLS',
+    'MetadataCache',
+)
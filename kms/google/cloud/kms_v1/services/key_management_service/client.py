@@ -16,9 +16,9 @@
 #
 
 from collections import OrderedDict
+import functools
 import re
-from typing import Callable, Dict, Sequence, Tuple, Type, Union
-import pkg_resources
+from typing import Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Type, Union
 
 import google.api_core.client_options as ClientOptions # type: ignore
 from google.api_core import exceptions                 # type: ignore
@@ -27,7 +27,14 @@ from google.api_core import retry as retries           # type: ignore
 from google.auth import credentials                    # type: ignore
 from google.oauth2 import service_account              # type: ignore
 
+from google.cloud.kms_v1.services.key_management_service import batch
+from google.cloud.kms_v1.services.key_management_service import cache
+from google.cloud.kms_v1.services.key_management_service import concurrency
+from google.cloud.kms_v1.services.key_management_service import hedging
 from google.cloud.kms_v1.services.key_management_service import pagers
+from google.cloud.kms_v1.services.key_management_service import ratelimit
+from google.cloud.kms_v1.services.key_management_service.transports import metrics
+from google.cloud.kms_v1.services.key_management_service.transports import refresh
 from google.cloud.kms_v1.types import resources
 from google.cloud.kms_v1.types import service
 from google.protobuf import duration_pb2 as duration  # type: ignore
@@ -36,6 +43,8 @@ from google.protobuf import timestamp_pb2 as timestamp  # type: ignore
 
 from .transports.base import KeyManagementServiceTransport
 from .transports.grpc import KeyManagementServiceGrpcTransport
+from .transports.grpc_asyncio import KeyManagementServiceGrpcAsyncIOTransport
+from .transports.interceptors import Interceptor
 
 
 class KeyManagementServiceClientMeta(type):
@@ -47,6 +56,7 @@ class KeyManagementServiceClientMeta(type):
     """
     _transport_registry = OrderedDict()  # type: Dict[str, Type[KeyManagementServiceTransport]]
     _transport_registry['grpc'] = KeyManagementServiceGrpcTransport
+    _transport_registry['grpc_asyncio'] = KeyManagementServiceGrpcAsyncIOTransport
 
     def get_transport_class(cls,
             label: str = None,
@@ -184,6 +194,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             credentials: credentials.Credentials = None,
             transport: Union[str, KeyManagementServiceTransport] = None,
             client_options: ClientOptions = None,
+            interceptors: Sequence[Interceptor] = (),
             ) -> None:
         """Instantiate the key management service client.
 
@@ -204,22 +215,101 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
                 is provided, mutual TLS transport will be created with the given
                 ``api_endpoint`` or the default mTLS endpoint, and the client
                 SSL credentials obtained from ``client_cert_source``.
+                (3) The ``method_configs`` property, or dictionary key, can
+                be used to override the default retry and timeout of each
+                RPC method, e.g. ``{'decrypt': {'timeout': 5.0}}``.
+                ``{'decrypt': {'coalesce': True}}`` makes identical
+                concurrent requests of a side-effect free method share
+                one call.
+                (4) The ``metadata_cache`` property, or dictionary key, can
+                be set to ``True`` or to a :class:`~.cache.MetadataCache`
+                to cache the responses of ``get_key_ring``,
+                ``get_crypto_key``, ``get_crypto_key_version`` and
+                ``get_import_job``. Entries are invalidated when this
+                client modifies the resource.
+                (5) The ``rate_limiter`` property, or dictionary key, can
+                be set to ``True`` or to a :class:`~.ratelimit.RateLimiter`
+                to delay requests, retries and hedged requests included,
+                so that they stay within the KMS read, write and
+                cryptographic request quotas.
+                (6) The ``concurrency_limiter`` property, or dictionary
+                key, can be set to ``True`` or to a
+                :class:`~.concurrency.AdaptiveLimiter` to adapt the
+                number of requests in flight, including retries, hedged
+                requests and those of ``encrypt_many`` and
+                ``decrypt_many``, to the service's load.
+                (7) The ``hedging`` property, or dictionary key, can be
+                set to ``True`` or to a :class:`~.hedging.HedgingPolicy`
+                to send a second request when a call of ``decrypt``,
+                ``get_public_key`` or ``get_crypto_key_version``, or of
+                the policy's methods, is slower than most, and use the
+                first response.
+                (8) The ``metrics`` property, or dictionary key, can be
+                set to ``True`` or to a :class:`~.metrics.TransportMetrics`
+                to record the calls, status codes, calls in flight and
+                latencies of each method, available from the transport's
+                ``metrics``.
+                (9) The ``interceptors`` property, or dictionary key, can
+                hold more interceptors, which run inside those given as
+                the ``interceptors`` argument.
+                (10) The ``refresh_credentials`` property, or dictionary
+                key, can be set to ``True`` or to a number of seconds to
+                refresh the access token in a background thread that
+                long before it expires, by default
+                :data:`~.refresh.DEFAULT_MARGIN`, rather than on a call.
+                Clients built from the same credentials share the token.
+            interceptors (Sequence[~.interceptors.Interceptor]): The
+                interceptors every call of the client passes through, in
+                order, the first one outermost.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
                 creation failed for any reason.
+            ValueError: If ``method_configs`` names an unknown RPC method or
+                setting, or ``hedging`` a method with side effects; or if
+                options that wrap the RPC methods are given along with a
+                transport instance that another client uses.
         """
         if isinstance(client_options, dict):
+            client_options = dict(client_options)
+            method_configs = client_options.pop('method_configs', None)
+            more_interceptors = client_options.pop('interceptors', ())
+            metadata_cache = client_options.pop('metadata_cache', None)
+            rate_limiter = client_options.pop('rate_limiter', None)
+            concurrency_limiter = client_options.pop('concurrency_limiter', None)
+            hedging_policy = client_options.pop('hedging', None)
+            transport_metrics = client_options.pop('metrics', None)
+            refresh_credentials = client_options.pop('refresh_credentials', None)
             client_options = ClientOptions.from_dict(client_options)
+        else:
+            method_configs = getattr(client_options, 'method_configs', None)
+            more_interceptors = getattr(client_options, 'interceptors', ())
+            metadata_cache = getattr(client_options, 'metadata_cache', None)
+            rate_limiter = getattr(client_options, 'rate_limiter', None)
+            concurrency_limiter = getattr(client_options, 'concurrency_limiter', None)
+            hedging_policy = getattr(client_options, 'hedging', None)
+            transport_metrics = getattr(client_options, 'metrics', None)
+            refresh_credentials = getattr(client_options, 'refresh_credentials', None)
+        self._metadata_cache = cache.from_option(metadata_cache)
 
         # Save or instantiate the transport.
         # Ordinarily, we provide the transport, but allowing a custom transport
         # instance provides an extensibility point for unusual situations.
+        prepared = False
         if isinstance(transport, KeyManagementServiceTransport):
             # transport is a KeyManagementServiceTransport instance.
             if credentials:
                 raise ValueError('When providing a transport instance, '
                                  'provide its credentials directly.')
+            # The methods of a transport that another client uses are
+            # wrapped already, with that client's options.
+            prepared = hasattr(transport, '_wrapped_methods')
+            if prepared and any((
+                    method_configs, rate_limiter, concurrency_limiter, hedging_policy,
+                    transport_metrics, interceptors, more_interceptors)):
+                raise ValueError('When providing a transport instance that '
+                                 'another client uses, configure its methods '
+                                 'on that client.')
             self._transport = transport
         elif client_options is None or (
             client_options.api_endpoint is None
@@ -249,20 +339,40 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
                 else self.DEFAULT_ENDPOINT
             )
 
-            self._transport = KeyManagementServiceGrpcTransport(
+            Transport = type(self).get_transport_class(transport)
+            self._transport = Transport(
                 credentials=credentials,
                 host=api_endpoint,
                 api_mtls_endpoint=api_mtls_endpoint,
                 client_cert_source=client_options.client_cert_source,
             )
 
+        # Refresh the access token ahead of its expiry, if so configured.
+        margin = refresh.from_option(refresh_credentials)
+        if margin is not None:
+            self._transport._refresh_in_background(margin)
+
+        # Wrap each RPC method once for this transport instead of on
+        # every call.
+        if not prepared:
+            self._transport._prep_wrapped_messages(
+                _client_info,
+                method_configs=method_configs,
+                rate_limiter=ratelimit.from_option(rate_limiter),
+                concurrency_limiter=concurrency.from_option(concurrency_limiter),
+                hedging=hedging.from_option(hedging_policy),
+                metrics=metrics.from_option(transport_metrics),
+                interceptors=tuple(interceptors) + tuple(more_interceptors or ()),
+            )
+
     def list_key_rings(self,
             request: service.ListKeyRingsRequest = None,
             *,
             parent: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
+            prefetch: int = 0,
             ) -> pagers.ListKeyRingsPager:
         r"""Lists [KeyRings][google.cloud.kms.v1.KeyRing].
 
@@ -283,6 +393,8 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of further pages to fetch in the
+                background while iterating over the current one.
 
         Returns:
             ~.pagers.ListKeyRingsPager:
@@ -308,20 +420,14 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if parent is not None:
             request.parent = parent
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.list_key_rings,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['list_key_rings']
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((
-                ('parent', request.parent),
-            )),
+            _routing_metadata('parent', request.parent),
         )
 
         # Send the request.
@@ -338,6 +444,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             method=rpc,
             request=request,
             response=response,
+            prefetch=prefetch,
         )
 
         # Done; return the response.
@@ -348,8 +455,9 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             *,
             parent: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
+            prefetch: int = 0,
             ) -> pagers.ListCryptoKeysPager:
         r"""Lists [CryptoKeys][google.cloud.kms.v1.CryptoKey].
 
@@ -370,6 +478,8 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of further pages to fetch in the
+                background while iterating over the current one.
 
         Returns:
             ~.pagers.ListCryptoKeysPager:
@@ -395,20 +505,14 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if parent is not None:
             request.parent = parent
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.list_crypto_keys,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['list_crypto_keys']
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((
-                ('parent', request.parent),
-            )),
+            _routing_metadata('parent', request.parent),
         )
 
         # Send the request.
@@ -425,6 +529,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             method=rpc,
             request=request,
             response=response,
+            prefetch=prefetch,
         )
 
         # Done; return the response.
@@ -435,8 +540,9 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             *,
             parent: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
+            prefetch: int = 0,
             ) -> pagers.ListCryptoKeyVersionsPager:
         r"""Lists [CryptoKeyVersions][google.cloud.kms.v1.CryptoKeyVersion].
 
@@ -458,6 +564,8 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of further pages to fetch in the
+                background while iterating over the current one.
 
         Returns:
             ~.pagers.ListCryptoKeyVersionsPager:
@@ -483,20 +591,14 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if parent is not None:
             request.parent = parent
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.list_crypto_key_versions,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['list_crypto_key_versions']
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((
-                ('parent', request.parent),
-            )),
+            _routing_metadata('parent', request.parent),
         )
 
         # Send the request.
@@ -513,6 +615,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             method=rpc,
             request=request,
             response=response,
+            prefetch=prefetch,
         )
 
         # Done; return the response.
@@ -523,8 +626,9 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             *,
             parent: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
+            prefetch: int = 0,
             ) -> pagers.ListImportJobsPager:
         r"""Lists [ImportJobs][google.cloud.kms.v1.ImportJob].
 
@@ -545,6 +649,8 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of further pages to fetch in the
+                background while iterating over the current one.
 
         Returns:
             ~.pagers.ListImportJobsPager:
@@ -570,20 +676,14 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if parent is not None:
             request.parent = parent
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.list_import_jobs,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['list_import_jobs']
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((
-                ('parent', request.parent),
-            )),
+            _routing_metadata('parent', request.parent),
         )
 
         # Send the request.
@@ -600,6 +700,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             method=rpc,
             request=request,
             response=response,
+            prefetch=prefetch,
         )
 
         # Done; return the response.
@@ -610,7 +711,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             *,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> resources.KeyRing:
         r"""Returns metadata for a given
@@ -655,20 +756,22 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.get_key_ring,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Serve the response from the metadata cache, if enabled.
+        metadata_cache = self._metadata_cache
+        if metadata_cache is not None:
+            cached = metadata_cache.get('get_key_ring', request.name)
+            if cached is not None:
+                return cached
+            generation = metadata_cache.generation
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['get_key_ring']
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((
-                ('name', request.name),
-            )),
+            _routing_metadata('name', request.name),
         )
 
         # Send the request.
@@ -679,6 +782,9 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             metadata=metadata,
         )
 
+        if metadata_cache is not None:
+            metadata_cache.put('get_key_ring', request.name, response, generation)
+
         # Done; return the response.
         return response
 
@@ -687,7 +793,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             *,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> resources.CryptoKey:
         r"""Returns metadata for a given
@@ -741,20 +847,22 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.get_crypto_key,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Serve the response from the metadata cache, if enabled.
+        metadata_cache = self._metadata_cache
+        if metadata_cache is not None:
+            cached = metadata_cache.get('get_crypto_key', request.name)
+            if cached is not None:
+                return cached
+            generation = metadata_cache.generation
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['get_crypto_key']
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((
-                ('name', request.name),
-            )),
+            _routing_metadata('name', request.name),
         )
 
         # Send the request.
@@ -765,6 +873,9 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             metadata=metadata,
         )
 
+        if metadata_cache is not None:
+            metadata_cache.put('get_crypto_key', request.name, response, generation)
+
         # Done; return the response.
         return response
 
@@ -773,7 +884,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             *,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> resources.CryptoKeyVersion:
         r"""Returns metadata for a given
@@ -832,20 +943,22 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.get_crypto_key_version,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Serve the response from the metadata cache, if enabled.
+        metadata_cache = self._metadata_cache
+        if metadata_cache is not None:
+            cached = metadata_cache.get('get_crypto_key_version', request.name)
+            if cached is not None:
+                return cached
+            generation = metadata_cache.generation
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['get_crypto_key_version']
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((
-                ('name', request.name),
-            )),
+            _routing_metadata('name', request.name),
         )
 
         # Send the request.
@@ -856,6 +969,9 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             metadata=metadata,
         )
 
+        if metadata_cache is not None:
+            metadata_cache.put('get_crypto_key_version', request.name, response, generation)
+
         # Done; return the response.
         return response
 
@@ -864,7 +980,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             *,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> resources.PublicKey:
         r"""Returns the public key for the given
@@ -917,20 +1033,14 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.get_public_key,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['get_public_key']
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((
-                ('name', request.name),
-            )),
+            _routing_metadata('name', request.name),
         )
 
         # Send the request.
@@ -949,7 +1059,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             *,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> resources.ImportJob:
         r"""Returns metadata for a given
@@ -1037,20 +1147,22 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.get_import_job,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Serve the response from the metadata cache, if enabled.
+        metadata_cache = self._metadata_cache
+        if metadata_cache is not None:
+            cached = metadata_cache.get('get_import_job', request.name)
+            if cached is not None:
+                return cached
+            generation = metadata_cache.generation
+
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['get_import_job']
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((
-                ('name', request.name),
-            )),
+            _routing_metadata('name', request.name),
         )
 
         # Send the request.
@@ -1061,6 +1173,9 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             metadata=metadata,
         )
 
+        if metadata_cache is not None:
+            metadata_cache.put('get_import_job', request.name, response, generation)
+
         # Done; return the response.
         return response
 
@@ -1071,7 +1186,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             key_ring_id: str = None,
             key_ring: resources.KeyRing = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> resources.KeyRing:
         r"""Create a new [KeyRing][google.cloud.kms.v1.KeyRing] in a given
@@ -1133,13 +1248,9 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if key_ring is not None:
             request.key_ring = key_ring
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.create_key_ring,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['create_key_ring']
 
         # Send the request.
         response = rpc(
@@ -1159,7 +1270,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             crypto_key_id: str = None,
             crypto_key: resources.CryptoKey = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> resources.CryptoKey:
         r"""Create a new [CryptoKey][google.cloud.kms.v1.CryptoKey] within a
@@ -1231,13 +1342,9 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if crypto_key is not None:
             request.crypto_key = crypto_key
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.create_crypto_key,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['create_crypto_key']
 
         # Send the request.
         response = rpc(
@@ -1256,7 +1363,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             parent: str = None,
             crypto_key_version: resources.CryptoKeyVersion = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> resources.CryptoKeyVersion:
         r"""Create a new
@@ -1330,13 +1437,9 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if crypto_key_version is not None:
             request.crypto_key_version = crypto_key_version
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.create_crypto_key_version,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['create_crypto_key_version']
 
         # Send the request.
         response = rpc(
@@ -1353,7 +1456,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             request: service.ImportCryptoKeyVersionRequest = None,
             *,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> resources.CryptoKeyVersion:
         r"""Imports a new
@@ -1398,13 +1501,9 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
 
         request = service.ImportCryptoKeyVersionRequest(request)
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.import_crypto_key_version,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['import_crypto_key_version']
 
         # Send the request.
         response = rpc(
@@ -1424,7 +1523,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             import_job_id: str = None,
             import_job: resources.ImportJob = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> resources.ImportJob:
         r"""Create a new [ImportJob][google.cloud.kms.v1.ImportJob] within a
@@ -1531,13 +1630,9 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if import_job is not None:
             request.import_job = import_job
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.create_import_job,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['create_import_job']
 
         # Send the request.
         response = rpc(
@@ -1556,7 +1651,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             crypto_key: resources.CryptoKey = None,
             update_mask: field_mask.FieldMask = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> resources.CryptoKey:
         r"""Update a [CryptoKey][google.cloud.kms.v1.CryptoKey].
@@ -1614,21 +1709,22 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if update_mask is not None:
             request.update_mask = update_mask
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.update_crypto_key,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['update_crypto_key']
 
         # Send the request.
-        response = rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        try:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            )
+        finally:
+            # Whatever the outcome, cached copies of the key are stale.
+            if self._metadata_cache is not None:
+                self._metadata_cache.invalidate(request.crypto_key.name)
 
         # Done; return the response.
         return response
@@ -1639,7 +1735,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             crypto_key_version: resources.CryptoKeyVersion = None,
             update_mask: field_mask.FieldMask = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> resources.CryptoKeyVersion:
         r"""Update a
@@ -1717,21 +1813,26 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if update_mask is not None:
             request.update_mask = update_mask
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.update_crypto_key_version,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['update_crypto_key_version']
 
         # Send the request.
-        response = rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        try:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            )
+        finally:
+            # Whatever the outcome, cached copies of the version and
+            # of its crypto key, whose primary it may be, are stale.
+            if self._metadata_cache is not None:
+                self._metadata_cache.invalidate(
+                    request.crypto_key_version.name,
+                    request.crypto_key_version.name.rsplit('/', 2)[0],
+                )
 
         # Done; return the response.
         return response
@@ -1742,7 +1843,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             name: str = None,
             plaintext: bytes = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> service.EncryptResponse:
         r"""Encrypts data, so that it can only be recovered by a call to
@@ -1813,13 +1914,9 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if plaintext is not None:
             request.plaintext = plaintext
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.encrypt,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['encrypt']
 
         # Send the request.
         response = rpc(
@@ -1838,7 +1935,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             name: str = None,
             ciphertext: bytes = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> service.DecryptResponse:
         r"""Decrypts data that was protected by
@@ -1895,13 +1992,9 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if ciphertext is not None:
             request.ciphertext = ciphertext
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.decrypt,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['decrypt']
 
         # Send the request.
         response = rpc(
@@ -1920,7 +2013,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             name: str = None,
             digest: service.Digest = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> service.AsymmetricSignResponse:
         r"""Signs data using a
@@ -1979,13 +2072,9 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if digest is not None:
             request.digest = digest
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.asymmetric_sign,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['asymmetric_sign']
 
         # Send the request.
         response = rpc(
@@ -2004,7 +2093,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             name: str = None,
             ciphertext: bytes = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> service.AsymmetricDecryptResponse:
         r"""Decrypts data that was encrypted with a public key retrieved
@@ -2063,13 +2152,9 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if ciphertext is not None:
             request.ciphertext = ciphertext
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.asymmetric_decrypt,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['asymmetric_decrypt']
 
         # Send the request.
         response = rpc(
@@ -2088,7 +2173,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             name: str = None,
             crypto_key_version_id: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> resources.CryptoKey:
         r"""Update the version of a
@@ -2151,21 +2236,22 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if crypto_key_version_id is not None:
             request.crypto_key_version_id = crypto_key_version_id
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.update_crypto_key_primary_version,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['update_crypto_key_primary_version']
 
         # Send the request.
-        response = rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        try:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            )
+        finally:
+            # Whatever the outcome, cached copies of the key are stale.
+            if self._metadata_cache is not None:
+                self._metadata_cache.invalidate(request.name)
 
         # Done; return the response.
         return response
@@ -2175,7 +2261,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             *,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> resources.CryptoKeyVersion:
         r"""Schedule a
@@ -2252,21 +2338,26 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.destroy_crypto_key_version,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['destroy_crypto_key_version']
 
         # Send the request.
-        response = rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        try:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            )
+        finally:
+            # Whatever the outcome, cached copies of the version and
+            # of its crypto key, whose primary it may be, are stale.
+            if self._metadata_cache is not None:
+                self._metadata_cache.invalidate(
+                    request.name,
+                    request.name.rsplit('/', 2)[0],
+                )
 
         # Done; return the response.
         return response
@@ -2276,7 +2367,7 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
             *,
             name: str = None,
             retry: retries.Retry = gapic_v1.method.DEFAULT,
-            timeout: float = None,
+            timeout: float = gapic_v1.method.DEFAULT,
             metadata: Sequence[Tuple[str, str]] = (),
             ) -> resources.CryptoKeyVersion:
         r"""Restore a
@@ -2344,37 +2435,174 @@ class KeyManagementServiceClient(metaclass=KeyManagementServiceClientMeta):
         if name is not None:
             request.name = name
 
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.restore_crypto_key_version,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        # Fetch the RPC method, wrapped once per transport; this adds
+        # retry and timeout information, and friendly error handling.
+        rpc = self._transport._wrapped_methods['restore_crypto_key_version']
 
         # Send the request.
-        response = rpc(
-            request,
+        try:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            )
+        finally:
+            # Whatever the outcome, cached copies of the version and
+            # of its crypto key, whose primary it may be, are stale.
+            if self._metadata_cache is not None:
+                self._metadata_cache.invalidate(
+                    request.name,
+                    request.name.rsplit('/', 2)[0],
+                )
+
+        # Done; return the response.
+        return response
+
+    def encrypt_many(self,
+            items: Iterable[Sequence],
+            *,
+            max_in_flight: int = 32,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> Iterator[batch.BatchResult]:
+        r"""Encrypt many payloads with at most ``max_in_flight`` concurrent
+        [Encrypt][google.cloud.kms.v1.KeyManagementService.Encrypt] calls.
+
+        Args:
+            items (Iterable[Sequence]): ``(name, plaintext)`` or
+                ``(name, plaintext, additional_authenticated_data)`` tuples.
+                The iterable is consumed lazily.
+            max_in_flight (int): The maximum number of concurrent calls.
+                The client's ``concurrency_limiter``, if any, may allow
+                fewer.
+            retry, timeout, metadata: Applied to every call, as for
+                :meth:`encrypt`.
+
+        Returns:
+            Iterator[~.batch.BatchResult]:
+                One :class:`~.batch.BatchResult` per item, in the order of
+                ``items``. A failed call, or a malformed item, sets
+                ``error`` and does not stop the batch.
+
+        Raises:
+            ValueError: If ``max_in_flight`` is less than 1.
+        """
+        return batch.call_many(
+            self.encrypt,
+            items,
+            max_in_flight,
+            functools.partial(batch.to_request, 'plaintext'),
             retry=retry,
             timeout=timeout,
             metadata=metadata,
         )
 
-        # Done; return the response.
-        return response
+    def decrypt_many(self,
+            items: Iterable[Sequence],
+            *,
+            max_in_flight: int = 32,
+            retry: retries.Retry = gapic_v1.method.DEFAULT,
+            timeout: float = gapic_v1.method.DEFAULT,
+            metadata: Sequence[Tuple[str, str]] = (),
+            ) -> Iterator[batch.BatchResult]:
+        r"""Decrypt many payloads with at most ``max_in_flight`` concurrent
+        [Decrypt][google.cloud.kms.v1.KeyManagementService.Decrypt] calls.
 
+        Args:
+            items (Iterable[Sequence]): ``(name, ciphertext)`` or
+                ``(name, ciphertext, additional_authenticated_data)`` tuples.
+                The iterable is consumed lazily.
+            max_in_flight (int): The maximum number of concurrent calls.
+                The client's ``concurrency_limiter``, if any, may allow
+                fewer.
+            retry, timeout, metadata: Applied to every call, as for
+                :meth:`decrypt`.
 
+        Returns:
+            Iterator[~.batch.BatchResult]:
+                One :class:`~.batch.BatchResult` per item, in the order of
+                ``items``. A failed call, or a malformed item, sets
+                ``error`` and does not stop the batch.
 
+        Raises:
+            ValueError: If ``max_in_flight`` is less than 1.
+        """
+        return batch.call_many(
+            self.decrypt,
+            items,
+            max_in_flight,
+            functools.partial(batch.to_request, 'ciphertext'),
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
 
+    def warmup(self, timeout: float = None) -> None:
+        r"""Prepare the client for its first call.
 
-try:
-    _client_info = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution(
-            'google-cloud-kms',
-        ).version,
-    )
-except pkg_resources.DistributionNotFound:
-    _client_info = gapic_v1.client_info.ClientInfo()
+        Fetch an access token, create the stub of every RPC method, and
+        connect the channel and wait until it is ready, so that the
+        first calls do not pay for them. It can serve as a readiness
+        probe.
+
+        Args:
+            timeout (Optional[float]): The seconds to wait for the
+                channel, or ``None`` to wait as long as it takes.
+
+        Raises:
+            google.api_core.exceptions.DeadlineExceeded: If the channel
+                is not ready within ``timeout``.
+            google.auth.exceptions.RefreshError: If the access token
+                could not be fetched.
+        """
+        self._transport.warmup(timeout=timeout)
+
+
+@functools.lru_cache(maxsize=1024)
+def _routing_metadata(key: str, value: str) -> Tuple[str, str]:
+    """Return the routing header for a single request field.
+
+    The same resource names are sent over and over, so the encoded
+    header is cached instead of being rebuilt for every request.
+    """
+    return gapic_v1.routing_header.to_grpc_metadata(((key, value),))
+
+
+@functools.lru_cache(maxsize=None)
+def _distribution_version() -> Optional[str]:
+    """Return the version of the installed distribution, if it is installed.
+
+    Scanning the installed distributions is slow, so it is done when the
+    first call builds its user agent rather than on import.
+    """
+    try:
+        from importlib import metadata
+    except ImportError:  # pragma: NO COVER
+        # Python < 3.8.
+        import pkg_resources
+        try:
+            return pkg_resources.get_distribution('google-cloud-kms').version
+        except pkg_resources.DistributionNotFound:
+            return None
+    try:
+        return metadata.version('google-cloud-kms')
+    except metadata.PackageNotFoundError:
+        return None
+
+
+class _ClientInfo(gapic_v1.client_info.ClientInfo):
+    """Client info whose ``gapic_version`` defaults to the version of the
+    installed distribution, looked up when the user agent is first built."""
+
+    def to_user_agent(self) -> str:
+        if self.gapic_version is None:
+            self.gapic_version = _distribution_version()
+        return super().to_user_agent()
+
+
+_client_info = _ClientInfo()
 
 
 __all__ = (
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""An adaptive limit on the number of calls in flight.
+
+:class:`AdaptiveLimiter` follows additive-increase, multiplicative-
+decrease (AIMD). While calls succeed at the usual latency and the limit
+is being used, the limit grows by about one per round of calls. It is
+cut when the service answers ``RESOURCE_EXHAUSTED``, or when the recent
+latency rises well above its long-term average, a sign that requests
+queue up somewhere. Only calls sent after the last cut can cause
+another one, so a burst of slow or throttled responses shrinks the
+limit once rather than collapsing it.
+
+Calls beyond the limit wait, in order of arrival, for a call to
+complete. Threads block; coroutines await.
+"""
+
+import asyncio
+import collections
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from google.api_core import exceptions  # type: ignore
+
+
+# The weights of a new latency sample in the short- and long-term
+# moving averages.
+_SHORT_WEIGHT = 0.2
+_LONG_WEIGHT = 0.01
+
+
+class _Waiter:
+    """A call waiting for a slot, granted by :meth:`AdaptiveLimiter._wake`."""
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        self.granted = False
+        self.loop = loop
+        if loop is None:
+            self.event = threading.Event()
+        else:
+            self.future = loop.create_future()
+
+    def grant(self) -> None:
+        self.granted = True
+        if self.loop is None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self) -> None:
+        if not self.future.done():
+            self.future.set_result(None)
+
+
+class AdaptiveLimiter:
+    """Limit the calls in flight, adapting the limit to the service's load.
+
+    One limiter can be shared by several clients, which then share their
+    limit.
+
+    Args:
+        initial_limit (int): The limit to start from.
+        min_limit (int): The lowest the limit can go.
+        max_limit (int): The highest the limit can go.
+        backoff (float): The factor applied to the limit when latency
+            rises.
+        throttled_backoff (float): The factor applied to the limit on
+            ``RESOURCE_EXHAUSTED``.
+        latency_tolerance (float): How many times its long-term average
+            the recent latency may reach before the limit is cut.
+
+    Raises:
+        ValueError: If the limits are not ``1 <= min_limit <=
+            initial_limit <= max_limit``, a backoff is not between 0 and
+            1, or ``latency_tolerance`` is less than 1.
+    """
+    def __init__(self,
+            initial_limit: int = 16,
+            *,
+            min_limit: int = 1,
+            max_limit: int = 1000,
+            backoff: float = 0.9,
+            throttled_backoff: float = 0.5,
+            latency_tolerance: float = 2.0) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError('The limits must satisfy 1 <= min_limit <= '
+                             'initial_limit <= max_limit.')
+        if not (0 < backoff < 1 and 0 < throttled_backoff < 1):
+            raise ValueError('backoff and throttled_backoff must be between 0 and 1.')
+        if latency_tolerance < 1:
+            raise ValueError('latency_tolerance must be at least 1.')
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._backoff = backoff
+        self._throttled_backoff = throttled_backoff
+        self._latency_tolerance = latency_tolerance
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiters = collections.deque()  # type: collections.deque
+        self._short_latency = None  # type: Optional[float]
+        self._long_latency = None  # type: Optional[float]
+        self._decreased_at = float('-inf')
+        self._decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """The current number of calls allowed in flight."""
+        return int(self._limit)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the ``limit``, the calls ``in_flight`` and ``waiting``,
+        the number of ``decreases``, and the short- and long-term average
+        latencies in seconds."""
+        with self._lock:
+            return {
+                'limit': int(self._limit),
+                'in_flight': self._in_flight,
+                'waiting': len(self._waiters),
+                'decreases': self._decreases,
+                'short_latency': self._short_latency,
+                'long_latency': self._long_latency,
+            }
+
+    def _try_acquire(self, waiter_loop=None) -> Optional[_Waiter]:
+        """Take a slot, or return a queued waiter if there is none."""
+        with self._lock:
+            if not self._waiters and self._in_flight < int(self._limit):
+                self._in_flight += 1
+                return None
+            waiter = _Waiter(waiter_loop)
+            self._waiters.append(waiter)
+            return waiter
+
+    def acquire(self) -> float:
+        """Block until a call may be sent; return when it started.
+
+        Pass the returned value to :meth:`release` when the call
+        completes.
+        """
+        waiter = self._try_acquire()
+        if waiter is not None:
+            waiter.event.wait()
+        return time.monotonic()
+
+    async def acquire_async(self) -> float:
+        """Await until a call may be sent; see :meth:`acquire`."""
+        waiter = self._try_acquire(asyncio.get_event_loop())
+        if waiter is not None:
+            try:
+                await waiter.future
+            except asyncio.CancelledError:
+                with self._lock:
+                    if not waiter.granted:
+                        self._waiters.remove(waiter)
+                if waiter.granted:
+                    self._release_slot()
+                raise
+        return time.monotonic()
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._wake()
+
+    def _wake(self) -> None:
+        # Called with the lock held.
+        while self._waiters and self._in_flight < int(self._limit):
+            self._in_flight += 1
+            self._waiters.popleft().grant()
+
+    def release(self, started: float, error: Optional[BaseException] = None) -> None:
+        """Record the outcome of a call and free its slot.
+
+        Args:
+            started (float): The value returned by :meth:`acquire`.
+            error (Optional[BaseException]): The exception raised by the
+                call, if any.
+        """
+        now = time.monotonic()
+        with self._lock:
+            in_flight = self._in_flight
+            self._in_flight -= 1
+            if isinstance(error, exceptions.ResourceExhausted):
+                self._decrease(started, now, self._throttled_backoff)
+            elif error is None:
+                latency = now - started
+                if self._long_latency is None:
+                    self._short_latency = self._long_latency = latency
+                else:
+                    self._short_latency += _SHORT_WEIGHT * (latency - self._short_latency)
+                    self._long_latency += _LONG_WEIGHT * (latency - self._long_latency)
+                if self._short_latency > self._latency_tolerance * self._long_latency:
+                    self._decrease(started, now, self._backoff)
+                elif 2 * in_flight >= self._limit:
+                    # Grow only while the limit is actually in use.
+                    self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+            self._wake()
+
+    def _decrease(self, started: float, now: float, factor: float) -> None:
+        # Called with the lock held.
+        if started <= self._decreased_at or self._limit <= self._min_limit:
+            return
+        self._limit = max(self._min_limit, self._limit * factor)
+        self._decreased_at = now
+        self._decreases += 1
+
+
+def from_option(option) -> Optional[AdaptiveLimiter]:
+    """Resolve the ``concurrency_limiter`` client option."""
+    if isinstance(option, AdaptiveLimiter):
+        return option
+    if option:
+        return AdaptiveLimiter()
+    return None
+
+
+__all__ = (
+    'AdaptiveLimiter',
+)
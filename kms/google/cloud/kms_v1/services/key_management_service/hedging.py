@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Hedged requests for side-effect free methods.
+
+When a hedged call has not completed after a delay, taken from a
+percentile of the method's recent latencies, the transport sends the
+same request a second time. The first successful response is returned
+and the other call is cancelled. A single slow backend then costs a
+little more than the delay instead of the whole call.
+
+A :class:`HedgingPolicy` decides which methods are hedged and when, and
+limits the extra load with a budget: every call earns a fraction of a
+hedge, and a hedge is only sent when a whole one has been earned.
+"""
+
+import collections
+import threading
+from typing import Any, Dict, Iterable, Optional
+
+
+DEFAULT_METHODS = ('decrypt', 'get_public_key', 'get_crypto_key_version')
+"""The methods hedged by default."""
+
+
+class _Method:
+    """The recent latencies and counters of one method."""
+    def __init__(self, window: int) -> None:
+        self.latencies = collections.deque(maxlen=window)  # type: collections.deque
+        self.fresh = 0
+        self.delay = None  # type: Optional[float]
+        self.calls = 0
+        self.hedges = 0
+        self.wins = 0
+        self.denied = 0
+
+
+class HedgingPolicy:
+    """When to hedge the calls of a client, and how often.
+
+    One policy can be shared by several clients, which then share their
+    budget.
+
+    Args:
+        methods (Iterable[str]): The RPC methods to hedge. They must be
+            free of side effects.
+        percentile (float): The percentile of the recent latencies of a
+            method after which a call is hedged.
+        min_delay (float): The shortest delay, in seconds, before a hedge.
+        budget (float): The number of hedges earned by each call, i.e.
+            the largest share of extra calls in the long run.
+        burst (float): The number of hedges that may be saved up, and
+            are available from the start.
+        window (int): The number of recent latencies kept per method.
+        min_samples (int): The number of latencies a method needs before
+            its calls are hedged.
+
+    Raises:
+        ValueError: If ``percentile`` is not between 0 and 100, ``budget``
+            is not between 0 and 1, ``min_delay`` or ``burst`` is
+            negative, or not ``1 <= min_samples <= window``.
+    """
+    def __init__(self,
+            methods: Iterable[str] = DEFAULT_METHODS,
+            *,
+            percentile: float = 95.0,
+            min_delay: float = 0.001,
+            budget: float = 0.05,
+            burst: float = 10.0,
+            window: int = 1000,
+            min_samples: int = 100) -> None:
+        if not 0 < percentile < 100:
+            raise ValueError('percentile must be between 0 and 100.')
+        if not 0 <= budget <= 1:
+            raise ValueError('budget must be between 0 and 1.')
+        if min_delay < 0 or burst < 0:
+            raise ValueError('min_delay and burst must not be negative.')
+        if not 1 <= min_samples <= window:
+            raise ValueError('The sample counts must satisfy '
+                             '1 <= min_samples <= window.')
+        self._methods = frozenset(methods)
+        self._percentile = percentile
+        self._min_delay = min_delay
+        self._budget = budget
+        self._burst = burst
+        self._window = window
+        self._min_samples = min_samples
+        # Recompute a delay after this many new latencies rather than
+        # sorting the window on every call.
+        self._refresh = max(1, min_samples // 10)
+        self._tokens = burst
+        self._lock = threading.Lock()
+        self._stats = {}  # type: Dict[str, _Method]
+
+    @property
+    def methods(self) -> frozenset:
+        """The names of the hedged RPC methods."""
+        return self._methods
+
+    def _method(self, method: str) -> _Method:
+        # Called with the lock held.
+        state = self._stats.get(method)
+        if state is None:
+            state = self._stats[method] = _Method(self._window)
+        return state
+
+    def begin(self, method: str) -> Optional[float]:
+        """Count a call and return the seconds after which to hedge it,
+        or ``None`` if its method has too few latencies yet."""
+        with self._lock:
+            state = self._method(method)
+            state.calls += 1
+            self._tokens = min(self._burst, self._tokens + self._budget)
+            return state.delay
+
+    def try_hedge(self, method: str) -> bool:
+        """Spend a hedge from the budget, if one is left."""
+        with self._lock:
+            state = self._method(method)
+            if self._tokens < 1:
+                state.denied += 1
+                return False
+            self._tokens -= 1
+            state.hedges += 1
+            return True
+
+    def record(self, method: str, latency: float, hedge_won: bool = False) -> None:
+        """Record the latency of a successful call.
+
+        Args:
+            method (str): The RPC method name.
+            latency (float): The seconds from the first request to the
+                response.
+            hedge_won (bool): Whether the response came from the hedge.
+        """
+        with self._lock:
+            state = self._method(method)
+            state.latencies.append(latency)
+            if hedge_won:
+                state.wins += 1
+            state.fresh += 1
+            if (len(state.latencies) >= self._min_samples
+                    and (state.delay is None or state.fresh >= self._refresh)):
+                latencies = sorted(state.latencies)
+                index = min(len(latencies) - 1,
+                            int(len(latencies) * self._percentile / 100))
+                state.delay = max(self._min_delay, latencies[index])
+                state.fresh = 0
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return, per method, the number of ``calls``, of ``hedges``
+        sent, of hedges that ``won``, of hedges ``denied`` by the budget,
+        and the current ``delay``."""
+        with self._lock:
+            return {
+                method: {
+                    'calls': state.calls,
+                    'hedges': state.hedges,
+                    'wins': state.wins,
+                    'denied': state.denied,
+                    'delay': state.delay,
+                }
+                for method, state in self._stats.items()
+            }
+
+
+def from_option(option) -> Optional[HedgingPolicy]:
+    """Resolve the ``hedging`` client option."""
+    if isinstance(option, HedgingPolicy):
+        return option
+    if option:
+        return HedgingPolicy()
+    return None
+
+
+__all__ = (
+    'DEFAULT_METHODS',
+    'HedgingPolicy',
+)
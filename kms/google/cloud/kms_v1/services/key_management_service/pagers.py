@@ -15,12 +15,114 @@
 # limitations under the License.
 #
 
-from typing import Any, Callable, Iterable
+import asyncio
+import queue
+import threading
+from typing import (Any, AsyncIterable, AsyncIterator, Awaitable, Callable,
+                    Iterable, Iterator)
 
 from google.cloud.kms_v1.types import resources
 from google.cloud.kms_v1.types import service
 
 
+# How often a prefetching thread blocked on a full buffer checks whether
+# the consumer has gone away.
+_POLL_INTERVAL = 0.1
+
+_DONE = object()
+
+
+def _check_prefetch(depth: int) -> int:
+    if depth < 0:
+        raise ValueError('prefetch must not be negative.')
+    return depth
+
+
+def _prefetch(pages: Iterator, depth: int) -> Iterator:
+    """Iterate over ``pages`` on a background thread, ``depth`` pages ahead.
+
+    Pages are chained by their page tokens, so they are still fetched one
+    after the other; prefetching overlaps those fetches with the caller's
+    processing. When the caller stops iterating, the thread exits as soon
+    as its current request, if any, completes.
+    """
+    if not depth:
+        return pages
+    return _prefetch_thread(pages, depth)
+
+
+def _prefetch_thread(pages, depth):
+    buffer = queue.Queue(maxsize=depth)  # type: queue.Queue
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for page in pages:
+                if not put((page, None)):
+                    return
+        except Exception as exc:
+            put((_DONE, exc))
+        else:
+            put((_DONE, None))
+
+    threading.Thread(target=produce, name='pager-prefetch', daemon=True).start()
+    try:
+        while True:
+            page, error = buffer.get()
+            if page is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield page
+    finally:
+        stop.set()
+
+
+def _prefetch_async(pages: AsyncIterator, depth: int) -> AsyncIterator:
+    """The asyncio counterpart of :func:`_prefetch`.
+
+    Pages are fetched by a task, which is cancelled, along with its
+    current request, when the caller stops iterating.
+    """
+    if not depth:
+        return pages
+    return _prefetch_task(pages, depth)
+
+
+async def _prefetch_task(pages, depth):
+    buffer = asyncio.Queue(maxsize=depth)  # type: asyncio.Queue
+
+    async def produce():
+        try:
+            async for page in pages:
+                await buffer.put((page, None))
+        except Exception as exc:
+            await buffer.put((_DONE, exc))
+        else:
+            await buffer.put((_DONE, None))
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            page, error = await buffer.get()
+            if page is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield page
+    finally:
+        task.cancel()
+
+
 class ListKeyRingsPager:
     """A pager for iterating through ``list_key_rings`` requests.
 
@@ -42,7 +144,8 @@ class ListKeyRingsPager:
             method: Callable[[service.ListKeyRingsRequest],
                 service.ListKeyRingsResponse],
             request: service.ListKeyRingsRequest,
-            response: service.ListKeyRingsResponse):
+            response: service.ListKeyRingsResponse,
+            prefetch: int = 0):
         """Instantiate the pager.
 
         Args:
@@ -52,21 +155,34 @@ class ListKeyRingsPager:
                 The initial request object.
             response (:class:`~.service.ListKeyRingsResponse`):
                 The initial response object.
+            prefetch (int): The number of pages to fetch in the
+                background ahead of the page being iterated over; ``0``
+                fetches each page only when it is needed.
+
+        Raises:
+            ValueError: If ``prefetch`` is negative.
         """
         self._method = method
         self._request = service.ListKeyRingsRequest(request)
         self._response = response
+        self._prefetch = _check_prefetch(prefetch)
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
     def pages(self) -> Iterable[service.ListKeyRingsResponse]:
-        yield self._response
-        while self._response.next_page_token:
-            self._request.page_token = self._response.next_page_token
-            self._response = self._method(self._request)
-            yield self._response
+        for page in _prefetch(self._fetch_pages(), self._prefetch):
+            self._response = page
+            yield page
+
+    def _fetch_pages(self) -> Iterator[service.ListKeyRingsResponse]:
+        response = self._response
+        yield response
+        while response.next_page_token:
+            self._request.page_token = response.next_page_token
+            response = self._method(self._request)
+            yield response
 
     def __iter__(self) -> Iterable[resources.KeyRing]:
         for page in self.pages:
@@ -76,6 +192,79 @@ class ListKeyRingsPager:
         return '{0}<{1!r}>'.format(self.__class__.__name__, self._response)
 
 
+
+class ListKeyRingsAsyncPager:
+    """A pager for iterating through ``list_key_rings`` requests.
+
+    This class thinly wraps an initial
+    :class:`~.service.ListKeyRingsResponse` object, and
+    provides an ``__aiter__`` method to iterate through its
+    ``key_rings`` field.
+
+    If there are more pages, the ``__aiter__`` method will make additional
+    ``ListKeyRings`` requests and continue to iterate
+    through the ``key_rings`` field on the
+    corresponding responses.
+
+    All the usual :class:`~.service.ListKeyRingsResponse`
+    attributes are available on the pager. If multiple requests are made, only
+    the most recent response is retained, and thus used for attribute lookup.
+    """
+    def __init__(self,
+            method: Callable[[service.ListKeyRingsRequest],
+                Awaitable[service.ListKeyRingsResponse]],
+            request: service.ListKeyRingsRequest,
+            response: service.ListKeyRingsResponse,
+            prefetch: int = 0):
+        """Instantiate the pager.
+
+        Args:
+            method (Callable): The method that was originally called, and
+                which instantiated this pager.
+            request (:class:`~.service.ListKeyRingsRequest`):
+                The initial request object.
+            response (:class:`~.service.ListKeyRingsResponse`):
+                The initial response object.
+            prefetch (int): The number of pages to fetch in the
+                background ahead of the page being iterated over; ``0``
+                fetches each page only when it is needed.
+
+        Raises:
+            ValueError: If ``prefetch`` is negative.
+        """
+        self._method = method
+        self._request = service.ListKeyRingsRequest(request)
+        self._response = response
+        self._prefetch = _check_prefetch(prefetch)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    @property
+    async def pages(self) -> AsyncIterable[service.ListKeyRingsResponse]:
+        async for page in _prefetch_async(self._fetch_pages(), self._prefetch):
+            self._response = page
+            yield page
+
+    async def _fetch_pages(self) -> AsyncIterator[service.ListKeyRingsResponse]:
+        response = self._response
+        yield response
+        while response.next_page_token:
+            self._request.page_token = response.next_page_token
+            response = await self._method(self._request)
+            yield response
+
+    def __aiter__(self) -> AsyncIterable[resources.KeyRing]:
+        async def async_generator():
+            async for page in self.pages:
+                for response in page.key_rings:
+                    yield response
+
+        return async_generator()
+
+    def __repr__(self) -> str:
+        return '{0}<{1!r}>'.format(self.__class__.__name__, self._response)
+
 class ListCryptoKeysPager:
     """A pager for iterating through ``list_crypto_keys`` requests.
 
@@ -97,7 +286,8 @@ class ListCryptoKeysPager:
             method: Callable[[service.ListCryptoKeysRequest],
                 service.ListCryptoKeysResponse],
             request: service.ListCryptoKeysRequest,
-            response: service.ListCryptoKeysResponse):
+            response: service.ListCryptoKeysResponse,
+            prefetch: int = 0):
         """Instantiate the pager.
 
         Args:
@@ -107,21 +297,34 @@ class ListCryptoKeysPager:
                 The initial request object.
             response (:class:`~.service.ListCryptoKeysResponse`):
                 The initial response object.
+            prefetch (int): The number of pages to fetch in the
+                background ahead of the page being iterated over; ``0``
+                fetches each page only when it is needed.
+
+        Raises:
+            ValueError: If ``prefetch`` is negative.
         """
         self._method = method
         self._request = service.ListCryptoKeysRequest(request)
         self._response = response
+        self._prefetch = _check_prefetch(prefetch)
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
     def pages(self) -> Iterable[service.ListCryptoKeysResponse]:
-        yield self._response
-        while self._response.next_page_token:
-            self._request.page_token = self._response.next_page_token
-            self._response = self._method(self._request)
-            yield self._response
+        for page in _prefetch(self._fetch_pages(), self._prefetch):
+            self._response = page
+            yield page
+
+    def _fetch_pages(self) -> Iterator[service.ListCryptoKeysResponse]:
+        response = self._response
+        yield response
+        while response.next_page_token:
+            self._request.page_token = response.next_page_token
+            response = self._method(self._request)
+            yield response
 
     def __iter__(self) -> Iterable[resources.CryptoKey]:
         for page in self.pages:
@@ -131,6 +334,79 @@ class ListCryptoKeysPager:
         return '{0}<{1!r}>'.format(self.__class__.__name__, self._response)
 
 
+
+class ListCryptoKeysAsyncPager:
+    """A pager for iterating through ``list_crypto_keys`` requests.
+
+    This class thinly wraps an initial
+    :class:`~.service.ListCryptoKeysResponse` object, and
+    provides an ``__aiter__`` method to iterate through its
+    ``crypto_keys`` field.
+
+    If there are more pages, the ``__aiter__`` method will make additional
+    ``ListCryptoKeys`` requests and continue to iterate
+    through the ``crypto_keys`` field on the
+    corresponding responses.
+
+    All the usual :class:`~.service.ListCryptoKeysResponse`
+    attributes are available on the pager. If multiple requests are made, only
+    the most recent response is retained, and thus used for attribute lookup.
+    """
+    def __init__(self,
+            method: Callable[[service.ListCryptoKeysRequest],
+                Awaitable[service.ListCryptoKeysResponse]],
+            request: service.ListCryptoKeysRequest,
+            response: service.ListCryptoKeysResponse,
+            prefetch: int = 0):
+        """Instantiate the pager.
+
+        Args:
+            method (Callable): The method that was originally called, and
+                which instantiated this pager.
+            request (:class:`~.service.ListCryptoKeysRequest`):
+                The initial request object.
+            response (:class:`~.service.ListCryptoKeysResponse`):
+                The initial response object.
+            prefetch (int): The number of pages to fetch in the
+                background ahead of the page being iterated over; ``0``
+                fetches each page only when it is needed.
+
+        Raises:
+            ValueError: If ``prefetch`` is negative.
+        """
+        self._method = method
+        self._request = service.ListCryptoKeysRequest(request)
+        self._response = response
+        self._prefetch = _check_prefetch(prefetch)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    @property
+    async def pages(self) -> AsyncIterable[service.ListCryptoKeysResponse]:
+        async for page in _prefetch_async(self._fetch_pages(), self._prefetch):
+            self._response = page
+            yield page
+
+    async def _fetch_pages(self) -> AsyncIterator[service.ListCryptoKeysResponse]:
+        response = self._response
+        yield response
+        while response.next_page_token:
+            self._request.page_token = response.next_page_token
+            response = await self._method(self._request)
+            yield response
+
+    def __aiter__(self) -> AsyncIterable[resources.CryptoKey]:
+        async def async_generator():
+            async for page in self.pages:
+                for response in page.crypto_keys:
+                    yield response
+
+        return async_generator()
+
+    def __repr__(self) -> str:
+        return '{0}<{1!r}>'.format(self.__class__.__name__, self._response)
+
 class ListCryptoKeyVersionsPager:
     """A pager for iterating through ``list_crypto_key_versions`` requests.
 
@@ -152,7 +428,8 @@ class ListCryptoKeyVersionsPager:
             method: Callable[[service.ListCryptoKeyVersionsRequest],
                 service.ListCryptoKeyVersionsResponse],
             request: service.ListCryptoKeyVersionsRequest,
-            response: service.ListCryptoKeyVersionsResponse):
+            response: service.ListCryptoKeyVersionsResponse,
+            prefetch: int = 0):
         """Instantiate the pager.
 
         Args:
@@ -162,21 +439,34 @@ class ListCryptoKeyVersionsPager:
                 The initial request object.
             response (:class:`~.service.ListCryptoKeyVersionsResponse`):
                 The initial response object.
+            prefetch (int): The number of pages to fetch in the
+                background ahead of the page being iterated over; ``0``
+                fetches each page only when it is needed.
+
+        Raises:
+            ValueError: If ``prefetch`` is negative.
         """
         self._method = method
         self._request = service.ListCryptoKeyVersionsRequest(request)
         self._response = response
+        self._prefetch = _check_prefetch(prefetch)
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
     def pages(self) -> Iterable[service.ListCryptoKeyVersionsResponse]:
-        yield self._response
-        while self._response.next_page_token:
-            self._request.page_token = self._response.next_page_token
-            self._response = self._method(self._request)
-            yield self._response
+        for page in _prefetch(self._fetch_pages(), self._prefetch):
+            self._response = page
+            yield page
+
+    def _fetch_pages(self) -> Iterator[service.ListCryptoKeyVersionsResponse]:
+        response = self._response
+        yield response
+        while response.next_page_token:
+            self._request.page_token = response.next_page_token
+            response = self._method(self._request)
+            yield response
 
     def __iter__(self) -> Iterable[resources.CryptoKeyVersion]:
         for page in self.pages:
@@ -186,6 +476,79 @@ class ListCryptoKeyVersionsPager:
         return '{0}<{1!r}>'.format(self.__class__.__name__, self._response)
 
 
+
+class ListCryptoKeyVersionsAsyncPager:
+    """A pager for iterating through ``list_crypto_key_versions`` requests.
+
+    This class thinly wraps an initial
+    :class:`~.service.ListCryptoKeyVersionsResponse` object, and
+    provides an ``__aiter__`` method to iterate through its
+    ``crypto_key_versions`` field.
+
+    If there are more pages, the ``__aiter__`` method will make additional
+    ``ListCryptoKeyVersions`` requests and continue to iterate
+    through the ``crypto_key_versions`` field on the
+    corresponding responses.
+
+    All the usual :class:`~.service.ListCryptoKeyVersionsResponse`
+    attributes are available on the pager. If multiple requests are made, only
+    the most recent response is retained, and thus used for attribute lookup.
+    """
+    def __init__(self,
+            method: Callable[[service.ListCryptoKeyVersionsRequest],
+                Awaitable[service.ListCryptoKeyVersionsResponse]],
+            request: service.ListCryptoKeyVersionsRequest,
+            response: service.ListCryptoKeyVersionsResponse,
+            prefetch: int = 0):
+        """Instantiate the pager.
+
+        Args:
+            method (Callable): The method that was originally called, and
+                which instantiated this pager.
+            request (:class:`~.service.ListCryptoKeyVersionsRequest`):
+                The initial request object.
+            response (:class:`~.service.ListCryptoKeyVersionsResponse`):
+                The initial response object.
+            prefetch (int): The number of pages to fetch in the
+                background ahead of the page being iterated over; ``0``
+                fetches each page only when it is needed.
+
+        Raises:
+            ValueError: If ``prefetch`` is negative.
+        """
+        self._method = method
+        self._request = service.ListCryptoKeyVersionsRequest(request)
+        self._response = response
+        self._prefetch = _check_prefetch(prefetch)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    @property
+    async def pages(self) -> AsyncIterable[service.ListCryptoKeyVersionsResponse]:
+        async for page in _prefetch_async(self._fetch_pages(), self._prefetch):
+            self._response = page
+            yield page
+
+    async def _fetch_pages(self) -> AsyncIterator[service.ListCryptoKeyVersionsResponse]:
+        response = self._response
+        yield response
+        while response.next_page_token:
+            self._request.page_token = response.next_page_token
+            response = await self._method(self._request)
+            yield response
+
+    def __aiter__(self) -> AsyncIterable[resources.CryptoKeyVersion]:
+        async def async_generator():
+            async for page in self.pages:
+                for response in page.crypto_key_versions:
+                    yield response
+
+        return async_generator()
+
+    def __repr__(self) -> str:
+        return '{0}<{1!r}>'.format(self.__class__.__name__, self._response)
+
 class ListImportJobsPager:
     """A pager for iterating through ``list_import_jobs`` requests.
 
@@ -207,7 +570,8 @@ class ListImportJobsPager:
             method: Callable[[service.ListImportJobsRequest],
                 service.ListImportJobsResponse],
             request: service.ListImportJobsRequest,
-            response: service.ListImportJobsResponse):
+            response: service.ListImportJobsResponse,
+            prefetch: int = 0):
         """Instantiate the pager.
 
         Args:
@@ -217,21 +581,34 @@ class ListImportJobsPager:
                 The initial request object.
             response (:class:`~.service.ListImportJobsResponse`):
                 The initial response object.
+            prefetch (int): The number of pages to fetch in the
+                background ahead of the page being iterated over; ``0``
+                fetches each page only when it is needed.
+
+        Raises:
+            ValueError: If ``prefetch`` is negative.
         """
         self._method = method
         self._request = service.ListImportJobsRequest(request)
         self._response = response
+        self._prefetch = _check_prefetch(prefetch)
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
     def pages(self) -> Iterable[service.ListImportJobsResponse]:
-        yield self._response
-        while self._response.next_page_token:
-            self._request.page_token = self._response.next_page_token
-            self._response = self._method(self._request)
-            yield self._response
+        for page in _prefetch(self._fetch_pages(), self._prefetch):
+            self._response = page
+            yield page
+
+    def _fetch_pages(self) -> Iterator[service.ListImportJobsResponse]:
+        response = self._response
+        yield response
+        while response.next_page_token:
+            self._request.page_token = response.next_page_token
+            response = self._method(self._request)
+            yield response
 
     def __iter__(self) -> Iterable[resources.ImportJob]:
         for page in self.pages:
@@ -239,3 +616,76 @@ class ListImportJobsPager:
 
     def __repr__(self) -> str:
         return '{0}<{1!r}>'.format(self.__class__.__name__, self._response)
+
+
+class ListImportJobsAsyncPager:
+    """A pager for iterating through ``list_import_jobs`` requests.
+
+    This class thinly wraps an initial
+    :class:`~.service.ListImportJobsResponse` object, and
+    provides an ``__aiter__`` method to iterate through its
+    ``import_jobs`` field.
+
+    If there are more pages, the ``__aiter__`` method will make additional
+    ``ListImportJobs`` requests and continue to iterate
+    through the ``import_jobs`` field on the
+    corresponding responses.
+
+    All the usual :class:`~.service.ListImportJobsResponse`
+    attributes are available on the pager. If multiple requests are made, only
+    the most recent response is retained, and thus used for attribute lookup.
+    """
+    def __init__(self,
+            method: Callable[[service.ListImportJobsRequest],
+                Awaitable[service.ListImportJobsResponse]],
+            request: service.ListImportJobsRequest,
+            response: service.ListImportJobsResponse,
+            prefetch: int = 0):
+        """Instantiate the pager.
+
+        Args:
+            method (Callable): The method that was originally called, and
+                which instantiated this pager.
+            request (:class:`~.service.ListImportJobsRequest`):
+                The initial request object.
+            response (:class:`~.service.ListImportJobsResponse`):
+                The initial response object.
+            prefetch (int): The number of pages to fetch in the
+                background ahead of the page being iterated over; ``0``
+                fetches each page only when it is needed.
+
+        Raises:
+            ValueError: If ``prefetch`` is negative.
+        """
+        self._method = method
+        self._request = service.ListImportJobsRequest(request)
+        self._response = response
+        self._prefetch = _check_prefetch(prefetch)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    @property
+    async def pages(self) -> AsyncIterable[service.ListImportJobsResponse]:
+        async for page in _prefetch_async(self._fetch_pages(), self._prefetch):
+            self._response = page
+            yield page
+
+    async def _fetch_pages(self) -> AsyncIterator[service.ListImportJobsResponse]:
+        response = self._response
+        yield response
+        while response.next_page_token:
+            self._request.page_token = response.next_page_token
+            response = await self._method(self._request)
+            yield response
+
+    def __aiter__(self) -> AsyncIterable[resources.ImportJob]:
+        async def async_generator():
+            async for page in self.pages:
+                for response in page.import_jobs:
+                    yield response
+
+        return async_generator()
+
+    def __repr__(self) -> str:
+        return '{0}<{1!r}>'.format(self.__class__.__name__, self._response)
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Client-side rate limiting matching the Cloud KMS request quotas.
+
+Cloud KMS counts read, write and cryptographic requests against separate
+quotas per project and location. A :class:`RateLimiter` keeps one token
+bucket per request class, project and location, and delays each call
+until its bucket has a token, so that a client can run at its quota
+without receiving ``RESOURCE_EXHAUSTED`` errors.
+
+Tokens are reserved in arrival order: a caller that finds the bucket
+empty is told how long to wait for its token, and then sleeps, or
+awaits, without holding any lock.
+"""
+
+import asyncio
+import re
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+
+REQUEST_CLASSES = {
+    'list_key_rings': 'read',
+    'list_crypto_keys': 'read',
+    'list_crypto_key_versions': 'read',
+    'list_import_jobs': 'read',
+    'get_key_ring': 'read',
+    'get_crypto_key': 'read',
+    'get_crypto_key_version': 'read',
+    'get_public_key': 'read',
+    'get_import_job': 'read',
+    'create_key_ring': 'write',
+    'create_crypto_key': 'write',
+    'create_crypto_key_version': 'write',
+    'import_crypto_key_version': 'write',
+    'create_import_job': 'write',
+    'update_crypto_key': 'write',
+    'update_crypto_key_version': 'write',
+    'update_crypto_key_primary_version': 'write',
+    'destroy_crypto_key_version': 'write',
+    'restore_crypto_key_version': 'write',
+    'encrypt': 'crypto',
+    'decrypt': 'crypto',
+    'asymmetric_sign': 'crypto',
+    'asymmetric_decrypt': 'crypto',
+}
+"""The quota that each RPC method counts against."""
+
+DEFAULT_RATES = {
+    'read': 300 / 60.0,
+    'write': 60 / 60.0,
+    'crypto': 60000 / 60.0,
+}
+"""The default KMS quotas, in requests per second."""
+
+_SCOPE = re.compile(r'projects/([^/]+)/locations/([^/]+)')
+
+# The request fields holding the name of the resource, or of a message
+# holding it, in order of preference.
+_NAME_FIELDS = ('name', 'parent', 'crypto_key', 'crypto_key_version')
+
+
+def _scope(request) -> Tuple[str, str]:
+    """Return the project and location of a request, or empty strings."""
+    pb = type(request).pb(request)
+    fields = pb.DESCRIPTOR.fields_by_name
+    for field in _NAME_FIELDS:
+        if field in fields:
+            value = getattr(pb, field)
+            if not isinstance(value, str):
+                value = value.name
+            match = _SCOPE.match(value)
+            if match:
+                return match.group(1), match.group(2)
+    return '', ''
+
+
+class _Bucket:
+    def __init__(self, rate: float, capacity: float, now: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """Take a token and return how long to wait until it is due."""
+        self.tokens = min(self.capacity,
+                          self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return max(0.0, -self.tokens / self.rate)
+
+
+class RateLimiter:
+    """Token buckets per request class, project and location.
+
+    One limiter can be shared by several clients, which then share their
+    quotas.
+
+    Args:
+        rates (Dict[str, float]): Requests per second for the ``read``,
+            ``write`` and ``crypto`` classes, overriding
+            :data:`DEFAULT_RATES`. A rate of ``None`` leaves that class
+            unlimited.
+        capacities (Dict[str, float]): The number of requests of each
+            class that may be sent in a burst. Defaults to one second's
+            worth, and at least one request.
+
+    Raises:
+        ValueError: If a class is unknown, or a rate or capacity is not
+            positive.
+    """
+    def __init__(self,
+            rates: Dict[str, float] = None,
+            capacities: Dict[str, float] = None) -> None:
+        self._rates = dict(DEFAULT_RATES)
+        self._capacities = {}  # type: Dict[str, float]
+        for name, value in (rates or {}).items():
+            self._check(name, value, 'rate')
+            self._rates[name] = value
+        for name, value in (capacities or {}).items():
+            self._check(name, value, 'capacity')
+            self._capacities[name] = value
+        self._buckets = {}  # type: Dict[Tuple[str, str, str], _Bucket]
+        self._lock = threading.Lock()
+        self._stats = {
+            name: {'requests': 0, 'delayed': 0, 'wait_time': 0.0, 'max_wait': 0.0}
+            for name in DEFAULT_RATES
+        }  # type: Dict[str, Dict[str, Any]]
+
+    @staticmethod
+    def _check(name, value, what):
+        if name not in DEFAULT_RATES:
+            raise ValueError('Unknown request class: {!r}.'.format(name))
+        if value is not None and value <= 0:
+            raise ValueError('The {} of {!r} must be positive.'.format(what, name))
+
+    def reserve(self, method: str, request) -> float:
+        """Reserve a token for a call and return the seconds to wait for it.
+
+        Args:
+            method (str): The RPC method name, e.g. ``'encrypt'``.
+            request: The request message, from whose resource name the
+                project and location are taken.
+        """
+        request_class = REQUEST_CLASSES.get(method)
+        if request_class is None:
+            return 0.0
+        rate = self._rates[request_class]
+        if rate is None:
+            return 0.0
+        key = (request_class,) + _scope(request)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                capacity = self._capacities.get(request_class, max(1.0, rate))
+                bucket = self._buckets[key] = _Bucket(rate, capacity, now)
+            delay = bucket.reserve(now)
+            stats = self._stats[request_class]
+            stats['requests'] += 1
+            if delay:
+                stats['delayed'] += 1
+                stats['wait_time'] += delay
+                stats['max_wait'] = max(stats['max_wait'], delay)
+        return delay
+
+    def acquire(self, method: str, request) -> float:
+        """Block until a call may be sent; return the seconds waited."""
+        delay = self.reserve(method, request)
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, method: str, request) -> float:
+        """Wait until a call may be sent; return the seconds waited."""
+        delay = self.reserve(method, request)
+        if delay:
+            await asyncio.sleep(delay)
+        return delay
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return, per request class, the number of ``requests``, how many
+        were ``delayed``, and their total and maximum wait in seconds."""
+        with self._lock:
+            return {name: dict(stats) for name, stats in self._stats.items()}
+
+
+def from_option(option):
+    """Resolve the ``rate_limiter`` client option."""
+    if isinstance(option, RateLimiter):
+        return option
+    if option:
+        return RateLimiter()
+    return None
+
+
+__all__ = (
+    'DEFAULT_RATES',
+    'RateLimiter',
+    'REQUEST_CLASSES',
+)
@@ -20,14 +20,17 @@ from typing import Dict, Type
 
 from .base import KeyManagementServiceTransport
 from .grpc import KeyManagementServiceGrpcTransport
+from .grpc_asyncio import KeyManagementServiceGrpcAsyncIOTransport
 
 
 # Compile a registry of transports.
 _transport_registry = OrderedDict()  # type: Dict[str, Type[KeyManagementServiceTransport]]
 _transport_registry['grpc'] = KeyManagementServiceGrpcTransport
+_transport_registry['grpc_asyncio'] = KeyManagementServiceGrpcAsyncIOTransport
 
 
 __all__ = (
     'KeyManagementServiceTransport',
     'KeyManagementServiceGrpcTransport',
+    'KeyManagementServiceGrpcAsyncIOTransport',
 )
@@ -16,18 +16,292 @@
 #
 
 import abc
+from concurrent import futures
+import functools
+import queue
+import threading
+import time
 import typing
 
 from google import auth
+from google.api_core import exceptions  # type: ignore
+from google.api_core import gapic_v1  # type: ignore
+from google.api_core import retry as retries  # type: ignore
 from google.auth import credentials  # type: ignore
+from google.auth.transport import requests as auth_requests  # type: ignore
+
+import grpc  # type: ignore
 
 from google.cloud.kms_v1.types import resources
 from google.cloud.kms_v1.types import service
 
+from . import refresh
+
+
+class _WrappedMethods(dict):
+    """Mapping of RPC method names to their wrapped callables.
+
+    A method is wrapped the first time it is looked up and the result is
+    kept for the lifetime of the transport.
+    """
+    def __init__(self,
+            transport: 'KeyManagementServiceTransport',
+            client_info: gapic_v1.client_info.ClientInfo,
+            method_configs: typing.Dict[str, typing.Dict[str, typing.Any]],
+            rate_limiter: typing.Any = None,
+            concurrency_limiter: typing.Any = None,
+            hedging: typing.Any = None,
+            metrics: typing.Any = None,
+            interceptors: typing.Sequence[typing.Any] = ()) -> None:
+        super().__init__()
+        self._transport = transport
+        self._client_info = client_info
+        self._method_configs = method_configs
+        self._rate_limiter = rate_limiter
+        self._concurrency_limiter = concurrency_limiter
+        self._hedging = hedging
+        self._metrics = metrics
+        self._interceptors = tuple(interceptors)
+
+    def __missing__(self, name: str) -> typing.Callable:
+        config = self._method_configs[name]
+        stub = getattr(self._transport, name)
+        # The limiters apply to every request sent, so they wrap the stub,
+        # below the hedging and the retries.
+        if self._concurrency_limiter is not None:
+            stub = self._transport._limited_class(stub, self._concurrency_limiter)
+        if self._rate_limiter is not None:
+            stub = self._transport._throttled_class(stub, self._rate_limiter, name)
+        if self._hedging is not None and name in self._hedging.methods:
+            # Hedge each attempt, below the retries.
+            stub = self._transport._hedged_class(stub, self._hedging, name)
+        rpc = self._transport._wrap_method(
+            stub,
+            default_retry=config['retry'],
+            default_timeout=config['timeout'],
+            client_info=self._client_info,
+        )
+        if config.get('coalesce'):
+            rpc = self._transport._coalescer_class(rpc)
+        if self._interceptors:
+            rpc = self._transport._intercepted_class(rpc, self._interceptors, name)
+        if self._metrics is not None:
+            rpc = self._transport._instrumented_class(rpc, self._metrics, name)
+        self[name] = rpc
+        return rpc
+
+
+class _Coalescer:
+    """Share one in-flight call between identical concurrent requests.
+
+    Requests are identical when their serialized messages and metadata
+    are equal. Callers that arrive while such a call is in flight wait
+    for it and receive the same response object, or the same exception;
+    the retry and timeout of the first caller apply.
+    """
+    def __init__(self, rpc: typing.Callable) -> None:
+        self._rpc = rpc
+        self._lock = threading.Lock()
+        self._calls = {}  # type: typing.Dict[typing.Tuple, futures.Future]
+
+    def __call__(self, request, *, metadata=(), **kwargs):
+        key = (type(request).serialize(request), tuple(metadata))
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = futures.Future()
+        if not leader:
+            return future.result()
+
+        try:
+            response = self._rpc(request, metadata=metadata, **kwargs)
+        except BaseException as exc:
+            with self._lock:
+                del self._calls[key]
+            future.set_exception(exc)
+            raise
+        with self._lock:
+            del self._calls[key]
+        future.set_result(response)
+        return response
+
+
+def _api_error(exc: BaseException) -> BaseException:
+    """Return ``exc`` as the API exception the retries would see."""
+    if isinstance(exc, grpc.RpcError):
+        return exceptions.from_grpc_error(exc)
+    return exc
+
+
+class _Throttled:
+    """Wait for the rate limiter before each request is sent.
+
+    It wraps the stub, so that every attempt and hedged request waits.
+    Callers block until their request may be sent; the wait does not
+    count against its timeout.
+    """
+    def __init__(self, stub: typing.Callable, rate_limiter, name: str) -> None:
+        self._stub = stub
+        self._rate_limiter = rate_limiter
+        self._name = name
+
+    def __call__(self, request, **kwargs):
+        self._rate_limiter.acquire(self._name, request)
+        return self._stub(request, **kwargs)
+
+    def future(self, request, **kwargs) -> futures.Future:
+        self._rate_limiter.acquire(self._name, request)
+        return self._stub.future(request, **kwargs)
+
+
+class _Limited:
+    """Hold a slot of the concurrency limiter while each request is in
+    flight.
+
+    It wraps the stub, so that every attempt and hedged request holds a
+    slot of its own.
+    """
+    def __init__(self, stub: typing.Callable, concurrency_limiter) -> None:
+        self._stub = stub
+        self._concurrency_limiter = concurrency_limiter
+
+    def __call__(self, request, **kwargs):
+        started = self._concurrency_limiter.acquire()
+        try:
+            response = self._stub(request, **kwargs)
+        except BaseException as exc:
+            self._concurrency_limiter.release(started, _api_error(exc))
+            raise
+        self._concurrency_limiter.release(started)
+        return response
+
+    def future(self, request, **kwargs) -> futures.Future:
+        started = self._concurrency_limiter.acquire()
+        try:
+            call = self._stub.future(request, **kwargs)
+        except BaseException as exc:
+            self._concurrency_limiter.release(started, _api_error(exc))
+            raise
+        call.add_done_callback(functools.partial(self._release, started))
+        return call
+
+    def _release(self, started: float, call: futures.Future) -> None:
+        if call.cancelled():
+            # A cancelled hedge only frees its slot.
+            self._concurrency_limiter.release(started, futures.CancelledError())
+        else:
+            error = call.exception()
+            self._concurrency_limiter.release(
+                started, None if error is None else _api_error(error))
+
+
+class _Intercepted:
+    """Pass each call through a chain of interceptors, the first outermost."""
+    def __init__(self, rpc: typing.Callable, interceptors, name: str) -> None:
+        self._rpc = rpc
+        self._interceptors = interceptors
+        self._name = name
+
+    def __call__(self, request, *, metadata=(), **kwargs):
+        return self._proceed(0, kwargs, request, tuple(metadata))
+
+    def _proceed(self, index, kwargs, request, metadata):
+        if index == len(self._interceptors):
+            return self._rpc(request, metadata=metadata, **kwargs)
+        return self._interceptors[index].intercept(
+            self._name, request, metadata,
+            functools.partial(self._proceed, index + 1, kwargs))
+
+
+class _Instrumented:
+    """Record the latency and outcome of each call in the transport metrics."""
+    def __init__(self, rpc: typing.Callable, metrics, name: str) -> None:
+        self._rpc = rpc
+        self._metrics = metrics
+        self._name = name
+
+    def __call__(self, request, **kwargs):
+        started = self._metrics.start(self._name)
+        try:
+            response = self._rpc(request, **kwargs)
+        except BaseException as exc:
+            self._metrics.finish(self._name, started, exc)
+            raise
+        self._metrics.finish(self._name, started)
+        return response
+
+
+class _Hedged:
+    """Send a second request when the first is slow; return the first
+    successful response and cancel the other call.
+
+    It takes the place of the stub, and uses its ``future`` method so
+    that the losing call can be cancelled.
+    """
+    def __init__(self, stub: typing.Callable, hedging, name: str) -> None:
+        self._stub = stub
+        self._hedging = hedging
+        self._name = name
+
+    def __call__(self, request, *, timeout=None, **kwargs):
+        delay = self._hedging.begin(self._name)
+        started = time.monotonic()
+        completed = queue.Queue()  # type: queue.Queue
+        calls = [self._stub.future(request, timeout=timeout, **kwargs)]
+        calls[0].add_done_callback(completed.put)
+        try:
+            call = completed.get(timeout=delay) if delay is not None else None
+        except queue.Empty:
+            call = None
+        if call is None and delay is not None and self._hedging.try_hedge(self._name):
+            if timeout is not None:
+                timeout = max(0.0, timeout - (time.monotonic() - started))
+            calls.append(self._stub.future(request, timeout=timeout, **kwargs))
+            calls[1].add_done_callback(completed.put)
+
+        try:
+            failed = 0
+            while True:
+                if call is None:
+                    call = completed.get()
+                if not call.cancelled() and call.exception() is None:
+                    break
+                failed += 1
+                if failed == len(calls):
+                    break
+                call = None
+        finally:
+            for other in calls:
+                if other is not call:
+                    other.cancel()
+        response = call.result()
+        self._hedging.record(
+            self._name, time.monotonic() - started, hedge_won=call is not calls[0])
+        return response
+
 
 class KeyManagementServiceTransport(metaclass=abc.ABCMeta):
     """Abstract transport class for KeyManagementService."""
 
+    # The function used to add retry, timeout and error handling to the
+    # RPC methods of this transport, the type of its default retries, the
+    # wrapper that coalesces identical concurrent requests, the ones
+    # that wait for a rate limiter and for a concurrency limiter, the one
+    # that hedges the calls of a stub, the ones that run the interceptors
+    # and record metrics.
+    _wrap_method = staticmethod(gapic_v1.method.wrap_method)
+    _retry_class = retries.Retry
+    _coalescer_class = _Coalescer
+    _throttled_class = _Throttled
+    _limited_class = _Limited
+    _hedged_class = _Hedged
+    _instrumented_class = _Instrumented
+    _intercepted_class = _Intercepted
+
+    # The per-method call metrics, when enabled.
+    metrics = None
+
     AUTH_SCOPES = (
         'https://www.googleapis.com/auth/cloud-platform',
         'https://www.googleapis.com/auth/cloudkms',
@@ -37,6 +311,7 @@ class KeyManagementServiceTransport(metaclass=abc.ABCMeta):
             self, *,
             host: str = 'cloudkms.googleapis.com',
             credentials: credentials.Credentials = None,
+            refresh_credentials: float = None,
             ) -> None:
         """Instantiate the transport.
 
@@ -47,6 +322,10 @@ class KeyManagementServiceTransport(metaclass=abc.ABCMeta):
                 credentials identify the application to the service; if none
                 are specified, the client will attempt to ascertain the
                 credentials from the environment.
+            refresh_credentials (Optional[float]): If set, the access
+                token is refreshed in a background thread this many
+                seconds before it expires, e.g.
+                :data:`~.refresh.DEFAULT_MARGIN`, instead of by a call.
         """
         # Save the hostname. Default to port 443 (HTTPS) if none is specified.
         if ':' not in host:
@@ -58,8 +337,158 @@ class KeyManagementServiceTransport(metaclass=abc.ABCMeta):
         if credentials is None:
             credentials, _ = auth.default(scopes=self.AUTH_SCOPES)
 
-        # Save the credentials.
-        self._credentials = credentials
+        # Scope the credentials here rather than when the channel is
+        # created, so that they are the ones the channel authorizes its
+        # calls with and a token fetched ahead of time is used. The
+        # scoped copy, and its token, is shared with every transport
+        # built from the same credentials.
+        self._credentials = refresh.shared_credentials(
+            credentials, self.AUTH_SCOPES)
+        self._credentials_refresher = None
+        if refresh_credentials is not None:
+            self._refresh_in_background(refresh_credentials)
+
+    def _refresh_in_background(self, margin: float) -> None:
+        """Refresh the access token ``margin`` seconds before it expires,
+        in the thread shared by the transports with these credentials."""
+        self._credentials_refresher = refresh.refresh_in_background(
+            self._credentials, margin)
+
+    def _refresh_credentials(self) -> None:
+        """Fetch an access token unless the credentials hold a valid one."""
+        if self._credentials and not self._credentials.valid:
+            self._credentials.refresh(auth_requests.Request())
+
+    def _create_stubs(self) -> None:
+        """Create the stub of every RPC method, and wrap it if the
+        client has prepared the wrapped methods."""
+        wrapped_methods = getattr(self, '_wrapped_methods', None)
+        for name in self._default_method_configs():
+            if wrapped_methods is not None:
+                wrapped_methods[name]
+            else:
+                getattr(self, name)
+
+    def warmup(self, timeout: float = None) -> None:
+        """Prepare the transport for its first call; see the concrete
+        transports."""
+        raise NotImplementedError
+
+    def _default_method_configs(self) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        """Return the default retry and timeout of each RPC method.
+
+        Methods without side effects are retried on transient errors.
+        Methods that change state are never retried by default.
+        """
+        retry = self._retry_class(
+            initial=0.1,
+            maximum=60.0,
+            multiplier=1.3,
+            predicate=retries.if_exception_type(
+                exceptions.DeadlineExceeded,
+                exceptions.ServiceUnavailable,
+            ),
+            deadline=60.0,
+        )
+        return {
+            'list_key_rings': {'retry': retry, 'timeout': 60.0},
+            'list_crypto_keys': {'retry': retry, 'timeout': 60.0},
+            'list_crypto_key_versions': {'retry': retry, 'timeout': 60.0},
+            'list_import_jobs': {'retry': retry, 'timeout': 60.0},
+            'get_key_ring': {'retry': retry, 'timeout': 60.0},
+            'get_crypto_key': {'retry': retry, 'timeout': 60.0},
+            'get_crypto_key_version': {'retry': retry, 'timeout': 60.0},
+            'get_public_key': {'retry': retry, 'timeout': 60.0},
+            'get_import_job': {'retry': retry, 'timeout': 60.0},
+            'create_key_ring': {'retry': None, 'timeout': 60.0},
+            'create_crypto_key': {'retry': None, 'timeout': 60.0},
+            'create_crypto_key_version': {'retry': None, 'timeout': 60.0},
+            'import_crypto_key_version': {'retry': None, 'timeout': 60.0},
+            'create_import_job': {'retry': None, 'timeout': 60.0},
+            'update_crypto_key': {'retry': None, 'timeout': 60.0},
+            'update_crypto_key_version': {'retry': None, 'timeout': 60.0},
+            'encrypt': {'retry': retry, 'timeout': 60.0},
+            'decrypt': {'retry': retry, 'timeout': 60.0},
+            'asymmetric_sign': {'retry': retry, 'timeout': 60.0},
+            'asymmetric_decrypt': {'retry': retry, 'timeout': 60.0},
+            'update_crypto_key_primary_version': {'retry': None, 'timeout': 60.0},
+            'destroy_crypto_key_version': {'retry': None, 'timeout': 60.0},
+            'restore_crypto_key_version': {'retry': None, 'timeout': 60.0},
+        }
+
+    def _prep_wrapped_messages(self,
+            client_info: gapic_v1.client_info.ClientInfo,
+            method_configs: typing.Mapping[str, typing.Mapping[str, typing.Any]] = None,
+            rate_limiter: typing.Any = None,
+            concurrency_limiter: typing.Any = None,
+            hedging: typing.Any = None,
+            metrics: typing.Any = None,
+            interceptors: typing.Sequence[typing.Any] = (),
+            ) -> None:
+        """Prepare the table of wrapped RPC methods used by the client.
+
+        Wrapping an RPC method is comparatively expensive, so it is done
+        once per transport rather than on every call. Each method is
+        wrapped on first use, which keeps channel and stub creation lazy.
+
+        Args:
+            client_info (google.api_core.gapic_v1.client_info.ClientInfo):
+                The client info sent as ``x-goog-api-client`` metadata
+                with every request.
+            method_configs (Optional[Mapping[str, Mapping[str, Any]]]):
+                Overrides of the default retry and timeout, keyed by RPC
+                method name. Each value may set ``retry`` and ``timeout``;
+                a ``retry`` of ``None`` disables retries for that method.
+                Setting ``coalesce`` to ``True`` makes identical
+                concurrent requests share a single call; it is only
+                allowed for methods that are retried by default, i.e.
+                that have no side effects.
+            rate_limiter (Optional[~.ratelimit.RateLimiter]): A limiter
+                that every request, retries and hedged requests included,
+                waits for before it is sent. Coalesced requests share one
+                wait.
+            concurrency_limiter (Optional[~.concurrency.AdaptiveLimiter]):
+                A limiter on the requests in flight, which every request
+                waits for after the rate limiter, and which learns from
+                its latency and errors.
+            hedging (Optional[~.hedging.HedgingPolicy]): A policy for
+                sending a second request when a call of one of its
+                methods is slow.
+            metrics (Optional[~.metrics.TransportMetrics]): Where to
+                record the latency and outcome of every call. It is also
+                exposed as :attr:`metrics`.
+            interceptors (Sequence[~.interceptors.Interceptor]): The
+                interceptors every call passes through, the first one
+                outermost.
+
+        Raises:
+            ValueError: If ``method_configs`` names an unknown RPC method
+                or setting, or ``coalesce`` or ``hedging`` covers a
+                method with side effects.
+        """
+        configs = self._default_method_configs()
+        for name in sorted(hedging.methods if hedging is not None else ()):
+            if name not in configs:
+                raise ValueError('Unknown RPC method in hedging: {!r}.'.format(name))
+            if configs[name]['retry'] is None:
+                raise ValueError('{!r} has side effects and cannot be '
+                                 'hedged.'.format(name))
+        for name, config in (method_configs or {}).items():
+            if name not in configs:
+                raise ValueError('Unknown RPC method in method_configs: '
+                                 '{!r}.'.format(name))
+            unknown = set(config) - {'retry', 'timeout', 'coalesce'}
+            if unknown:
+                raise ValueError('Unknown settings for {!r} in method_configs: '
+                                 '{}.'.format(name, ', '.join(sorted(unknown))))
+            if config.get('coalesce') and configs[name]['retry'] is None:
+                raise ValueError('{!r} has side effects and cannot be '
+                                 'coalesced.'.format(name))
+            configs[name] = dict(configs[name], **config)
+        self.metrics = metrics
+        self._wrapped_methods = _WrappedMethods(
+            self, client_info, configs, rate_limiter, concurrency_limiter,
+            hedging, metrics, interceptors)
 
     @property
     def list_key_rings(self) -> typing.Callable[
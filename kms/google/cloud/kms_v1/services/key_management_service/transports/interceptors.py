@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Interceptors around the RPC methods of a client.
+
+An :class:`Interceptor` is handed every call of the client, with the
+method name, the request and the metadata, and a ``proceed`` callable
+that continues the call. It can change the request or metadata before
+proceeding, inspect or replace the response, observe, translate or
+raise exceptions, or answer the call without proceeding at all.
+
+Interceptors run in the order given, the first one outermost. They see
+each call once, as the caller does: with the routing header added to
+the metadata, around any retries, and with the errors mapped to
+:mod:`google.api_core.exceptions`.
+
+For example, to time every call::
+
+    class Timing(Interceptor):
+        def intercept(self, method, request, metadata, proceed):
+            started = time.monotonic()
+            try:
+                return proceed(request, metadata)
+            finally:
+                log(method, time.monotonic() - started)
+
+        async def intercept_async(self, method, request, metadata, proceed):
+            started = time.monotonic()
+            try:
+                return await proceed(request, metadata)
+            finally:
+                log(method, time.monotonic() - started)
+
+    client = Client(interceptors=[Timing()])
+"""
+
+from typing import Any, Awaitable, Callable, Sequence, Tuple
+
+
+class Interceptor:
+    """Base class for interceptors; by default calls are passed on.
+
+    Override :meth:`intercept` for the synchronous clients and
+    :meth:`intercept_async` for the asyncio ones.
+    """
+
+    def intercept(self,
+            method: str,
+            request: Any,
+            metadata: Sequence[Tuple[str, str]],
+            proceed: Callable[[Any, Sequence[Tuple[str, str]]], Any]) -> Any:
+        """Intercept a call and return its response.
+
+        Args:
+            method (str): The RPC method name, e.g. ``'decrypt'``.
+            request: The request message.
+            metadata (Sequence[Tuple[str, str]]): The metadata sent with
+                the call.
+            proceed (Callable[[Any, Sequence[Tuple[str, str]]], Any]):
+                Continues the call with the given request and metadata
+                and returns its response, or raises its exception.
+        """
+        return proceed(request, metadata)
+
+    async def intercept_async(self,
+            method: str,
+            request: Any,
+            metadata: Sequence[Tuple[str, str]],
+            proceed: Callable[[Any, Sequence[Tuple[str, str]]], Awaitable]) -> Any:
+        """Intercept a call of an asyncio client; see :meth:`intercept`.
+
+        ``proceed`` returns an awaitable of the response.
+        """
+        return await proceed(request, metadata)
+
+
+__all__ = (
+    'Interceptor',
+)
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Per-method call metrics recorded by the transport.
+
+:class:`TransportMetrics` counts the calls of each RPC method by status
+code, tracks how many are in flight, and keeps a :class:`Histogram` of
+their latencies. Recording a call costs a few integer operations under
+a per-method lock, so the metrics can stay enabled in production.
+
+The latency of a call is the time the client waited for it, including
+retries and any wait for a rate or concurrency limiter.
+"""
+
+import bisect
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+# Values below 2 ** _SUB_BUCKET_BITS microseconds are counted exactly;
+# above, each power of two is split into 2 ** (_SUB_BUCKET_BITS - 1)
+# linear sub-buckets, so that any value is known to within 1%.
+_SUB_BUCKET_BITS = 8
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+_HALF = _SUB_BUCKETS // 2
+
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+"""The percentiles included in a histogram's snapshot."""
+
+
+def _index(value: int) -> int:
+    if value < _SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - _SUB_BUCKET_BITS
+    return _SUB_BUCKETS + (shift - 1) * _HALF + (value >> shift) - _HALF
+
+
+def _highest_value(index: int) -> int:
+    """Return the highest value counted in the bucket at ``index``."""
+    if index < _SUB_BUCKETS:
+        return index
+    shift, sub_bucket = divmod(index - _SUB_BUCKETS, _HALF)
+    shift += 1
+    return ((sub_bucket + _HALF + 1) << shift) - 1
+
+
+class Histogram:
+    """An HDR-style histogram of durations, with microsecond resolution.
+
+    Buckets are exact below 256 microseconds and then grow with the
+    value, keeping the relative error of every percentile below 1% at a
+    constant cost per recorded value. Only non-empty buckets are stored.
+
+    A histogram is not thread-safe by itself.
+    """
+    def __init__(self) -> None:
+        self._counts = {}  # type: Dict[int, int]
+        self.count = 0
+        self.total = 0.0
+        self.min = None  # type: Optional[float]
+        self.max = None  # type: Optional[float]
+
+    def record(self, seconds: float) -> None:
+        """Count a duration in seconds."""
+        index = _index(max(0, int(seconds * 1e6)))
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Return the duration in seconds below which ``percentile``
+        percent of the values lie, or ``None`` if there are none."""
+        if not self.count:
+            return None
+        rank = max(1, round(self.count * percentile / 100))
+        indexes = sorted(self._counts)
+        counts = list(itertools.accumulate(self._counts[i] for i in indexes))
+        index = indexes[bisect.bisect_left(counts, rank)]
+        return min(self.max, _highest_value(index) / 1e6)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the ``count``, ``min``, ``max`` and ``mean`` of the
+        durations, and their :data:`PERCENTILES` as ``p50`` to ``p99.9``."""
+        snapshot = {
+            'count': self.count,
+            'min': self.min,
+            'max': self.max,
+            'mean': self.total / self.count if self.count else None,
+        }
+        for percentile in PERCENTILES:
+            snapshot['p{:g}'.format(percentile)] = self.percentile(percentile)
+        return snapshot
+
+
+def _code(error: Optional[BaseException]) -> str:
+    """Return the name of the status code of a call's outcome."""
+    if error is None:
+        return 'OK'
+    code = getattr(error, 'grpc_status_code', None)
+    if code is not None:
+        return code.name
+    if type(error).__name__ == 'CancelledError':
+        return 'CANCELLED'
+    return 'UNKNOWN'
+
+
+class _Method:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.codes = {}  # type: Dict[str, int]
+        self.latency = Histogram()
+
+
+class TransportMetrics:
+    """Call counts, status codes, calls in flight and latencies per method.
+
+    Args:
+        sink (Callable[[str, float, str], None]): Called after every
+            call with the method name, the latency in seconds and the
+            status code name, e.g. to forward them to a metrics system.
+            It runs on the calling thread and should return quickly.
+    """
+    def __init__(self, sink: Callable[[str, float, str], None] = None) -> None:
+        self._sink = sink
+        self._methods = {}  # type: Dict[str, _Method]
+        self._lock = threading.Lock()
+
+    def _method(self, method: str) -> _Method:
+        state = self._methods.get(method)
+        if state is None:
+            with self._lock:
+                state = self._methods.setdefault(method, _Method())
+        return state
+
+    def start(self, method: str) -> float:
+        """Count a call as in flight; return when it started."""
+        state = self._method(method)
+        with state.lock:
+            state.in_flight += 1
+        return time.monotonic()
+
+    def finish(self, method: str, started: float,
+            error: Optional[BaseException] = None) -> None:
+        """Record the outcome of a call.
+
+        Args:
+            method (str): The RPC method name.
+            started (float): The value returned by :meth:`start`.
+            error (Optional[BaseException]): The exception raised by the
+                call, if any.
+        """
+        latency = time.monotonic() - started
+        code = _code(error)
+        state = self._method(method)
+        with state.lock:
+            state.in_flight -= 1
+            state.codes[code] = state.codes.get(code, 0) + 1
+            state.latency.record(latency)
+        if self._sink is not None:
+            self._sink(method, latency, code)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return, per method that was called, the number of ``calls``
+        completed, the calls ``in_flight``, the calls per status code in
+        ``codes``, and the :meth:`Histogram.snapshot` of their ``latency``.
+        """
+        with self._lock:
+            methods = dict(self._methods)
+        snapshot = {}
+        for method, state in sorted(methods.items()):
+            with state.lock:
+                snapshot[method] = {
+                    'calls': state.latency.count,
+                    'in_flight': state.in_flight,
+                    'codes': dict(state.codes),
+                    'latency': state.latency.snapshot(),
+                }
+        return snapshot
+
+
+def from_option(option) -> Optional[TransportMetrics]:
+    """Resolve the ``metrics`` client option."""
+    if isinstance(option, TransportMetrics):
+        return option
+    if option:
+        return TransportMetrics()
+    return None
+
+
+__all__ = (
+    'Histogram',
+    'PERCENTILES',
+    'TransportMetrics',
+)
@@ -24,8 +24,8 @@ import nox  # type: ignore
 def unit(session):
     """Run the unit test suite."""
 
-    session.install('coverage', 'pytest', 'pytest-cov')
-    session.install('-e', '.')
+    session.install('coverage', 'pytest', 'pytest-cov', 'pytest-asyncio')
+    session.install('-e', '.[crypto,export]')
 
     session.run(
         'py.test',
@@ -47,3 +47,18 @@ def mypy(session):
         'mypy',
         'google',
     )
+
+
+@nox.session(python=['3.6', '3.7'])
+def benchmark(session):
+    """Run the client micro-benchmarks."""
+    session.install('-e', '.')
+
+    session.run(
+        'python',
+        os.path.join('tests', 'benchmark', 'bench_wrapped_methods.py'),
+    )
+    session.run(
+        'python',
+        os.path.join('tests', 'benchmark', 'bench_import_time.py'),
+    )
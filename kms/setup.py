@@ -27,11 +27,15 @@ setuptools.setup(
     include_package_data=True,
     install_requires=(
         'google-auth >= 1.14.0',
-        'google-api-core >= 1.17.0, < 2.0.0dev',
+        'google-api-core >= 1.22.0, < 2.0.0dev',
         'googleapis-common-protos >= 1.5.8',
-        'grpcio >= 1.10.0',
+        'grpcio >= 1.32.0',
         'proto-plus >= 0.4.0',
     ),
+    extras_require={
+        'crypto': ['cryptography >= 2.5'],
+        'export': ['pyarrow >= 1.0.0'],
+    },
     python_requires='>=3.6',
     setup_requires=[
         'libcst >= 0.2.5',
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Benchmark of the cold-start cost of importing the package.
+
+Each scenario runs in a fresh interpreter, and only the statement
+itself is timed, not the interpreter startup. ``import`` is the package
+import alone, which loads nothing else; ``types`` and ``client`` add the
+first access to a message type and to the client.
+
+The ``client`` scenario is also measured against the import of the
+modules the client depends on, which cancels out the speed of the
+machine; the package's own share is about half of theirs.
+
+The script exits with status 1 if the median time of a scenario exceeds
+its budget, or the client takes more than ``CLIENT_RATIO`` times as long
+as its dependencies, so that it can guard the cold start in CI.
+
+Usage::
+
+    python tests/benchmark/bench_import_time.py [--runs N] [--scale X]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+
+SCENARIOS = (
+    # (label, statement, budget in seconds)
+    ('import', 'import google.cloud.kms', 0.05),
+    ('types', 'import google.cloud.kms; google.cloud.kms.KeyRing', 0.5),
+    ('client', 'import google.cloud.kms; google.cloud.kms.KeyManagementServiceClient', 2.0),
+)
+
+DEPENDENCIES = (
+    'import grpc, proto, google.api_core.gapic_v1, '
+    'google.api_core.grpc_helpers_async, google.oauth2.service_account')
+CLIENT_RATIO = 2.0
+
+TIMER = '''
+import time
+started = time.perf_counter()
+{}
+print(time.perf_counter() - started)
+'''
+
+
+def measure(statement):
+    output = subprocess.check_output(
+        [sys.executable, '-c', TIMER.format(statement)],
+        universal_newlines=True)
+    return float(output.split()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='multiply the budgets, e.g. for slow machines')
+    args = parser.parse_args()
+
+    over = False
+    medians = {}
+    for label, statement, budget in SCENARIOS:
+        median = medians[label] = statistics.median(
+            measure(statement) for _ in range(args.runs))
+        budget *= args.scale
+        over |= median > budget
+        print('{0:<8} {1:8.1f} ms  (budget {2:.0f} ms){3}'.format(
+            label, median * 1e3, budget * 1e3,
+            '  OVER BUDGET' if median > budget else ''))
+
+    dependencies = statistics.median(
+        measure(DEPENDENCIES) for _ in range(args.runs))
+    ratio = medians['client'] / dependencies
+    over |= ratio > CLIENT_RATIO
+    print('{0:<8} {1:8.2f} x   (budget {2:.1f} x){3}'.format(
+        'ratio', ratio, CLIENT_RATIO,
+        '  OVER BUDGET' if ratio > CLIENT_RATIO else ''))
+    return 1 if over else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
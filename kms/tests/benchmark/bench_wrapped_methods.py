@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Micro-benchmark of the client-side overhead of a single RPC.
+
+The gRPC stub is replaced by a function returning a canned response, so
+the numbers only cover the work done by the client: request coercion,
+method wrapping, routing headers, retry/timeout handling and error
+mapping.
+
+``per-call wrap`` reproduces the previous behavior of wrapping the RPC
+method and encoding the routing header on every call; ``client`` is the
+current client code path.
+
+Usage::
+
+    python tests/benchmark/bench_wrapped_methods.py [--number N]
+"""
+
+import argparse
+import timeit
+from unittest import mock
+
+from google.api_core import gapic_v1
+from google.auth import credentials
+from google.cloud.kms_v1.services.key_management_service import KeyManagementServiceClient
+from google.cloud.kms_v1.services.key_management_service import client as client_module
+from google.cloud.kms_v1.types import resources
+from google.cloud.kms_v1.types import service
+
+
+NAME = 'projects/p/locations/l/keyRings/r/cryptoKeys/k'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=20000)
+    args = parser.parse_args()
+
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+    response = resources.CryptoKey(name=NAME)
+    stub = client._transport.get_crypto_key
+
+    def per_call_wrap():
+        request = service.GetCryptoKeyRequest(name=NAME)
+        rpc = gapic_v1.method.wrap_method(
+            client._transport.get_crypto_key,
+            default_timeout=None,
+            client_info=client_module._client_info,
+        )
+        metadata = (
+            gapic_v1.routing_header.to_grpc_metadata((
+                ('name', request.name),
+            )),
+        )
+        return rpc(request, metadata=metadata)
+
+    def current():
+        return client.get_crypto_key(name=NAME)
+
+    with mock.patch.object(type(stub), '__call__',
+                           lambda self, *args, **kwargs: response):
+        for label, func in (('per-call wrap', per_call_wrap),
+                            ('client', current)):
+            func()
+            best = min(timeit.repeat(func, number=args.number, repeat=5))
+            print('{0:<14} {1:8.2f} us/call'.format(
+                label, best / args.number * 1e6))
+
+
+if __name__ == '__main__':
+    main()
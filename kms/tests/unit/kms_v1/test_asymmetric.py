@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import hashlib
+from unittest import mock
+
+import pytest
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric import utils
+
+from google.auth import credentials
+from google.cloud.kms_v1 import asymmetric
+from google.cloud.kms_v1.services.key_management_service import KeyManagementServiceClient
+from google.cloud.kms_v1.types import resources
+from google.cloud.kms_v1.types import service
+
+
+Algorithm = resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm
+NAME = 'projects/p/locations/l/keyRings/r/cryptoKeys/k/cryptoKeyVersions/1'
+MESSAGE = b'message'
+
+RSA_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+P256_KEY = ec.generate_private_key(ec.SECP256R1())
+P384_KEY = ec.generate_private_key(ec.SECP384R1())
+
+
+def pem(private_key):
+    return private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode('ascii')
+
+
+@pytest.fixture
+def client():
+    return KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+
+def patch_public_key(client, private_key, algorithm):
+    return mock.patch.object(
+        type(client._transport.get_public_key), '__call__',
+        return_value=resources.PublicKey(
+            pem=pem(private_key),
+            algorithm=algorithm,
+        ),
+    )
+
+
+def sign(private_key, algorithm):
+    # Sign the way Cloud KMS does: over a digest computed by the caller.
+    hash_ = {'sha256': hashes.SHA256(), 'sha384': hashes.SHA384(),
+             'sha512': hashes.SHA512()}[algorithm.name[-6:].lower()]
+    digest = hashlib.new(hash_.name, MESSAGE).digest()
+    prehashed = utils.Prehashed(hash_)
+    if algorithm.name.startswith('EC_'):
+        signature = private_key.sign(digest, ec.ECDSA(prehashed))
+    elif '_PSS_' in algorithm.name:
+        signature = private_key.sign(digest, padding.PSS(
+            mgf=padding.MGF1(hash_), salt_length=hash_.digest_size), prehashed)
+    else:
+        signature = private_key.sign(digest, padding.PKCS1v15(), prehashed)
+    return {hash_.name: digest}, signature
+
+
+@pytest.mark.parametrize('private_key,algorithm', [
+    (RSA_KEY, Algorithm.RSA_SIGN_PSS_2048_SHA256),
+    (RSA_KEY, Algorithm.RSA_SIGN_PSS_4096_SHA512),
+    (RSA_KEY, Algorithm.RSA_SIGN_PKCS1_2048_SHA256),
+    (RSA_KEY, Algorithm.RSA_SIGN_PKCS1_4096_SHA512),
+    (P256_KEY, Algorithm.EC_SIGN_P256_SHA256),
+    (P384_KEY, Algorithm.EC_SIGN_P384_SHA384),
+])
+def test_verify(client, private_key, algorithm):
+    cache = asymmetric.PublicKeyCache(client)
+    digest, signature = sign(private_key, algorithm)
+    with patch_public_key(client, private_key, algorithm) as call:
+        assert cache.verify(NAME, digest, signature)
+        assert cache.verify(NAME, service.Digest(digest), signature)
+        assert not cache.verify(NAME, digest, signature[:-1] + bytes([signature[-1] ^ 1]))
+
+        # The key is fetched once, by name.
+        call.assert_called_once()
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == service.GetPublicKeyRequest(name=NAME)
+
+
+def test_verify_wrong_digest(client):
+    cache = asymmetric.PublicKeyCache(client)
+    digest, signature = sign(P256_KEY, Algorithm.EC_SIGN_P256_SHA256)
+    with patch_public_key(client, P256_KEY, Algorithm.EC_SIGN_P256_SHA256):
+        with pytest.raises(ValueError, match='SHA256'):
+            cache.verify(NAME, {'sha384': b'x' * 48}, signature)
+
+
+def test_verify_not_a_signing_key(client):
+    cache = asymmetric.PublicKeyCache(client)
+    with patch_public_key(client, RSA_KEY,
+                          Algorithm.RSA_DECRYPT_OAEP_2048_SHA256):
+        with pytest.raises(ValueError):
+            cache.verify(NAME, {'sha256': b'x' * 32}, b'sig')
+
+
+def test_get_caches_parsed_key(client):
+    cache = asymmetric.PublicKeyCache(client)
+    with patch_public_key(client, P256_KEY,
+                          Algorithm.EC_SIGN_P256_SHA256) as call:
+        key = cache.get(NAME)
+        assert cache.get(NAME) is key
+        assert key.name == NAME
+        assert key.algorithm == Algorithm.EC_SIGN_P256_SHA256
+        assert isinstance(key.key, ec.EllipticCurvePublicKey)
+        assert call.call_count == 1
+
+        cache.invalidate(NAME)
+        cache.get(NAME)
+        cache.invalidate()
+        assert len(cache) == 0
+        assert call.call_count == 2
+
+
+def test_get_lru(client):
+    cache = asymmetric.PublicKeyCache(client, max_size=2)
+    with patch_public_key(client, P256_KEY,
+                          Algorithm.EC_SIGN_P256_SHA256) as call:
+        for version in ('1', '2', '1', '3', '1', '2'):
+            cache.get(NAME[:-1] + version)
+        assert len(cache) == 2
+        assert call.call_count == 4
+
+
+def test_invalid_max_size(client):
+    with pytest.raises(ValueError):
+        asymmetric.PublicKeyCache(client, max_size=0)
+
+
+@pytest.mark.parametrize('algorithm,hash_', [
+    (Algorithm.RSA_DECRYPT_OAEP_2048_SHA256, hashes.SHA256()),
+    (Algorithm.RSA_DECRYPT_OAEP_4096_SHA512, hashes.SHA512()),
+])
+def test_encrypt(client, algorithm, hash_):
+    cache = asymmetric.PublicKeyCache(client)
+    oaep = padding.OAEP(mgf=padding.MGF1(hash_), algorithm=hash_, label=None)
+    with patch_public_key(client, RSA_KEY, algorithm) as call:
+        ciphertext = cache.encrypt(NAME, b'secret')
+        assert RSA_KEY.decrypt(ciphertext, oaep) == b'secret'
+
+        ciphertexts = cache.encrypt_batch(NAME, (b'a', b'b', b'c'))
+        assert [RSA_KEY.decrypt(c, oaep) for c in ciphertexts] == [b'a', b'b', b'c']
+        assert call.call_count == 1
+
+
+def test_encrypt_not_an_oaep_key(client):
+    cache = asymmetric.PublicKeyCache(client)
+    with patch_public_key(client, RSA_KEY,
+                          Algorithm.RSA_SIGN_PSS_2048_SHA256):
+        with pytest.raises(ValueError):
+            cache.encrypt(NAME, b'secret')
+
+
+def test_encrypt_too_long(client):
+    cache = asymmetric.PublicKeyCache(client)
+    with patch_public_key(client, RSA_KEY,
+                          Algorithm.RSA_DECRYPT_OAEP_2048_SHA256):
+        with pytest.raises(ValueError):
+            cache.encrypt(NAME, b'x' * 191)
@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import io
+from unittest import mock
+
+import pytest
+
+from google.auth import credentials
+from google.cloud.kms_v1 import envelope
+from google.cloud.kms_v1.services.key_management_service import KeyManagementServiceClient
+from google.cloud.kms_v1.types import service
+
+
+KEY_NAME = 'projects/p/locations/l/keyRings/r/cryptoKeys/k'
+
+
+def fake_kms(request, **kwargs):
+    # "Wrap" a DEK by reversing it, so unwrapping can be checked.
+    if isinstance(request, service.EncryptRequest):
+        return service.EncryptResponse(
+            name=request.name,
+            ciphertext=request.plaintext[::-1],
+        )
+    return service.DecryptResponse(plaintext=request.ciphertext[::-1])
+
+
+@pytest.fixture
+def client():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+    # Encrypt and decrypt share a stub type, so one patch covers both.
+    with mock.patch.object(
+            type(client._transport.encrypt),
+            '__call__', side_effect=fake_kms) as call:
+        client.call = call
+        yield client
+
+
+def kms_calls(client, request_type):
+    return [c for c in client.call.mock_calls
+            if c.args and isinstance(c.args[0], request_type)]
+
+
+@pytest.mark.parametrize('size', [0, 1, 15, 16, 17, 64, 1000])
+def test_encrypt_decrypt_round_trip(client, size):
+    cipher = envelope.EnvelopeCipher(client, KEY_NAME, segment_size=16)
+    plaintext = bytes(range(256)) * 4
+    plaintext = plaintext[:size]
+
+    ciphertext = cipher.encrypt(plaintext, b'aad')
+    assert ciphertext.startswith(envelope.MAGIC)
+    header = envelope.EnvelopeHeader.parse(ciphertext)
+    segments = max(1, -(-size // 16))
+    assert len(ciphertext) == len(header.raw) + size + 16 * segments
+    assert cipher.decrypt(ciphertext, b'aad') == plaintext
+
+
+def test_dek_wrapped_once(client):
+    cipher = envelope.EnvelopeCipher(client, KEY_NAME)
+    ciphertexts = [cipher.encrypt(b'record %d' % i) for i in range(10)]
+
+    encrypts = kms_calls(client, service.EncryptRequest)
+    assert len(encrypts) == 1
+    request = encrypts[0].args[0]
+    assert request.name == KEY_NAME
+    assert len(request.plaintext) == envelope.DEK_SIZE
+
+    headers = [envelope.EnvelopeHeader.parse(c) for c in ciphertexts]
+    assert len({h.wrapped_dek for h in headers}) == 1
+    assert len({h.nonce_prefix for h in headers}) == 10
+    assert headers[0].key_name == KEY_NAME
+
+    decrypter = envelope.EnvelopeCipher(client)
+    for i, ciphertext in enumerate(ciphertexts):
+        assert decrypter.decrypt(ciphertext) == b'record %d' % i
+    decrypts = kms_calls(client, service.DecryptRequest)
+    assert decrypts[0].args[0].name == KEY_NAME
+
+
+def test_dek_rotated_after_max_uses(client):
+    cipher = envelope.EnvelopeCipher(client, KEY_NAME, max_dek_uses=2)
+    for i in range(5):
+        cipher.encrypt(b'x')
+    assert len(kms_calls(client, service.EncryptRequest)) == 3
+
+
+def test_dek_rotated_after_max_age(client):
+    cipher = envelope.EnvelopeCipher(client, KEY_NAME, max_dek_age=10)
+    with mock.patch('time.monotonic', return_value=100.0):
+        cipher.encrypt(b'x')
+        cipher.encrypt(b'x')
+    with mock.patch('time.monotonic', return_value=110.0):
+        cipher.encrypt(b'x')
+    assert len(kms_calls(client, service.EncryptRequest)) == 2
+
+
+def test_kms_associated_data(client):
+    cipher = envelope.EnvelopeCipher(
+        client, KEY_NAME, kms_associated_data=b'ctx')
+    cipher.decrypt(cipher.encrypt(b'x'))
+    for request_type in (service.EncryptRequest, service.DecryptRequest):
+        request = kms_calls(client, request_type)[0].args[0]
+        assert request.additional_authenticated_data == b'ctx'
+
+
+def test_stream_round_trip(client):
+    cipher = envelope.EnvelopeCipher(client, KEY_NAME, segment_size=1024)
+    plaintext = bytes(range(256)) * 100
+    ciphertext = io.BytesIO()
+    cipher.encrypt_stream(io.BytesIO(plaintext), ciphertext)
+
+    ciphertext.seek(0)
+    result = io.BytesIO()
+    cipher.decrypt_stream(ciphertext, result)
+    assert result.getvalue() == plaintext
+
+
+def test_decrypt_wrong_associated_data(client):
+    cipher = envelope.EnvelopeCipher(client, KEY_NAME)
+    ciphertext = cipher.encrypt(b'secret', b'a')
+    with pytest.raises(ValueError):
+        cipher.decrypt(ciphertext, b'b')
+
+
+def test_decrypt_tampered(client):
+    cipher = envelope.EnvelopeCipher(client, KEY_NAME)
+    ciphertext = bytearray(cipher.encrypt(b'secret'))
+    ciphertext[-1] ^= 1
+    with pytest.raises(ValueError):
+        cipher.decrypt(bytes(ciphertext))
+
+
+def test_decrypt_truncated_segments(client):
+    cipher = envelope.EnvelopeCipher(client, KEY_NAME, segment_size=4)
+    ciphertext = cipher.encrypt(b'0123456789')
+    # Drop the final segment; the previous one is not marked as last.
+    with pytest.raises(ValueError):
+        cipher.decrypt(ciphertext[:-(2 + 16)])
+
+
+def test_decrypt_reordered_segments(client):
+    cipher = envelope.EnvelopeCipher(client, KEY_NAME, segment_size=4)
+    ciphertext = cipher.encrypt(b'01234567abcd')
+    header = envelope.EnvelopeHeader.parse(ciphertext)
+    body = ciphertext[len(header.raw):]
+    segments = [body[i:i + 20] for i in range(0, len(body), 20)]
+    swapped = header.raw + segments[1] + segments[0] + segments[2]
+    with pytest.raises(ValueError):
+        cipher.decrypt(swapped)
+
+
+@pytest.mark.parametrize('data,message', [
+    (b'', 'Truncated'),
+    (b'XXXX\x01\x00\x00', 'Not an envelope'),
+    (envelope.MAGIC + b'\x09\x00\x00', 'Unsupported'),
+    (envelope.MAGIC + b'\x01\x00\x00\x00\x00\x00\x00\x00\x00', 'segment size'),
+])
+def test_decrypt_malformed_header(client, data, message):
+    cipher = envelope.EnvelopeCipher(client, KEY_NAME)
+    with pytest.raises(ValueError, match=message):
+        cipher.decrypt(data)
+
+
+def test_encrypt_requires_key_name(client):
+    cipher = envelope.EnvelopeCipher(client)
+    with pytest.raises(ValueError):
+        cipher.encrypt(b'x')
+
+
+def test_too_many_segments(client):
+    cipher = envelope.EnvelopeCipher(client, KEY_NAME, segment_size=1)
+    with mock.patch.object(envelope, '_MAX_SEGMENTS', 2):
+        cipher.encrypt(b'ab')
+        with pytest.raises(ValueError):
+            cipher.encrypt(b'abc')
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'max_dek_uses': 0},
+    {'max_dek_uses': envelope.MAX_DEK_USES + 1},
+    {'segment_size': 0},
+    {'segment_size': 1 << 32},
+])
+def test_invalid_arguments(client, kwargs):
+    with pytest.raises(ValueError):
+        envelope.EnvelopeCipher(client, KEY_NAME, **kwargs)
+
+
+def test_max_dek_uses(client):
+    # The nonce prefixes of the ciphertexts under one DEK are random
+    # 56-bit values; 2**12 of them keep the chance of a collision below
+    # 2**-33.
+    assert envelope.MAX_DEK_USES == 1 << 12
+    assert envelope._NONCE_PREFIX_SIZE == 7
+
+    cipher = envelope.EnvelopeCipher(client, KEY_NAME)
+    with mock.patch.object(cipher, '_wrap', side_effect=cipher._wrap) as wrap:
+        for _ in range(envelope.MAX_DEK_USES):
+            cipher._current_dek()
+        assert wrap.call_count == 1
+        cipher._current_dek()
+        assert wrap.call_count == 2
+
+
+def test_dek_cache_decrypt(client):
+    cache = envelope.DekCache()
+    cipher = envelope.EnvelopeCipher(client, KEY_NAME)
+    ciphertexts = [cipher.encrypt(b'record %d' % i) for i in range(5)]
+
+    decrypter = envelope.EnvelopeCipher(client, dek_cache=cache)
+    for i, ciphertext in enumerate(ciphertexts):
+        assert decrypter.decrypt(ciphertext) == b'record %d' % i
+    assert len(kms_calls(client, service.DecryptRequest)) == 1
+    assert cache.stats() == {'hits': 4, 'misses': 1, 'evictions': 0, 'size': 1}
+
+
+def test_dek_cache_primed_by_encrypt(client):
+    cache = envelope.DekCache()
+    cipher = envelope.EnvelopeCipher(client, KEY_NAME, dek_cache=cache)
+    assert cipher.decrypt(cipher.encrypt(b'x')) == b'x'
+    assert not kms_calls(client, service.DecryptRequest)
+    assert cache.hits == 1
+
+
+def test_dek_cache_keyed_by_associated_data(client):
+    cache = envelope.DekCache()
+    cipher = envelope.EnvelopeCipher(
+        client, KEY_NAME, kms_associated_data=b'a', dek_cache=cache)
+    other = envelope.EnvelopeCipher(
+        client, kms_associated_data=b'b', dek_cache=cache)
+    other.decrypt(cipher.encrypt(b'x'))
+    assert cache.misses == 1
+    assert len(cache) == 2
+
+
+def test_dek_cache_lru():
+    cache = envelope.DekCache(max_size=2)
+    load = mock.Mock(side_effect=lambda: object())
+    for dek in (b'1', b'2', b'1', b'3'):
+        cache.get(KEY_NAME, dek, b'', load)
+    # b'2' was the least recently used entry.
+    assert cache.evictions == 1
+    cache.get(KEY_NAME, b'1', b'', load)
+    cache.get(KEY_NAME, b'2', b'', load)
+    assert load.call_count == 4
+
+
+def test_dek_cache_max_age():
+    cache = envelope.DekCache(max_age=10)
+    load = mock.Mock(return_value='dek')
+    with mock.patch('time.monotonic', return_value=100.0):
+        cache.get(KEY_NAME, b'1', b'', load)
+        cache.get(KEY_NAME, b'1', b'', load)
+    with mock.patch('time.monotonic', return_value=110.0):
+        assert cache.get(KEY_NAME, b'1', b'', load) == 'dek'
+    assert load.call_count == 2
+    assert cache.stats() == {'hits': 1, 'misses': 2, 'evictions': 1, 'size': 1}
+
+
+def test_dek_cache_no_max_age():
+    cache = envelope.DekCache(max_age=None)
+    load = mock.Mock(return_value='dek')
+    with mock.patch('time.monotonic', return_value=0.0):
+        cache.get(KEY_NAME, b'1', b'', load)
+    with mock.patch('time.monotonic', return_value=1e9):
+        cache.get(KEY_NAME, b'1', b'', load)
+    assert load.call_count == 1
+
+
+def test_dek_cache_max_uses():
+    cache = envelope.DekCache(max_uses=3)
+    load = mock.Mock(return_value='dek')
+    for _ in range(7):
+        cache.get(KEY_NAME, b'1', b'', load)
+    assert load.call_count == 3
+    assert cache.evictions == 2
+
+
+def test_dek_cache_invalidate():
+    cache = envelope.DekCache()
+    for name, dek in (('a', b'1'), ('a', b'2'), ('b', b'1')):
+        cache.put(name, dek, b'', 'dek')
+    assert cache.invalidate('a', b'1') == 1
+    assert cache.invalidate(wrapped_dek=b'1') == 1
+    assert cache.invalidate('a') == 1
+    cache.put('c', b'1', b'', 'dek')
+    assert cache.invalidate() == 1
+    assert len(cache) == 0
+    assert cache.evictions == 0
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'max_size': 0},
+    {'max_uses': 0},
+])
+def test_dek_cache_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        envelope.DekCache(**kwargs)
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import datetime
+import io
+import json
+from unittest import mock
+
+import pytest
+from pyarrow import parquet
+
+from google.auth import credentials
+from google.cloud.kms_v1 import export
+from google.cloud.kms_v1.services.key_management_service import KeyManagementServiceClient
+from google.cloud.kms_v1.types import resources
+from google.cloud.kms_v1.types import service
+from google.protobuf import timestamp_pb2 as timestamp  # type: ignore
+
+
+Version = resources.CryptoKeyVersion
+UTC = datetime.timezone.utc
+
+KEY_RING = resources.KeyRing(
+    name='projects/p/locations/l/keyRings/r',
+    create_time=timestamp.Timestamp(seconds=1600000000),
+)
+CRYPTO_KEY = resources.CryptoKey(
+    name='projects/p/locations/l/keyRings/r/cryptoKeys/k',
+    purpose=resources.CryptoKey.CryptoKeyPurpose.ENCRYPT_DECRYPT,
+    primary=Version(state=Version.CryptoKeyVersionState.ENABLED),
+    version_template=resources.CryptoKeyVersionTemplate(
+        algorithm=Version.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION,
+        protection_level=resources.ProtectionLevel.HSM,
+    ),
+    create_time=timestamp.Timestamp(seconds=1600000000, nanos=123456789),
+    labels={'team': 'security'},
+)
+VERSION = Version(
+    name='projects/p/locations/l/keyRings/r/cryptoKeys/k/cryptoKeyVersions/1',
+    state=Version.CryptoKeyVersionState.DESTROYED,
+    algorithm=Version.CryptoKeyVersionAlgorithm.EC_SIGN_P256_SHA256,
+    protection_level=resources.ProtectionLevel.SOFTWARE,
+    create_time=timestamp.Timestamp(seconds=1600000000),
+    destroy_time=timestamp.Timestamp(seconds=1700000000),
+)
+
+KEY_RING_ROW = {
+    'type': 'KeyRing',
+    'name': 'projects/p/locations/l/keyRings/r',
+    'purpose': None,
+    'state': None,
+    'algorithm': None,
+    'protection_level': None,
+    'create_time': datetime.datetime(2020, 9, 13, 12, 26, 40, tzinfo=UTC),
+    'destroy_time': None,
+    'labels': None,
+}
+CRYPTO_KEY_ROW = {
+    'type': 'CryptoKey',
+    'name': 'projects/p/locations/l/keyRings/r/cryptoKeys/k',
+    'purpose': 'ENCRYPT_DECRYPT',
+    'state': 'ENABLED',
+    'algorithm': 'GOOGLE_SYMMETRIC_ENCRYPTION',
+    'protection_level': 'HSM',
+    'create_time': datetime.datetime(2020, 9, 13, 12, 26, 40, 123456, tzinfo=UTC),
+    'destroy_time': None,
+    'labels': {'team': 'security'},
+}
+VERSION_ROW = {
+    'type': 'CryptoKeyVersion',
+    'name': 'projects/p/locations/l/keyRings/r/cryptoKeys/k/cryptoKeyVersions/1',
+    'purpose': None,
+    'state': 'DESTROYED',
+    'algorithm': 'EC_SIGN_P256_SHA256',
+    'protection_level': 'SOFTWARE',
+    'create_time': datetime.datetime(2020, 9, 13, 12, 26, 40, tzinfo=UTC),
+    'destroy_time': datetime.datetime(2023, 11, 14, 22, 13, 20, tzinfo=UTC),
+    'labels': None,
+}
+
+
+def test_to_row():
+    assert export.to_row(KEY_RING) == KEY_RING_ROW
+    assert export.to_row(CRYPTO_KEY) == CRYPTO_KEY_ROW
+    assert export.to_row(VERSION) == VERSION_ROW
+    assert export.to_row(Version.pb(VERSION)) == VERSION_ROW
+
+
+def test_to_row_unset_fields():
+    row = export.to_row(resources.CryptoKey(name='k'))
+    assert row['purpose'] is None
+    assert row['state'] is None
+    assert row['create_time'] is None
+    assert row['labels'] == {}
+
+
+def test_to_row_import_job():
+    row = export.to_row(resources.ImportJob(
+        name='projects/p/locations/l/keyRings/r/importJobs/j',
+        import_method=resources.ImportJob.ImportMethod.RSA_OAEP_3072_SHA1_AES_256,
+        protection_level=resources.ProtectionLevel.HSM,
+        state=resources.ImportJob.ImportJobState.ACTIVE,
+    ))
+    assert row['type'] == 'ImportJob'
+    assert row['state'] == 'ACTIVE'
+    assert row['algorithm'] == 'RSA_OAEP_3072_SHA1_AES_256'
+    assert row['protection_level'] == 'HSM'
+
+
+def test_to_row_unknown_type():
+    with pytest.raises(TypeError):
+        export.to_row(resources.PublicKey())
+
+
+def test_iter_rows_from_pager():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    with mock.patch.object(
+            type(client._transport.list_crypto_key_versions),
+            '__call__') as call:
+        call.side_effect = (
+            service.ListCryptoKeyVersionsResponse(
+                crypto_key_versions=[VERSION, VERSION],
+                next_page_token='abc',
+            ),
+            service.ListCryptoKeyVersionsResponse(next_page_token='def'),
+            service.ListCryptoKeyVersionsResponse(
+                crypto_key_versions=[VERSION],
+            ),
+        )
+        pager = client.list_crypto_key_versions(parent='parent_value')
+        with mock.patch.object(Version, 'wrap') as wrap:
+            rows = list(export.iter_rows(pager))
+            # No proto-plus wrapper is built for the resources.
+            wrap.assert_not_called()
+    assert rows == [VERSION_ROW] * 3
+
+
+def test_write_ndjson():
+    out = io.StringIO()
+    assert export.write_ndjson([KEY_RING, CRYPTO_KEY, VERSION], out) == 3
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert lines[0]['create_time'] == '2020-09-13T12:26:40Z'
+    assert lines[1]['create_time'] == '2020-09-13T12:26:40.123456Z'
+    assert lines[1]['labels'] == {'team': 'security'}
+    assert lines[2]['destroy_time'] == '2023-11-14T22:13:20Z'
+    assert [list(line) for line in lines] == [list(export.COLUMNS)] * 3
+
+
+@pytest.mark.parametrize('count,row_group_size', [
+    (0, 2),
+    (3, 2),
+    (4, 2),
+])
+def test_write_parquet(count, row_group_size):
+    source = ([KEY_RING, CRYPTO_KEY, VERSION] * 2)[:count]
+    out = io.BytesIO()
+    assert export.write_parquet(
+        source, out, row_group_size=row_group_size) == count
+
+    out.seek(0)
+    table = parquet.read_table(out)
+    assert table.column_names == list(export.COLUMNS)
+    rows = table.to_pylist()
+    assert len(rows) == count
+    expected = ([KEY_RING_ROW, CRYPTO_KEY_ROW, VERSION_ROW] * 2)[:count]
+    for row, expected_row in zip(rows, expected):
+        if row['labels'] is not None:
+            row['labels'] = dict(row['labels'])
+        assert row == expected_row
+
+
+def test_write_parquet_invalid_row_group_size():
+    with pytest.raises(ValueError):
+        export.write_parquet([], io.BytesIO(), row_group_size=0)
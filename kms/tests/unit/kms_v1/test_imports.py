@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import subprocess
+import sys
+from unittest import mock
+
+import pytest
+
+from google.cloud import kms
+from google.cloud import kms_v1
+from google.cloud.kms_v1.services.key_management_service import KeyManagementServiceClient
+from google.cloud.kms_v1.types import resources
+from google.cloud.kms_v1.types import service
+
+
+def loaded_modules(statement):
+    """Return the modules loaded by ``statement`` in a fresh interpreter."""
+    output = subprocess.check_output([
+        sys.executable, '-c',
+        'import sys; before = set(sys.modules); {}; '
+        'print(" ".join(set(sys.modules) - before))'.format(statement),
+    ], universal_newlines=True)
+    return set(output.split())
+
+
+@pytest.mark.parametrize('package', [kms, kms_v1])
+def test_lazy_attributes(package):
+    assert package.KeyRing is resources.KeyRing
+    assert package.DecryptRequest is service.DecryptRequest
+    assert package.KeyManagementServiceClient is KeyManagementServiceClient
+    assert set(package.__all__) <= set(dir(package))
+    with pytest.raises(AttributeError):
+        package.NoSuchThing
+
+
+def test_subpackages():
+    # Subpackages are reachable by attribute access alone.
+    modules = loaded_modules('from google.cloud import kms_v1; kms_v1.types.EncryptRequest')
+    assert 'google.cloud.kms_v1.types.service' in modules
+
+    # A failing import is not mistaken for a missing subpackage.
+    with mock.patch('importlib.import_module',
+                    side_effect=ImportError('broken', name='grpc')):
+        with pytest.raises(ImportError):
+            kms_v1.no_such_module
+
+
+def test_lazy_imports():
+    modules = loaded_modules('import google.cloud.kms')
+    assert 'google.cloud.kms_v1.types.resources' not in modules
+    assert 'grpc' not in modules
+
+    modules = loaded_modules('import google.cloud.kms; google.cloud.kms.KeyRing')
+    assert 'google.cloud.kms_v1.types.resources' in modules
+    assert 'google.cloud.kms_v1.services.key_management_service.client' not in modules
+    assert 'grpc' not in modules
+
+
+def test_no_pkg_resources():
+    # Importing pkg_resources scans every installed distribution.
+    modules = loaded_modules('import google.cloud.kms_v1; google.cloud.kms_v1.KeyManagementServiceClient')
+    assert 'google.cloud.kms_v1.services.key_management_service.client' in modules
+    assert 'pkg_resources' not in modules
+
+
+@pytest.mark.parametrize('package', ['google.cloud.kms', 'google.cloud.kms_v1'])
+def test_bare_import(package):
+    # The package import alone loads none of its modules.
+    modules = loaded_modules('import ' + package)
+    assert not any(m.startswith('google.cloud.kms_v1.') for m in modules)
+    assert 'pkg_resources' not in modules
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import datetime
+import re
+from unittest import mock
+
+import pytest
+
+from google.auth import credentials
+from google.cloud.kms_v1 import index
+from google.cloud.kms_v1.services.key_management_service import KeyManagementServiceClient
+from google.cloud.kms_v1.types import resources
+from google.cloud.kms_v1.types import service
+from google.protobuf import timestamp_pb2 as timestamp  # type: ignore
+
+
+LOCATION = 'projects/p/locations/global'
+RING = LOCATION + '/keyRings/r'
+KEY = RING + '/cryptoKeys/k'
+
+Algorithm = resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm
+State = resources.CryptoKeyVersion.CryptoKeyVersionState
+
+
+def ts(seconds):
+    return timestamp.Timestamp(seconds=seconds)
+
+
+class FakeKms:
+    """Serve ``resources``, one per page, honouring create_time filters."""
+    def __init__(self):
+        self.resources = {
+            'ListKeyRingsRequest': [
+                resources.KeyRing(name=RING, create_time=ts(100)),
+            ],
+            'ListImportJobsRequest': [
+                resources.ImportJob(
+                    name=RING + '/importJobs/j', create_time=ts(110),
+                    protection_level=resources.ProtectionLevel.HSM),
+            ],
+            'ListCryptoKeysRequest': [
+                resources.CryptoKey(name=KEY, create_time=ts(120),
+                                    labels={'env': 'prod'}),
+            ],
+            'ListCryptoKeyVersionsRequest': [
+                self.version(1, 200, State.ENABLED),
+                self.version(2, 300, State.DISABLED),
+            ],
+        }
+        self.requests = []
+
+    @staticmethod
+    def version(number, created, state, protection_level=resources.ProtectionLevel.HSM):
+        return resources.CryptoKeyVersion(
+            name='{}/cryptoKeyVersions/{}'.format(KEY, number),
+            create_time=ts(created),
+            state=state,
+            protection_level=protection_level,
+            algorithm=Algorithm.GOOGLE_SYMMETRIC_ENCRYPTION,
+        )
+
+    def __call__(self, request, **kwargs):
+        self.requests.append(request)
+        kind = type(request).__name__
+        items = self.resources[kind]
+        match = re.fullmatch(r'create_time >= "(.*)Z"', request.filter)
+        if match:
+            since = match.group(1)
+            since = datetime.datetime.strptime(
+                since, '%Y-%m-%dT%H:%M:%S.%f' if '.' in since else '%Y-%m-%dT%H:%M:%S',
+            ).replace(tzinfo=datetime.timezone.utc).timestamp()
+            items = [i for i in items if i.create_time.timestamp() >= since]
+        else:
+            assert not request.filter
+        assert request.order_by == 'create_time'
+        items = sorted(items, key=lambda i: i.create_time.timestamp())
+
+        page = int(request.page_token or 0)
+        token = str(page + 1) if page + 1 < len(items) else ''
+        field = {
+            'ListKeyRingsRequest': 'key_rings',
+            'ListImportJobsRequest': 'import_jobs',
+            'ListCryptoKeysRequest': 'crypto_keys',
+            'ListCryptoKeyVersionsRequest': 'crypto_key_versions',
+        }[kind]
+        response_type = getattr(service, kind.replace('Request', 'Response'))
+        return response_type(
+            next_page_token=token, **{field: items[page:page + 1]})
+
+    def filters(self):
+        filters = [(type(r).__name__, r.filter) for r in self.requests if not r.page_token]
+        self.requests = []
+        return filters
+
+
+@pytest.fixture
+def client():
+    return KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+
+@pytest.fixture
+def fake(client):
+    fake = FakeKms()
+    # All list methods share a stub type, so one patch covers them all.
+    with mock.patch.object(
+            type(client._transport.list_key_rings), '__call__', side_effect=fake):
+        yield fake
+
+
+def names(rows):
+    return [row['name'] for row in rows]
+
+
+def test_sync(client, fake):
+    idx = index.InventoryIndex(client)
+    stats = idx.sync('p', ['global'])
+    assert stats == {'listed': 5, 'deleted': 0, 'reconciled': 1}
+    assert fake.filters() == [
+        ('ListKeyRingsRequest', ''),
+        ('ListImportJobsRequest', ''),
+        ('ListCryptoKeysRequest', ''),
+        ('ListCryptoKeyVersionsRequest', ''),
+    ]
+
+    key, = idx.find('CryptoKey')
+    assert key['name'] == KEY
+    assert key['labels'] == {'env': 'prod'}
+    assert key['create_time'] == datetime.datetime(
+        1970, 1, 1, 0, 2, tzinfo=datetime.timezone.utc)
+    job, = idx.find('ImportJob', parent=RING)
+    assert job['protection_level'] == 'HSM'
+    assert idx.find('KeyRing')[0]['labels'] is None
+    assert len(idx.find()) == 5
+
+    # New versions are picked up incrementally.
+    fake.resources['ListCryptoKeyVersionsRequest'].append(
+        fake.version(3, 400, State.ENABLED))
+    stats = idx.sync('p', ['global'])
+    assert stats == {'listed': 5, 'deleted': 0, 'reconciled': 0}
+    assert fake.filters() == [
+        ('ListKeyRingsRequest', 'create_time >= "1970-01-01T00:01:40Z"'),
+        ('ListImportJobsRequest', 'create_time >= "1970-01-01T00:01:50Z"'),
+        ('ListCryptoKeysRequest', 'create_time >= "1970-01-01T00:02:00Z"'),
+        ('ListCryptoKeyVersionsRequest', 'create_time >= "1970-01-01T00:05:00Z"'),
+    ]
+    assert names(idx.find('CryptoKeyVersion', state='ENABLED')) == [
+        KEY + '/cryptoKeyVersions/1',
+        KEY + '/cryptoKeyVersions/3',
+    ]
+    idx.close()
+
+
+def test_sync_reconcile(client, fake):
+    idx = index.InventoryIndex(client)
+    idx.sync('p', ['global'])
+
+    # Updates and deletions are only seen when reconciling.
+    fake.resources['ListCryptoKeyVersionsRequest'] = [
+        fake.version(1, 200, State.DESTROYED),
+    ]
+    idx.sync('p', ['global'])
+    assert len(idx.find('CryptoKeyVersion')) == 2
+    assert idx.find(state='DESTROYED') == []
+
+    stats = idx.sync('p', ['global'], reconcile=True)
+    assert stats == {'listed': 4, 'deleted': 1, 'reconciled': 1}
+    assert all(not f for _, f in fake.filters()[-4:])
+    version, = idx.find('CryptoKeyVersion')
+    assert version['state'] == 'DESTROYED'
+
+
+def test_sync_reconcile_other_location(client, fake):
+    idx = index.InventoryIndex(client)
+    idx.sync('p', ['global'])
+
+    # Reconciling a location leaves the names of its siblings alone,
+    # including those a LIKE pattern would match.
+    fake.resources['ListKeyRingsRequest'] = []
+    for location in ('glob_l', 'GLOBAL'):
+        assert idx.sync('p', [location], reconcile=True)['deleted'] == 0
+    assert len(idx.find()) == 5
+
+
+def test_sync_reconcile_interval(client, fake):
+    idx = index.InventoryIndex(client, reconcile_interval=60)
+    with mock.patch('time.time', return_value=1000.0):
+        assert idx.sync('p', ['global'])['reconciled'] == 1
+    with mock.patch('time.time', return_value=1030.0):
+        assert idx.sync('p', ['global'])['reconciled'] == 0
+    with mock.patch('time.time', return_value=1060.0):
+        assert idx.sync('p', ['global'])['reconciled'] == 1
+    assert idx.sync('p', ['global'], reconcile=False)['reconciled'] == 0
+
+
+def test_sync_empty(client, fake):
+    fake.resources['ListKeyRingsRequest'] = []
+    idx = index.InventoryIndex(client)
+    assert idx.sync('p', ['global']) == {'listed': 0, 'deleted': 0, 'reconciled': 1}
+    idx.sync('p', ['global'])
+    assert fake.filters()[-1] == ('ListKeyRingsRequest', '')
+
+
+def test_persistence(client, fake, tmp_path):
+    path = str(tmp_path / 'kms.sqlite')
+    idx = index.InventoryIndex(client, path)
+    idx.sync('p', ['global'])
+    idx.close()
+
+    fake.filters()
+    idx = index.InventoryIndex(client, path)
+    assert len(idx.find()) == 5
+    idx.sync('p', ['global'])
+    assert fake.filters()[0] == (
+        'ListKeyRingsRequest', 'create_time >= "1970-01-01T00:01:40Z"')
+    count, = idx.connection.execute('SELECT COUNT(*) FROM resources').fetchone()
+    assert count == 5
+
+
+def test_find(client, fake):
+    fake.resources['ListCryptoKeyVersionsRequest'].append(fake.version(
+        3, 100 * 86400, State.ENABLED, resources.ProtectionLevel.SOFTWARE))
+    idx = index.InventoryIndex(client)
+    idx.sync('p', ['global'])
+
+    now = datetime.datetime(1970, 4, 11)
+    assert names(idx.find(
+        'CryptoKeyVersion',
+        state='ENABLED',
+        protection_level='HSM',
+        created_before=now - datetime.timedelta(days=90),
+    )) == [KEY + '/cryptoKeyVersions/1']
+    assert names(idx.find(
+        created_after=datetime.datetime(1970, 1, 2, tzinfo=datetime.timezone.utc),
+    )) == [KEY + '/cryptoKeyVersions/3']
+    assert names(idx.find(
+        algorithm='GOOGLE_SYMMETRIC_ENCRYPTION', protection_level='SOFTWARE',
+    )) == [KEY + '/cryptoKeyVersions/3']
+    assert idx.find(purpose='ASYMMETRIC_SIGN') == []
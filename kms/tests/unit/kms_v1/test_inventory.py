@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from google.api_core import exceptions
+from google.auth import credentials
+from google.cloud.kms_v1 import inventory
+from google.cloud.kms_v1.services.key_management_service import KeyManagementServiceClient
+from google.cloud.kms_v1.types import resources
+from google.cloud.kms_v1.types import service
+
+
+class FakeKms:
+    """Serve a fixed hierarchy, two children per parent, one per page."""
+    def __init__(self, fanout=2, delay=0.0, fail=None):
+        self.fanout = fanout
+        self.delay = delay
+        self.fail = fail
+        self.requests = []
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def __call__(self, request, **kwargs):
+        with self.lock:
+            self.requests.append(request)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if self.fail and request.parent.endswith(self.fail):
+                raise exceptions.PermissionDenied('denied')
+            index = int(request.page_token or 0)
+            token = str(index + 1) if index + 1 < self.fanout else ''
+            if isinstance(request, service.ListKeyRingsRequest):
+                return service.ListKeyRingsResponse(
+                    key_rings=[resources.KeyRing(
+                        name='{}/keyRings/r{}'.format(request.parent, index))],
+                    next_page_token=token,
+                )
+            if isinstance(request, service.ListCryptoKeysRequest):
+                return service.ListCryptoKeysResponse(
+                    crypto_keys=[resources.CryptoKey(
+                        name='{}/cryptoKeys/k{}'.format(request.parent, index))],
+                    next_page_token=token,
+                )
+            return service.ListCryptoKeyVersionsResponse(
+                crypto_key_versions=[resources.CryptoKeyVersion(
+                    name='{}/cryptoKeyVersions/{}'.format(request.parent, index))],
+                next_page_token=token,
+            )
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def client():
+    return KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+
+def patch_list(client, fake):
+    # All list methods share a stub type, so one patch covers them all.
+    return mock.patch.object(
+        type(client._transport.list_key_rings), '__call__', side_effect=fake)
+
+
+def test_crawl(client):
+    fake = FakeKms(delay=0.001)
+    with patch_list(client, fake):
+        results = list(inventory.crawl(client, 'p', ['global', 'us'],
+                                       max_concurrency=4, buffer_size=2))
+
+    key_rings = [r for r in results if isinstance(r, resources.KeyRing)]
+    crypto_keys = [r for r in results if isinstance(r, resources.CryptoKey)]
+    versions = [r for r in results if isinstance(r, resources.CryptoKeyVersion)]
+    assert len(key_rings) == 4
+    assert len(crypto_keys) == 8
+    assert len(versions) == 16
+    assert len({r.name for r in results}) == 28
+    assert 'projects/p/locations/us/keyRings/r1/cryptoKeys/k0/cryptoKeyVersions/1' in {
+        v.name for v in versions}
+
+    # A parent is always yielded before its children.
+    position = {r.name: i for i, r in enumerate(results)}
+    for name, i in position.items():
+        parent = name.rsplit('/', 2)[0]
+        if parent in position:
+            assert position[parent] < i
+    assert fake.peak <= 4
+
+
+def test_crawl_pushdown(client):
+    fake = FakeKms(fanout=1)
+    view = resources.CryptoKeyVersion.CryptoKeyVersionView.FULL
+    with patch_list(client, fake):
+        list(inventory.crawl(
+            client, 'p', ['global'],
+            key_ring_filter='name:r',
+            crypto_key_filter='purpose=ENCRYPT_DECRYPT',
+            crypto_key_version_filter='state=ENABLED',
+            version_view=view,
+            page_size=50,
+        ))
+
+    key_rings, crypto_keys, versions = fake.requests
+    assert key_rings == service.ListKeyRingsRequest(
+        parent='projects/p/locations/global', page_size=50, filter='name:r')
+    assert crypto_keys == service.ListCryptoKeysRequest(
+        parent='projects/p/locations/global/keyRings/r0', page_size=50,
+        version_view=view, filter='purpose=ENCRYPT_DECRYPT')
+    assert versions == service.ListCryptoKeyVersionsRequest(
+        parent='projects/p/locations/global/keyRings/r0/cryptoKeys/k0',
+        page_size=50, view=view, filter='state=ENABLED')
+
+
+def test_crawl_without_versions(client):
+    fake = FakeKms()
+    with patch_list(client, fake):
+        results = list(inventory.crawl(client, 'p', ['global'],
+                                       include_versions=False))
+    assert len(results) == 6
+    assert not any(isinstance(r, resources.CryptoKeyVersion) for r in results)
+
+
+def test_crawl_no_locations(client):
+    assert list(inventory.crawl(client, 'p', [])) == []
+
+
+def test_crawl_error(client):
+    fake = FakeKms(fail='r1')
+    with patch_list(client, fake):
+        with pytest.raises(exceptions.PermissionDenied):
+            list(inventory.crawl(client, 'p', ['global'], max_concurrency=1))
+    # The crypto keys of r1 are listed first; once that fails, the
+    # listing of r0 is skipped.
+    assert len(fake.requests) == 3
+
+
+def test_crawl_slow_consumer(client):
+    fake = FakeKms()
+    with patch_list(client, fake), \
+            mock.patch.object(inventory, '_POLL_INTERVAL', 0.001):
+        results = []
+        for result in inventory.crawl(client, 'p', ['global'], buffer_size=1):
+            time.sleep(0.005)
+            results.append(result)
+    assert len(results) == 14
+
+
+def test_crawl_bounded_queue(client):
+    queued = []
+    schedule = inventory._Crawl.schedule
+
+    def record(state, *args, **kwargs):
+        schedule(state, *args, **kwargs)
+        queued.append(state._tasks.qsize())
+
+    fake = FakeKms(fanout=4)
+    with patch_list(client, fake), \
+            mock.patch.object(inventory, '_MAX_QUEUED_TASKS', 2), \
+            mock.patch.object(inventory._Crawl, 'schedule', record):
+        results = list(inventory.crawl(client, 'p', ['global'], max_concurrency=1))
+
+    # Children beyond the bound are listed by the worker itself.
+    assert len({r.name for r in results}) == 4 + 16 + 64
+    assert len(queued) == 1 + 4 + 16
+    assert max(queued) == 2
+
+
+def test_crawl_close_early(client):
+    fake = FakeKms(fanout=10)
+    with patch_list(client, fake):
+        results = inventory.crawl(client, 'p', ['global'],
+                                  max_concurrency=2, buffer_size=1)
+        next(results)
+        results.close()
+        time.sleep(3 * inventory._POLL_INTERVAL)
+        count = len(fake.requests)
+        time.sleep(3 * inventory._POLL_INTERVAL)
+        assert len(fake.requests) == count < 10
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'max_concurrency': 0},
+    {'buffer_size': 0},
+])
+def test_crawl_invalid_arguments(client, kwargs):
+    with pytest.raises(ValueError):
+        inventory.crawl(client, 'p', ['global'], **kwargs)
@@ -15,19 +15,37 @@
 # limitations under the License.
 #
 
+import asyncio
+from concurrent import futures
+import datetime
+import gc
+import sys
+import threading
+import time
 from unittest import mock
 
 import grpc
+from grpc import aio
 import math
 import pytest
 
 from google import auth
 from google.api_core import client_options
+from google.api_core import exceptions
 from google.api_core import grpc_helpers
+from google.api_core import grpc_helpers_async
 from google.auth import credentials
+from google.cloud.kms_v1.services.key_management_service import KeyManagementServiceAsyncClient
 from google.cloud.kms_v1.services.key_management_service import KeyManagementServiceClient
+from google.cloud.kms_v1.services.key_management_service import cache as metadata_cache
+from google.cloud.kms_v1.services.key_management_service import concurrency
+from google.cloud.kms_v1.services.key_management_service import hedging
 from google.cloud.kms_v1.services.key_management_service import pagers
+from google.cloud.kms_v1.services.key_management_service import ratelimit
 from google.cloud.kms_v1.services.key_management_service import transports
+from google.cloud.kms_v1.services.key_management_service.transports import interceptors
+from google.cloud.kms_v1.services.key_management_service.transports import metrics
+from google.cloud.kms_v1.services.key_management_service.transports import refresh
 from google.cloud.kms_v1.types import resources
 from google.cloud.kms_v1.types import service
 from google.oauth2 import service_account
@@ -40,6 +58,22 @@ def client_cert_source_callback():
     return b"cert bytes", b"key bytes"
 
 
+class AwaitableMock(mock.Mock):
+    """A mock whose calls return awaitables, as ``mock.AsyncMock`` does
+    on Python 3.8 and later."""
+    def __call__(self, *args, **kwargs):
+        try:
+            result, error = super().__call__(*args, **kwargs), None
+        except Exception as exc:
+            result, error = None, exc
+
+        async def call():
+            if error is not None:
+                raise error
+            return result
+        return call()
+
+
 def test__get_default_mtls_endpoint():
     api_endpoint = "example.googleapis.com"
     api_mtls_endpoint = "example.mtls.googleapis.com"
@@ -177,6 +211,41 @@ def test_list_key_rings(transport: str = 'grpc'):
     assert response.total_size == 1086
 
 
+@pytest.mark.asyncio
+async def test_list_key_rings_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.ListKeyRingsRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_key_rings),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(service.ListKeyRingsResponse(
+            next_page_token='next_page_token_value',
+            total_size=1086,
+        ))
+
+        response = await client.list_key_rings(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.ListKeyRingsAsyncPager)
+    assert response.next_page_token == 'next_page_token_value'
+    assert response.total_size == 1086
+
+
 def test_list_key_rings_field_headers():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -208,6 +277,38 @@ def test_list_key_rings_field_headers():
     ) in kw['metadata']
 
 
+@pytest.mark.asyncio
+async def test_list_key_rings_field_headers_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = service.ListKeyRingsRequest(
+        parent='parent/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_key_rings),
+            '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(service.ListKeyRingsResponse())
+        await client.list_key_rings(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'parent=parent/value',
+    ) in kw['metadata']
+
+
 def test_list_key_rings_flattened():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -233,6 +334,32 @@ def test_list_key_rings_flattened():
         assert args[0].parent == 'parent_value'
 
 
+@pytest.mark.asyncio
+async def test_list_key_rings_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_key_rings),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(service.ListKeyRingsResponse())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.list_key_rings(
+            parent='parent_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].parent == 'parent_value'
+
+
 def test_list_key_rings_flattened_error():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -247,6 +374,21 @@ def test_list_key_rings_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_list_key_rings_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.list_key_rings(
+            service.ListKeyRingsRequest(),
+            parent='parent_value',
+        )
+
+
 def test_list_key_rings_pager():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials,
@@ -333,6 +475,187 @@ def test_list_key_rings_pages():
             assert page.raw_page.next_page_token == token
 
 
+@pytest.mark.asyncio
+async def test_list_key_rings_async_pager():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_key_rings),
+            '__call__', new_callable=AwaitableMock) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListKeyRingsResponse(
+                key_rings=[
+                    resources.KeyRing(),
+                    resources.KeyRing(),
+                    resources.KeyRing(),
+                ],
+                next_page_token='abc',
+            ),
+            service.ListKeyRingsResponse(
+                key_rings=[],
+                next_page_token='def',
+            ),
+            service.ListKeyRingsResponse(
+                key_rings=[
+                    resources.KeyRing(),
+                ],
+                next_page_token='ghi',
+            ),
+            service.ListKeyRingsResponse(
+                key_rings=[
+                    resources.KeyRing(),
+                    resources.KeyRing(),
+                ],
+            ),
+            RuntimeError,
+        )
+        async_pager = await client.list_key_rings(request={},)
+        assert async_pager.next_page_token == 'abc'
+        responses = []
+        async for response in async_pager:
+            responses.append(response)
+
+        assert len(responses) == 6
+        assert all(isinstance(i, resources.KeyRing)
+                   for i in responses)
+
+
+@pytest.mark.asyncio
+async def test_list_key_rings_async_pages():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_key_rings),
+            '__call__', new_callable=AwaitableMock) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListKeyRingsResponse(
+                key_rings=[
+                    resources.KeyRing(),
+                    resources.KeyRing(),
+                    resources.KeyRing(),
+                ],
+                next_page_token='abc',
+            ),
+            service.ListKeyRingsResponse(
+                key_rings=[],
+                next_page_token='def',
+            ),
+            service.ListKeyRingsResponse(
+                key_rings=[
+                    resources.KeyRing(),
+                ],
+                next_page_token='ghi',
+            ),
+            service.ListKeyRingsResponse(
+                key_rings=[
+                    resources.KeyRing(),
+                    resources.KeyRing(),
+                ],
+            ),
+            RuntimeError,
+        )
+        pages = []
+        async for page in (await client.list_key_rings(request={})).pages:
+            pages.append(page)
+        for page, token in zip(pages, ['abc','def','ghi', '']):
+            assert page.raw_page.next_page_token == token
+
+
+def test_list_key_rings_pages_prefetch():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.list_key_rings),
+            '__call__') as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListKeyRingsResponse(
+                key_rings=[
+                    resources.KeyRing(),
+                    resources.KeyRing(),
+                    resources.KeyRing(),
+                ],
+                next_page_token='abc',
+            ),
+            service.ListKeyRingsResponse(
+                key_rings=[],
+                next_page_token='def',
+            ),
+            service.ListKeyRingsResponse(
+                key_rings=[
+                    resources.KeyRing(),
+                ],
+                next_page_token='ghi',
+            ),
+            service.ListKeyRingsResponse(
+                key_rings=[
+                    resources.KeyRing(),
+                    resources.KeyRing(),
+                ],
+            ),
+            RuntimeError,
+        )
+        pages = list(client.list_key_rings(request={}, prefetch=2).pages)
+        for page, token in zip(pages, ['abc','def','ghi', '']):
+            assert page.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_list_key_rings_async_pages_prefetch():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_key_rings),
+            '__call__', new_callable=AwaitableMock) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListKeyRingsResponse(
+                key_rings=[
+                    resources.KeyRing(),
+                    resources.KeyRing(),
+                    resources.KeyRing(),
+                ],
+                next_page_token='abc',
+            ),
+            service.ListKeyRingsResponse(
+                key_rings=[],
+                next_page_token='def',
+            ),
+            service.ListKeyRingsResponse(
+                key_rings=[
+                    resources.KeyRing(),
+                ],
+                next_page_token='ghi',
+            ),
+            service.ListKeyRingsResponse(
+                key_rings=[
+                    resources.KeyRing(),
+                    resources.KeyRing(),
+                ],
+            ),
+            RuntimeError,
+        )
+        pages = []
+        async for page in (await client.list_key_rings(request={}, prefetch=2)).pages:
+            pages.append(page)
+        for page, token in zip(pages, ['abc','def','ghi', '']):
+            assert page.raw_page.next_page_token == token
+
+
 def test_list_crypto_keys(transport: str = 'grpc'):
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -367,24 +690,91 @@ def test_list_crypto_keys(transport: str = 'grpc'):
     assert response.total_size == 1086
 
 
-def test_list_crypto_keys_field_headers():
-    client = KeyManagementServiceClient(
+@pytest.mark.asyncio
+async def test_list_crypto_keys_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
         credentials=credentials.AnonymousCredentials(),
-  )
-
-    # Any value that is part of the HTTP/1.1 URI should be sent as
-    # a field header. Set these to a non-empty value.
-    request = service.ListCryptoKeysRequest(
-        parent='parent/value',
+        transport=transport,
     )
 
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.ListCryptoKeysRequest()
+
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.list_crypto_keys),
+            type(client._client._transport.list_crypto_keys),
             '__call__') as call:
-        call.return_value = service.ListCryptoKeysResponse()
-        client.list_crypto_keys(request)
-
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(service.ListCryptoKeysResponse(
+            next_page_token='next_page_token_value',
+            total_size=1086,
+        ))
+
+        response = await client.list_crypto_keys(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.ListCryptoKeysAsyncPager)
+    assert response.next_page_token == 'next_page_token_value'
+    assert response.total_size == 1086
+
+
+def test_list_crypto_keys_field_headers():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = service.ListCryptoKeysRequest(
+        parent='parent/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.list_crypto_keys),
+            '__call__') as call:
+        call.return_value = service.ListCryptoKeysResponse()
+        client.list_crypto_keys(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'parent=parent/value',
+    ) in kw['metadata']
+
+
+@pytest.mark.asyncio
+async def test_list_crypto_keys_field_headers_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = service.ListCryptoKeysRequest(
+        parent='parent/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_crypto_keys),
+            '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(service.ListCryptoKeysResponse())
+        await client.list_crypto_keys(request)
+
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
         _, args, _ = call.mock_calls[0]
@@ -423,6 +813,32 @@ def test_list_crypto_keys_flattened():
         assert args[0].parent == 'parent_value'
 
 
+@pytest.mark.asyncio
+async def test_list_crypto_keys_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_crypto_keys),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(service.ListCryptoKeysResponse())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.list_crypto_keys(
+            parent='parent_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].parent == 'parent_value'
+
+
 def test_list_crypto_keys_flattened_error():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -437,6 +853,21 @@ def test_list_crypto_keys_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_list_crypto_keys_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.list_crypto_keys(
+            service.ListCryptoKeysRequest(),
+            parent='parent_value',
+        )
+
+
 def test_list_crypto_keys_pager():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials,
@@ -523,6 +954,187 @@ def test_list_crypto_keys_pages():
             assert page.raw_page.next_page_token == token
 
 
+@pytest.mark.asyncio
+async def test_list_crypto_keys_async_pager():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_crypto_keys),
+            '__call__', new_callable=AwaitableMock) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListCryptoKeysResponse(
+                crypto_keys=[
+                    resources.CryptoKey(),
+                    resources.CryptoKey(),
+                    resources.CryptoKey(),
+                ],
+                next_page_token='abc',
+            ),
+            service.ListCryptoKeysResponse(
+                crypto_keys=[],
+                next_page_token='def',
+            ),
+            service.ListCryptoKeysResponse(
+                crypto_keys=[
+                    resources.CryptoKey(),
+                ],
+                next_page_token='ghi',
+            ),
+            service.ListCryptoKeysResponse(
+                crypto_keys=[
+                    resources.CryptoKey(),
+                    resources.CryptoKey(),
+                ],
+            ),
+            RuntimeError,
+        )
+        async_pager = await client.list_crypto_keys(request={},)
+        assert async_pager.next_page_token == 'abc'
+        responses = []
+        async for response in async_pager:
+            responses.append(response)
+
+        assert len(responses) == 6
+        assert all(isinstance(i, resources.CryptoKey)
+                   for i in responses)
+
+
+@pytest.mark.asyncio
+async def test_list_crypto_keys_async_pages():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_crypto_keys),
+            '__call__', new_callable=AwaitableMock) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListCryptoKeysResponse(
+                crypto_keys=[
+                    resources.CryptoKey(),
+                    resources.CryptoKey(),
+                    resources.CryptoKey(),
+                ],
+                next_page_token='abc',
+            ),
+            service.ListCryptoKeysResponse(
+                crypto_keys=[],
+                next_page_token='def',
+            ),
+            service.ListCryptoKeysResponse(
+                crypto_keys=[
+                    resources.CryptoKey(),
+                ],
+                next_page_token='ghi',
+            ),
+            service.ListCryptoKeysResponse(
+                crypto_keys=[
+                    resources.CryptoKey(),
+                    resources.CryptoKey(),
+                ],
+            ),
+            RuntimeError,
+        )
+        pages = []
+        async for page in (await client.list_crypto_keys(request={})).pages:
+            pages.append(page)
+        for page, token in zip(pages, ['abc','def','ghi', '']):
+            assert page.raw_page.next_page_token == token
+
+
+def test_list_crypto_keys_pages_prefetch():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.list_crypto_keys),
+            '__call__') as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListCryptoKeysResponse(
+                crypto_keys=[
+                    resources.CryptoKey(),
+                    resources.CryptoKey(),
+                    resources.CryptoKey(),
+                ],
+                next_page_token='abc',
+            ),
+            service.ListCryptoKeysResponse(
+                crypto_keys=[],
+                next_page_token='def',
+            ),
+            service.ListCryptoKeysResponse(
+                crypto_keys=[
+                    resources.CryptoKey(),
+                ],
+                next_page_token='ghi',
+            ),
+            service.ListCryptoKeysResponse(
+                crypto_keys=[
+                    resources.CryptoKey(),
+                    resources.CryptoKey(),
+                ],
+            ),
+            RuntimeError,
+        )
+        pages = list(client.list_crypto_keys(request={}, prefetch=2).pages)
+        for page, token in zip(pages, ['abc','def','ghi', '']):
+            assert page.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_list_crypto_keys_async_pages_prefetch():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_crypto_keys),
+            '__call__', new_callable=AwaitableMock) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListCryptoKeysResponse(
+                crypto_keys=[
+                    resources.CryptoKey(),
+                    resources.CryptoKey(),
+                    resources.CryptoKey(),
+                ],
+                next_page_token='abc',
+            ),
+            service.ListCryptoKeysResponse(
+                crypto_keys=[],
+                next_page_token='def',
+            ),
+            service.ListCryptoKeysResponse(
+                crypto_keys=[
+                    resources.CryptoKey(),
+                ],
+                next_page_token='ghi',
+            ),
+            service.ListCryptoKeysResponse(
+                crypto_keys=[
+                    resources.CryptoKey(),
+                    resources.CryptoKey(),
+                ],
+            ),
+            RuntimeError,
+        )
+        pages = []
+        async for page in (await client.list_crypto_keys(request={}, prefetch=2)).pages:
+            pages.append(page)
+        for page, token in zip(pages, ['abc','def','ghi', '']):
+            assert page.raw_page.next_page_token == token
+
+
 def test_list_crypto_key_versions(transport: str = 'grpc'):
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -557,15 +1169,50 @@ def test_list_crypto_key_versions(transport: str = 'grpc'):
     assert response.total_size == 1086
 
 
-def test_list_crypto_key_versions_field_headers():
-    client = KeyManagementServiceClient(
+@pytest.mark.asyncio
+async def test_list_crypto_key_versions_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
         credentials=credentials.AnonymousCredentials(),
-  )
-
-    # Any value that is part of the HTTP/1.1 URI should be sent as
-    # a field header. Set these to a non-empty value.
-    request = service.ListCryptoKeyVersionsRequest(
-        parent='parent/value',
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.ListCryptoKeyVersionsRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_crypto_key_versions),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(service.ListCryptoKeyVersionsResponse(
+            next_page_token='next_page_token_value',
+            total_size=1086,
+        ))
+
+        response = await client.list_crypto_key_versions(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.ListCryptoKeyVersionsAsyncPager)
+    assert response.next_page_token == 'next_page_token_value'
+    assert response.total_size == 1086
+
+
+def test_list_crypto_key_versions_field_headers():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = service.ListCryptoKeyVersionsRequest(
+        parent='parent/value',
     )
 
     # Mock the actual call within the gRPC stub, and fake the request.
@@ -588,6 +1235,38 @@ def test_list_crypto_key_versions_field_headers():
     ) in kw['metadata']
 
 
+@pytest.mark.asyncio
+async def test_list_crypto_key_versions_field_headers_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = service.ListCryptoKeyVersionsRequest(
+        parent='parent/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_crypto_key_versions),
+            '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(service.ListCryptoKeyVersionsResponse())
+        await client.list_crypto_key_versions(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'parent=parent/value',
+    ) in kw['metadata']
+
+
 def test_list_crypto_key_versions_flattened():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -613,6 +1292,32 @@ def test_list_crypto_key_versions_flattened():
         assert args[0].parent == 'parent_value'
 
 
+@pytest.mark.asyncio
+async def test_list_crypto_key_versions_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_crypto_key_versions),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(service.ListCryptoKeyVersionsResponse())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.list_crypto_key_versions(
+            parent='parent_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].parent == 'parent_value'
+
+
 def test_list_crypto_key_versions_flattened_error():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -627,6 +1332,21 @@ def test_list_crypto_key_versions_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_list_crypto_key_versions_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.list_crypto_key_versions(
+            service.ListCryptoKeyVersionsRequest(),
+            parent='parent_value',
+        )
+
+
 def test_list_crypto_key_versions_pager():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials,
@@ -713,6 +1433,187 @@ def test_list_crypto_key_versions_pages():
             assert page.raw_page.next_page_token == token
 
 
+@pytest.mark.asyncio
+async def test_list_crypto_key_versions_async_pager():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_crypto_key_versions),
+            '__call__', new_callable=AwaitableMock) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListCryptoKeyVersionsResponse(
+                crypto_key_versions=[
+                    resources.CryptoKeyVersion(),
+                    resources.CryptoKeyVersion(),
+                    resources.CryptoKeyVersion(),
+                ],
+                next_page_token='abc',
+            ),
+            service.ListCryptoKeyVersionsResponse(
+                crypto_key_versions=[],
+                next_page_token='def',
+            ),
+            service.ListCryptoKeyVersionsResponse(
+                crypto_key_versions=[
+                    resources.CryptoKeyVersion(),
+                ],
+                next_page_token='ghi',
+            ),
+            service.ListCryptoKeyVersionsResponse(
+                crypto_key_versions=[
+                    resources.CryptoKeyVersion(),
+                    resources.CryptoKeyVersion(),
+                ],
+            ),
+            RuntimeError,
+        )
+        async_pager = await client.list_crypto_key_versions(request={},)
+        assert async_pager.next_page_token == 'abc'
+        responses = []
+        async for response in async_pager:
+            responses.append(response)
+
+        assert len(responses) == 6
+        assert all(isinstance(i, resources.CryptoKeyVersion)
+                   for i in responses)
+
+
+@pytest.mark.asyncio
+async def test_list_crypto_key_versions_async_pages():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_crypto_key_versions),
+            '__call__', new_callable=AwaitableMock) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListCryptoKeyVersionsResponse(
+                crypto_key_versions=[
+                    resources.CryptoKeyVersion(),
+                    resources.CryptoKeyVersion(),
+                    resources.CryptoKeyVersion(),
+                ],
+                next_page_token='abc',
+            ),
+            service.ListCryptoKeyVersionsResponse(
+                crypto_key_versions=[],
+                next_page_token='def',
+            ),
+            service.ListCryptoKeyVersionsResponse(
+                crypto_key_versions=[
+                    resources.CryptoKeyVersion(),
+                ],
+                next_page_token='ghi',
+            ),
+            service.ListCryptoKeyVersionsResponse(
+                crypto_key_versions=[
+                    resources.CryptoKeyVersion(),
+                    resources.CryptoKeyVersion(),
+                ],
+            ),
+            RuntimeError,
+        )
+        pages = []
+        async for page in (await client.list_crypto_key_versions(request={})).pages:
+            pages.append(page)
+        for page, token in zip(pages, ['abc','def','ghi', '']):
+            assert page.raw_page.next_page_token == token
+
+
+def test_list_crypto_key_versions_pages_prefetch():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.list_crypto_key_versions),
+            '__call__') as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListCryptoKeyVersionsResponse(
+                crypto_key_versions=[
+                    resources.CryptoKeyVersion(),
+                    resources.CryptoKeyVersion(),
+                    resources.CryptoKeyVersion(),
+                ],
+                next_page_token='abc',
+            ),
+            service.ListCryptoKeyVersionsResponse(
+                crypto_key_versions=[],
+                next_page_token='def',
+            ),
+            service.ListCryptoKeyVersionsResponse(
+                crypto_key_versions=[
+                    resources.CryptoKeyVersion(),
+                ],
+                next_page_token='ghi',
+            ),
+            service.ListCryptoKeyVersionsResponse(
+                crypto_key_versions=[
+                    resources.CryptoKeyVersion(),
+                    resources.CryptoKeyVersion(),
+                ],
+            ),
+            RuntimeError,
+        )
+        pages = list(client.list_crypto_key_versions(request={}, prefetch=2).pages)
+        for page, token in zip(pages, ['abc','def','ghi', '']):
+            assert page.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_list_crypto_key_versions_async_pages_prefetch():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_crypto_key_versions),
+            '__call__', new_callable=AwaitableMock) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListCryptoKeyVersionsResponse(
+                crypto_key_versions=[
+                    resources.CryptoKeyVersion(),
+                    resources.CryptoKeyVersion(),
+                    resources.CryptoKeyVersion(),
+                ],
+                next_page_token='abc',
+            ),
+            service.ListCryptoKeyVersionsResponse(
+                crypto_key_versions=[],
+                next_page_token='def',
+            ),
+            service.ListCryptoKeyVersionsResponse(
+                crypto_key_versions=[
+                    resources.CryptoKeyVersion(),
+                ],
+                next_page_token='ghi',
+            ),
+            service.ListCryptoKeyVersionsResponse(
+                crypto_key_versions=[
+                    resources.CryptoKeyVersion(),
+                    resources.CryptoKeyVersion(),
+                ],
+            ),
+            RuntimeError,
+        )
+        pages = []
+        async for page in (await client.list_crypto_key_versions(request={}, prefetch=2)).pages:
+            pages.append(page)
+        for page, token in zip(pages, ['abc','def','ghi', '']):
+            assert page.raw_page.next_page_token == token
+
+
 def test_list_import_jobs(transport: str = 'grpc'):
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -747,24 +1648,91 @@ def test_list_import_jobs(transport: str = 'grpc'):
     assert response.total_size == 1086
 
 
-def test_list_import_jobs_field_headers():
-    client = KeyManagementServiceClient(
+@pytest.mark.asyncio
+async def test_list_import_jobs_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
         credentials=credentials.AnonymousCredentials(),
-  )
-
-    # Any value that is part of the HTTP/1.1 URI should be sent as
-    # a field header. Set these to a non-empty value.
-    request = service.ListImportJobsRequest(
-        parent='parent/value',
+        transport=transport,
     )
 
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.ListImportJobsRequest()
+
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.list_import_jobs),
+            type(client._client._transport.list_import_jobs),
             '__call__') as call:
-        call.return_value = service.ListImportJobsResponse()
-        client.list_import_jobs(request)
-
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(service.ListImportJobsResponse(
+            next_page_token='next_page_token_value',
+            total_size=1086,
+        ))
+
+        response = await client.list_import_jobs(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.ListImportJobsAsyncPager)
+    assert response.next_page_token == 'next_page_token_value'
+    assert response.total_size == 1086
+
+
+def test_list_import_jobs_field_headers():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = service.ListImportJobsRequest(
+        parent='parent/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.list_import_jobs),
+            '__call__') as call:
+        call.return_value = service.ListImportJobsResponse()
+        client.list_import_jobs(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'parent=parent/value',
+    ) in kw['metadata']
+
+
+@pytest.mark.asyncio
+async def test_list_import_jobs_field_headers_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = service.ListImportJobsRequest(
+        parent='parent/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_import_jobs),
+            '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(service.ListImportJobsResponse())
+        await client.list_import_jobs(request)
+
         # Establish that the underlying gRPC stub method was called.
         assert len(call.mock_calls) == 1
         _, args, _ = call.mock_calls[0]
@@ -803,6 +1771,32 @@ def test_list_import_jobs_flattened():
         assert args[0].parent == 'parent_value'
 
 
+@pytest.mark.asyncio
+async def test_list_import_jobs_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_import_jobs),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(service.ListImportJobsResponse())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.list_import_jobs(
+            parent='parent_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].parent == 'parent_value'
+
+
 def test_list_import_jobs_flattened_error():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -817,6 +1811,21 @@ def test_list_import_jobs_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_list_import_jobs_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.list_import_jobs(
+            service.ListImportJobsRequest(),
+            parent='parent_value',
+        )
+
+
 def test_list_import_jobs_pager():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials,
@@ -903,6 +1912,187 @@ def test_list_import_jobs_pages():
             assert page.raw_page.next_page_token == token
 
 
+@pytest.mark.asyncio
+async def test_list_import_jobs_async_pager():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_import_jobs),
+            '__call__', new_callable=AwaitableMock) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListImportJobsResponse(
+                import_jobs=[
+                    resources.ImportJob(),
+                    resources.ImportJob(),
+                    resources.ImportJob(),
+                ],
+                next_page_token='abc',
+            ),
+            service.ListImportJobsResponse(
+                import_jobs=[],
+                next_page_token='def',
+            ),
+            service.ListImportJobsResponse(
+                import_jobs=[
+                    resources.ImportJob(),
+                ],
+                next_page_token='ghi',
+            ),
+            service.ListImportJobsResponse(
+                import_jobs=[
+                    resources.ImportJob(),
+                    resources.ImportJob(),
+                ],
+            ),
+            RuntimeError,
+        )
+        async_pager = await client.list_import_jobs(request={},)
+        assert async_pager.next_page_token == 'abc'
+        responses = []
+        async for response in async_pager:
+            responses.append(response)
+
+        assert len(responses) == 6
+        assert all(isinstance(i, resources.ImportJob)
+                   for i in responses)
+
+
+@pytest.mark.asyncio
+async def test_list_import_jobs_async_pages():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_import_jobs),
+            '__call__', new_callable=AwaitableMock) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListImportJobsResponse(
+                import_jobs=[
+                    resources.ImportJob(),
+                    resources.ImportJob(),
+                    resources.ImportJob(),
+                ],
+                next_page_token='abc',
+            ),
+            service.ListImportJobsResponse(
+                import_jobs=[],
+                next_page_token='def',
+            ),
+            service.ListImportJobsResponse(
+                import_jobs=[
+                    resources.ImportJob(),
+                ],
+                next_page_token='ghi',
+            ),
+            service.ListImportJobsResponse(
+                import_jobs=[
+                    resources.ImportJob(),
+                    resources.ImportJob(),
+                ],
+            ),
+            RuntimeError,
+        )
+        pages = []
+        async for page in (await client.list_import_jobs(request={})).pages:
+            pages.append(page)
+        for page, token in zip(pages, ['abc','def','ghi', '']):
+            assert page.raw_page.next_page_token == token
+
+
+def test_list_import_jobs_pages_prefetch():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.list_import_jobs),
+            '__call__') as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListImportJobsResponse(
+                import_jobs=[
+                    resources.ImportJob(),
+                    resources.ImportJob(),
+                    resources.ImportJob(),
+                ],
+                next_page_token='abc',
+            ),
+            service.ListImportJobsResponse(
+                import_jobs=[],
+                next_page_token='def',
+            ),
+            service.ListImportJobsResponse(
+                import_jobs=[
+                    resources.ImportJob(),
+                ],
+                next_page_token='ghi',
+            ),
+            service.ListImportJobsResponse(
+                import_jobs=[
+                    resources.ImportJob(),
+                    resources.ImportJob(),
+                ],
+            ),
+            RuntimeError,
+        )
+        pages = list(client.list_import_jobs(request={}, prefetch=2).pages)
+        for page, token in zip(pages, ['abc','def','ghi', '']):
+            assert page.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_list_import_jobs_async_pages_prefetch():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.list_import_jobs),
+            '__call__', new_callable=AwaitableMock) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListImportJobsResponse(
+                import_jobs=[
+                    resources.ImportJob(),
+                    resources.ImportJob(),
+                    resources.ImportJob(),
+                ],
+                next_page_token='abc',
+            ),
+            service.ListImportJobsResponse(
+                import_jobs=[],
+                next_page_token='def',
+            ),
+            service.ListImportJobsResponse(
+                import_jobs=[
+                    resources.ImportJob(),
+                ],
+                next_page_token='ghi',
+            ),
+            service.ListImportJobsResponse(
+                import_jobs=[
+                    resources.ImportJob(),
+                    resources.ImportJob(),
+                ],
+            ),
+            RuntimeError,
+        )
+        pages = []
+        async for page in (await client.list_import_jobs(request={}, prefetch=2)).pages:
+            pages.append(page)
+        for page, token in zip(pages, ['abc','def','ghi', '']):
+            assert page.raw_page.next_page_token == token
+
+
 def test_get_key_ring(transport: str = 'grpc'):
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -935,15 +2125,48 @@ def test_get_key_ring(transport: str = 'grpc'):
     assert response.name == 'name_value'
 
 
-def test_get_key_ring_field_headers():
-    client = KeyManagementServiceClient(
+@pytest.mark.asyncio
+async def test_get_key_ring_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
         credentials=credentials.AnonymousCredentials(),
-  )
-
-    # Any value that is part of the HTTP/1.1 URI should be sent as
-    # a field header. Set these to a non-empty value.
-    request = service.GetKeyRingRequest(
-        name='name/value',
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.GetKeyRingRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_key_ring),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.KeyRing(
+            name='name_value',
+        ))
+
+        response = await client.get_key_ring(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, resources.KeyRing)
+    assert response.name == 'name_value'
+
+
+def test_get_key_ring_field_headers():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = service.GetKeyRingRequest(
+        name='name/value',
     )
 
     # Mock the actual call within the gRPC stub, and fake the request.
@@ -966,6 +2189,38 @@ def test_get_key_ring_field_headers():
     ) in kw['metadata']
 
 
+@pytest.mark.asyncio
+async def test_get_key_ring_field_headers_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = service.GetKeyRingRequest(
+        name='name/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_key_ring),
+            '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.KeyRing())
+        await client.get_key_ring(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'name=name/value',
+    ) in kw['metadata']
+
+
 def test_get_key_ring_flattened():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -991,6 +2246,32 @@ def test_get_key_ring_flattened():
         assert args[0].name == 'name_value'
 
 
+@pytest.mark.asyncio
+async def test_get_key_ring_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_key_ring),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.KeyRing())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.get_key_ring(
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].name == 'name_value'
+
+
 def test_get_key_ring_flattened_error():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1005,6 +2286,21 @@ def test_get_key_ring_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_get_key_ring_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.get_key_ring(
+            service.GetKeyRingRequest(),
+            name='name_value',
+        )
+
+
 def test_get_crypto_key(transport: str = 'grpc'):
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1039,6 +2335,41 @@ def test_get_crypto_key(transport: str = 'grpc'):
     assert response.purpose == resources.CryptoKey.CryptoKeyPurpose.ENCRYPT_DECRYPT
 
 
+@pytest.mark.asyncio
+async def test_get_crypto_key_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.GetCryptoKeyRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_crypto_key),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKey(
+            name='name_value',
+            purpose=resources.CryptoKey.CryptoKeyPurpose.ENCRYPT_DECRYPT,
+        ))
+
+        response = await client.get_crypto_key(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, resources.CryptoKey)
+    assert response.name == 'name_value'
+    assert response.purpose == resources.CryptoKey.CryptoKeyPurpose.ENCRYPT_DECRYPT
+
+
 def test_get_crypto_key_field_headers():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1070,6 +2401,38 @@ def test_get_crypto_key_field_headers():
     ) in kw['metadata']
 
 
+@pytest.mark.asyncio
+async def test_get_crypto_key_field_headers_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = service.GetCryptoKeyRequest(
+        name='name/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_crypto_key),
+            '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKey())
+        await client.get_crypto_key(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'name=name/value',
+    ) in kw['metadata']
+
+
 def test_get_crypto_key_flattened():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1095,6 +2458,32 @@ def test_get_crypto_key_flattened():
         assert args[0].name == 'name_value'
 
 
+@pytest.mark.asyncio
+async def test_get_crypto_key_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_crypto_key),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKey())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.get_crypto_key(
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].name == 'name_value'
+
+
 def test_get_crypto_key_flattened_error():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1109,6 +2498,21 @@ def test_get_crypto_key_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_get_crypto_key_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.get_crypto_key(
+            service.GetCryptoKeyRequest(),
+            name='name_value',
+        )
+
+
 def test_get_crypto_key_version(transport: str = 'grpc'):
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1151,6 +2555,49 @@ def test_get_crypto_key_version(transport: str = 'grpc'):
     assert response.import_failure_reason == 'import_failure_reason_value'
 
 
+@pytest.mark.asyncio
+async def test_get_crypto_key_version_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.GetCryptoKeyVersionRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_crypto_key_version),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKeyVersion(
+            name='name_value',
+            state=resources.CryptoKeyVersion.CryptoKeyVersionState.PENDING_GENERATION,
+            protection_level=resources.ProtectionLevel.SOFTWARE,
+            algorithm=resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION,
+            import_job='import_job_value',
+            import_failure_reason='import_failure_reason_value',
+        ))
+
+        response = await client.get_crypto_key_version(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, resources.CryptoKeyVersion)
+    assert response.name == 'name_value'
+    assert response.state == resources.CryptoKeyVersion.CryptoKeyVersionState.PENDING_GENERATION
+    assert response.protection_level == resources.ProtectionLevel.SOFTWARE
+    assert response.algorithm == resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION
+    assert response.import_job == 'import_job_value'
+    assert response.import_failure_reason == 'import_failure_reason_value'
+
+
 def test_get_crypto_key_version_field_headers():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1182,6 +2629,38 @@ def test_get_crypto_key_version_field_headers():
     ) in kw['metadata']
 
 
+@pytest.mark.asyncio
+async def test_get_crypto_key_version_field_headers_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = service.GetCryptoKeyVersionRequest(
+        name='name/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_crypto_key_version),
+            '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKeyVersion())
+        await client.get_crypto_key_version(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'name=name/value',
+    ) in kw['metadata']
+
+
 def test_get_crypto_key_version_flattened():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1207,6 +2686,32 @@ def test_get_crypto_key_version_flattened():
         assert args[0].name == 'name_value'
 
 
+@pytest.mark.asyncio
+async def test_get_crypto_key_version_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_crypto_key_version),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKeyVersion())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.get_crypto_key_version(
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].name == 'name_value'
+
+
 def test_get_crypto_key_version_flattened_error():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1221,6 +2726,21 @@ def test_get_crypto_key_version_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_get_crypto_key_version_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.get_crypto_key_version(
+            service.GetCryptoKeyVersionRequest(),
+            name='name_value',
+        )
+
+
 def test_get_public_key(transport: str = 'grpc'):
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1255,6 +2775,41 @@ def test_get_public_key(transport: str = 'grpc'):
     assert response.algorithm == resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION
 
 
+@pytest.mark.asyncio
+async def test_get_public_key_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.GetPublicKeyRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_public_key),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.PublicKey(
+            pem='pem_value',
+            algorithm=resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION,
+        ))
+
+        response = await client.get_public_key(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, resources.PublicKey)
+    assert response.pem == 'pem_value'
+    assert response.algorithm == resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION
+
+
 def test_get_public_key_field_headers():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1286,6 +2841,38 @@ def test_get_public_key_field_headers():
     ) in kw['metadata']
 
 
+@pytest.mark.asyncio
+async def test_get_public_key_field_headers_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = service.GetPublicKeyRequest(
+        name='name/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_public_key),
+            '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.PublicKey())
+        await client.get_public_key(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'name=name/value',
+    ) in kw['metadata']
+
+
 def test_get_public_key_flattened():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1311,6 +2898,32 @@ def test_get_public_key_flattened():
         assert args[0].name == 'name_value'
 
 
+@pytest.mark.asyncio
+async def test_get_public_key_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_public_key),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.PublicKey())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.get_public_key(
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].name == 'name_value'
+
+
 def test_get_public_key_flattened_error():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1325,6 +2938,21 @@ def test_get_public_key_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_get_public_key_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.get_public_key(
+            service.GetPublicKeyRequest(),
+            name='name_value',
+        )
+
+
 def test_get_import_job(transport: str = 'grpc'):
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1363,6 +2991,45 @@ def test_get_import_job(transport: str = 'grpc'):
     assert response.state == resources.ImportJob.ImportJobState.PENDING_GENERATION
 
 
+@pytest.mark.asyncio
+async def test_get_import_job_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.GetImportJobRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_import_job),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.ImportJob(
+            name='name_value',
+            import_method=resources.ImportJob.ImportMethod.RSA_OAEP_3072_SHA1_AES_256,
+            protection_level=resources.ProtectionLevel.SOFTWARE,
+            state=resources.ImportJob.ImportJobState.PENDING_GENERATION,
+        ))
+
+        response = await client.get_import_job(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, resources.ImportJob)
+    assert response.name == 'name_value'
+    assert response.import_method == resources.ImportJob.ImportMethod.RSA_OAEP_3072_SHA1_AES_256
+    assert response.protection_level == resources.ProtectionLevel.SOFTWARE
+    assert response.state == resources.ImportJob.ImportJobState.PENDING_GENERATION
+
+
 def test_get_import_job_field_headers():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1394,6 +3061,38 @@ def test_get_import_job_field_headers():
     ) in kw['metadata']
 
 
+@pytest.mark.asyncio
+async def test_get_import_job_field_headers_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+  )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = service.GetImportJobRequest(
+        name='name/value',
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_import_job),
+            '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.ImportJob())
+        await client.get_import_job(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert (
+        'x-goog-request-params',
+        'name=name/value',
+    ) in kw['metadata']
+
+
 def test_get_import_job_flattened():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1419,6 +3118,32 @@ def test_get_import_job_flattened():
         assert args[0].name == 'name_value'
 
 
+@pytest.mark.asyncio
+async def test_get_import_job_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.get_import_job),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.ImportJob())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.get_import_job(
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].name == 'name_value'
+
+
 def test_get_import_job_flattened_error():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1433,6 +3158,21 @@ def test_get_import_job_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_get_import_job_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.get_import_job(
+            service.GetImportJobRequest(),
+            name='name_value',
+        )
+
+
 def test_create_key_ring(transport: str = 'grpc'):
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1465,6 +3205,39 @@ def test_create_key_ring(transport: str = 'grpc'):
     assert response.name == 'name_value'
 
 
+@pytest.mark.asyncio
+async def test_create_key_ring_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.CreateKeyRingRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.create_key_ring),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.KeyRing(
+            name='name_value',
+        ))
+
+        response = await client.create_key_ring(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, resources.KeyRing)
+    assert response.name == 'name_value'
+
+
 def test_create_key_ring_flattened():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1494,6 +3267,36 @@ def test_create_key_ring_flattened():
         assert args[0].key_ring == resources.KeyRing(name='name_value')
 
 
+@pytest.mark.asyncio
+async def test_create_key_ring_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.create_key_ring),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.KeyRing())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.create_key_ring(
+            parent='parent_value',
+            key_ring_id='key_ring_id_value',
+            key_ring=resources.KeyRing(name='name_value'),
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].parent == 'parent_value'
+        assert args[0].key_ring_id == 'key_ring_id_value'
+        assert args[0].key_ring == resources.KeyRing(name='name_value')
+
+
 def test_create_key_ring_flattened_error():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1510,6 +3313,23 @@ def test_create_key_ring_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_create_key_ring_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.create_key_ring(
+            service.CreateKeyRingRequest(),
+            parent='parent_value',
+            key_ring_id='key_ring_id_value',
+            key_ring=resources.KeyRing(name='name_value'),
+        )
+
+
 def test_create_crypto_key(transport: str = 'grpc'):
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1544,13 +3364,48 @@ def test_create_crypto_key(transport: str = 'grpc'):
     assert response.purpose == resources.CryptoKey.CryptoKeyPurpose.ENCRYPT_DECRYPT
 
 
-def test_create_crypto_key_flattened():
-    client = KeyManagementServiceClient(
+@pytest.mark.asyncio
+async def test_create_crypto_key_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
         credentials=credentials.AnonymousCredentials(),
+        transport=transport,
     )
 
-    # Mock the actual call within the gRPC stub, and fake the request.
-    with mock.patch.object(
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.CreateCryptoKeyRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.create_crypto_key),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKey(
+            name='name_value',
+            purpose=resources.CryptoKey.CryptoKeyPurpose.ENCRYPT_DECRYPT,
+        ))
+
+        response = await client.create_crypto_key(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, resources.CryptoKey)
+    assert response.name == 'name_value'
+    assert response.purpose == resources.CryptoKey.CryptoKeyPurpose.ENCRYPT_DECRYPT
+
+
+def test_create_crypto_key_flattened():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
             type(client._transport.create_crypto_key),
             '__call__') as call:
         # Designate an appropriate return value for the call.
@@ -1573,6 +3428,36 @@ def test_create_crypto_key_flattened():
         assert args[0].crypto_key == resources.CryptoKey(name='name_value')
 
 
+@pytest.mark.asyncio
+async def test_create_crypto_key_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.create_crypto_key),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKey())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.create_crypto_key(
+            parent='parent_value',
+            crypto_key_id='crypto_key_id_value',
+            crypto_key=resources.CryptoKey(name='name_value'),
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].parent == 'parent_value'
+        assert args[0].crypto_key_id == 'crypto_key_id_value'
+        assert args[0].crypto_key == resources.CryptoKey(name='name_value')
+
+
 def test_create_crypto_key_flattened_error():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1589,6 +3474,23 @@ def test_create_crypto_key_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_create_crypto_key_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.create_crypto_key(
+            service.CreateCryptoKeyRequest(),
+            parent='parent_value',
+            crypto_key_id='crypto_key_id_value',
+            crypto_key=resources.CryptoKey(name='name_value'),
+        )
+
+
 def test_create_crypto_key_version(transport: str = 'grpc'):
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1631,6 +3533,49 @@ def test_create_crypto_key_version(transport: str = 'grpc'):
     assert response.import_failure_reason == 'import_failure_reason_value'
 
 
+@pytest.mark.asyncio
+async def test_create_crypto_key_version_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.CreateCryptoKeyVersionRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.create_crypto_key_version),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKeyVersion(
+            name='name_value',
+            state=resources.CryptoKeyVersion.CryptoKeyVersionState.PENDING_GENERATION,
+            protection_level=resources.ProtectionLevel.SOFTWARE,
+            algorithm=resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION,
+            import_job='import_job_value',
+            import_failure_reason='import_failure_reason_value',
+        ))
+
+        response = await client.create_crypto_key_version(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, resources.CryptoKeyVersion)
+    assert response.name == 'name_value'
+    assert response.state == resources.CryptoKeyVersion.CryptoKeyVersionState.PENDING_GENERATION
+    assert response.protection_level == resources.ProtectionLevel.SOFTWARE
+    assert response.algorithm == resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION
+    assert response.import_job == 'import_job_value'
+    assert response.import_failure_reason == 'import_failure_reason_value'
+
+
 def test_create_crypto_key_version_flattened():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1658,6 +3603,34 @@ def test_create_crypto_key_version_flattened():
         assert args[0].crypto_key_version == resources.CryptoKeyVersion(name='name_value')
 
 
+@pytest.mark.asyncio
+async def test_create_crypto_key_version_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.create_crypto_key_version),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKeyVersion())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.create_crypto_key_version(
+            parent='parent_value',
+            crypto_key_version=resources.CryptoKeyVersion(name='name_value'),
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].parent == 'parent_value'
+        assert args[0].crypto_key_version == resources.CryptoKeyVersion(name='name_value')
+
+
 def test_create_crypto_key_version_flattened_error():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1673,6 +3646,22 @@ def test_create_crypto_key_version_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_create_crypto_key_version_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.create_crypto_key_version(
+            service.CreateCryptoKeyVersionRequest(),
+            parent='parent_value',
+            crypto_key_version=resources.CryptoKeyVersion(name='name_value'),
+        )
+
+
 def test_import_crypto_key_version(transport: str = 'grpc'):
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1715,6 +3704,49 @@ def test_import_crypto_key_version(transport: str = 'grpc'):
     assert response.import_failure_reason == 'import_failure_reason_value'
 
 
+@pytest.mark.asyncio
+async def test_import_crypto_key_version_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.ImportCryptoKeyVersionRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.import_crypto_key_version),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKeyVersion(
+            name='name_value',
+            state=resources.CryptoKeyVersion.CryptoKeyVersionState.PENDING_GENERATION,
+            protection_level=resources.ProtectionLevel.SOFTWARE,
+            algorithm=resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION,
+            import_job='import_job_value',
+            import_failure_reason='import_failure_reason_value',
+        ))
+
+        response = await client.import_crypto_key_version(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, resources.CryptoKeyVersion)
+    assert response.name == 'name_value'
+    assert response.state == resources.CryptoKeyVersion.CryptoKeyVersionState.PENDING_GENERATION
+    assert response.protection_level == resources.ProtectionLevel.SOFTWARE
+    assert response.algorithm == resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION
+    assert response.import_job == 'import_job_value'
+    assert response.import_failure_reason == 'import_failure_reason_value'
+
+
 def test_create_import_job(transport: str = 'grpc'):
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1753,6 +3785,45 @@ def test_create_import_job(transport: str = 'grpc'):
     assert response.state == resources.ImportJob.ImportJobState.PENDING_GENERATION
 
 
+@pytest.mark.asyncio
+async def test_create_import_job_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.CreateImportJobRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.create_import_job),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.ImportJob(
+            name='name_value',
+            import_method=resources.ImportJob.ImportMethod.RSA_OAEP_3072_SHA1_AES_256,
+            protection_level=resources.ProtectionLevel.SOFTWARE,
+            state=resources.ImportJob.ImportJobState.PENDING_GENERATION,
+        ))
+
+        response = await client.create_import_job(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, resources.ImportJob)
+    assert response.name == 'name_value'
+    assert response.import_method == resources.ImportJob.ImportMethod.RSA_OAEP_3072_SHA1_AES_256
+    assert response.protection_level == resources.ProtectionLevel.SOFTWARE
+    assert response.state == resources.ImportJob.ImportJobState.PENDING_GENERATION
+
+
 def test_create_import_job_flattened():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1782,6 +3853,36 @@ def test_create_import_job_flattened():
         assert args[0].import_job == resources.ImportJob(name='name_value')
 
 
+@pytest.mark.asyncio
+async def test_create_import_job_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.create_import_job),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.ImportJob())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.create_import_job(
+            parent='parent_value',
+            import_job_id='import_job_id_value',
+            import_job=resources.ImportJob(name='name_value'),
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].parent == 'parent_value'
+        assert args[0].import_job_id == 'import_job_id_value'
+        assert args[0].import_job == resources.ImportJob(name='name_value')
+
+
 def test_create_import_job_flattened_error():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1798,6 +3899,23 @@ def test_create_import_job_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_create_import_job_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.create_import_job(
+            service.CreateImportJobRequest(),
+            parent='parent_value',
+            import_job_id='import_job_id_value',
+            import_job=resources.ImportJob(name='name_value'),
+        )
+
+
 def test_update_crypto_key(transport: str = 'grpc'):
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1832,17 +3950,52 @@ def test_update_crypto_key(transport: str = 'grpc'):
     assert response.purpose == resources.CryptoKey.CryptoKeyPurpose.ENCRYPT_DECRYPT
 
 
-def test_update_crypto_key_flattened():
-    client = KeyManagementServiceClient(
+@pytest.mark.asyncio
+async def test_update_crypto_key_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
         credentials=credentials.AnonymousCredentials(),
+        transport=transport,
     )
 
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.UpdateCryptoKeyRequest()
+
     # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.update_crypto_key),
+            type(client._client._transport.update_crypto_key),
             '__call__') as call:
         # Designate an appropriate return value for the call.
-        call.return_value = resources.CryptoKey()
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKey(
+            name='name_value',
+            purpose=resources.CryptoKey.CryptoKeyPurpose.ENCRYPT_DECRYPT,
+        ))
+
+        response = await client.update_crypto_key(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, resources.CryptoKey)
+    assert response.name == 'name_value'
+    assert response.purpose == resources.CryptoKey.CryptoKeyPurpose.ENCRYPT_DECRYPT
+
+
+def test_update_crypto_key_flattened():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.update_crypto_key),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = resources.CryptoKey()
 
         # Call the method with a truthy value for each flattened field,
         # using the keyword arguments to the method.
@@ -1859,6 +4012,34 @@ def test_update_crypto_key_flattened():
         assert args[0].update_mask == field_mask.FieldMask(paths=['paths_value'])
 
 
+@pytest.mark.asyncio
+async def test_update_crypto_key_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.update_crypto_key),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKey())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.update_crypto_key(
+            crypto_key=resources.CryptoKey(name='name_value'),
+            update_mask=field_mask.FieldMask(paths=['paths_value']),
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].crypto_key == resources.CryptoKey(name='name_value')
+        assert args[0].update_mask == field_mask.FieldMask(paths=['paths_value'])
+
+
 def test_update_crypto_key_flattened_error():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1874,6 +4055,22 @@ def test_update_crypto_key_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_update_crypto_key_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.update_crypto_key(
+            service.UpdateCryptoKeyRequest(),
+            crypto_key=resources.CryptoKey(name='name_value'),
+            update_mask=field_mask.FieldMask(paths=['paths_value']),
+        )
+
+
 def test_update_crypto_key_version(transport: str = 'grpc'):
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1916,6 +4113,49 @@ def test_update_crypto_key_version(transport: str = 'grpc'):
     assert response.import_failure_reason == 'import_failure_reason_value'
 
 
+@pytest.mark.asyncio
+async def test_update_crypto_key_version_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.UpdateCryptoKeyVersionRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.update_crypto_key_version),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKeyVersion(
+            name='name_value',
+            state=resources.CryptoKeyVersion.CryptoKeyVersionState.PENDING_GENERATION,
+            protection_level=resources.ProtectionLevel.SOFTWARE,
+            algorithm=resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION,
+            import_job='import_job_value',
+            import_failure_reason='import_failure_reason_value',
+        ))
+
+        response = await client.update_crypto_key_version(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, resources.CryptoKeyVersion)
+    assert response.name == 'name_value'
+    assert response.state == resources.CryptoKeyVersion.CryptoKeyVersionState.PENDING_GENERATION
+    assert response.protection_level == resources.ProtectionLevel.SOFTWARE
+    assert response.algorithm == resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION
+    assert response.import_job == 'import_job_value'
+    assert response.import_failure_reason == 'import_failure_reason_value'
+
+
 def test_update_crypto_key_version_flattened():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1943,6 +4183,34 @@ def test_update_crypto_key_version_flattened():
         assert args[0].update_mask == field_mask.FieldMask(paths=['paths_value'])
 
 
+@pytest.mark.asyncio
+async def test_update_crypto_key_version_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.update_crypto_key_version),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKeyVersion())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.update_crypto_key_version(
+            crypto_key_version=resources.CryptoKeyVersion(name='name_value'),
+            update_mask=field_mask.FieldMask(paths=['paths_value']),
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].crypto_key_version == resources.CryptoKeyVersion(name='name_value')
+        assert args[0].update_mask == field_mask.FieldMask(paths=['paths_value'])
+
+
 def test_update_crypto_key_version_flattened_error():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1958,6 +4226,22 @@ def test_update_crypto_key_version_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_update_crypto_key_version_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.update_crypto_key_version(
+            service.UpdateCryptoKeyVersionRequest(),
+            crypto_key_version=resources.CryptoKeyVersion(name='name_value'),
+            update_mask=field_mask.FieldMask(paths=['paths_value']),
+        )
+
+
 def test_encrypt(transport: str = 'grpc'):
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -1992,6 +4276,41 @@ def test_encrypt(transport: str = 'grpc'):
     assert response.ciphertext == b'ciphertext_blob'
 
 
+@pytest.mark.asyncio
+async def test_encrypt_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.EncryptRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.encrypt),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(service.EncryptResponse(
+            name='name_value',
+            ciphertext=b'ciphertext_blob',
+        ))
+
+        response = await client.encrypt(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, service.EncryptResponse)
+    assert response.name == 'name_value'
+    assert response.ciphertext == b'ciphertext_blob'
+
+
 def test_encrypt_flattened():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -2019,6 +4338,34 @@ def test_encrypt_flattened():
         assert args[0].plaintext == b'plaintext_blob'
 
 
+@pytest.mark.asyncio
+async def test_encrypt_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.encrypt),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(service.EncryptResponse())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.encrypt(
+            name='name_value',
+            plaintext=b'plaintext_blob',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].name == 'name_value'
+        assert args[0].plaintext == b'plaintext_blob'
+
+
 def test_encrypt_flattened_error():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -2034,6 +4381,22 @@ def test_encrypt_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_encrypt_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.encrypt(
+            service.EncryptRequest(),
+            name='name_value',
+            plaintext=b'plaintext_blob',
+        )
+
+
 def test_decrypt(transport: str = 'grpc'):
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -2066,6 +4429,39 @@ def test_decrypt(transport: str = 'grpc'):
     assert response.plaintext == b'plaintext_blob'
 
 
+@pytest.mark.asyncio
+async def test_decrypt_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.DecryptRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.decrypt),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(service.DecryptResponse(
+            plaintext=b'plaintext_blob',
+        ))
+
+        response = await client.decrypt(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, service.DecryptResponse)
+    assert response.plaintext == b'plaintext_blob'
+
+
 def test_decrypt_flattened():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -2093,6 +4489,34 @@ def test_decrypt_flattened():
         assert args[0].ciphertext == b'ciphertext_blob'
 
 
+@pytest.mark.asyncio
+async def test_decrypt_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.decrypt),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(service.DecryptResponse())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.decrypt(
+            name='name_value',
+            ciphertext=b'ciphertext_blob',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].name == 'name_value'
+        assert args[0].ciphertext == b'ciphertext_blob'
+
+
 def test_decrypt_flattened_error():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -2108,20 +4532,36 @@ def test_decrypt_flattened_error():
         )
 
 
-def test_asymmetric_sign(transport: str = 'grpc'):
-    client = KeyManagementServiceClient(
+@pytest.mark.asyncio
+async def test_decrypt_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
         credentials=credentials.AnonymousCredentials(),
-        transport=transport,
     )
 
-    # Everything is optional in proto3 as far as the runtime is concerned,
-    # and we are mocking out the actual API, so just send an empty request.
-    request = service.AsymmetricSignRequest()
-
-    # Mock the actual call within the gRPC stub, and fake the request.
-    with mock.patch.object(
-            type(client._transport.asymmetric_sign),
-            '__call__') as call:
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.decrypt(
+            service.DecryptRequest(),
+            name='name_value',
+            ciphertext=b'ciphertext_blob',
+        )
+
+
+def test_asymmetric_sign(transport: str = 'grpc'):
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.AsymmetricSignRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.asymmetric_sign),
+            '__call__') as call:
         # Designate an appropriate return value for the call.
         call.return_value = service.AsymmetricSignResponse(
             signature=b'signature_blob',
@@ -2140,6 +4580,39 @@ def test_asymmetric_sign(transport: str = 'grpc'):
     assert response.signature == b'signature_blob'
 
 
+@pytest.mark.asyncio
+async def test_asymmetric_sign_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.AsymmetricSignRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.asymmetric_sign),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(service.AsymmetricSignResponse(
+            signature=b'signature_blob',
+        ))
+
+        response = await client.asymmetric_sign(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, service.AsymmetricSignResponse)
+    assert response.signature == b'signature_blob'
+
+
 def test_asymmetric_sign_flattened():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -2167,6 +4640,34 @@ def test_asymmetric_sign_flattened():
         assert args[0].digest == service.Digest(sha256=b'sha256_blob')
 
 
+@pytest.mark.asyncio
+async def test_asymmetric_sign_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.asymmetric_sign),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(service.AsymmetricSignResponse())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.asymmetric_sign(
+            name='name_value',
+            digest=service.Digest(sha256=b'sha256_blob'),
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].name == 'name_value'
+        assert args[0].digest == service.Digest(sha256=b'sha256_blob')
+
+
 def test_asymmetric_sign_flattened_error():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -2182,6 +4683,22 @@ def test_asymmetric_sign_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_asymmetric_sign_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.asymmetric_sign(
+            service.AsymmetricSignRequest(),
+            name='name_value',
+            digest=service.Digest(sha256=b'sha256_blob'),
+        )
+
+
 def test_asymmetric_decrypt(transport: str = 'grpc'):
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -2214,6 +4731,39 @@ def test_asymmetric_decrypt(transport: str = 'grpc'):
     assert response.plaintext == b'plaintext_blob'
 
 
+@pytest.mark.asyncio
+async def test_asymmetric_decrypt_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.AsymmetricDecryptRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.asymmetric_decrypt),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(service.AsymmetricDecryptResponse(
+            plaintext=b'plaintext_blob',
+        ))
+
+        response = await client.asymmetric_decrypt(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, service.AsymmetricDecryptResponse)
+    assert response.plaintext == b'plaintext_blob'
+
+
 def test_asymmetric_decrypt_flattened():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -2241,6 +4791,34 @@ def test_asymmetric_decrypt_flattened():
         assert args[0].ciphertext == b'ciphertext_blob'
 
 
+@pytest.mark.asyncio
+async def test_asymmetric_decrypt_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.asymmetric_decrypt),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(service.AsymmetricDecryptResponse())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.asymmetric_decrypt(
+            name='name_value',
+            ciphertext=b'ciphertext_blob',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].name == 'name_value'
+        assert args[0].ciphertext == b'ciphertext_blob'
+
+
 def test_asymmetric_decrypt_flattened_error():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -2256,6 +4834,22 @@ def test_asymmetric_decrypt_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_asymmetric_decrypt_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.asymmetric_decrypt(
+            service.AsymmetricDecryptRequest(),
+            name='name_value',
+            ciphertext=b'ciphertext_blob',
+        )
+
+
 def test_update_crypto_key_primary_version(transport: str = 'grpc'):
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -2290,6 +4884,41 @@ def test_update_crypto_key_primary_version(transport: str = 'grpc'):
     assert response.purpose == resources.CryptoKey.CryptoKeyPurpose.ENCRYPT_DECRYPT
 
 
+@pytest.mark.asyncio
+async def test_update_crypto_key_primary_version_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.UpdateCryptoKeyPrimaryVersionRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.update_crypto_key_primary_version),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKey(
+            name='name_value',
+            purpose=resources.CryptoKey.CryptoKeyPurpose.ENCRYPT_DECRYPT,
+        ))
+
+        response = await client.update_crypto_key_primary_version(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, resources.CryptoKey)
+    assert response.name == 'name_value'
+    assert response.purpose == resources.CryptoKey.CryptoKeyPurpose.ENCRYPT_DECRYPT
+
+
 def test_update_crypto_key_primary_version_flattened():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -2317,6 +4946,34 @@ def test_update_crypto_key_primary_version_flattened():
         assert args[0].crypto_key_version_id == 'crypto_key_version_id_value'
 
 
+@pytest.mark.asyncio
+async def test_update_crypto_key_primary_version_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.update_crypto_key_primary_version),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKey())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.update_crypto_key_primary_version(
+            name='name_value',
+            crypto_key_version_id='crypto_key_version_id_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].name == 'name_value'
+        assert args[0].crypto_key_version_id == 'crypto_key_version_id_value'
+
+
 def test_update_crypto_key_primary_version_flattened_error():
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -2332,6 +4989,22 @@ def test_update_crypto_key_primary_version_flattened_error():
         )
 
 
+@pytest.mark.asyncio
+async def test_update_crypto_key_primary_version_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.update_crypto_key_primary_version(
+            service.UpdateCryptoKeyPrimaryVersionRequest(),
+            name='name_value',
+            crypto_key_version_id='crypto_key_version_id_value',
+        )
+
+
 def test_destroy_crypto_key_version(transport: str = 'grpc'):
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
@@ -2356,142 +5029,2314 @@ def test_destroy_crypto_key_version(transport: str = 'grpc'):
             import_failure_reason='import_failure_reason_value',
         )
 
-        response = client.destroy_crypto_key_version(request)
+        response = client.destroy_crypto_key_version(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, resources.CryptoKeyVersion)
+    assert response.name == 'name_value'
+    assert response.state == resources.CryptoKeyVersion.CryptoKeyVersionState.PENDING_GENERATION
+    assert response.protection_level == resources.ProtectionLevel.SOFTWARE
+    assert response.algorithm == resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION
+    assert response.import_job == 'import_job_value'
+    assert response.import_failure_reason == 'import_failure_reason_value'
+
+
+@pytest.mark.asyncio
+async def test_destroy_crypto_key_version_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.DestroyCryptoKeyVersionRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.destroy_crypto_key_version),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKeyVersion(
+            name='name_value',
+            state=resources.CryptoKeyVersion.CryptoKeyVersionState.PENDING_GENERATION,
+            protection_level=resources.ProtectionLevel.SOFTWARE,
+            algorithm=resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION,
+            import_job='import_job_value',
+            import_failure_reason='import_failure_reason_value',
+        ))
+
+        response = await client.destroy_crypto_key_version(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, resources.CryptoKeyVersion)
+    assert response.name == 'name_value'
+    assert response.state == resources.CryptoKeyVersion.CryptoKeyVersionState.PENDING_GENERATION
+    assert response.protection_level == resources.ProtectionLevel.SOFTWARE
+    assert response.algorithm == resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION
+    assert response.import_job == 'import_job_value'
+    assert response.import_failure_reason == 'import_failure_reason_value'
+
+
+def test_destroy_crypto_key_version_flattened():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.destroy_crypto_key_version),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = resources.CryptoKeyVersion()
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = client.destroy_crypto_key_version(
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].name == 'name_value'
+
+
+@pytest.mark.asyncio
+async def test_destroy_crypto_key_version_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.destroy_crypto_key_version),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKeyVersion())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.destroy_crypto_key_version(
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].name == 'name_value'
+
+
+def test_destroy_crypto_key_version_flattened_error():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.destroy_crypto_key_version(
+            service.DestroyCryptoKeyVersionRequest(),
+            name='name_value',
+        )
+
+
+@pytest.mark.asyncio
+async def test_destroy_crypto_key_version_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.destroy_crypto_key_version(
+            service.DestroyCryptoKeyVersionRequest(),
+            name='name_value',
+        )
+
+
+def test_restore_crypto_key_version(transport: str = 'grpc'):
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.RestoreCryptoKeyVersionRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.restore_crypto_key_version),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = resources.CryptoKeyVersion(
+            name='name_value',
+            state=resources.CryptoKeyVersion.CryptoKeyVersionState.PENDING_GENERATION,
+            protection_level=resources.ProtectionLevel.SOFTWARE,
+            algorithm=resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION,
+            import_job='import_job_value',
+            import_failure_reason='import_failure_reason_value',
+        )
+
+        response = client.restore_crypto_key_version(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, resources.CryptoKeyVersion)
+    assert response.name == 'name_value'
+    assert response.state == resources.CryptoKeyVersion.CryptoKeyVersionState.PENDING_GENERATION
+    assert response.protection_level == resources.ProtectionLevel.SOFTWARE
+    assert response.algorithm == resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION
+    assert response.import_job == 'import_job_value'
+    assert response.import_failure_reason == 'import_failure_reason_value'
+
+
+@pytest.mark.asyncio
+async def test_restore_crypto_key_version_async(transport: str = 'grpc_asyncio'):
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = service.RestoreCryptoKeyVersionRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.restore_crypto_key_version),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKeyVersion(
+            name='name_value',
+            state=resources.CryptoKeyVersion.CryptoKeyVersionState.PENDING_GENERATION,
+            protection_level=resources.ProtectionLevel.SOFTWARE,
+            algorithm=resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION,
+            import_job='import_job_value',
+            import_failure_reason='import_failure_reason_value',
+        ))
+
+        response = await client.restore_crypto_key_version(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, resources.CryptoKeyVersion)
+    assert response.name == 'name_value'
+    assert response.state == resources.CryptoKeyVersion.CryptoKeyVersionState.PENDING_GENERATION
+    assert response.protection_level == resources.ProtectionLevel.SOFTWARE
+    assert response.algorithm == resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION
+    assert response.import_job == 'import_job_value'
+    assert response.import_failure_reason == 'import_failure_reason_value'
+
+
+def test_restore_crypto_key_version_flattened():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.restore_crypto_key_version),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = resources.CryptoKeyVersion()
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = client.restore_crypto_key_version(
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].name == 'name_value'
+
+
+@pytest.mark.asyncio
+async def test_restore_crypto_key_version_flattened_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.restore_crypto_key_version),
+            '__call__') as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(resources.CryptoKeyVersion())
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.restore_crypto_key_version(
+            name='name_value',
+        )
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].name == 'name_value'
+
+
+def test_restore_crypto_key_version_flattened_error():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.restore_crypto_key_version(
+            service.RestoreCryptoKeyVersionRequest(),
+            name='name_value',
+        )
+
+
+@pytest.mark.asyncio
+async def test_restore_crypto_key_version_flattened_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.restore_crypto_key_version(
+            service.RestoreCryptoKeyVersionRequest(),
+            name='name_value',
+        )
+
+
+def test_wrapped_methods_cached_per_transport():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.get_crypto_key),
+            '__call__') as call:
+        call.return_value = resources.CryptoKey()
+        client.get_crypto_key(service.GetCryptoKeyRequest(name='name/value'))
+        rpc = client._transport._wrapped_methods['get_crypto_key']
+        client.get_crypto_key(service.GetCryptoKeyRequest(name='name/value'))
+
+        # The RPC method is wrapped only once and reused afterwards.
+        assert client._transport._wrapped_methods['get_crypto_key'] is rpc
+        assert list(client._transport._wrapped_methods) == ['get_crypto_key']
+
+        # The routing header is sent with every call.
+        assert len(call.mock_calls) == 2
+        for _, _, kw in call.mock_calls:
+            assert (
+                'x-goog-request-params',
+                'name=name/value',
+            ) in kw['metadata']
+
+
+def test_decrypt_default_retry():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.decrypt),
+            '__call__') as call, mock.patch('time.sleep'):
+        call.side_effect = (
+            exceptions.ServiceUnavailable('unavailable'),
+            service.DecryptResponse(),
+        )
+        response = client.decrypt(service.DecryptRequest())
+
+        # Idempotent methods are retried on transient errors.
+        assert len(call.mock_calls) == 2
+        _, _, kw = call.mock_calls[0]
+        assert kw['timeout'] == pytest.approx(60.0, abs=1)
+    assert isinstance(response, service.DecryptResponse)
+
+
+def test_create_key_ring_default_no_retry():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.create_key_ring),
+            '__call__') as call:
+        call.side_effect = exceptions.ServiceUnavailable('unavailable')
+
+        # Methods that change state are never retried by default.
+        with pytest.raises(exceptions.ServiceUnavailable):
+            client.create_key_ring(service.CreateKeyRingRequest())
+        assert len(call.mock_calls) == 1
+        _, _, kw = call.mock_calls[0]
+        assert kw['timeout'] == pytest.approx(60.0, abs=1)
+
+
+@pytest.mark.asyncio
+async def test_decrypt_default_retry_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._client._transport.decrypt),
+            '__call__', new_callable=AwaitableMock) as call, \
+            mock.patch('asyncio.sleep', new_callable=AwaitableMock):
+        call.side_effect = (
+            exceptions.ServiceUnavailable('unavailable'),
+            service.DecryptResponse(),
+        )
+        response = await client.decrypt(service.DecryptRequest())
+
+        # Idempotent methods are retried on transient errors.
+        assert len(call.mock_calls) == 2
+    assert isinstance(response, service.DecryptResponse)
+
+
+def test_method_configs_from_dict():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={
+            'method_configs': {
+                'decrypt': {'retry': None, 'timeout': 5.0},
+            },
+        },
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.decrypt),
+            '__call__') as call:
+        call.side_effect = exceptions.ServiceUnavailable('unavailable')
+
+        # The overridden retry and timeout are used instead of the defaults.
+        with pytest.raises(exceptions.ServiceUnavailable):
+            client.decrypt(service.DecryptRequest())
+        assert len(call.mock_calls) == 1
+        _, _, kw = call.mock_calls[0]
+        assert kw['timeout'] == pytest.approx(5.0, abs=1)
+
+
+def test_method_configs_from_client_options():
+    options = client_options.ClientOptions()
+    options.method_configs = {'create_key_ring': {'timeout': 7.0}}
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options=options,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+            type(client._transport.create_key_ring),
+            '__call__') as call:
+        call.return_value = resources.KeyRing()
+        client.create_key_ring(service.CreateKeyRingRequest())
+
+        _, _, kw = call.mock_calls[0]
+        assert kw['timeout'] == pytest.approx(7.0, abs=1)
+
+
+def test_method_configs_unknown():
+    with pytest.raises(ValueError):
+        KeyManagementServiceClient(
+            credentials=credentials.AnonymousCredentials(),
+            client_options={'method_configs': {'not_a_method': {}}},
+        )
+    with pytest.raises(ValueError):
+        KeyManagementServiceClient(
+            credentials=credentials.AnonymousCredentials(),
+            client_options={'method_configs': {'decrypt': {'deadline': 1.0}}},
+        )
+
+
+def test_encrypt_many():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def encrypt(request, **kwargs):
+        with lock:
+            in_flight.append(request)
+            peak.append(len(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.remove(request)
+        if request.plaintext == b'bad':
+            raise exceptions.InvalidArgument('bad plaintext')
+        return service.EncryptResponse(ciphertext=request.plaintext[::-1])
+
+    items = [('name_value', b'item %d' % i) for i in range(20)]
+    items[5] = ('name_value', b'bad', b'aad')
+
+    with mock.patch.object(
+            type(client._transport.encrypt),
+            '__call__', side_effect=encrypt) as call:
+        results = list(client.encrypt_many(iter(items), max_in_flight=4))
+
+    assert call.call_count == 20
+    assert max(peak) <= 4
+    assert len(results) == 20
+    for (name, plaintext, *aad), result in zip(items, results):
+        assert result.request['plaintext'] == plaintext
+        if plaintext == b'bad':
+            assert result.request['additional_authenticated_data'] == b'aad'
+            assert result.response is None
+            assert isinstance(result.error, exceptions.InvalidArgument)
+        else:
+            assert result.response.ciphertext == plaintext[::-1]
+            assert result.error is None
+
+
+def test_decrypt_many():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    with mock.patch.object(
+            type(client._transport.decrypt),
+            '__call__') as call:
+        call.return_value = service.DecryptResponse(plaintext=b'plaintext_blob')
+        results = list(client.decrypt_many(
+            [('name_value', b'ciphertext_blob', b'aad')]))
+
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == service.DecryptRequest(
+            name='name_value',
+            ciphertext=b'ciphertext_blob',
+            additional_authenticated_data=b'aad',
+        )
+    assert results[0].response.plaintext == b'plaintext_blob'
+
+
+def test_decrypt_many_close_early():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+    items = [('name_value', b'%d' % i) for i in range(100)]
+
+    with mock.patch.object(
+            type(client._transport.decrypt),
+            '__call__') as call:
+        call.return_value = service.DecryptResponse()
+        results = client.decrypt_many(items, max_in_flight=2)
+        next(results)
+        results.close()
+        assert call.call_count <= 3
+
+
+def test_decrypt_many_errors():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+    with pytest.raises(ValueError):
+        client.decrypt_many([], max_in_flight=0)
+
+
+def test_decrypt_many_malformed_items():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+    items = [('name_value', b'0'), ('name_value',), ('name_value', b'2'), None]
+
+    with mock.patch.object(
+            type(client._transport.decrypt),
+            '__call__') as call:
+        call.return_value = service.DecryptResponse(plaintext=b'plaintext_blob')
+        results = list(client.decrypt_many(items, max_in_flight=2))
+
+    # Malformed items fail in their position, without a call.
+    assert call.call_count == 2
+    assert [r.error is None for r in results] == [True, False, True, False]
+    assert results[1].request == ('name_value',)
+    assert isinstance(results[1].error, ValueError)
+    assert isinstance(results[3].error, TypeError)
+    assert results[2].response.plaintext == b'plaintext_blob'
+
+
+@pytest.mark.asyncio
+async def test_encrypt_many_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+    in_flight = []
+    peak = []
+
+    async def encrypt(request, **kwargs):
+        in_flight.append(request)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(request)
+        if request.plaintext == b'bad':
+            raise exceptions.InvalidArgument('bad plaintext')
+        return service.EncryptResponse(ciphertext=request.plaintext[::-1])
+
+    items = [('name_value', b'item %d' % i) for i in range(20)]
+    items[5] = ('name_value', b'bad')
+
+    with mock.patch.object(
+            type(client._client._transport.encrypt),
+            '__call__', side_effect=encrypt) as call:
+        results = [r async for r in client.encrypt_many(items, max_in_flight=4)]
+
+    assert call.call_count == 20
+    assert max(peak) == 4
+    for (name, plaintext), result in zip(items, results):
+        if plaintext == b'bad':
+            assert isinstance(result.error, exceptions.InvalidArgument)
+        else:
+            assert result.response.ciphertext == plaintext[::-1]
+
+
+@pytest.mark.asyncio
+async def test_decrypt_many_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+    items = [('name_value', b'%d' % i, b'aad') for i in range(10)]
+
+    with mock.patch.object(
+            type(client._client._transport.decrypt),
+            '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(
+            service.DecryptResponse(plaintext=b'plaintext_blob'))
+        results = client.decrypt_many(items, max_in_flight=3)
+        result = await results.__anext__()
+        assert result.request['ciphertext'] == b'0'
+        assert result.response.plaintext == b'plaintext_blob'
+        await results.aclose()
+        assert call.call_count <= 4
+
+
+@pytest.mark.asyncio
+async def test_decrypt_many_async_malformed_items():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+    items = [('name_value', b'0'), ('name_value',), ('name_value', b'2'), ()]
+
+    with mock.patch.object(
+            type(client._client._transport.decrypt),
+            '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(
+            service.DecryptResponse(plaintext=b'plaintext_blob'))
+        results = [r async for r in client.decrypt_many(items, max_in_flight=2)]
+        assert call.call_count == 2
+
+        # Closing early with a malformed item pending.
+        results_iter = client.decrypt_many(items[:2], max_in_flight=2)
+        await results_iter.__anext__()
+        await results_iter.aclose()
+
+    assert [r.error is None for r in results] == [True, False, True, False]
+    assert results[1].request == ('name_value',)
+    assert isinstance(results[1].error, ValueError)
+    assert results[2].response.plaintext == b'plaintext_blob'
+
+
+def test_coalesce_decrypt():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'method_configs': {'decrypt': {'coalesce': True}}},
+    )
+    release = threading.Event()
+
+    def decrypt(request, **kwargs):
+        release.wait(5)
+        return service.DecryptResponse(plaintext=b'plaintext_blob')
+
+    with mock.patch.object(
+            type(client._transport.decrypt),
+            '__call__', side_effect=decrypt) as call:
+        with futures.ThreadPoolExecutor(8) as executor:
+            results = [
+                executor.submit(client.decrypt, name='name_value',
+                                ciphertext=b'ciphertext_blob')
+                for _ in range(8)
+            ]
+            time.sleep(0.1)
+            release.set()
+            responses = [r.result() for r in results]
+        assert call.call_count == 1
+        assert all(r.plaintext == b'plaintext_blob' for r in responses)
+
+        # Once the shared call completed, the next request is sent anew,
+        # and different requests are never shared.
+        client.decrypt(name='name_value', ciphertext=b'ciphertext_blob')
+        client.decrypt(name='name_value', ciphertext=b'other_blob')
+        assert call.call_count == 3
+
+
+def test_coalesce_error():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'method_configs': {
+            'get_public_key': {'coalesce': True, 'retry': None},
+        }},
+    )
+    release = threading.Event()
+
+    def get_public_key(request, **kwargs):
+        release.wait(5)
+        raise exceptions.NotFound('no such key')
+
+    with mock.patch.object(
+            type(client._transport.get_public_key),
+            '__call__', side_effect=get_public_key) as call:
+        with futures.ThreadPoolExecutor(4) as executor:
+            results = [
+                executor.submit(client.get_public_key, name='name_value')
+                for _ in range(4)
+            ]
+            time.sleep(0.1)
+            release.set()
+            for result in results:
+                with pytest.raises(exceptions.NotFound):
+                    result.result()
+        assert call.call_count == 1
+
+        with pytest.raises(exceptions.NotFound):
+            client.get_public_key(name='name_value')
+        assert call.call_count == 2
+
+
+def test_coalesce_side_effects():
+    with pytest.raises(ValueError):
+        KeyManagementServiceClient(
+            credentials=credentials.AnonymousCredentials(),
+            client_options={'method_configs': {
+                'create_key_ring': {'coalesce': True},
+            }},
+        )
+
+
+@pytest.mark.asyncio
+async def test_coalesce_decrypt_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'method_configs': {'decrypt': {'coalesce': True}}},
+    )
+
+    async def decrypt(request, **kwargs):
+        await asyncio.sleep(0.01)
+        return service.DecryptResponse(plaintext=b'plaintext_blob')
+
+    with mock.patch.object(
+            type(client._client._transport.decrypt),
+            '__call__', side_effect=decrypt) as call:
+        calls = [
+            asyncio.ensure_future(client.decrypt(
+                name='name_value', ciphertext=b'ciphertext_blob'))
+            for _ in range(8)
+        ]
+        # Cancelling one caller does not cancel the shared call.
+        await asyncio.sleep(0)
+        calls[0].cancel()
+        responses = await asyncio.gather(*calls[1:])
+        assert call.call_count == 1
+        assert all(r.plaintext == b'plaintext_blob' for r in responses)
+
+        await client.decrypt(name='name_value', ciphertext=b'ciphertext_blob')
+        assert call.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesce_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'method_configs': {
+            'get_crypto_key': {'coalesce': True, 'retry': None},
+        }},
+    )
+
+    async def get_crypto_key(request, **kwargs):
+        await asyncio.sleep(0.01)
+        raise exceptions.NotFound('no such key')
+
+    with mock.patch.object(
+            type(client._client._transport.get_crypto_key),
+            '__call__', side_effect=get_crypto_key) as call:
+        results = await asyncio.gather(
+            *[client.get_crypto_key(name='name_value') for _ in range(4)],
+            return_exceptions=True)
+        assert call.call_count == 1
+        assert all(isinstance(r, exceptions.NotFound) for r in results)
+
+
+def test_pager_prefetch_stops_early():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+    fetched = threading.Semaphore(0)
+
+    def list_key_rings(request, **kwargs):
+        fetched.release()
+        return service.ListKeyRingsResponse(
+            key_rings=[resources.KeyRing()],
+            next_page_token='next',
+        )
+
+    with mock.patch.object(
+            type(client._transport.list_key_rings),
+            '__call__', side_effect=list_key_rings) as call:
+        pages = client.list_key_rings(request={}, prefetch=2).pages
+        next(pages)
+        # The buffer holds two pages and one more request is blocked on
+        # the full buffer.
+        for _ in range(4):
+            assert fetched.acquire(timeout=5)
+        assert not fetched.acquire(timeout=0.2)
+        pages.close()
+        time.sleep(3 * pagers._POLL_INTERVAL)
+        assert call.call_count == 4
+
+
+def test_pager_prefetch_error():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    with mock.patch.object(
+            type(client._transport.list_import_jobs),
+            '__call__') as call:
+        call.side_effect = (
+            service.ListImportJobsResponse(next_page_token='abc'),
+            exceptions.InternalServerError('boom'),
+        )
+        pager = client.list_import_jobs(request={}, prefetch=1)
+        with pytest.raises(exceptions.InternalServerError):
+            list(pager)
+
+
+def test_pager_prefetch_negative():
+    with pytest.raises(ValueError):
+        pagers.ListKeyRingsPager(
+            method=mock.Mock(),
+            request={},
+            response=service.ListKeyRingsResponse(),
+            prefetch=-1,
+        )
+
+
+@pytest.mark.asyncio
+async def test_pager_prefetch_stops_early_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    with mock.patch.object(
+            type(client._client._transport.list_crypto_keys),
+            '__call__', new_callable=AwaitableMock) as call:
+        call.return_value = service.ListCryptoKeysResponse(
+            crypto_keys=[resources.CryptoKey()],
+            next_page_token='next',
+        )
+        pages = (await client.list_crypto_keys(request={}, prefetch=3)).pages
+        await pages.__anext__()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        count = call.call_count
+        assert count == 5
+        await pages.aclose()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert call.call_count == count
+
+
+@pytest.mark.asyncio
+async def test_pager_prefetch_error_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    with mock.patch.object(
+            type(client._client._transport.list_crypto_key_versions),
+            '__call__', new_callable=AwaitableMock) as call:
+        call.side_effect = (
+            service.ListCryptoKeyVersionsResponse(next_page_token='abc'),
+            exceptions.InternalServerError('boom'),
+        )
+        pager = await client.list_crypto_key_versions(request={}, prefetch=1)
+        with pytest.raises(exceptions.InternalServerError):
+            async for _ in pager:
+                pass
+
+
+class FakeMetadata:
+    """Serve get and update requests for one crypto key and version."""
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, request, **kwargs):
+        self.calls.append(type(request).__name__)
+        if isinstance(request, service.GetKeyRingRequest):
+            return resources.KeyRing(name=request.name)
+        if isinstance(request, service.GetImportJobRequest):
+            return resources.ImportJob(name=request.name)
+        if isinstance(request, (service.GetCryptoKeyRequest,
+                                service.UpdateCryptoKeyPrimaryVersionRequest)):
+            return resources.CryptoKey(name=request.name)
+        if isinstance(request, service.UpdateCryptoKeyRequest):
+            return request.crypto_key
+        if isinstance(request, service.UpdateCryptoKeyVersionRequest):
+            return request.crypto_key_version
+        if isinstance(request, service.RestoreCryptoKeyVersionRequest):
+            raise exceptions.InternalServerError('boom')
+        return resources.CryptoKeyVersion(name=request.name)
+
+    def count(self, name):
+        count = self.calls.count(name)
+        self.calls = []
+        return count
+
+
+def test_metadata_cache():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'metadata_cache': True},
+    )
+    key = 'projects/p/locations/l/keyRings/r/cryptoKeys/k'
+    version = key + '/cryptoKeyVersions/1'
+    fake = FakeMetadata()
+
+    with mock.patch.object(
+            type(client._transport.get_crypto_key),
+            '__call__', side_effect=fake):
+        for _ in range(3):
+            client.get_key_ring(name='projects/p/locations/l/keyRings/r')
+            client.get_import_job(name='projects/p/locations/l/keyRings/r/importJobs/j')
+            response = client.get_crypto_key(name=key)
+            client.get_crypto_key_version(name=version)
+        assert len(fake.calls) == 4
+        fake.calls = []
+
+        # Callers get copies.
+        response.name = 'changed'
+        assert client.get_crypto_key(name=key).name == key
+
+        client.update_crypto_key(crypto_key=resources.CryptoKey(name=key))
+        client.get_crypto_key(name=key)
+        client.get_crypto_key_version(name=version)
+        assert fake.count('GetCryptoKeyRequest') == 1
+        assert not fake.calls
+
+        client.update_crypto_key_primary_version(name=key, crypto_key_version_id='2')
+        client.get_crypto_key(name=key)
+        assert fake.count('GetCryptoKeyRequest') == 1
+
+        # Changing a version also invalidates its crypto key, even when the
+        # change fails.
+        for method in (client.update_crypto_key_version,
+                       client.destroy_crypto_key_version,
+                       client.restore_crypto_key_version):
+            if method == client.update_crypto_key_version:
+                method(crypto_key_version=resources.CryptoKeyVersion(name=version))
+            else:
+                try:
+                    method(name=version, retry=None)
+                except exceptions.InternalServerError:
+                    pass
+            fake.calls = []
+            client.get_crypto_key(name=key)
+            client.get_crypto_key_version(name=version)
+            assert fake.calls == ['GetCryptoKeyRequest', 'GetCryptoKeyVersionRequest']
+            fake.calls = []
+    assert client._metadata_cache.stats()['size'] == 4
+
+
+def test_metadata_cache_option():
+    options = client_options.ClientOptions()
+    options.metadata_cache = metadata_cache.MetadataCache()
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options=options,
+    )
+    assert client._metadata_cache is options.metadata_cache
+
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+    assert client._metadata_cache is None
+
+
+def test_metadata_cache_expiry():
+    cache = metadata_cache.MetadataCache(ttls={'get_crypto_key': 10.0}, max_size=2)
+    generation = cache.generation
+    with mock.patch('time.monotonic', return_value=100.0):
+        cache.put('get_crypto_key', 'a', resources.CryptoKey(name='a'), generation)
+        cache.put('get_crypto_key_version', 'v', resources.CryptoKeyVersion(name='v'), generation)
+    with mock.patch('time.monotonic', return_value=109.0):
+        assert cache.get('get_crypto_key', 'a').name == 'a'
+        assert cache.get('get_crypto_key_version', 'v').name == 'v'
+    with mock.patch('time.monotonic', return_value=110.0):
+        assert cache.get('get_crypto_key', 'a') is None
+        assert cache.get('get_crypto_key', 'a') is None
+        assert cache.get('get_crypto_key_version', 'v').name == 'v'
+    assert cache.stats() == {'hits': 3, 'misses': 2, 'evictions': 0, 'size': 1}
+
+
+def test_metadata_cache_lru():
+    cache = metadata_cache.MetadataCache(max_size=2)
+    generation = cache.generation
+    for name in 'abc':
+        cache.put('get_key_ring', name, resources.KeyRing(name=name), generation)
+        cache.get('get_key_ring', 'a')
+    assert cache.get('get_key_ring', 'b') is None
+    assert cache.get('get_key_ring', 'c').name == 'c'
+    assert cache.evictions == 1
+
+    cache.invalidate()
+    assert cache.get('get_key_ring', 'a') is None
+
+
+def test_metadata_cache_stale_response():
+    cache = metadata_cache.MetadataCache(ttls={'get_import_job': 0})
+    generation = cache.generation
+    cache.put('get_import_job', 'j', resources.ImportJob(name='j'), generation)
+    assert cache.get('get_import_job', 'j') is None
+
+    # A response fetched before an invalidation is not cached.
+    cache.invalidate('k')
+    cache.put('get_crypto_key', 'k', resources.CryptoKey(name='k'), generation)
+    assert cache.get('get_crypto_key', 'k') is None
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'ttls': {'get_public_key': 60.0}},
+    {'max_size': 0},
+])
+def test_metadata_cache_invalid(kwargs):
+    with pytest.raises(ValueError):
+        metadata_cache.MetadataCache(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_metadata_cache_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'metadata_cache': metadata_cache.MetadataCache()},
+    )
+    key = 'projects/p/locations/l/keyRings/r/cryptoKeys/k'
+    version = key + '/cryptoKeyVersions/1'
+    fake = FakeMetadata()
+
+    async def call(request, **kwargs):
+        return fake(request)
+
+    with mock.patch.object(
+            type(client._client._transport.get_crypto_key),
+            '__call__', side_effect=call):
+        for _ in range(2):
+            await client.get_key_ring(name='projects/p/locations/l/keyRings/r')
+            await client.get_import_job(name='projects/p/locations/l/keyRings/r/importJobs/j')
+            await client.get_crypto_key(name=key)
+            await client.get_crypto_key_version(name=version)
+        assert len(fake.calls) == 4
+        fake.calls = []
+
+        await client.update_crypto_key(crypto_key=resources.CryptoKey(name=key))
+        await client.update_crypto_key_primary_version(name=key, crypto_key_version_id='2')
+        await client.get_crypto_key(name=key)
+        assert fake.count('GetCryptoKeyRequest') == 1
+
+        await client.update_crypto_key_version(
+            crypto_key_version=resources.CryptoKeyVersion(name=version))
+        await client.destroy_crypto_key_version(name=version)
+        with pytest.raises(exceptions.InternalServerError):
+            await client.restore_crypto_key_version(name=version, retry=None)
+        fake.calls = []
+        await client.get_crypto_key(name=key)
+        await client.get_crypto_key_version(name=version)
+        assert fake.calls == ['GetCryptoKeyRequest', 'GetCryptoKeyVersionRequest']
+
+
+class FakeChannel:
+    """A channel whose calls succeed, or fail with ``error`` if set."""
+    def __init__(self):
+        self.calls = []
+        self.error = None
+        self.closed = False
+        self.subscribed = []
+        self.ready = False
+
+    def _callable(self, method, *args, **kwargs):
+        channel = self
+
+        class MultiCallable:
+            def __call__(self, request, **kwargs):
+                channel.calls.append(method)
+                if channel.error is not None:
+                    raise channel.error
+                return request
+
+            def with_call(self, request, **kwargs):
+                return self(request), None
+
+            def future(self, request, **kwargs):
+                channel.calls.append(method)
+                return futures.Future()
+
+        return MultiCallable()
+
+    unary_unary = unary_stream = stream_unary = stream_stream = _callable
+
+    def subscribe(self, callback, try_to_connect=False):
+        self.subscribed.append(callback)
+        if self.ready:
+            callback(grpc.ChannelConnectivity.READY)
+
+    def unsubscribe(self, callback):
+        self.subscribed.remove(callback)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeRpcError(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+def test_transport_grpc_pool():
+    channels = []
+
+    def create_channel(*args, **kwargs):
+        channels.append(FakeChannel())
+        return channels[-1]
+
+    with mock.patch.object(grpc_helpers, 'create_channel', side_effect=create_channel) as create:
+        transport = transports.KeyManagementServiceGrpcTransport(
+            credentials=credentials.AnonymousCredentials(),
+            pool_size=3,
+        )
+        assert isinstance(transport.grpc_channel, transports.pool.ChannelPool)
+        assert transport.grpc_channel.channels == channels
+        assert create.call_count == 3
+
+        client = KeyManagementServiceClient(transport=transport)
+        for _ in range(6):
+            client.get_crypto_key(name='name_value')
+        assert [len(c.calls) for c in channels] == [2, 2, 2]
+        assert channels[0].calls[0] == '/google.cloud.kms.v1.KeyManagementService/GetCryptoKey'
+
+    with mock.patch.object(grpc_helpers, 'create_channel', side_effect=create_channel), \
+            mock.patch('grpc.ssl_channel_credentials', autospec=True):
+        transport = transports.KeyManagementServiceGrpcTransport(
+            credentials=credentials.AnonymousCredentials(),
+            api_mtls_endpoint='mtls.squid.clam.whelk',
+            client_cert_source=client_cert_source_callback,
+            pool_size=2,
+            pool_policy='least_outstanding',
+        )
+        assert len(transport.grpc_channel.channels) == 2
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'pool_size': 0},
+    {'pool_size': 2, 'pool_policy': 'random'},
+])
+def test_transport_grpc_pool_invalid(kwargs):
+    with pytest.raises(ValueError):
+        transports.KeyManagementServiceGrpcTransport(
+            credentials=credentials.AnonymousCredentials(),
+            **kwargs
+        )
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'size': 0},
+    {'policy': 'random'},
+    {'max_failures': 0},
+])
+def test_channel_pool_invalid(kwargs):
+    kwargs = dict({'size': 2}, **kwargs)
+    with pytest.raises(ValueError):
+        transports.pool.ChannelPool(FakeChannel, **kwargs)
+
+
+def test_channel_pool_least_outstanding():
+    pool = transports.pool.ChannelPool(FakeChannel, 3, 'least_outstanding')
+    rpc = pool.unary_unary('/Service/Method')
+    pending = [rpc.future('request') for _ in range(2)]
+    assert pool.stats()['outstanding'] == [1, 1, 0]
+
+    # Idle channels are preferred until the load is even.
+    assert rpc('request') == 'request'
+    assert rpc.with_call('request') == ('request', None)
+    rpc.future('request')
+    assert pool.stats()['outstanding'] == [1, 1, 1]
+
+    pending[0].cancel()
+    pending[1].set_exception(FakeRpcError(grpc.StatusCode.NOT_FOUND))
+    assert pool.stats()['outstanding'] == [0, 0, 1]
+    assert [len(c.calls) for c in pool.channels] == [1, 1, 3]
+
+
+def test_channel_pool_eviction():
+    pool = transports.pool.ChannelPool(FakeChannel, 1, max_failures=2)
+    rpc = pool.unary_unary('/Service/Method')
+    first = pool.channels[0]
+    first.error = FakeRpcError(grpc.StatusCode.UNAVAILABLE)
+
+    # A call in flight keeps the evicted channel open until it completes.
+    pending = rpc.future('request')
+    for _ in range(2):
+        with pytest.raises(grpc.RpcError):
+            rpc('request')
+    assert pool.stats()['evictions'] == 1
+    second = pool.channels[0]
+    assert second is not first
+    assert not first.closed
+    pending.set_exception(FakeRpcError(grpc.StatusCode.UNAVAILABLE))
+    assert first.closed
+
+    # Successes and other errors reset the count of failures.
+    for error in (None, FakeRpcError(grpc.StatusCode.PERMISSION_DENIED)):
+        second.error = FakeRpcError(grpc.StatusCode.UNAVAILABLE)
+        with pytest.raises(grpc.RpcError):
+            rpc('request')
+        second.error = error
+        try:
+            rpc('request')
+        except grpc.RpcError:
+            pass
+    assert pool.channels[0] is second
+
+    # An evicted channel with nothing in flight is closed at once.
+    second.error = FakeRpcError(grpc.StatusCode.UNAVAILABLE)
+    for _ in range(2):
+        with pytest.raises(grpc.RpcError):
+            rpc('request')
+    assert second.closed
+    assert pool.stats() == {'outstanding': [0], 'evictions': 2}
+
+
+def test_channel_pool_future_error():
+    pool = transports.pool.ChannelPool(FakeChannel, 1)
+    rpc = pool.stream_unary('/Service/Method')
+    with mock.patch.object(FakeChannel, 'stream_unary', side_effect=RuntimeError):
+        with pytest.raises(RuntimeError):
+            rpc.future(iter(()))
+    assert pool.stats()['outstanding'] == [0]
+
+
+def test_channel_pool_channel_methods():
+    pool = transports.pool.ChannelPool(FakeChannel, 2)
+    assert isinstance(pool.unary_unary('/S/M'), grpc.UnaryUnaryMultiCallable)
+    assert isinstance(pool.unary_stream('/S/M'), grpc.UnaryStreamMultiCallable)
+    assert isinstance(pool.stream_unary('/S/M'), grpc.StreamUnaryMultiCallable)
+    assert isinstance(pool.stream_stream('/S/M'), grpc.StreamStreamMultiCallable)
+    assert pool.stream_stream('/S/M')(iter(())) is not None
+
+    callback = mock.Mock()
+    pool.subscribe(callback)
+    assert all(c.subscribed == [callback] for c in pool.channels)
+    pool.unsubscribe(callback)
+    assert all(c.subscribed == [] for c in pool.channels)
+    pool.close()
+    assert all(c.closed for c in pool.channels)
+
+
+def test_channel_pool_context_manager():
+    with transports.pool.ChannelPool(FakeChannel, 2) as pool:
+        assert not any(c.closed for c in pool.channels)
+    assert all(c.closed for c in pool.channels)
+
+
+def test_channel_pool_eviction_outside_lock():
+    channels = []
+
+    def create_channel():
+        # Other calls may pick a channel while this one is created.
+        if channels:
+            assert pool._lock.acquire(blocking=False)
+            pool._lock.release()
+            assert pool.stats()['outstanding'] == [0]
+        channels.append(FakeChannel())
+        return channels[-1]
+
+    pool = transports.pool.ChannelPool(create_channel, 1, max_failures=1)
+    rpc = pool.unary_unary('/Service/Method')
+    pending = rpc.future('request')
+    pending.set_exception(FakeRpcError(grpc.StatusCode.UNAVAILABLE))
+    assert pool.channels == [channels[1]]
+    assert channels[0].closed
+
+
+def test_rate_limiter():
+    limiter = ratelimit.RateLimiter(rates={'crypto': 2.0, 'write': 0.5})
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'rate_limiter': limiter},
+    )
+    key = 'projects/p/locations/{}/keyRings/r/cryptoKeys/k'
+
+    with mock.patch.object(
+            type(client._transport.encrypt), '__call__') as call, \
+            mock.patch('time.monotonic', return_value=100.0), \
+            mock.patch('time.sleep') as sleep:
+        call.return_value = service.EncryptResponse()
+        # The bucket holds one second's worth of requests; later ones wait
+        # for their token in turn.
+        for _ in range(4):
+            client.encrypt(name=key.format('us'), plaintext=b'data')
+        assert sleep.call_args_list == [mock.call(0.5), mock.call(1.0)]
+
+        # Buckets are per location, and per request class.
+        sleep.reset_mock()
+        client.encrypt(name=key.format('eu'), plaintext=b'data')
+        client.get_crypto_key(name=key.format('us'))
+        client.create_key_ring(parent='projects/p/locations/us')
+        client.update_crypto_key(crypto_key=resources.CryptoKey(name=key.format('us')))
+        assert sleep.call_args_list == [mock.call(2.0)]
+
+    with mock.patch('time.monotonic', return_value=101.0):
+        # Tokens are refilled over time, up to the bucket's capacity.
+        assert limiter.reserve('encrypt', service.EncryptRequest(name=key.format('us'))) == 0.5
+
+    assert limiter.stats() == {
+        'read': {'requests': 1, 'delayed': 0, 'wait_time': 0.0, 'max_wait': 0.0},
+        'write': {'requests': 2, 'delayed': 1, 'wait_time': 2.0, 'max_wait': 2.0},
+        'crypto': {'requests': 6, 'delayed': 3, 'wait_time': 2.0, 'max_wait': 1.0},
+    }
+
+
+def test_rate_limiter_unlimited():
+    limiter = ratelimit.RateLimiter(rates={'read': None}, capacities={'crypto': 1})
+    with mock.patch('time.monotonic', return_value=100.0):
+        for _ in range(3):
+            assert limiter.reserve('get_crypto_key', service.GetCryptoKeyRequest()) == 0.0
+        assert limiter.reserve('some_other_method', service.GetCryptoKeyRequest()) == 0.0
+        # Requests without a resource name share one bucket per class.
+        assert limiter.reserve('decrypt', service.DecryptRequest(name='k')) == 0.0
+        assert limiter.reserve('decrypt', service.DecryptRequest()) == 0.001
+    assert limiter.stats()['read']['requests'] == 0
+
+
+def test_rate_limiter_option():
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'rate_limiter': True},
+    )
+    rpc = client._transport._wrapped_methods['encrypt']
+    assert isinstance(rpc._rate_limiter, ratelimit.RateLimiter)
+
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+    assert not hasattr(client._transport._wrapped_methods['encrypt'], '_rate_limiter')
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'rates': {'admin': 1.0}},
+    {'rates': {'read': 0}},
+    {'capacities': {'write': -1}},
+])
+def test_rate_limiter_invalid(kwargs):
+    with pytest.raises(ValueError):
+        ratelimit.RateLimiter(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'rate_limiter': ratelimit.RateLimiter(rates={'crypto': 1.0})},
+    )
+
+    with mock.patch.object(
+            type(client._client._transport.decrypt),
+            '__call__', new_callable=AwaitableMock) as call, \
+            mock.patch('time.monotonic', return_value=100.0), \
+            mock.patch('asyncio.sleep', new_callable=AwaitableMock) as sleep:
+        call.return_value = service.DecryptResponse(plaintext=b'data')
+        for _ in range(3):
+            response = await client.decrypt(
+                name='projects/p/locations/us/keyRings/r/cryptoKeys/k',
+                ciphertext=b'ciphertext')
+        assert response.plaintext == b'data'
+        assert sleep.call_args_list == [mock.call(1.0), mock.call(2.0)]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_adaptive_limiter_aimd():
+    clock = Clock()
+    limiter = concurrency.AdaptiveLimiter(4, max_limit=5)
+    with mock.patch('time.monotonic', clock):
+        # The limit grows by about one per round of successful calls,
+        # but only while it is in use.
+        for _ in range(4):
+            calls = [limiter.acquire() for _ in range(limiter.limit)]
+            clock.now += 0.01
+            for started in calls:
+                limiter.release(started)
+        assert limiter.limit == 5
+        limiter.release(limiter.acquire())
+        assert limiter.stats()['limit'] == 5
+
+        # Throttling halves the limit once per round of calls.
+        calls = [limiter.acquire() for _ in range(5)]
+        limiter.release(calls[0], exceptions.ResourceExhausted('quota'))
+        limiter.release(calls[1], exceptions.ResourceExhausted('quota'))
+        assert limiter.limit == 2
+        limiter.release(calls[2], exceptions.NotFound('no such key'))
+        for started in calls[3:]:
+            limiter.release(started)
+        clock.now += 0.01
+        started = limiter.acquire()
+        limiter.release(started, exceptions.ResourceExhausted('quota'))
+        assert limiter.limit == 1
+
+        # So does a sustained rise in latency.
+        limiter = concurrency.AdaptiveLimiter(10, min_limit=8)
+        for latency in (0.01,) * 10 + (0.1,) * 10:
+            started = limiter.acquire()
+            clock.now += latency
+            limiter.release(started)
+        stats = limiter.stats()
+        assert stats['decreases'] == 3
+        assert stats['limit'] == 8
+        assert stats['short_latency'] > 2 * stats['long_latency']
+
+
+def test_adaptive_limiter_blocks():
+    limiter = concurrency.AdaptiveLimiter(1, max_limit=1)
+    started = limiter.acquire()
+    acquired = threading.Event()
+
+    def acquire():
+        limiter.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=acquire)
+    thread.start()
+    assert not acquired.wait(0.1)
+    assert limiter.stats()['waiting'] == 1
+    limiter.release(started)
+    assert acquired.wait(5)
+    thread.join()
+    assert limiter.stats()['in_flight'] == 1
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_async():
+    limiter = concurrency.AdaptiveLimiter(1, max_limit=1)
+    started = await limiter.acquire_async()
+
+    # A cancelled waiter leaves the queue...
+    waiter = asyncio.ensure_future(limiter.acquire_async())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.stats()['waiting'] == 0
+
+    # ... and gives back a slot it was granted but did not get to use.
+    waiter = asyncio.ensure_future(limiter.acquire_async())
+    await asyncio.sleep(0)
+    limiter.release(started)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.stats()['in_flight'] == 0
+
+    await limiter.acquire_async()
+    assert limiter.stats()['in_flight'] == 1
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'initial_limit': 0},
+    {'initial_limit': 4, 'max_limit': 2},
+    {'min_limit': 20},
+    {'backoff': 1.0},
+    {'throttled_backoff': 0},
+    {'latency_tolerance': 0.5},
+])
+def test_adaptive_limiter_invalid(kwargs):
+    with pytest.raises(ValueError):
+        concurrency.AdaptiveLimiter(**kwargs)
+
+
+def test_concurrency_limiter():
+    limiter = concurrency.AdaptiveLimiter(2, max_limit=2, latency_tolerance=100)
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'concurrency_limiter': limiter},
+    )
+    lock = threading.Lock()
+    in_flight = [0, 0]
+
+    def encrypt(request, **kwargs):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        if request.plaintext == b'9':
+            raise exceptions.ResourceExhausted('quota')
+        return service.EncryptResponse(ciphertext=request.plaintext)
+
+    with mock.patch.object(
+            type(client._transport.encrypt),
+            '__call__', side_effect=encrypt):
+        items = [('name_value', str(i).encode()) for i in range(10)]
+        results = list(client.encrypt_many(items, max_in_flight=8))
+    assert [r.error is None for r in results] == [True] * 9 + [False]
+    assert in_flight[1] == 2
+    assert limiter.stats()['decreases'] == 1
+
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'concurrency_limiter': True},
+    )
+    rpc = client._transport._wrapped_methods['encrypt']
+    assert isinstance(rpc._concurrency_limiter, concurrency.AdaptiveLimiter)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_async():
+    limiter = concurrency.AdaptiveLimiter(2, max_limit=2, latency_tolerance=100)
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'concurrency_limiter': limiter},
+    )
+    in_flight = [0, 0]
+
+    async def decrypt(request, **kwargs):
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight)
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        if request.ciphertext == b'9':
+            raise exceptions.ResourceExhausted('quota')
+        return service.DecryptResponse(plaintext=request.ciphertext)
+
+    with mock.patch.object(
+            type(client._client._transport.decrypt),
+            '__call__', side_effect=decrypt):
+        items = [('name_value', str(i).encode()) for i in range(10)]
+        results = [r async for r in client.decrypt_many(items, max_in_flight=8)]
+    assert [r.error is None for r in results] == [True] * 9 + [False]
+    assert in_flight[1] == 2
+    assert limiter.stats()['decreases'] == 1
+
+
+def test_hedging_policy():
+    policy = hedging.HedgingPolicy(
+        percentile=50, budget=0.5, burst=1, window=4, min_samples=2)
+    assert policy.methods == frozenset(hedging.DEFAULT_METHODS)
+
+    # Calls are only hedged once there are enough latencies.
+    assert policy.begin('decrypt') is None
+    policy.record('decrypt', 0.1)
+    assert policy.begin('decrypt') is None
+    policy.record('decrypt', 0.3)
+    assert policy.begin('decrypt') == 0.3
+    for latency in (0.2, 0.2, 0.2):
+        policy.record('decrypt', latency, hedge_won=True)
+    assert policy.begin('decrypt') == 0.2
+
+    # Each call earns half a hedge, and at most one is saved up.
+    assert policy.try_hedge('decrypt')
+    assert not policy.try_hedge('decrypt')
+    policy.begin('decrypt')
+    assert not policy.try_hedge('decrypt')
+    policy.begin('decrypt')
+    assert policy.try_hedge('decrypt')
+    assert policy.stats() == {'decrypt': {
+        'calls': 6, 'hedges': 2, 'wins': 3, 'denied': 2, 'delay': 0.2,
+    }}
+
+    assert hedging.from_option(policy) is policy
+    assert isinstance(hedging.from_option(True), hedging.HedgingPolicy)
+    assert hedging.from_option(None) is None
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'percentile': 100},
+    {'budget': 2},
+    {'min_delay': -1},
+    {'burst': -1},
+    {'min_samples': 0},
+    {'window': 10, 'min_samples': 20},
+])
+def test_hedging_policy_invalid(kwargs):
+    with pytest.raises(ValueError):
+        hedging.HedgingPolicy(**kwargs)
+
+
+@pytest.mark.parametrize('methods', [['decrypt', 'create_key_ring'], ['nope']])
+def test_hedging_invalid_methods(methods):
+    with pytest.raises(ValueError):
+        KeyManagementServiceClient(
+            credentials=credentials.AnonymousCredentials(),
+            client_options={'hedging': hedging.HedgingPolicy(methods)},
+        )
+
+
+def hedging_policy(**kwargs):
+    policy = hedging.HedgingPolicy(min_samples=1, min_delay=0.01, **kwargs)
+    policy.record('decrypt', 0.01)
+    return policy
+
+
+def test_hedged_call():
+    policy = hedging_policy()
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'hedging': policy},
+    )
+    calls = []
+
+    def future(request, **kwargs):
+        calls.append((futures.Future(), kwargs))
+        if len(calls) == 2:
+            calls[1][0].set_result(service.DecryptResponse(plaintext=b'hedged'))
+        return calls[-1][0]
+
+    with mock.patch.object(
+            type(client._transport.decrypt), 'future', side_effect=future):
+        response = client.decrypt(name='name_value', ciphertext=b'ciphertext')
+
+    # The slow first call is cancelled, and the hedge gets what is left
+    # of the timeout.
+    assert response.plaintext == b'hedged'
+    assert calls[0][0].cancelled()
+    assert calls[1][1]['timeout'] < calls[0][1]['timeout']
+    assert policy.stats()['decrypt']['wins'] == 1
+
+    # Fast calls are not hedged.
+    calls.clear()
+    with mock.patch.object(
+            type(client._transport.decrypt), 'future') as call:
+        call.return_value = futures.Future()
+        call.return_value.set_result(service.DecryptResponse(plaintext=b'fast'))
+        response = client.decrypt(name='name_value', ciphertext=b'ciphertext')
+    assert response.plaintext == b'fast'
+    assert call.call_count == 1
+
+    # Other methods are not hedged.
+    with mock.patch.object(
+            type(client._transport.encrypt), '__call__') as call:
+        call.return_value = service.EncryptResponse(ciphertext=b'ciphertext')
+        client.encrypt(name='name_value', plaintext=b'plaintext')
+    assert call.call_count == 1
+
+
+@pytest.mark.parametrize('hedge_fails', [False, True])
+def test_hedged_call_failure(hedge_fails):
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'hedging': hedging_policy()},
+    )
+    calls = []
+
+    def future(request, **kwargs):
+        calls.append(futures.Future())
+        if len(calls) == 2:
+            # The first call fails, and the hedge completes later.
+            calls[0].set_exception(FakeRpcError(grpc.StatusCode.INTERNAL))
+            if hedge_fails:
+                outcome = calls[1].set_exception, [FakeRpcError(grpc.StatusCode.INTERNAL)]
+            else:
+                outcome = calls[1].set_result, [service.DecryptResponse(plaintext=b'hedged')]
+            threading.Timer(0.01, *outcome).start()
+        return calls[-1]
+
+    with mock.patch.object(
+            type(client._transport.decrypt), 'future', side_effect=future):
+        if hedge_fails:
+            with pytest.raises(exceptions.GoogleAPICallError):
+                client.decrypt(
+                    name='name_value', ciphertext=b'ciphertext', timeout=None)
+        else:
+            response = client.decrypt(name='name_value', ciphertext=b'ciphertext')
+            assert response.plaintext == b'hedged'
+    assert len(calls) == 2
+
+
+def test_hedged_call_budget():
+    policy = hedging_policy(budget=0, burst=0)
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'hedging': policy},
+    )
+    with mock.patch.object(
+            type(client._transport.decrypt), 'future') as call:
+        call.return_value = futures.Future()
+        threading.Timer(0.05, call.return_value.set_result,
+                        [service.DecryptResponse(plaintext=b'slow')]).start()
+        response = client.decrypt(name='name_value', ciphertext=b'ciphertext')
+    assert response.plaintext == b'slow'
+    assert call.call_count == 1
+    assert policy.stats()['decrypt']['denied'] == 1
+
+    # Without latencies, calls are not hedged.
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'hedging': True},
+    )
+    with mock.patch.object(
+            type(client._transport.decrypt), 'future') as call:
+        call.return_value = futures.Future()
+        call.return_value.set_result(service.DecryptResponse(plaintext=b'data'))
+        response = client.decrypt(
+            name='name_value', ciphertext=b'ciphertext', timeout=None)
+    assert response.plaintext == b'data'
+
 
-        # Establish that the underlying gRPC stub method was called.
-        assert len(call.mock_calls) == 1
-        _, args, _ = call.mock_calls[0]
+@pytest.mark.asyncio
+async def test_hedged_call_async():
+    policy = hedging_policy()
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'hedging': policy},
+    )
+    cancelled = []
+    calls = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    def call(request, **kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            return slow()
+        return grpc_helpers_async.FakeUnaryUnaryCall(
+            service.DecryptResponse(plaintext=b'hedged'))
 
-        assert args[0] == request
+    with mock.patch.object(
+            type(client._client._transport.decrypt), '__call__', side_effect=call):
+        response = await client.decrypt(name='name_value', ciphertext=b'ciphertext')
+    assert response.plaintext == b'hedged'
+    assert cancelled == [True]
+    assert calls[1]['timeout'] < calls[0]['timeout']
+    assert policy.stats()['decrypt']['wins'] == 1
 
-    # Establish that the response is the type that we expect.
-    assert isinstance(response, resources.CryptoKeyVersion)
-    assert response.name == 'name_value'
-    assert response.state == resources.CryptoKeyVersion.CryptoKeyVersionState.PENDING_GENERATION
-    assert response.protection_level == resources.ProtectionLevel.SOFTWARE
-    assert response.algorithm == resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION
-    assert response.import_job == 'import_job_value'
-    assert response.import_failure_reason == 'import_failure_reason_value'
 
+@pytest.mark.asyncio
+async def test_hedged_call_async_failure():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'hedging': hedging_policy()},
+    )
+
+    async def fail():
+        await asyncio.sleep(0.05)
+        raise FakeRpcError(grpc.StatusCode.INTERNAL)
 
-def test_destroy_crypto_key_version_flattened():
+    with mock.patch.object(
+            type(client._client._transport.decrypt), '__call__',
+            side_effect=lambda request, **kwargs: fail()) as call:
+        with pytest.raises(exceptions.GoogleAPICallError):
+            await client.decrypt(
+                name='name_value', ciphertext=b'ciphertext', timeout=None)
+    assert call.call_count == 2
+
+    # Neither fast calls nor calls without latencies are hedged.
+    for option in (hedging_policy(), True):
+        client = KeyManagementServiceAsyncClient(
+            credentials=credentials.AnonymousCredentials(),
+            client_options={'hedging': option},
+        )
+        with mock.patch.object(
+                type(client._client._transport.decrypt), '__call__') as call:
+            call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(
+                service.DecryptResponse(plaintext=b'data'))
+            response = await client.decrypt(
+                name='name_value', ciphertext=b'ciphertext')
+        assert response.plaintext == b'data'
+        assert call.call_count == 1
+
+
+@pytest.mark.parametrize('first_fails', [False, True])
+def test_hedged_call_limiters(first_fails):
+    rate_limiter = ratelimit.RateLimiter(rates={'crypto': 100.0})
+    concurrency_limiter = concurrency.AdaptiveLimiter(4, latency_tolerance=100)
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
+        client_options={
+            'hedging': hedging_policy(),
+            'rate_limiter': rate_limiter,
+            'concurrency_limiter': concurrency_limiter,
+        },
     )
+    calls = []
+
+    def future(request, **kwargs):
+        # Each request sent holds a slot of its own.
+        assert concurrency_limiter.stats()['in_flight'] == len(calls) + 1
+        calls.append(futures.Future())
+        if len(calls) == 2:
+            if first_fails:
+                calls[0].set_exception(FakeRpcError(grpc.StatusCode.INTERNAL))
+            calls[1].set_result(service.DecryptResponse(plaintext=b'hedged'))
+        return calls[-1]
 
-    # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.destroy_crypto_key_version),
-            '__call__') as call:
-        # Designate an appropriate return value for the call.
-        call.return_value = resources.CryptoKeyVersion()
+            type(client._transport.decrypt), 'future', side_effect=future):
+        response = client.decrypt(name='name_value', ciphertext=b'ciphertext')
+    assert response.plaintext == b'hedged'
+    assert calls[0].cancelled() is not first_fails
 
-        # Call the method with a truthy value for each flattened field,
-        # using the keyword arguments to the method.
-        response = client.destroy_crypto_key_version(
-            name='name_value',
-        )
+    # The hedge consumes a token too, and every slot is freed.
+    assert rate_limiter.stats()['crypto']['requests'] == 2
+    assert concurrency_limiter.stats()['in_flight'] == 0
 
-        # Establish that the underlying call was made with the expected
-        # request object values.
-        assert len(call.mock_calls) == 1
-        _, args, _ = call.mock_calls[0]
-        assert args[0].name == 'name_value'
+    with mock.patch.object(
+            type(client._transport.decrypt), 'future',
+            side_effect=FakeRpcError(grpc.StatusCode.INTERNAL)):
+        with pytest.raises(exceptions.GoogleAPICallError):
+            client.decrypt(name='name_value', ciphertext=b'ciphertext')
+    assert concurrency_limiter.stats()['in_flight'] == 0
 
 
-def test_destroy_crypto_key_version_flattened_error():
+def test_retried_call_limiters():
+    rate_limiter = ratelimit.RateLimiter(rates={'crypto': 100.0})
+    concurrency_limiter = concurrency.AdaptiveLimiter(4, latency_tolerance=100)
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
+        client_options={
+            'rate_limiter': rate_limiter,
+            'concurrency_limiter': concurrency_limiter,
+        },
     )
 
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.destroy_crypto_key_version(
-            service.DestroyCryptoKeyVersionRequest(),
-            name='name_value',
+    with mock.patch.object(
+            type(client._transport.decrypt), '__call__') as call, \
+            mock.patch('time.sleep'):
+        call.side_effect = (
+            exceptions.ServiceUnavailable('unavailable'),
+            service.DecryptResponse(),
         )
+        client.decrypt(name='name_value', ciphertext=b'ciphertext')
 
+    # Each attempt consumes a token and holds a slot.
+    assert call.call_count == 2
+    assert rate_limiter.stats()['crypto']['requests'] == 2
+    assert concurrency_limiter.stats()['in_flight'] == 0
 
-def test_restore_crypto_key_version(transport: str = 'grpc'):
-    client = KeyManagementServiceClient(
+
+@pytest.mark.asyncio
+async def test_hedged_call_async_limiters():
+    rate_limiter = ratelimit.RateLimiter(rates={'crypto': 100.0})
+    concurrency_limiter = concurrency.AdaptiveLimiter(4, latency_tolerance=100)
+    client = KeyManagementServiceAsyncClient(
         credentials=credentials.AnonymousCredentials(),
-        transport=transport,
+        client_options={
+            'hedging': hedging_policy(),
+            'rate_limiter': rate_limiter,
+            'concurrency_limiter': concurrency_limiter,
+        },
     )
+    in_flight = []
 
-    # Everything is optional in proto3 as far as the runtime is concerned,
-    # and we are mocking out the actual API, so just send an empty request.
-    request = service.RestoreCryptoKeyVersionRequest()
+    def call(request, **kwargs):
+        in_flight.append(concurrency_limiter.stats()['in_flight'])
+        if len(in_flight) == 1:
+            return asyncio.sleep(10)
+        return grpc_helpers_async.FakeUnaryUnaryCall(
+            service.DecryptResponse(plaintext=b'hedged'))
 
-    # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.restore_crypto_key_version),
-            '__call__') as call:
-        # Designate an appropriate return value for the call.
-        call.return_value = resources.CryptoKeyVersion(
-            name='name_value',
-            state=resources.CryptoKeyVersion.CryptoKeyVersionState.PENDING_GENERATION,
-            protection_level=resources.ProtectionLevel.SOFTWARE,
-            algorithm=resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION,
-            import_job='import_job_value',
-            import_failure_reason='import_failure_reason_value',
-        )
+            type(client._client._transport.decrypt), '__call__', side_effect=call):
+        response = await client.decrypt(name='name_value', ciphertext=b'ciphertext')
+    assert response.plaintext == b'hedged'
+
+    # Each request sent consumes a token and holds a slot of its own;
+    # the cancelled one frees its slot.
+    assert in_flight == [1, 2]
+    assert rate_limiter.stats()['crypto']['requests'] == 2
+    assert concurrency_limiter.stats()['in_flight'] == 0
+
+
+def test_metrics_histogram():
+    histogram = metrics.Histogram()
+    assert histogram.percentile(50) is None
+    assert histogram.snapshot() == {
+        'count': 0, 'min': None, 'max': None, 'mean': None,
+        'p50': None, 'p90': None, 'p99': None, 'p99.9': None,
+    }
 
-        response = client.restore_crypto_key_version(request)
+    # Short durations are exact...
+    histogram.record(0.0001)
+    assert histogram.percentile(50) == 0.0001
+
+    # ... and percentiles are within 1% otherwise.
+    histogram = metrics.Histogram()
+    for micros in range(1, 100001):
+        histogram.record(micros / 1e6)
+    for percentile in metrics.PERCENTILES:
+        expected = percentile / 100 * 0.1
+        assert abs(histogram.percentile(percentile) - expected) <= 0.01 * expected
+    assert histogram.percentile(100) == 0.1
+    snapshot = histogram.snapshot()
+    assert snapshot['count'] == 100000
+    assert snapshot['min'] == 1e-6
+    assert snapshot['max'] == 0.1
+    assert snapshot['mean'] == pytest.approx(0.05, rel=1e-3)
+
+
+def test_transport_metrics():
+    records = []
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'metrics': metrics.TransportMetrics(
+            sink=lambda *args: records.append(args))},
+    )
+    snapshots = []
 
-        # Establish that the underlying gRPC stub method was called.
-        assert len(call.mock_calls) == 1
-        _, args, _ = call.mock_calls[0]
+    def rpc(request, **kwargs):
+        snapshots.append(client._transport.metrics.snapshot())
+        return resources.KeyRing(name='name_value')
 
-        assert args[0] == request
+    with mock.patch.object(
+            type(client._transport.get_key_ring), '__call__') as call:
+        call.side_effect = rpc
+        client.get_key_ring(name='name_value')
+        call.side_effect = exceptions.NotFound('not found')
+        with pytest.raises(exceptions.NotFound):
+            client.get_key_ring(name='name_value')
+        call.side_effect = RuntimeError('boom')
+        with pytest.raises(RuntimeError):
+            client.get_key_ring(name='name_value')
+
+    assert snapshots[0]['get_key_ring']['in_flight'] == 1
+    snapshot = client._transport.metrics.snapshot()
+    assert list(snapshot) == ['get_key_ring']
+    assert snapshot['get_key_ring']['calls'] == 3
+    assert snapshot['get_key_ring']['in_flight'] == 0
+    assert snapshot['get_key_ring']['codes'] == {'OK': 1, 'NOT_FOUND': 1, 'UNKNOWN': 1}
+    assert snapshot['get_key_ring']['latency']['count'] == 3
+    assert [(r[0], r[2]) for r in records] == [
+        ('get_key_ring', 'OK'), ('get_key_ring', 'NOT_FOUND'), ('get_key_ring', 'UNKNOWN'),
+    ]
 
-    # Establish that the response is the type that we expect.
-    assert isinstance(response, resources.CryptoKeyVersion)
-    assert response.name == 'name_value'
-    assert response.state == resources.CryptoKeyVersion.CryptoKeyVersionState.PENDING_GENERATION
-    assert response.protection_level == resources.ProtectionLevel.SOFTWARE
-    assert response.algorithm == resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm.GOOGLE_SYMMETRIC_ENCRYPTION
-    assert response.import_job == 'import_job_value'
-    assert response.import_failure_reason == 'import_failure_reason_value'
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'metrics': True},
+    )
+    assert isinstance(client._transport.metrics, metrics.TransportMetrics)
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+    assert client._transport.metrics is None
 
 
-def test_restore_crypto_key_version_flattened():
+@pytest.mark.asyncio
+async def test_transport_metrics_async():
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'metrics': True},
+    )
+    with mock.patch.object(
+            type(client._client._transport.get_key_ring), '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(
+            resources.KeyRing(name='name_value'))
+        await client.get_key_ring(name='name_value')
+        call.side_effect = asyncio.CancelledError()
+        with pytest.raises(asyncio.CancelledError):
+            await client.get_key_ring(name='name_value')
+
+    snapshot = client._client._transport.metrics.snapshot()['get_key_ring']
+    assert snapshot['calls'] == 2
+    assert snapshot['in_flight'] == 0
+    assert snapshot['codes'] == {'OK': 1, 'CANCELLED': 1}
+
+
+class Recorder(interceptors.Interceptor):
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+
+    def _before(self, method, request, metadata):
+        self.log.append((self.name, method, request.name))
+        return metadata + (('x-' + self.name, '1'),)
+
+    def intercept(self, method, request, metadata, proceed):
+        metadata = self._before(method, request, metadata)
+        try:
+            response = proceed(request, metadata)
+        except exceptions.GoogleAPICallError as exc:
+            self.log.append((self.name, type(exc).__name__))
+            raise
+        self.log.append((self.name, response.name))
+        return response
+
+    async def intercept_async(self, method, request, metadata, proceed):
+        metadata = self._before(method, request, metadata)
+        try:
+            response = await proceed(request, metadata)
+        except exceptions.GoogleAPICallError as exc:
+            self.log.append((self.name, type(exc).__name__))
+            raise
+        self.log.append((self.name, response.name))
+        return response
+
+
+class Cached(interceptors.Interceptor):
+    def intercept(self, method, request, metadata, proceed):
+        return resources.KeyRing(name='cached')
+
+    async def intercept_async(self, method, request, metadata, proceed):
+        return resources.KeyRing(name='cached')
+
+
+def test_interceptors():
+    log = []
     client = KeyManagementServiceClient(
         credentials=credentials.AnonymousCredentials(),
+        client_options={'interceptors': [Recorder('inner', log)]},
+        interceptors=[Recorder('outer', log), interceptors.Interceptor()],
     )
-
-    # Mock the actual call within the gRPC stub, and fake the request.
     with mock.patch.object(
-            type(client._transport.restore_crypto_key_version),
-            '__call__') as call:
-        # Designate an appropriate return value for the call.
-        call.return_value = resources.CryptoKeyVersion()
+            type(client._transport.get_key_ring), '__call__') as call:
+        call.return_value = resources.KeyRing(name='response')
+        response = client.get_key_ring(name='name_value')
+        assert response.name == 'response'
+        _, args, kw = call.mock_calls[0]
+        assert ('x-outer', '1') in kw['metadata']
+        assert ('x-inner', '1') in kw['metadata']
+        assert log == [
+            ('outer', 'get_key_ring', 'name_value'),
+            ('inner', 'get_key_ring', 'name_value'),
+            ('inner', 'response'),
+            ('outer', 'response'),
+        ]
+
+        log.clear()
+        call.side_effect = exceptions.NotFound('not found')
+        with pytest.raises(exceptions.NotFound):
+            client.get_key_ring(name='name_value')
+        assert log[2:] == [('inner', 'NotFound'), ('outer', 'NotFound')]
+
+    # An interceptor can answer calls itself.
+    client = KeyManagementServiceClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options=client_options.ClientOptions(),
+        interceptors=[Cached()],
+    )
+    with mock.patch.object(
+            type(client._transport.get_key_ring), '__call__') as call:
+        assert client.get_key_ring(name='name_value').name == 'cached'
+    call.assert_not_called()
 
-        # Call the method with a truthy value for each flattened field,
-        # using the keyword arguments to the method.
-        response = client.restore_crypto_key_version(
-            name='name_value',
-        )
 
-        # Establish that the underlying call was made with the expected
-        # request object values.
-        assert len(call.mock_calls) == 1
-        _, args, _ = call.mock_calls[0]
-        assert args[0].name == 'name_value'
+@pytest.mark.asyncio
+async def test_interceptors_async():
+    log = []
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        client_options={'interceptors': [Recorder('inner', log)]},
+        interceptors=[Recorder('outer', log), interceptors.Interceptor()],
+    )
+    with mock.patch.object(
+            type(client._client._transport.get_key_ring), '__call__') as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(
+            resources.KeyRing(name='response'))
+        response = await client.get_key_ring(name='name_value')
+        assert response.name == 'response'
+        _, args, kw = call.mock_calls[0]
+        assert ('x-outer', '1') in kw['metadata']
+        assert ('x-inner', '1') in kw['metadata']
+        assert log == [
+            ('outer', 'get_key_ring', 'name_value'),
+            ('inner', 'get_key_ring', 'name_value'),
+            ('inner', 'response'),
+            ('outer', 'response'),
+        ]
+
+        log.clear()
+        call.side_effect = exceptions.NotFound('not found')
+        with pytest.raises(exceptions.NotFound):
+            await client.get_key_ring(name='name_value')
+        assert log[2:] == [('inner', 'NotFound'), ('outer', 'NotFound')]
+
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+        interceptors=[Cached()],
+    )
+    with mock.patch.object(
+            type(client._client._transport.get_key_ring), '__call__') as call:
+        assert (await client.get_key_ring(name='name_value')).name == 'cached'
+    call.assert_not_called()
+
+
+def test_warmup():
+    creds = mock.Mock(spec=credentials.Credentials, valid=False)
+    channel = FakeChannel()
+    channel.ready = True
+    with mock.patch.object(grpc_helpers, 'create_channel', return_value=channel) as create:
+        client = KeyManagementServiceClient(credentials=creds)
+        create.assert_not_called()
+        client.warmup(timeout=1)
+        create.assert_called_once()
+    creds.refresh.assert_called_once()
+    transport = client._transport
+    assert set(transport._stubs) == set(transport._default_method_configs())
+    assert set(transport._wrapped_methods) == set(transport._stubs)
+    assert not channel.subscribed
+
+    # Valid credentials are not refreshed.
+    creds.valid = True
+    client.warmup()
+    creds.refresh.assert_called_once()
+
+
+def test_warmup_pool_timeout():
+    channels = []
+
+    def create_channel(*args, **kwargs):
+        channels.append(FakeChannel())
+        return channels[-1]
+
+    with mock.patch.object(grpc_helpers, 'create_channel', side_effect=create_channel):
+        transport = transports.KeyManagementServiceGrpcTransport(
+            credentials=credentials.AnonymousCredentials(),
+            pool_size=2,
+        )
+        transport.grpc_channel
+    channels[0].ready = True
+    with pytest.raises(exceptions.DeadlineExceeded):
+        transport.warmup(timeout=0.01)
+    # Without a client, the stubs are created but not wrapped.
+    assert len(transport._stubs) == len(transport._default_method_configs())
+    assert not hasattr(transport, '_wrapped_methods')
+    assert not channels[0].subscribed and not channels[1].subscribed
+
+    channels[1].ready = True
+    transport.warmup(timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_warmup_async():
+    creds = mock.Mock(spec=credentials.Credentials, valid=False)
+    client = KeyManagementServiceAsyncClient(credentials=creds)
+    transport = client._client._transport
+    with mock.patch.object(type(transport.grpc_channel), 'channel_ready',
+            new_callable=AwaitableMock) as ready:
+        await client.warmup(timeout=1)
+    ready.assert_called_once_with()
+    creds.refresh.assert_called_once()
+    assert set(transport._stubs) == set(transport._default_method_configs())
+    assert set(transport._wrapped_methods) == set(transport._stubs)
+
+    transport = transports.KeyManagementServiceGrpcAsyncIOTransport(
+        channel=aio.insecure_channel('localhost:1'),
+    )
+    with pytest.raises(exceptions.DeadlineExceeded):
+        await transport.warmup(timeout=0.01)
 
 
-def test_restore_crypto_key_version_flattened_error():
-    client = KeyManagementServiceClient(
+def test_warmup_abstract():
+    transport = transports.KeyManagementServiceTransport(
         credentials=credentials.AnonymousCredentials(),
     )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
+    with pytest.raises(NotImplementedError):
+        transport.warmup()
+
+
+class ScopedCredentials(credentials.Scoped, credentials.Credentials):
+    """Credentials that need scopes, and whose tokens last ``lifetime``
+    seconds, or forever if it is ``None``."""
+    def __init__(self, scopes=None, lifetime=3600.0, errors=0):
+        super().__init__()
+        self._scopes = scopes
+        self.lifetime = lifetime
+        self.errors = errors
+
+    @property
+    def requires_scopes(self):
+        return not self._scopes
+
+    def with_scopes(self, scopes, default_scopes=None):
+        return ScopedCredentials(scopes, self.lifetime, self.errors)
+
+    def refresh(self, request):
+        if self.errors:
+            self.errors -= 1
+            raise ValueError('refresh failed')
+        self.token = 'token'
+        if self.lifetime is not None:
+            self.expiry = datetime.datetime.utcnow() + datetime.timedelta(
+                seconds=self.lifetime)
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_shared_credentials():
+    creds = ScopedCredentials()
+    transport = transports.KeyManagementServiceGrpcTransport(credentials=creds)
+    client = KeyManagementServiceClient(credentials=creds)
+    scoped = transport._credentials
+    assert scoped is not creds
+    assert scoped.scopes == transport.AUTH_SCOPES
+    assert client._transport._credentials is scoped
+    assert refresh.shared_credentials(creds, ('scope',)) is not scoped
+
+    # The channel uses the shared copy as it is.
+    with mock.patch.object(grpc_helpers, 'create_channel') as create:
+        transport.grpc_channel
+    assert create.call_args[1]['credentials'] is scoped
+
+    anonymous = credentials.AnonymousCredentials()
+    assert refresh.shared_credentials(anonymous, ('scope',)) is anonymous
+    assert refresh.shared_credentials(False, ('scope',)) is False
+
+
+def test_credentials_refresher():
     with pytest.raises(ValueError):
-        client.restore_crypto_key_version(
-            service.RestoreCryptoKeyVersionRequest(),
-            name='name_value',
-        )
+        refresh.CredentialsRefresher(ScopedCredentials(), margin=0)
+
+    # Invalid credentials are refreshed right away, then before expiry.
+    creds = ScopedCredentials(('scope',), errors=1)
+    refresher = refresh.CredentialsRefresher(creds, retry_delay=0.01).start()
+    wait_until(lambda: creds.valid)
+    assert (refresher.failures, refresher.refreshes) == (1, 1)
+    assert 3250 < refresher._next_refresh() <= 3300
+    assert refresher.running
+    refresher.stop(timeout=5)
+    assert not refresher.running
+
+    # Tokens that expire within the margin are refreshed no more often
+    # than the retry delay.
+    creds = ScopedCredentials(('scope',), lifetime=0.0)
+    refresher = refresh.CredentialsRefresher(creds, retry_delay=0.01).start()
+    wait_until(lambda: refresher.refreshes >= 3)
+    refresher.stop(timeout=5)
+
+    # The thread ends if the token does not expire...
+    creds = ScopedCredentials(('scope',), lifetime=None)
+    refresher = refresh.CredentialsRefresher(creds).start()
+    wait_until(lambda: not refresher.running)
+    assert creds.valid and refresher.refreshes == 1
+
+    # ... or once the credentials are gone.
+    refresher = refresh.CredentialsRefresher(ScopedCredentials(('scope',)))
+    gc.collect()
+    assert refresher._next_refresh() is None
+    assert refresher._refresh() is None
+    refresher.stop()
+
+
+@pytest.mark.asyncio
+async def test_refresh_in_background():
+    assert refresh.from_option(True) == refresh.DEFAULT_MARGIN
+    assert refresh.from_option(60) == 60.0
+    assert refresh.from_option(None) is None
+
+    creds = ScopedCredentials()
+    transport = transports.KeyManagementServiceGrpcTransport(
+        credentials=creds, refresh_credentials=refresh.DEFAULT_MARGIN)
+    refresher = transport._credentials_refresher
+    wait_until(lambda: transport._credentials.valid)
+    assert refresher.running and refresher.refreshes == 1
+
+    # Clients built from the same credentials share the refresher.
+    client = KeyManagementServiceClient(
+        credentials=creds,
+        client_options={'refresh_credentials': True},
+    )
+    assert client._transport._credentials_refresher is refresher
+    client = KeyManagementServiceAsyncClient(
+        credentials=creds,
+        client_options={'refresh_credentials': 60},
+    )
+    assert client._client._transport._credentials_refresher is refresher
+    assert KeyManagementServiceClient(
+        credentials=creds)._transport._credentials_refresher is None
+
+    # A stopped refresher is replaced.
+    refresher.stop(timeout=5)
+    transport._refresh_in_background(60)
+    assert transport._credentials_refresher is not refresher
+    assert transport._credentials_refresher.running
+    transport._credentials_refresher.stop(timeout=5)
+
+    # Anonymous credentials, or a channel's own, have no token to refresh.
+    transport = transports.KeyManagementServiceGrpcTransport(
+        credentials=credentials.AnonymousCredentials(), refresh_credentials=60)
+    assert transport._credentials_refresher is None
+    transport = transports.KeyManagementServiceGrpcAsyncIOTransport(
+        channel=aio.insecure_channel('localhost:1'), refresh_credentials=60)
+    assert transport._credentials_refresher is None
+
+
+def test_client_info_gapic_version():
+    from importlib import metadata
+    module = sys.modules[KeyManagementServiceClient.__module__]
+
+    # The version is looked up once, when a user agent is first built.
+    module._distribution_version.cache_clear()
+    with mock.patch.object(metadata, 'version', return_value='1.2.3') as version:
+        client_info = module._ClientInfo()
+        version.assert_not_called()
+        assert client_info.gapic_version is None
+        assert 'gapic/1.2.3' in client_info.to_user_agent()
+        assert client_info.gapic_version == '1.2.3'
+    version.assert_called_once_with('google-cloud-kms')
+
+    module._distribution_version.cache_clear()
+    with mock.patch.object(metadata, 'version',
+            side_effect=metadata.PackageNotFoundError('google-cloud-kms')):
+        assert 'gapic/' not in module._ClientInfo().to_user_agent()
+        client_info = module._ClientInfo(gapic_version='4.5.6')
+        assert 'gapic/4.5.6' in client_info.to_user_agent()
+    module._distribution_version.cache_clear()
 
 
 def test_credentials_transport_error():
@@ -2515,6 +7360,31 @@ def test_transport_instance():
     assert client._transport is transport
 
 
+def test_transport_instance_shared():
+    # A second client of a transport keeps the methods the first wrapped.
+    transport = transports.KeyManagementServiceGrpcTransport(
+        credentials=credentials.AnonymousCredentials(),
+    )
+    KeyManagementServiceClient(
+        transport=transport,
+        client_options={'method_configs': {'decrypt': {'timeout': 5.0}}},
+    )
+    wrapped = transport._wrapped_methods
+    KeyManagementServiceClient(transport=transport, client_options={'metadata_cache': True})
+    assert transport._wrapped_methods is wrapped
+
+    # Options that wrap the methods would conflict with the first client's.
+    for client_options in (
+            {'method_configs': {'decrypt': {'timeout': 1.0}}},
+            {'rate_limiter': True},
+            {'interceptors': [mock.Mock()]}):
+        with pytest.raises(ValueError):
+            KeyManagementServiceClient(transport=transport, client_options=client_options)
+    with pytest.raises(ValueError):
+        KeyManagementServiceClient(transport=transport, interceptors=[mock.Mock()])
+    assert transport._wrapped_methods is wrapped
+
+
 def test_transport_grpc_default():
     # A client should use the gRPC transport by default.
     client = KeyManagementServiceClient(
@@ -2526,6 +7396,34 @@ def test_transport_grpc_default():
     )
 
 
+def test_transport_grpc_asyncio_default():
+    # The async client should use the gRPC AsyncIO transport by default.
+    client = KeyManagementServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(),
+    )
+    assert isinstance(
+        client._client._transport,
+        transports.KeyManagementServiceGrpcAsyncIOTransport,
+    )
+
+
+def test_key_management_service_async_client_client_options():
+    # Check mTLS is triggered with the AsyncIO transport if
+    # client_cert_source is provided.
+    options = client_options.ClientOptions(
+        client_cert_source=client_cert_source_callback
+    )
+    with mock.patch('google.cloud.kms_v1.services.key_management_service.transports.KeyManagementServiceGrpcAsyncIOTransport.__init__') as grpc_transport:
+        grpc_transport.return_value = None
+        client = KeyManagementServiceAsyncClient(client_options=options)
+        grpc_transport.assert_called_once_with(
+            api_mtls_endpoint=client.DEFAULT_MTLS_ENDPOINT,
+            client_cert_source=client_cert_source_callback,
+            credentials=None,
+            host=client.DEFAULT_ENDPOINT,
+        )
+
+
 def test_key_management_service_base_transport():
     # Instantiate the base transport.
     transport = transports.KeyManagementServiceTransport(
@@ -2684,6 +7582,98 @@ def test_key_management_service_grpc_transport_channel_mtls_with_adc(
         assert transport.grpc_channel == mock_grpc_channel
 
 
+@pytest.mark.asyncio
+async def test_key_management_service_grpc_asyncio_transport_channel():
+    channel = aio.insecure_channel('http://localhost/')
+
+    # Check that if channel is provided, mtls endpoint and client_cert_source
+    # won't be used.
+    callback = mock.MagicMock()
+    transport = transports.KeyManagementServiceGrpcAsyncIOTransport(
+        host="squid.clam.whelk",
+        channel=channel,
+        api_mtls_endpoint="mtls.squid.clam.whelk",
+        client_cert_source=callback,
+    )
+    assert transport.grpc_channel == channel
+    assert transport._host == "squid.clam.whelk:443"
+    assert not callback.called
+
+
+@mock.patch("grpc.ssl_channel_credentials", autospec=True)
+@mock.patch("google.api_core.grpc_helpers_async.create_channel", autospec=True)
+def test_key_management_service_grpc_asyncio_transport_channel_mtls_with_client_cert_source(
+    grpc_create_channel, grpc_ssl_channel_cred
+):
+    # Check that if channel is None, but api_mtls_endpoint and client_cert_source
+    # are provided, then a mTLS channel will be created.
+    mock_cred = mock.Mock()
+
+    mock_ssl_cred = mock.Mock()
+    grpc_ssl_channel_cred.return_value = mock_ssl_cred
+
+    mock_grpc_channel = mock.Mock()
+    grpc_create_channel.return_value = mock_grpc_channel
+
+    transport = transports.KeyManagementServiceGrpcAsyncIOTransport(
+        host="squid.clam.whelk",
+        credentials=mock_cred,
+        api_mtls_endpoint="mtls.squid.clam.whelk",
+        client_cert_source=client_cert_source_callback,
+    )
+    grpc_ssl_channel_cred.assert_called_once_with(
+        certificate_chain=b"cert bytes", private_key=b"key bytes"
+    )
+    grpc_create_channel.assert_called_once_with(
+        "mtls.squid.clam.whelk:443",
+        credentials=mock_cred,
+        ssl_credentials=mock_ssl_cred,
+        scopes=(
+            'https://www.googleapis.com/auth/cloud-platform',
+            'https://www.googleapis.com/auth/cloudkms',
+        ),
+    )
+    assert transport.grpc_channel == mock_grpc_channel
+
+
+@pytest.mark.parametrize(
+    "api_mtls_endpoint", ["mtls.squid.clam.whelk", "mtls.squid.clam.whelk:443"]
+)
+@mock.patch("google.api_core.grpc_helpers_async.create_channel", autospec=True)
+def test_key_management_service_grpc_asyncio_transport_channel_mtls_with_adc(
+    grpc_create_channel, api_mtls_endpoint
+):
+    # Check that if channel and client_cert_source are None, but api_mtls_endpoint
+    # is provided, then a mTLS channel will be created with SSL ADC.
+    mock_grpc_channel = mock.Mock()
+    grpc_create_channel.return_value = mock_grpc_channel
+
+    # Mock google.auth.transport.grpc.SslCredentials class.
+    mock_ssl_cred = mock.Mock()
+    with mock.patch.multiple(
+        "google.auth.transport.grpc.SslCredentials",
+        __init__=mock.Mock(return_value=None),
+        ssl_credentials=mock.PropertyMock(return_value=mock_ssl_cred),
+    ):
+        mock_cred = mock.Mock()
+        transport = transports.KeyManagementServiceGrpcAsyncIOTransport(
+            host="squid.clam.whelk",
+            credentials=mock_cred,
+            api_mtls_endpoint=api_mtls_endpoint,
+            client_cert_source=None,
+        )
+        grpc_create_channel.assert_called_once_with(
+            "mtls.squid.clam.whelk:443",
+            credentials=mock_cred,
+            ssl_credentials=mock_ssl_cred,
+            scopes=(
+                'https://www.googleapis.com/auth/cloud-platform',
+                'https://www.googleapis.com/auth/cloudkms',
+            ),
+        )
+        assert transport.grpc_channel == mock_grpc_channel
+
+
 def test_import_job_path():
     project = "squid"
     location = "clam"